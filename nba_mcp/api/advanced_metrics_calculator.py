@@ -7,6 +7,12 @@ Implements sophisticated basketball metrics beyond basic box score stats:
 - WS (Win Shares) - Offensive and Defensive
 - RAPM (Regularized Adjusted Plus-Minus) - when sufficient data available
 
+Metrics can be calculated for one player from scalar season totals, or for
+the whole league at once: the batch path aggregates one league_player_games
+Arrow table per player and applies the same formulas as column math. The
+per-season result is persisted as parquet by LeagueMetricsStore, so player
+lookups and leaderboards are index hits instead of per-player fetches.
+
 References:
 - Basketball Reference methodology for WS
 - Hollinger's Game Score formula
@@ -15,12 +21,19 @@ References:
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
+import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 
 logger = logging.getLogger(__name__)
 
@@ -109,6 +122,24 @@ class AdvancedMetrics:
             "RAPM_DEFENSE": round(self.rapm_defense, 2) if self.rapm_defense else None,
         }
 
+    @classmethod
+    def from_league_row(cls, row: Dict[str, Any], player_name: Optional[str] = None) -> AdvancedMetrics:
+        """Build from one row of compute_league_metrics output"""
+        return cls(
+            player_name=player_name or row.get("PLAYER_NAME", ""),
+            season=row["SEASON"],
+            game_score_total=row["GAME_SCORE_TOTAL"],
+            game_score_per_game=row["GAME_SCORE_PER_GAME"],
+            game_score_per_36=row["GAME_SCORE_PER_36"],
+            true_shooting_pct=row["TRUE_SHOOTING_PCT"],
+            effective_fg_pct=row["EFFECTIVE_FG_PCT"],
+            offensive_win_shares=row["OFFENSIVE_WIN_SHARES"],
+            defensive_win_shares=row["DEFENSIVE_WIN_SHARES"],
+            win_shares=row["WIN_SHARES"],
+            win_shares_per_48=row["WIN_SHARES_PER_48"],
+            ewa=row["EWA"],
+        )
+
 
 # ============================================================================
 # GAME SCORE CALCULATOR
@@ -382,6 +413,203 @@ def calculate_ewa(player_stats: Dict[str, float], season: str) -> float:
     return ewa
 
 
+# ============================================================================
+# VECTORIZED (LEAGUE-WIDE) METRICS
+# ============================================================================
+
+# Box score totals summed per player before the metrics are applied
+METRIC_COUNTING_STATS = [
+    "MIN", "PTS", "FGM", "FGA", "FG3M", "FG3A", "FTM", "FTA",
+    "OREB", "DREB", "REB", "AST", "STL", "BLK", "TOV", "PF",
+]
+
+# Output columns of compute_league_metrics (same names as AdvancedMetrics.to_dict)
+LEAGUE_METRIC_COLUMNS = [
+    "GAME_SCORE_TOTAL",
+    "GAME_SCORE_PER_GAME",
+    "GAME_SCORE_PER_36",
+    "TRUE_SHOOTING_PCT",
+    "EFFECTIVE_FG_PCT",
+    "OFFENSIVE_WIN_SHARES",
+    "DEFENSIVE_WIN_SHARES",
+    "WIN_SHARES",
+    "WIN_SHARES_PER_48",
+    "EWA",
+]
+
+StatColumns = Union[pa.Table, pd.DataFrame, Mapping[str, Any]]
+
+
+def _stat_array(stats: StatColumns, name: str, size: int) -> np.ndarray:
+    """Column as float64 with nulls as 0 (missing columns are all 0, like stats.get(name, 0))"""
+    names = stats.column_names if isinstance(stats, pa.Table) else stats
+    if name not in names:
+        return np.zeros(size)
+    values = stats[name]
+    if isinstance(values, (pa.Array, pa.ChunkedArray)):
+        values = values.to_numpy(zero_copy_only=False)
+    return np.nan_to_num(np.asarray(values, dtype=np.float64), nan=0.0)
+
+
+def _column_size(stats: StatColumns) -> int:
+    if isinstance(stats, pa.Table):
+        return stats.num_rows
+    if isinstance(stats, pd.DataFrame):
+        return len(stats)
+    return max((len(v) for v in stats.values()), default=0)
+
+
+def _safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Element-wise division that returns 0.0 where the denominator is 0"""
+    out = np.zeros(np.broadcast(numerator, denominator).shape)
+    np.divide(numerator, denominator, out=out, where=denominator != 0)
+    return out
+
+
+def game_score_array(stats: StatColumns) -> np.ndarray:
+    """
+    Vectorized calculate_game_score over box score columns
+
+    Args:
+        stats: DataFrame or mapping of column name -> array (PTS, FGM, FGA, etc.)
+
+    Returns:
+        Game Score per row
+    """
+    size = _column_size(stats)
+    col = lambda name: _stat_array(stats, name, size)  # noqa: E731
+
+    return (
+        col("PTS")
+        + 0.4 * col("FGM")
+        - 0.7 * col("FGA")
+        - 0.4 * (col("FTA") - col("FTM"))
+        + 0.7 * col("OREB")
+        + 0.3 * col("DREB")
+        + col("STL")
+        + 0.7 * col("AST")
+        + 0.7 * col("BLK")
+        - 0.4 * col("PF")
+        - col("TOV")
+    )
+
+
+def true_shooting_pct_array(pts: Any, fga: Any, fta: Any) -> np.ndarray:
+    """Vectorized calculate_true_shooting_pct (0.0 where there are no attempts)"""
+    pts, fga, fta = (np.asarray(x, dtype=np.float64) for x in (pts, fga, fta))
+    return _safe_divide(pts, 2 * (fga + 0.44 * fta))
+
+
+def effective_fg_pct_array(fgm: Any, fg3m: Any, fga: Any) -> np.ndarray:
+    """Vectorized calculate_effective_fg_pct (0.0 where FGA is 0)"""
+    fgm, fg3m, fga = (np.asarray(x, dtype=np.float64) for x in (fgm, fg3m, fga))
+    return _safe_divide(fgm + 0.5 * fg3m, fga)
+
+
+def aggregate_player_totals(games: Union[pa.Table, pd.DataFrame]) -> pa.Table:
+    """
+    Sum league-wide game logs into one row of season totals per player
+
+    Args:
+        games: league_player_games rows (one per player per game)
+
+    Returns:
+        Arrow table with PLAYER_ID, PLAYER_NAME, TEAM_ID, TEAM_ABBREVIATION
+        (most recent team), GP and the summed METRIC_COUNTING_STATS
+    """
+    if isinstance(games, pd.DataFrame):
+        games = pa.Table.from_pandas(games, preserve_index=False)
+    if "PLAYER_ID" not in games.column_names:
+        raise ValueError("league game logs must include PLAYER_ID")
+
+    # Chronological order so "last" picks the team a player ended up on
+    if "GAME_DATE" in games.column_names:
+        games = games.sort_by([("GAME_DATE", "ascending")])
+
+    stat_columns = [c for c in METRIC_COUNTING_STATS if c in games.column_names]
+    for name in stat_columns:
+        index = games.column_names.index(name)
+        games = games.set_column(index, name, games[name].cast(pa.float64()))
+
+    aggregations = [(name, "sum") for name in stat_columns]
+    aggregations.append(("PLAYER_ID", "count"))
+    label_columns = [
+        c for c in ("PLAYER_NAME", "TEAM_ID", "TEAM_ABBREVIATION") if c in games.column_names
+    ]
+    aggregations.extend((name, "last") for name in label_columns)
+
+    grouped = games.group_by("PLAYER_ID", use_threads=False).aggregate(aggregations)
+
+    renamed = {f"{name}_sum": name for name in stat_columns}
+    renamed.update({f"{name}_last": name for name in label_columns})
+    renamed["PLAYER_ID_count"] = "GP"
+    grouped = grouped.rename_columns([renamed.get(c, c) for c in grouped.column_names])
+
+    ordered = ["PLAYER_ID", *label_columns, "GP", *stat_columns]
+    return grouped.select(ordered)
+
+
+def compute_league_metrics(
+    games: Union[pa.Table, pd.DataFrame],
+    season: str,
+) -> pa.Table:
+    """
+    Calculate advanced metrics for every player in one pass
+
+    Aggregates the game logs per player, then applies the Game Score, TS%,
+    eFG%, Win Shares and EWA formulas as column math. Each row matches what
+    AdvancedMetricsCalculator.calculate_all_metrics returns for that player's
+    season totals (without team_stats).
+
+    Args:
+        games: league_player_games rows for the season
+        season: Season in YYYY-YY format (selects league average ORtg)
+
+    Returns:
+        Arrow table with one row per player, sorted by WIN_SHARES descending
+    """
+    totals = aggregate_player_totals(games)
+    size = totals.num_rows
+    col = lambda name: _stat_array(totals, name, size)  # noqa: E731
+
+    minutes = col("MIN")
+    games_played = col("GP")
+    played = minutes > 0
+
+    game_score = game_score_array(totals)
+
+    # Win Shares (WinSharesCalculator, simplified)
+    league_avg_ortg = LEAGUE_AVG_ORTG.get(season, DEFAULT_ORTG)
+    points_produced = col("PTS") + 0.7 * col("AST") - 0.5 * col("TOV")
+    marginal_offense = points_produced - (league_avg_ortg / 100 / 48) * minutes
+    ows = np.where(played, np.maximum(0.0, marginal_offense / 30), 0.0)
+    defensive_value = 2 * col("STL") + 1.5 * col("BLK") + 0.5 * col("DREB")
+    dws = np.where(played, np.maximum(0.0, defensive_value / 30), 0.0)
+    win_shares = ows + dws
+
+    # EWA (Game Score above a 15-per-36 replacement level)
+    ewa = np.where(played, (game_score - (15 / 36) * minutes) / 30, 0.0)
+
+    metrics = {
+        "GAME_SCORE_TOTAL": game_score,
+        "GAME_SCORE_PER_GAME": _safe_divide(game_score, games_played),
+        "GAME_SCORE_PER_36": _safe_divide(game_score, minutes) * 36,
+        "TRUE_SHOOTING_PCT": true_shooting_pct_array(col("PTS"), col("FGA"), col("FTA")),
+        "EFFECTIVE_FG_PCT": effective_fg_pct_array(col("FGM"), col("FG3M"), col("FGA")),
+        "OFFENSIVE_WIN_SHARES": ows,
+        "DEFENSIVE_WIN_SHARES": dws,
+        "WIN_SHARES": win_shares,
+        "WIN_SHARES_PER_48": _safe_divide(win_shares, minutes) * 48,
+        "EWA": ewa,
+    }
+
+    table = totals.append_column("SEASON", pa.array([season] * size, pa.string()))
+    for name in LEAGUE_METRIC_COLUMNS:
+        table = table.append_column(name, pa.array(metrics[name], pa.float64()))
+
+    return table.sort_by([("WIN_SHARES", "descending"), ("PLAYER_ID", "ascending")])
+
+
 # ============================================================================
 # MAIN CALCULATOR CLASS
 # ============================================================================
@@ -414,8 +642,13 @@ class AdvancedMetricsCalculator:
         Returns:
             AdvancedMetrics object with all calculated metrics
         """
-        # Fetch player stats if not provided
+        # Fetch player stats if not provided. Without team context the
+        # league-wide table has the same numbers, so try that index first.
         if player_stats is None:
+            if team_stats is None:
+                row = await self._lookup_league_metrics(player_name, season)
+                if row is not None:
+                    return AdvancedMetrics.from_league_row(row, player_name)
             player_stats = await self._fetch_player_season_stats(player_name, season)
 
         # Initialize metrics container
@@ -475,6 +708,49 @@ class AdvancedMetricsCalculator:
 
         return metrics
 
+    async def calculate_league_metrics(
+        self,
+        season: str,
+        season_type: str = "Regular Season",
+        refresh: bool = False
+    ) -> pa.Table:
+        """
+        Calculate advanced metrics for every player in a season
+
+        Args:
+            season: Season in YYYY-YY format
+            season_type: "Regular Season" or "Playoffs"
+            refresh: Rebuild from fresh game logs instead of the stored table
+
+        Returns:
+            Arrow table with one row per player (see compute_league_metrics)
+        """
+        return await get_league_metrics_store().get_table(season, season_type, refresh=refresh)
+
+    async def _lookup_league_metrics(
+        self,
+        player_name: str,
+        season: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look a player up in the stored league-wide metrics table
+
+        Returns:
+            Metrics row, or None if the table is unavailable or lacks the player
+        """
+        from nba_mcp.api.entity_resolver import resolve_entity
+
+        player_entity = resolve_entity(player_name, entity_type="player")
+
+        try:
+            return await get_league_metrics_store().lookup(player_entity.entity_id, season)
+        except Exception as e:
+            logger.warning(
+                f"League metrics lookup failed for {player_name} ({season}), "
+                f"falling back to per-player stats: {e}"
+            )
+            return None
+
     async def _fetch_player_season_stats(
         self,
         player_name: str,
@@ -505,6 +781,261 @@ class AdvancedMetricsCalculator:
         return stats_dict
 
 
+# ============================================================================
+# LEAGUE METRICS STORE
+# ============================================================================
+
+DEFAULT_METRICS_CACHE_DIR = Path("mcp_data/advanced_metrics")
+
+# Seconds a stored table is trusted before it is rebuilt from fresh game logs
+# (an in-progress season gains games daily; rebuilding a past season is cheap
+# because league_player_games itself is parquet-cached)
+DEFAULT_METRICS_MAX_AGE = 6 * 3600.0
+
+LeagueGamesFetcher = Callable[[str, str], Awaitable[Union[pa.Table, pd.DataFrame]]]
+
+
+async def _fetch_league_player_games(season: str, season_type: str) -> pa.Table:
+    """One league-wide game log request through unified_fetch"""
+    from nba_mcp.data.unified_fetch import unified_fetch
+
+    result = await unified_fetch(
+        endpoint="league_player_games",
+        params={"season": season, "season_type": season_type},
+    )
+    return result.data
+
+
+class LeagueMetricsStore:
+    """
+    Per-season league-wide advanced metrics with a player_id index
+
+    Tables are built once from league_player_games (compute_league_metrics),
+    kept in memory, and persisted as parquet so a new process starts from
+    disk. Concurrent requests for the same season share one build.
+
+    Usage:
+        store = get_league_metrics_store()
+        row = await store.lookup(2544, "2023-24")
+        top = await store.leaders("2023-24", metric="WIN_SHARES", top_n=10)
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = DEFAULT_METRICS_CACHE_DIR,
+        max_age: float = DEFAULT_METRICS_MAX_AGE,
+        fetch_func: Optional[LeagueGamesFetcher] = None,
+    ):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.max_age = max_age
+        self._fetch_func = fetch_func or _fetch_league_player_games
+
+        self._tables: Dict[Tuple[str, str], pa.Table] = {}
+        self._built_at: Dict[Tuple[str, str], float] = {}
+        self._indexes: Dict[Tuple[str, str], Dict[int, int]] = {}
+        self._rows: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+
+        self.stats = {
+            "builds": 0,
+            "disk_loads": 0,
+            "memory_hits": 0,
+            "lookups": 0,
+            "lookup_misses": 0,
+        }
+
+    def _path(self, season: str, season_type: str) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        slug = season_type.lower().replace(" ", "_")
+        return self.cache_dir / f"{season}_{slug}.parquet"
+
+    def _is_fresh(self, built_at: float) -> bool:
+        return time.time() - built_at < self.max_age
+
+    def _install(self, key: Tuple[str, str], table: pa.Table, built_at: float) -> None:
+        rows = table.to_pylist()
+        self._tables[key] = table
+        self._built_at[key] = built_at
+        self._rows[key] = rows
+        self._indexes[key] = {int(row["PLAYER_ID"]): i for i, row in enumerate(rows)}
+
+    def _load_from_disk(self, key: Tuple[str, str]) -> bool:
+        path = self._path(*key)
+        if path is None or not path.exists():
+            return False
+        try:
+            table = pq.read_table(path)
+            metadata = table.schema.metadata or {}
+            built_at = float(metadata.get(b"built_at", path.stat().st_mtime))
+            if not self._is_fresh(built_at):
+                return False
+            self._install(key, table, built_at)
+            self.stats["disk_loads"] += 1
+            logger.info(f"Loaded league metrics for {key[0]} {key[1]} from {path}")
+            return True
+        except Exception as e:
+            logger.warning(f"Could not load league metrics from {path}: {e}")
+            return False
+
+    def _persist(self, key: Tuple[str, str], table: pa.Table, built_at: float) -> None:
+        path = self._path(*key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            table = table.replace_schema_metadata(
+                {**(table.schema.metadata or {}), b"built_at": str(built_at).encode()}
+            )
+            tmp_path = path.with_suffix(".parquet.tmp")
+            pq.write_table(table, tmp_path)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not persist league metrics to {path}: {e}")
+
+    async def get_table(
+        self,
+        season: str,
+        season_type: str = "Regular Season",
+        refresh: bool = False,
+    ) -> pa.Table:
+        """
+        League metrics table for a season, building it if needed
+
+        Args:
+            season: Season in YYYY-YY format
+            season_type: "Regular Season" or "Playoffs"
+            refresh: Rebuild even if a fresh table is stored
+
+        Returns:
+            Arrow table from compute_league_metrics
+        """
+        key = (season, season_type)
+        if not refresh and key in self._tables and self._is_fresh(self._built_at[key]):
+            self.stats["memory_hits"] += 1
+            return self._tables[key]
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another caller may have built it while we waited
+            if not refresh and key in self._tables and self._is_fresh(self._built_at[key]):
+                self.stats["memory_hits"] += 1
+                return self._tables[key]
+            if not refresh and self._load_from_disk(key):
+                return self._tables[key]
+
+            start = time.perf_counter()
+            games = await self._fetch_func(season, season_type)
+            table = compute_league_metrics(games, season)
+            built_at = time.time()
+            self._install(key, table, built_at)
+            self._persist(key, table, built_at)
+            self.stats["builds"] += 1
+
+            logger.info(
+                f"Built league metrics for {season} {season_type}: "
+                f"{table.num_rows} players in {(time.perf_counter() - start) * 1000:.0f}ms"
+            )
+            return table
+
+    async def lookup(
+        self,
+        player_id: int,
+        season: str,
+        season_type: str = "Regular Season",
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Metrics row for one player (index hit once the season is built)
+
+        Returns:
+            Row as a dict, or None if the player has no games that season
+        """
+        key = (season, season_type)
+        await self.get_table(season, season_type)
+        self.stats["lookups"] += 1
+        position = self._indexes[key].get(int(player_id))
+        if position is None:
+            self.stats["lookup_misses"] += 1
+            return None
+        return dict(self._rows[key][position])
+
+    async def leaders(
+        self,
+        season: str,
+        metric: str = "WIN_SHARES",
+        top_n: int = 25,
+        season_type: str = "Regular Season",
+        min_games: int = 0,
+        ascending: bool = False,
+    ) -> pa.Table:
+        """
+        Players ranked by one metric
+
+        Args:
+            season: Season in YYYY-YY format
+            metric: One of LEAGUE_METRIC_COLUMNS
+            top_n: Number of players to return
+            season_type: "Regular Season" or "Playoffs"
+            min_games: Minimum games played to qualify
+            ascending: Rank lowest first
+
+        Returns:
+            Arrow table of the top_n rows with a RANK column
+        """
+        if metric not in LEAGUE_METRIC_COLUMNS:
+            raise ValueError(
+                f"Unknown metric: {metric}. Available: {', '.join(LEAGUE_METRIC_COLUMNS)}"
+            )
+
+        table = await self.get_table(season, season_type)
+        if min_games > 0:
+            table = table.filter(pc.greater_equal(table["GP"], min_games))
+
+        values = table[metric].to_numpy()
+        order = np.argsort(values if ascending else -values, kind="stable")[:top_n]
+        ranked = table.take(pa.array(order))
+        return ranked.add_column(0, "RANK", pa.array(np.arange(1, ranked.num_rows + 1)))
+
+    def invalidate(self, season: Optional[str] = None) -> None:
+        """Drop stored tables for one season (or all) from memory and disk"""
+        keys = [k for k in self._tables if season is None or k[0] == season]
+        for key in keys:
+            self._tables.pop(key, None)
+            self._built_at.pop(key, None)
+            self._indexes.pop(key, None)
+            self._rows.pop(key, None)
+        if self.cache_dir is not None and self.cache_dir.exists():
+            pattern = f"{season}_*.parquet" if season else "*.parquet"
+            for path in self.cache_dir.glob(pattern):
+                path.unlink(missing_ok=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Store statistics"""
+        return {
+            **self.stats,
+            "seasons": [f"{season} {season_type}" for season, season_type in self._tables],
+            "players": sum(t.num_rows for t in self._tables.values()),
+        }
+
+
+# Global store instance
+_league_metrics_store: Optional[LeagueMetricsStore] = None
+
+
+def get_league_metrics_store() -> LeagueMetricsStore:
+    """Get or create the global league metrics store"""
+    global _league_metrics_store
+    if _league_metrics_store is None:
+        _league_metrics_store = LeagueMetricsStore()
+    return _league_metrics_store
+
+
+def reset_league_metrics_store() -> None:
+    """Reset the global league metrics store (for testing)"""
+    global _league_metrics_store
+    _league_metrics_store = None
+
+
 # ============================================================================
 # CONVENIENCE FUNCTIONS
 # ============================================================================
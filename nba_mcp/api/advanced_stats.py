@@ -26,7 +26,7 @@ from nba_api.stats.endpoints import (
 )
 
 from .entity_resolver import resolve_entity
-from .errors import InvalidParameterError, NBAApiError, retry_with_backoff
+from .errors import EntityNotFoundError, InvalidParameterError, NBAApiError, retry_with_backoff
 from .models import (
     PlayerComparison,
     PlayerSeasonStats,
@@ -471,6 +471,70 @@ def normalize_per_possession(
     return normalized
 
 
+async def _season_table_player_stats(
+    player_name: str, season: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Per-game stats for one player from the materialized season stats table.
+
+    Returns the get_player_advanced_stats keys that can be derived from game
+    log totals, or None if the player has no games that season.
+    """
+    from .advanced_metrics_calculator import (
+        calculate_effective_fg_pct,
+        calculate_true_shooting_pct,
+    )
+    from .season_aggregator import get_season_stats_store
+
+    player_entity = resolve_entity(player_name, entity_type="player")
+    seasons = normalize_season(season)
+    season_str = seasons[0] if seasons else season
+
+    row = await get_season_stats_store().lookup(season_str, player_entity.entity_id)
+    if row is None:
+        return None
+
+    games = row["GP"]
+    return {
+        "player_id": int(row["PLAYER_ID"]),
+        "player_name": row["PLAYER_NAME"] or player_entity.name,
+        "season": season_str,
+        "team_abbreviation": row["TEAM_ABBREVIATION"],
+        "games_played": int(games),
+        "minutes_per_game": row["MIN"] / games if games else 0.0,
+        "true_shooting_pct": calculate_true_shooting_pct(row["PTS"], row["FGA"], row["FTA"]),
+        "effective_fg_pct": calculate_effective_fg_pct(row["FGM"], row["FG3M"], row["FGA"]),
+        "points_per_game": row["PPG"],
+        "rebounds_per_game": row["RPG"],
+        "assists_per_game": row["APG"],
+        "steals_per_game": row["SPG"],
+        "blocks_per_game": row["BPG"],
+        "turnovers_per_game": row["TOV"] / games if games else 0.0,
+        "field_goal_pct": row["FG_PCT"],
+        "three_point_pct": row["FG3_PCT"],
+        "free_throw_pct": row["FT_PCT"],
+    }
+
+
+async def _comparison_stats(player_name: str, season: Optional[str]) -> Dict[str, Any]:
+    """
+    Stats for one side of a comparison.
+
+    Uses the shared season stats table when a season is given (both players
+    come from one league-wide build), otherwise the LeagueDash endpoints.
+    """
+    if season:
+        try:
+            stats = await _season_table_player_stats(player_name, season)
+            if stats is not None:
+                return stats
+        except EntityNotFoundError:
+            raise
+        except Exception as e:
+            logger.warning(f"Season stats table unavailable for {player_name} ({season}): {e}")
+    return await get_player_advanced_stats(player_name, season)
+
+
 async def compare_players(
     player1_name: str,
     player2_name: str,
@@ -498,9 +562,9 @@ async def compare_players(
         NBAApiError: If NBA API call fails
     """
     try:
-        # Fetch both players' advanced stats in parallel
-        stats1_task = get_player_advanced_stats(player1_name, season)
-        stats2_task = get_player_advanced_stats(player2_name, season)
+        # Fetch both players' stats in parallel
+        stats1_task = _comparison_stats(player1_name, season)
+        stats2_task = _comparison_stats(player2_name, season)
 
         stats1, stats2 = await asyncio.gather(stats1_task, stats2_task)
 
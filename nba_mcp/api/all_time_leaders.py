@@ -0,0 +1,558 @@
+# nba_mcp/api/all_time_leaders.py
+"""
+Pre-ranked, persisted snapshot of the NBA all-time (career) leaderboards.
+
+AllTimeLeadersGrids returns one leaderboard per stat category in a single
+response, and the numbers only move once per game night. Instead of calling
+it on every get_all_time_leaders request:
+- One pull is split into a per-stat Arrow table, already sorted by rank,
+  with active-player positions and a player index precomputed
+- The snapshot is persisted as parquet (with its build time) so restarts
+  serve it straight from disk
+- A background thread rebuilds it on a schedule; lookups (top-N,
+  active-only, a player's rank) only read memory
+
+If the API is unreachable, the last snapshot (memory or disk) is served.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .errors import InvalidParameterError
+
+logger = logging.getLogger(__name__)
+
+# Stat category -> AllTimeLeadersGrids dataset name
+ALL_TIME_STATS: Dict[str, str] = {
+    "PTS": "PTSLeaders",
+    "AST": "ASTLeaders",
+    "REB": "REBLeaders",
+    "STL": "STLLeaders",
+    "BLK": "BLKLeaders",
+    "FGM": "FGMLeaders",
+    "FGA": "FGALeaders",
+    "FG_PCT": "FG_PCTLeaders",
+    "FG3M": "FG3MLeaders",
+    "FG3A": "FG3ALeaders",
+    "FG3_PCT": "FG3_PCTLeaders",
+    "FTM": "FTMLeaders",
+    "FTA": "FTALeaders",
+    "FT_PCT": "FT_PCTLeaders",
+    "OREB": "OREBLeaders",
+    "DREB": "DREBLeaders",
+    "TOV": "TOVLeaders",
+    "PF": "PFLeaders",
+    "GP": "GPLeaders",
+}
+
+DEFAULT_CACHE_DIR = Path("mcp_data/all_time_leaders")
+
+SNAPSHOT_FILE = "all_time_leaders.parquet"
+
+# Players per leaderboard in the single pull (the endpoint defaults to 10)
+DEFAULT_TOPX = 250
+
+# Seconds a snapshot is trusted before a lookup triggers a rebuild
+DEFAULT_MAX_AGE = 12 * 3600.0
+
+# Seconds between scheduled rebuilds
+DEFAULT_REFRESH_INTERVAL = 6 * 3600.0
+
+SCHEMA = pa.schema(
+    [
+        ("STAT_CATEGORY", pa.string()),
+        ("RANK", pa.int64()),
+        ("PLAYER_ID", pa.int64()),
+        ("PLAYER_NAME", pa.string()),
+        ("VALUE", pa.float64()),
+        ("IS_ACTIVE", pa.bool_()),
+    ]
+)
+
+COLUMNS = SCHEMA.names
+
+LeadersFetcher = Callable[[str, str, int], List[pd.DataFrame]]
+
+
+def _fetch_all_time_leaders_grids(
+    season_type: str, per_mode: str, topx: int
+) -> List[pd.DataFrame]:
+    """Every all-time leaderboard in one AllTimeLeadersGrids request (blocking)"""
+    from nba_api.stats.endpoints import alltimeleadersgrids
+
+    result = alltimeleadersgrids.AllTimeLeadersGrids(
+        season_type=season_type,
+        per_mode_simple=per_mode,
+        topx=topx,
+        timeout=60,
+    )
+    return result.get_data_frames()
+
+
+def _find_leaderboard(frames: List[pd.DataFrame], stat: str) -> Optional[pd.DataFrame]:
+    """The response frame holding a stat's leaderboard (matched on its columns)"""
+    rank_col = f"{stat}_RANK"
+    fallback = None
+    for df in frames:
+        if stat not in df.columns:
+            continue
+        if rank_col in df.columns:
+            return df
+        fallback = df if fallback is None else fallback
+    return fallback
+
+
+def build_leaders_table(frames: List[pd.DataFrame]) -> pa.Table:
+    """
+    Combine the AllTimeLeadersGrids frames into one long table.
+
+    Rows are grouped by STAT_CATEGORY (in ALL_TIME_STATS order) and sorted
+    by RANK within each stat; stats missing from the response are skipped.
+    """
+    parts = []
+    for stat in ALL_TIME_STATS:
+        df = _find_leaderboard(frames, stat)
+        if df is None or df.empty:
+            continue
+        values = pd.to_numeric(df[stat], errors="coerce")
+        rank_col = f"{stat}_RANK"
+        if rank_col in df.columns:
+            ranks = pd.to_numeric(df[rank_col], errors="coerce")
+        else:
+            ranks = values.rank(method="min", ascending=False)
+        active = (
+            df["IS_ACTIVE_FLAG"].astype(str).str.upper().eq("Y")
+            if "IS_ACTIVE_FLAG" in df.columns
+            else pd.Series(False, index=df.index)
+        )
+        part = pd.DataFrame(
+            {
+                "STAT_CATEGORY": stat,
+                "RANK": ranks,
+                "PLAYER_ID": pd.to_numeric(df["PLAYER_ID"], errors="coerce"),
+                "PLAYER_NAME": df["PLAYER_NAME"].astype(str),
+                "VALUE": values.astype("float64"),
+                "IS_ACTIVE": active.to_numpy(bool),
+            }
+        )
+        part = part.dropna(subset=["VALUE", "RANK", "PLAYER_ID"])
+        parts.append(part.sort_values("RANK", kind="stable"))
+
+    if not parts:
+        return SCHEMA.empty_table()
+    frame = pd.concat(parts, ignore_index=True)
+    frame = frame.astype({"RANK": "int64", "PLAYER_ID": "int64"})
+    return pa.Table.from_pandas(frame[COLUMNS], schema=SCHEMA, preserve_index=False)
+
+
+class StatLeaders:
+    """One stat's leaderboard: rank-ordered rows plus lookup positions"""
+
+    def __init__(self, table: pa.Table):
+        self.table = table
+        self.active_positions = np.flatnonzero(
+            table.column("IS_ACTIVE").to_numpy(zero_copy_only=False)
+        )
+        player_ids = table.column("PLAYER_ID").to_pylist()
+        # Inserted last-to-first so the best-ranked row wins if a player appears twice
+        self.player_positions = dict(
+            zip(player_ids[::-1], range(len(player_ids) - 1, -1, -1))
+        )
+
+    def __len__(self) -> int:
+        return self.table.num_rows
+
+    def top(self, n: int, active_only: bool = False) -> pa.Table:
+        if active_only:
+            return self.table.take(self.active_positions[: max(n, 0)])
+        return self.table.slice(0, max(n, 0))
+
+
+class AllTimeLeadersStore:
+    """
+    All-time leaderboards as pre-ranked Arrow tables, one per stat.
+
+    Lookups (top, top_table, player_rank) only read memory; call
+    ensure_fresh() first to rebuild when the snapshot is older than max_age,
+    or start_scheduled_refresh() to keep it rebuilt in the background.
+
+    Usage:
+        store = get_all_time_leaders_store()
+        await store.ensure_fresh()
+        leaders = store.top("PTS", 10, active_only=True)
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = DEFAULT_CACHE_DIR,
+        max_age: float = DEFAULT_MAX_AGE,
+        season_type: str = "Regular Season",
+        per_mode: str = "Totals",
+        topx: int = DEFAULT_TOPX,
+        fetch_func: Optional[LeadersFetcher] = None,
+    ):
+        """
+        Initialize the store, loading the last persisted snapshot if any.
+
+        Args:
+            cache_dir: Directory for the parquet snapshot (None keeps it in
+                memory only)
+            max_age: Seconds before the snapshot is rebuilt on lookup
+            season_type: AllTimeLeadersGrids season type
+            per_mode: AllTimeLeadersGrids per mode ("Totals" or "PerGame")
+            topx: Players per leaderboard in the pull
+            fetch_func: Blocking (season_type, per_mode, topx) -> DataFrames
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.max_age = max_age
+        self.season_type = season_type
+        self.per_mode = per_mode
+        self.topx = topx
+        self._fetch_func = fetch_func or _fetch_all_time_leaders_grids
+
+        self.leaders: Dict[str, StatLeaders] = {}
+        self._names: Dict[str, int] = {}
+        self.built_at = 0.0
+        self.checked_at = 0.0  # last build or failed rebuild attempt (epoch)
+        self.last_status: Optional[str] = None
+
+        self.stats = {
+            "builds": 0,
+            "fresh_hits": 0,
+            "stale_served": 0,
+            "errors": 0,
+            "disk_loads": 0,
+            "lookups": 0,
+        }
+        self._lock = threading.Lock()
+        self._stop_event: Optional[threading.Event] = None
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._load_from_disk()
+
+    # ------------------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------------------
+
+    def is_fresh(self) -> bool:
+        """Whether the snapshot can be used without rebuilding."""
+        return bool(self.leaders) and time.time() - self.checked_at < self.max_age
+
+    def refresh(self, force: bool = False) -> str:
+        """
+        Rebuild the snapshot from one AllTimeLeadersGrids pull (blocking).
+
+        Concurrent callers share one pull: whoever waits on the lock finds
+        the snapshot fresh and returns immediately.
+
+        Args:
+            force: Rebuild even if the snapshot is fresh
+
+        Returns:
+            "fresh", "built" or "stale" (API error or a response without any
+            leaderboard, previous snapshot kept)
+
+        Raises:
+            Exception: Whatever the fetch raised, if there is no snapshot
+        """
+        with self._lock:
+            if not force and self.is_fresh():
+                return self._set_status("fresh")
+
+            start = time.perf_counter()
+            try:
+                table = build_leaders_table(
+                    self._fetch_func(self.season_type, self.per_mode, self.topx)
+                )
+                if table.num_rows == 0:
+                    # Schema change or partial response: keep the last good snapshot
+                    raise ValueError(
+                        "AllTimeLeadersGrids response has no recognizable leaderboards"
+                    )
+            except Exception as e:
+                self.stats["errors"] += 1
+                if not self.leaders:
+                    raise
+                # Retry on the next schedule rather than on every lookup
+                self.checked_at = time.time()
+                logger.warning(
+                    f"All-time leaders refresh failed, serving previous snapshot: {e}"
+                )
+                return self._set_status("stale")
+
+            self.built_at = self.checked_at = time.time()
+            self._install(table)
+            self._persist(table)
+            logger.info(
+                f"All-time leaders snapshot built: {len(self.leaders)} stats, "
+                f"{table.num_rows} rows in {(time.perf_counter() - start) * 1000:.0f}ms"
+            )
+            return self._set_status("built")
+
+    async def ensure_fresh(self, force: bool = False) -> str:
+        """Rebuild in a worker thread if needed (see refresh())."""
+        if not force and self.is_fresh():
+            return self._set_status("fresh")
+        return await asyncio.to_thread(self.refresh, force)
+
+    def _set_status(self, status: str) -> str:
+        key = {"fresh": "fresh_hits", "built": "builds", "stale": "stale_served"}[
+            status
+        ]
+        self.stats[key] += 1
+        self.last_status = status
+        return status
+
+    def start_scheduled_refresh(
+        self, interval: float = DEFAULT_REFRESH_INTERVAL
+    ) -> threading.Thread:
+        """
+        Rebuild the snapshot every `interval` seconds in a daemon thread.
+
+        The first pass only builds if the snapshot is missing or stale, so a
+        restart with a recent parquet snapshot makes no request.
+        """
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return self._refresh_thread
+
+        stop_event = threading.Event()
+
+        def refresher():
+            force = False
+            while not stop_event.is_set():
+                try:
+                    self.refresh(force=force)
+                except Exception as e:
+                    logger.warning(f"Scheduled all-time leaders refresh failed: {e}")
+                force = True
+                stop_event.wait(interval)
+
+        self._stop_event = stop_event
+        self._refresh_thread = threading.Thread(
+            target=refresher, name="all-time-leaders-refresh", daemon=True
+        )
+        self._refresh_thread.start()
+        return self._refresh_thread
+
+    def stop_scheduled_refresh(self, timeout: Optional[float] = None):
+        """Stop the background refresh thread (if running)."""
+        if self._stop_event is not None:
+            self._stop_event.set()
+        if self._refresh_thread is not None:
+            self._refresh_thread.join(timeout)
+        self._stop_event = self._refresh_thread = None
+
+    # ------------------------------------------------------------------
+    # Indexes
+    # ------------------------------------------------------------------
+
+    def _install(self, table: pa.Table):
+        """Split the long table into per-stat leaderboards (zero-copy slices)."""
+        stats = table.column("STAT_CATEGORY").to_numpy(zero_copy_only=False)
+        leaders = {}
+        if len(stats):
+            boundaries = np.flatnonzero(stats[1:] != stats[:-1]) + 1
+            starts = np.concatenate(([0], boundaries)).tolist()
+            stops = np.concatenate((boundaries, [len(stats)])).tolist()
+            for start, stop in zip(starts, stops):
+                leaders[str(stats[start])] = StatLeaders(
+                    table.slice(start, stop - start)
+                )
+
+        names = {}
+        for name, player_id in zip(
+            table.column("PLAYER_NAME").to_pylist(),
+            table.column("PLAYER_ID").to_pylist(),
+        ):
+            names.setdefault(name.casefold(), player_id)
+
+        self.leaders = leaders
+        self._names = names
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def _leaderboard(self, stat_category: str) -> Optional[StatLeaders]:
+        stat = stat_category.upper()
+        if stat not in ALL_TIME_STATS:
+            raise InvalidParameterError(
+                param_name="stat_category",
+                param_value=stat_category,
+                expected=f"one of {', '.join(sorted(ALL_TIME_STATS))}",
+                examples=["PTS", "AST", "FG3M"],
+            )
+        self.stats["lookups"] += 1
+        return self.leaders.get(stat)
+
+    def has_stat(self, stat_category: str) -> bool:
+        """Whether the snapshot holds a leaderboard for the stat."""
+        return stat_category.upper() in self.leaders
+
+    def top_table(
+        self, stat_category: str, n: int = 10, active_only: bool = False
+    ) -> pa.Table:
+        """
+        The top `n` rows of a leaderboard, in rank order.
+
+        Args:
+            stat_category: Stat in ALL_TIME_STATS (case-insensitive)
+            n: Number of rows
+            active_only: Only players still active
+
+        Returns:
+            Arrow table with the COLUMNS schema (empty if the stat is missing
+            from the snapshot)
+
+        Raises:
+            InvalidParameterError: If the stat is not supported
+        """
+        leaderboard = self._leaderboard(stat_category)
+        if leaderboard is None:
+            return SCHEMA.empty_table()
+        return leaderboard.top(n, active_only)
+
+    def top(
+        self, stat_category: str, n: int = 10, active_only: bool = False
+    ) -> List[Dict[str, Any]]:
+        """top_table() rows as dicts: player_id, player_name, value, rank, is_active."""
+        return [
+            _row_dict(row)
+            for row in self.top_table(stat_category, n, active_only).to_pylist()
+        ]
+
+    def player_rank(
+        self, stat_category: str, player: Union[int, str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        A player's row on a leaderboard.
+
+        Args:
+            stat_category: Stat in ALL_TIME_STATS (case-insensitive)
+            player: NBA player ID or full name (case-insensitive)
+
+        Returns:
+            Row dict, or None if the player is not on the leaderboard
+
+        Raises:
+            InvalidParameterError: If the stat is not supported
+        """
+        leaderboard = self._leaderboard(stat_category)
+        if leaderboard is None:
+            return None
+        player_id = (
+            self._names.get(player.casefold()) if isinstance(player, str) else player
+        )
+        position = (
+            leaderboard.player_positions.get(player_id)
+            if player_id is not None
+            else None
+        )
+        if position is None:
+            return None
+        return _row_dict(leaderboard.table.slice(position, 1).to_pylist()[0])
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Snapshot size, age and refresh counters."""
+        return {
+            **self.stats,
+            "stat_categories": len(self.leaders),
+            "rows": sum(len(leaders) for leaders in self.leaders.values()),
+            "age_seconds": time.time() - self.built_at if self.leaders else None,
+            "last_status": self.last_status,
+            "scheduled": self._refresh_thread is not None
+            and self._refresh_thread.is_alive(),
+        }
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _path(self) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        slug = f"{self.season_type}_{self.per_mode}".lower().replace(" ", "_")
+        return self.cache_dir / slug / SNAPSHOT_FILE
+
+    def _persist(self, table: pa.Table):
+        path = self._path()
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            table = table.replace_schema_metadata(
+                {
+                    **(table.schema.metadata or {}),
+                    b"built_at": str(self.built_at).encode(),
+                }
+            )
+            tmp_path = path.with_suffix(".parquet.tmp")
+            pq.write_table(table, tmp_path)
+            os.replace(tmp_path, path)
+        except (OSError, pa.ArrowException) as e:
+            logger.warning(f"Could not persist all-time leaders snapshot: {e}")
+
+    def _load_from_disk(self):
+        path = self._path()
+        if path is None or not path.exists():
+            return
+        try:
+            table = pq.read_table(path)
+            metadata = table.schema.metadata or {}
+            built_at = float(metadata.get(b"built_at", path.stat().st_mtime))
+            self._install(table.select(COLUMNS).cast(SCHEMA))
+        except (OSError, ValueError, KeyError, pa.ArrowException) as e:
+            logger.warning(f"Ignoring unreadable all-time leaders snapshot {path}: {e}")
+            return
+        # A stale snapshot is kept for serving; ensure_fresh() rebuilds it
+        self.built_at = self.checked_at = built_at
+        self.stats["disk_loads"] += 1
+        logger.info(
+            f"Loaded all-time leaders snapshot from disk: {len(self.leaders)} stats"
+        )
+
+
+def _row_dict(row: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "player_name": row["PLAYER_NAME"],
+        "player_id": row["PLAYER_ID"],
+        "value": row["VALUE"],
+        "rank": row["RANK"],
+        "is_active": row["IS_ACTIVE"],
+    }
+
+
+# ============================================================================
+# GLOBAL STORE
+# ============================================================================
+
+_all_time_leaders_store: Optional[AllTimeLeadersStore] = None
+_store_lock = threading.Lock()
+
+
+def get_all_time_leaders_store() -> AllTimeLeadersStore:
+    """Get the global all-time leaders store (loaded from disk on first use)."""
+    global _all_time_leaders_store
+    if _all_time_leaders_store is None:
+        with _store_lock:
+            if _all_time_leaders_store is None:
+                _all_time_leaders_store = AllTimeLeadersStore()
+    return _all_time_leaders_store
+
+
+def reset_all_time_leaders_store():
+    """Stop and drop the global store (for testing)."""
+    global _all_time_leaders_store
+    with _store_lock:
+        if _all_time_leaders_store is not None:
+            _all_time_leaders_store.stop_scheduled_refresh(timeout=1.0)
+        _all_time_leaders_store = None
@@ -17,9 +17,13 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from enum import Enum
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Literal, Optional, Tuple, Union
 
 import pandas as pd
+import pyarrow as pa
+
+if TYPE_CHECKING:
+    from nba_mcp.data.fetch_scheduler import FetchScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -906,46 +910,109 @@ async def fetch_grouping(
     df = await grouping.fetch(**filters)
 
     # Apply enrichment if requested
-    if enrich and not df.empty:
-        from nba_mcp.data.enrichment_strategy import (
-            enrich_dataset,
-            EnrichmentType,
-        )
-
-        # Convert string enrichment names to EnrichmentType
-        enrichment_types = None
-        if enrichments:
-            enrichment_types = [EnrichmentType(e) for e in enrichments]
-
-        exclude_types = None
-        if exclude_enrichments:
-            exclude_types = [EnrichmentType(e) for e in exclude_enrichments]
-
-        # Enrich the dataset
-        df = await enrich_dataset(
-            df,
-            grouping_level=GroupingLevel(grouping_level) if isinstance(grouping_level, str) else grouping_level,
-            enrichments=enrichment_types,
-            use_defaults=(enrichments is None),  # Use defaults if no specific enrichments requested
-            exclude=exclude_types,
-        )
+    if enrich:
+        df = await _enrich_grouping(df, grouping_level, enrichments, exclude_enrichments)
 
     return df
 
 
+async def _enrich_grouping(
+    df: pd.DataFrame,
+    grouping_level: Union[GroupingLevel, str],
+    enrichments: Optional[List[str]],
+    exclude_enrichments: Optional[List[str]],
+) -> pd.DataFrame:
+    """Apply default or requested enrichments to fetched grouping data."""
+    if df.empty:
+        return df
+
+    from nba_mcp.data.enrichment_strategy import (
+        enrich_dataset,
+        EnrichmentType,
+    )
+
+    # Convert string enrichment names to EnrichmentType
+    enrichment_types = None
+    if enrichments:
+        enrichment_types = [EnrichmentType(e) for e in enrichments]
+
+    exclude_types = None
+    if exclude_enrichments:
+        exclude_types = [EnrichmentType(e) for e in exclude_enrichments]
+
+    # Enrich the dataset
+    return await enrich_dataset(
+        df,
+        grouping_level=GroupingLevel(grouping_level) if isinstance(grouping_level, str) else grouping_level,
+        enrichments=enrichment_types,
+        use_defaults=(enrichments is None),  # Use defaults if no specific enrichments requested
+        exclude=exclude_types,
+    )
+
+
+async def stream_grouping_seasons(
+    grouping_level: Union[GroupingLevel, str],
+    seasons: List[str],
+    scheduler: Optional["FetchScheduler"] = None,
+    **filters
+) -> AsyncIterator[Tuple[str, Optional[pa.Table]]]:
+    """
+    Fetch un-enriched data for several seasons, yielding each as it completes.
+
+    Requests go through the shared FetchScheduler (global concurrency cap,
+    backoff on 429/timeouts), so long season ranges don't burst the NBA API.
+
+    Args:
+        grouping_level: Grouping level (e.g., "player/game")
+        seasons: Season strings to fetch
+        scheduler: Scheduler to use (default: the shared one)
+        **filters: Additional filters (player_id, team_id, etc.) - do NOT include season
+
+    Yields:
+        Tuple of (season, Arrow table) in completion order; the table is None
+        if the season failed or returned no rows
+    """
+    from nba_mcp.data.fetch_scheduler import get_fetch_scheduler
+
+    scheduler = scheduler or get_fetch_scheduler()
+
+    async def fetch_season(season_str: str) -> pa.Table:
+        df = await fetch_grouping(grouping_level, enrich=False, season=season_str, **filters)
+        try:
+            return pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Mixed-type object columns: convert them as nullable strings
+            mixed = {col: "string" for col in df.columns if df[col].dtype == object}
+            return pa.Table.from_pandas(df.astype(mixed), preserve_index=False)
+
+    jobs = {season: (fetch_season, (season,)) for season in seasons}
+    async for season, (table, error) in scheduler.as_completed(jobs):
+        if error is not None:
+            logger.error(f"Failed to fetch {season}: {error}")
+            yield season, None
+        elif table.num_rows == 0:
+            yield season, None
+        else:
+            logger.info(f"Fetched {season}: {table.num_rows} rows")
+            yield season, table
+
+
 async def fetch_grouping_multi_season(
     grouping_level: Union[GroupingLevel, str],
     seasons: List[str],
     enrich: bool = True,
     enrichments: Optional[List[str]] = None,
     exclude_enrichments: Optional[List[str]] = None,
+    ctx: Optional[Any] = None,
     **filters
 ) -> pd.DataFrame:
     """
     Fetch data for multiple seasons concurrently and combine results with optional enrichment.
 
-    Uses asyncio.gather() for parallel API calls - approximately N times faster
-    than sequential fetching for N seasons.
+    Seasons are fetched through the shared FetchScheduler (bounded, rate-aware
+    concurrency) and collected as Arrow tables as they complete. Each season
+    is enriched on its own as it arrives (rest days and back-to-backs must not
+    span the offseason), then all seasons are concatenated in season order.
 
     Args:
         grouping_level: Grouping level (e.g., "player/game")
@@ -953,6 +1020,7 @@ async def fetch_grouping_multi_season(
         enrich: Whether to apply default enrichments (default: True)
         enrichments: Specific enrichments to apply (overrides defaults)
         exclude_enrichments: Enrichments to exclude from defaults
+        ctx: Optional MCP Context; receives progress as each season completes
         **filters: Additional filters (player_id, team_id, etc.) - do NOT include season
 
     Returns:
@@ -974,52 +1042,58 @@ async def fetch_grouping_multi_season(
             enrich=False
         )
     """
-    import asyncio
-    import logging
-
-    logger = logging.getLogger(__name__)
-
     # Remove 'season' from filters if accidentally passed
     if 'season' in filters:
         logger.warning("Removing 'season' from filters - use seasons parameter instead")
         del filters['season']
 
-    # Create tasks for concurrent fetching
-    async def fetch_season(season_str: str) -> pd.DataFrame:
-        """Fetch data for a single season"""
-        try:
-            season_filters = {
-                **filters,
-                "season": season_str,
-                "enrich": enrich,
-                "enrichments": enrichments,
-                "exclude_enrichments": exclude_enrichments,
-            }
-            df = await fetch_grouping(grouping_level, **season_filters)
-            logger.info(f"Fetched {season_str}: {len(df)} rows")
-            return df
-        except Exception as e:
-            logger.error(f"Failed to fetch {season_str}: {e}")
-            return pd.DataFrame()  # Return empty DataFrame on error
-
-    # Execute all season fetches concurrently
     logger.info(f"Fetching {len(seasons)} seasons concurrently: {seasons}")
-    dfs = await asyncio.gather(*[fetch_season(s) for s in seasons])
-
-    # Filter out empty DataFrames
-    dfs = [df for df in dfs if not df.empty]
+    tables: Dict[str, pa.Table] = {}
+    frames: Dict[str, pd.DataFrame] = {}
+    completed = 0
+
+    async for season, table in stream_grouping_seasons(grouping_level, seasons, **filters):
+        completed += 1
+        if table is not None:
+            if enrich:
+                frames[season] = await _enrich_grouping(
+                    table.to_pandas(), grouping_level, enrichments, exclude_enrichments
+                )
+            else:
+                tables[season] = table
+        await _report_progress(ctx, completed, len(seasons), f"Fetched {season}")
 
-    if not dfs:
+    if not tables and not frames:
         logger.warning(f"No data found for any season: {seasons}")
         return pd.DataFrame()
 
-    # Concatenate all results
-    combined = pd.concat(dfs, ignore_index=True)
-    logger.info(f"Combined {len(dfs)} seasons: {len(combined)} total rows")
+    # Concatenate in requested season order (completion order varies)
+    if enrich:
+        ordered_frames = [frames[season] for season in seasons if season in frames]
+        combined = pd.concat(ordered_frames, ignore_index=True)
+    else:
+        ordered = [tables[season] for season in seasons if season in tables]
+        try:
+            combined = pa.concat_tables(ordered, promote_options="permissive").to_pandas()
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            logger.debug(f"Arrow concat failed ({e}), falling back to pandas")
+            combined = pd.concat([t.to_pandas() for t in ordered], ignore_index=True)
+    logger.info(f"Combined {len(tables) + len(frames)} seasons: {len(combined)} total rows")
 
     return combined
 
 
+async def _report_progress(ctx: Optional[Any], done: int, total: int, message: str):
+    """Send progress to an MCP Context, ignoring clients that can't receive it."""
+    if ctx is None:
+        return
+    try:
+        await ctx.report_progress(done, total)
+        await ctx.info(f"{message} ({done}/{total})")
+    except Exception as e:
+        logger.debug(f"Progress report failed: {e}")
+
+
 def get_grouping_info(grouping_level: Union[GroupingLevel, str]) -> GroupingMetadata:
     """
     Get metadata information about a grouping level
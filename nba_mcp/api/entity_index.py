@@ -0,0 +1,289 @@
+# nba_mcp/api/entity_index.py
+"""
+Prebuilt in-memory index for player and team resolution.
+
+Built once from the nba_api static player/team lists and reused by
+entity_resolver for every lookup:
+- Hash maps for full name, last name and accent-folded variants
+- Nickname / alternate spelling maps from name_variations
+- Trigram postings over folded names for substring and fuzzy top-k candidates
+
+Resolving a cold query touches a handful of dict entries and a few short
+posting lists instead of scanning all ~5,000 players.
+"""
+
+import heapq
+import logging
+import threading
+import time
+import unicodedata
+from collections import Counter
+from typing import Any, Dict, List, Optional, Set
+
+from nba_api.stats.static import players, teams
+
+from .name_variations import (
+    get_alternate_spelling,
+    get_player_nickname_search,
+    get_team_abbreviation,
+)
+
+logger = logging.getLogger(__name__)
+
+NGRAM_SIZE = 3
+
+
+def fold_accents(text: str) -> str:
+    """
+    Strip diacritical marks ("Dončić" → "Doncic", "Schröder" → "Schroder").
+
+    Args:
+        text: Any string
+
+    Returns:
+        Text with combining marks removed
+    """
+    if text.isascii():
+        return text
+    decomposed = unicodedata.normalize("NFD", text)
+    return "".join(char for char in decomposed if unicodedata.category(char) != "Mn")
+
+
+def ngrams(text: str, n: int = NGRAM_SIZE) -> Set[str]:
+    """Distinct character n-grams of text (empty if shorter than n)."""
+    return {text[i : i + n] for i in range(len(text) - n + 1)}
+
+
+class EntityIndex:
+    """
+    Read-only lookup structures over players and teams.
+
+    Lookup order for players mirrors the original linear resolver:
+    nickname → alternate spelling → exact full name → exact last name →
+    folded full/last name → first substring match (raw, then folded).
+    "First" always means lowest position in the nba_api player list.
+    """
+
+    def __init__(
+        self,
+        player_records: List[Dict[str, Any]],
+        team_records: List[Dict[str, Any]],
+    ):
+        self.players = player_records
+        self.teams = team_records
+
+        # Players
+        self._player_names: List[str] = []
+        self._player_folded: List[str] = []
+        self._player_full: Dict[str, int] = {}
+        self._player_last: Dict[str, int] = {}
+        self._player_folded_full: Dict[str, int] = {}
+        self._player_folded_last: Dict[str, int] = {}
+        self._postings: Dict[str, List[int]] = {}
+        self._gram_counts: List[int] = []
+
+        for position, player in enumerate(player_records):
+            full_name = f"{player['first_name']} {player['last_name']}".lower()
+            last_name = player["last_name"].lower()
+            folded = fold_accents(full_name)
+
+            self._player_names.append(full_name)
+            self._player_folded.append(folded)
+            self._player_full.setdefault(full_name, position)
+            self._player_last.setdefault(last_name, position)
+            self._player_folded_full.setdefault(folded, position)
+            self._player_folded_last.setdefault(fold_accents(last_name), position)
+
+            grams = ngrams(folded)
+            self._gram_counts.append(len(grams))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(position)
+
+        # Teams
+        self._team_abbreviation: Dict[str, int] = {}
+        self._team_keys: List[Dict[str, int]] = [{}, {}, {}, {}]
+        self._team_full_names: List[str] = []
+
+        for position, team in enumerate(team_records):
+            self._team_abbreviation.setdefault(team["abbreviation"], position)
+            keys = (
+                team["full_name"],
+                team["abbreviation"],
+                team["city"],
+                team["nickname"],
+            )
+            for lookup, key in zip(self._team_keys, keys):
+                lookup.setdefault(key.lower(), position)
+            self._team_full_names.append(team["full_name"].lower())
+
+    # ------------------------------------------------------------------
+    # Players
+    # ------------------------------------------------------------------
+
+    def lookup_player(self, query_lower: str) -> Optional[Dict[str, Any]]:
+        """
+        Resolve a lowercase query to a single player record.
+
+        Args:
+            query_lower: Lowercased player name, last name or nickname
+
+        Returns:
+            Player dict from nba_api, or None
+        """
+        search_name = get_player_nickname_search(query_lower)
+        if search_name != query_lower:
+            logger.debug(f"Player nickname resolved: '{query_lower}' → '{search_name}'")
+        query_lower = get_alternate_spelling(search_name)
+
+        for lookup in (self._player_full, self._player_last):
+            position = lookup.get(query_lower)
+            if position is not None:
+                return self.players[position]
+
+        folded = fold_accents(query_lower)
+        for lookup in (self._player_folded_full, self._player_folded_last):
+            position = lookup.get(folded)
+            if position is not None:
+                return self.players[position]
+
+        candidates = self._substring_positions(query_lower)
+        if candidates:
+            return self.players[candidates[0]]
+
+        candidates = self._substring_positions(folded, names=self._player_folded)
+        if candidates:
+            return self.players[candidates[0]]
+
+        return None
+
+    def player_candidates(self, query_lower: str) -> List[Dict[str, Any]]:
+        """All players whose lowercase full name contains query_lower, in list order."""
+        return [self.players[p] for p in self._substring_positions(query_lower)]
+
+    def fuzzy_players(self, query_lower: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Top players by trigram (Jaccard) similarity to query_lower.
+
+        Used when no name contains the query (typos such as "lebrn james").
+
+        Args:
+            query_lower: Lowercased query
+            limit: Maximum candidates returned
+
+        Returns:
+            Player dicts, most similar first
+        """
+        grams = ngrams(fold_accents(query_lower))
+        if not grams:
+            return []
+
+        shared: Counter = Counter()
+        for gram in grams:
+            postings = self._postings.get(gram)
+            if postings:
+                shared.update(postings)
+
+        query_count = len(grams)
+        gram_counts = self._gram_counts
+        best = heapq.nlargest(
+            limit,
+            shared.items(),
+            key=lambda item: item[1] / (query_count + gram_counts[item[0]] - item[1]),
+        )
+        return [self.players[position] for position, _ in best]
+
+    def _substring_positions(
+        self, query: str, names: Optional[List[str]] = None
+    ) -> List[int]:
+        """Positions of names containing query, ascending."""
+        names = self._player_names if names is None else names
+        grams = ngrams(fold_accents(query))
+
+        if not grams:
+            # Too short for the trigram index
+            return [position for position, name in enumerate(names) if query in name]
+
+        postings = [self._postings.get(gram) for gram in grams]
+        if not all(postings):
+            return []
+
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for other in postings[1:]:
+            candidates.intersection_update(other)
+            if not candidates:
+                return []
+
+        return [position for position in sorted(candidates) if query in names[position]]
+
+    # ------------------------------------------------------------------
+    # Teams
+    # ------------------------------------------------------------------
+
+    def lookup_team(self, query_lower: str) -> Optional[Dict[str, Any]]:
+        """
+        Resolve a lowercase query to a single team record.
+
+        Checks name_variations first, then full name, abbreviation, city and
+        nickname, then the first full name containing the query.
+        """
+        abbreviation = get_team_abbreviation(query_lower)
+        if abbreviation:
+            position = self._team_abbreviation.get(abbreviation)
+            if position is not None:
+                return self.teams[position]
+
+        for lookup in self._team_keys:
+            position = lookup.get(query_lower)
+            if position is not None:
+                return self.teams[position]
+
+        for position, full_name in enumerate(self._team_full_names):
+            if query_lower in full_name:
+                return self.teams[position]
+
+        return None
+
+    def stats(self) -> Dict[str, int]:
+        """Index sizes."""
+        return {
+            "players": len(self.players),
+            "teams": len(self.teams),
+            "ngrams": len(self._postings),
+        }
+
+
+# ============================================================================
+# GLOBAL INDEX
+# ============================================================================
+
+_entity_index: Optional[EntityIndex] = None
+_index_lock = threading.Lock()
+
+
+def build_entity_index() -> EntityIndex:
+    """Build (or rebuild) the global entity index from nba_api static data."""
+    global _entity_index
+    start = time.perf_counter()
+    index = EntityIndex(players.get_players(), teams.get_teams())
+    with _index_lock:
+        _entity_index = index
+    logger.info(
+        f"Entity index built: {len(index.players)} players, {len(index.teams)} teams "
+        f"in {(time.perf_counter() - start) * 1000:.0f}ms"
+    )
+    return index
+
+
+def get_entity_index() -> EntityIndex:
+    """Get the global entity index, building it on first use."""
+    if _entity_index is None:
+        return build_entity_index()
+    return _entity_index
+
+
+def reset_entity_index():
+    """Drop the global index (rebuilt on next use)."""
+    global _entity_index
+    with _index_lock:
+        _entity_index = None
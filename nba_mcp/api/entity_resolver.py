@@ -10,6 +10,7 @@ Resolves ambiguous queries to specific NBA entities:
 
 Features:
 - Fuzzy string matching with confidence scores
+- Prebuilt hash/trigram index (entity_index.py) for cold lookups
 - LRU cache for fast lookups (1000 entries)
 - Nickname/abbreviation support
 - Suggestion ranking for ambiguous queries
@@ -20,8 +21,7 @@ from difflib import SequenceMatcher
 from functools import lru_cache
 from typing import Any, Dict, List, Literal, Optional
 
-from nba_api.stats.static import players, teams
-
+from .entity_index import fold_accents, get_entity_index
 from .errors import EntityNotFoundError
 from .models import EntityReference
 from .name_variations import (
@@ -47,48 +47,13 @@ def _cached_player_lookup(query_lower: str) -> Optional[Dict[str, Any]]:
     Enhanced with:
     - Player nicknames ("King James" → "LeBron James", "Greek Freak" → "Giannis")
     - Alternate spellings ("Doncic" → "Dončić", "Jokic" → "Jokić")
-    - Fuzzy matching fallback
+    - Accent-folded matching ("Schroder" → "Schröder")
+    - Substring fallback served by the trigram index
+
+    The LRU cache only helps exact repeats; cold queries hit the prebuilt
+    EntityIndex (hash maps + trigram postings) instead of scanning all players.
     """
-    all_players = players.get_players()
-
-    # ========================================================================
-    # FAST PATH: Check nickname dictionary first
-    # ========================================================================
-    # Examples: "King James" → "LeBron James", "Greek Freak" → "Giannis"
-    search_name = get_player_nickname_search(query_lower)
-    if search_name != query_lower:
-        # Nickname found - search for the actual name
-        logger.debug(f"Player nickname resolved: '{query_lower}' → '{search_name}'")
-        query_lower = search_name
-
-    # ========================================================================
-    # ALTERNATE SPELLINGS: Handle diacritical marks
-    # ========================================================================
-    # Examples: "Doncic" → "Dončić", "Jokic" → "Jokić"
-    query_lower = get_alternate_spelling(query_lower)
-
-    # ========================================================================
-    # STANDARD PATH: Exact matches (original logic)
-    # ========================================================================
-
-    # Exact full name match
-    for player in all_players:
-        full_name = f"{player['first_name']} {player['last_name']}".lower()
-        if query_lower == full_name:
-            return player
-
-    # Last name exact match
-    for player in all_players:
-        if query_lower == player["last_name"].lower():
-            return player
-
-    # Fuzzy match (first partial match)
-    for player in all_players:
-        full_name = f"{player['first_name']} {player['last_name']}".lower()
-        if query_lower in full_name:
-            return player
-
-    return None
+    return get_entity_index().lookup_player(query_lower)
 
 
 @lru_cache(maxsize=1000)
@@ -97,51 +62,9 @@ def _cached_team_lookup(query_lower: str) -> Optional[Dict[str, Any]]:
     Cached team lookup by name/abbreviation (case-insensitive).
 
     Enhanced with comprehensive name variations for maximum flexibility.
-    Checks variations dictionary first (O(1)) before fuzzy matching.
+    Checks variations dictionary first (O(1)) before exact and substring matching.
     """
-    all_teams = teams.get_teams()
-
-    # ========================================================================
-    # FAST PATH: Check comprehensive variations dictionary first (O(1) lookup)
-    # ========================================================================
-    # Examples: "Dubs" → "GSW", "Clips" → "LAC", "Sixers" → "PHI"
-    abbreviation = get_team_abbreviation(query_lower)
-    if abbreviation:
-        # Found in variations dict - lookup by abbreviation
-        for team in all_teams:
-            if team["abbreviation"] == abbreviation:
-                return team
-
-    # ========================================================================
-    # STANDARD PATH: Exact matches (original logic - kept for non-variation queries)
-    # ========================================================================
-
-    # Exact full name match
-    for team in all_teams:
-        if query_lower == team["full_name"].lower():
-            return team
-
-    # Abbreviation match
-    for team in all_teams:
-        if query_lower == team["abbreviation"].lower():
-            return team
-
-    # City match
-    for team in all_teams:
-        if query_lower == team["city"].lower():
-            return team
-
-    # Nickname match
-    for team in all_teams:
-        if query_lower == team["nickname"].lower():
-            return team
-
-    # Fuzzy match on full name
-    for team in all_teams:
-        if query_lower in team["full_name"].lower():
-            return team
-
-    return None
+    return get_entity_index().lookup_team(query_lower)
 
 
 # ============================================================================
@@ -223,6 +146,10 @@ def resolve_player(
         confidence = 0.9  # Last name match (high confidence but not perfect)
     elif query_lower == player["first_name"].lower():
         confidence = 0.7  # First name only (lower confidence due to common first names)
+    elif fold_accents(query_lower) == fold_accents(full_name.lower()):
+        confidence = 1.0  # Full name without diacritics ("Dennis Schroder")
+    elif fold_accents(query_lower) == fold_accents(player["last_name"].lower()):
+        confidence = 0.9  # Last name without diacritics ("Schroder")
     else:
         # Fuzzy match for partial queries
         confidence = calculate_match_confidence(query, full_name)
@@ -335,15 +262,14 @@ def suggest_players(query: str, top_n: int = 5) -> List[EntityReference]:
     if isinstance(query, int):
         query = str(query)
 
-    all_players = players.get_players()
+    index = get_entity_index()
     query_lower = query.lower()
 
-    # Filter to candidates containing query
-    candidates = [
-        p
-        for p in all_players
-        if query_lower in f"{p['first_name']} {p['last_name']}".lower()
-    ]
+    # Filter to candidates containing query (trigram postings, no full scan)
+    candidates = index.player_candidates(query_lower)
+    if not candidates:
+        # Nothing contains the query (typo): take the closest trigram matches
+        candidates = index.fuzzy_players(query_lower, limit=max(top_n * 4, 20))
 
     # Rank by confidence
     ranked = rank_suggestions(
@@ -390,7 +316,7 @@ def suggest_teams(query: str, top_n: int = 5) -> List[EntityReference]:
     if isinstance(query, int):
         query = str(query)
 
-    all_teams = teams.get_teams()
+    all_teams = get_entity_index().teams
     query_lower = query.lower()
 
     # Filter to candidates
@@ -498,7 +424,7 @@ def resolve_entity(
 
 
 def clear_entity_cache():
-    """Clear LRU cache for entity lookups."""
+    """Clear LRU cache for entity lookups (the prebuilt index is kept)."""
     _cached_player_lookup.cache_clear()
     _cached_team_lookup.cache_clear()
     logger.info("Entity cache cleared")
@@ -509,4 +435,5 @@ def get_cache_info() -> Dict[str, Any]:
     return {
         "player_cache": _cached_player_lookup.cache_info()._asdict(),
         "team_cache": _cached_team_lookup.cache_info()._asdict(),
+        "index": get_entity_index().stats(),
     }
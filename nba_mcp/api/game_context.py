@@ -6,6 +6,7 @@ Provides rich game context by composing data from multiple NBA API sources:
 - Advanced statistics (offensive/defensive rating, net rating, pace)
 - Recent form (last N games, win/loss record, streaks)
 - Head-to-head record (season series, game results)
+- Scheduled meeting (from the cached schedule snapshot)
 - Narrative synthesis (markdown-formatted storylines)
 
 Features:
@@ -44,6 +45,7 @@ from nba_mcp.api.errors import (
     retry_with_backoff,
 )
 from nba_mcp.api.client import NBAApiClient
+from nba_mcp.api.schedule_store import get_schedule_store
 from nba_mcp.api.tools.nba_api_utils import normalize_season
 
 logger = logging.getLogger(__name__)
@@ -321,6 +323,51 @@ async def fetch_recent_form(
         )
 
 
+async def fetch_schedule_context(
+    team1_id: int, team2_id: int, date: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Find the teams' scheduled meeting on or after a date.
+
+    Answered from the schedule snapshot (one conditional GET at most per
+    refresh interval, then in-memory index lookups).
+
+    Args:
+        team1_id: First team ID
+        team2_id: Second team ID
+        date: YYYY-MM-DD (defaults to today)
+
+    Returns:
+        {
+            "game_id": str,
+            "game_date": str,
+            "tipoff_utc": str,
+            "home": str (abbreviation),
+            "away": str (abbreviation),
+            "arena": str,
+            "status": str,
+            "broadcasters": str or None
+        }
+        Empty dict if no meeting is scheduled
+    """
+    store = get_schedule_store()
+    await store.ensure_fresh()
+    game = store.next_game(team1_id, opponent=team2_id, on_or_after=date)
+    if game is None:
+        return {}
+
+    return {
+        "game_id": game.get("game_id"),
+        "game_date": game.get("game_date_local"),
+        "tipoff_utc": game.get("game_date_utc"),
+        "home": game.get("home_abbr"),
+        "away": game.get("away_abbr"),
+        "arena": game.get("arena"),
+        "status": game.get("game_status"),
+        "broadcasters": game.get("broadcasters_national"),
+    }
+
+
 @retry_with_backoff(max_retries=3)
 async def fetch_head_to_head(
     team1_id: int, team2_id: int, team1_abbrev: str, team2_abbrev: str, season: str
@@ -643,6 +690,7 @@ async def get_game_context(
     2. Team advanced stats (both teams)
     3. Recent form (last 10 games, both teams)
     4. Head-to-head record (this season)
+    5. Scheduled meeting (schedule snapshot, no API call when fresh)
 
     Then synthesizes into narrative summary.
 
@@ -650,7 +698,8 @@ async def get_game_context(
         team1_name: First team name (fuzzy matching supported)
         team2_name: Second team name (fuzzy matching supported)
         season: Season in YYYY-YY format (defaults to current)
-        date: Date in YYYY-MM-DD format (for future use, not yet implemented)
+        date: Date in YYYY-MM-DD format (scheduled meeting on or after this
+            date; defaults to today)
 
     Returns:
         {
@@ -665,6 +714,7 @@ async def get_game_context(
                 "team2": Dict
             },
             "head_to_head": Dict,
+            "schedule": Dict (scheduled meeting, empty if none),
             "narrative": str (markdown formatted),
             "metadata": {
                 "season": str,
@@ -720,6 +770,7 @@ async def get_game_context(
                 team2.name[:3].upper(),
                 season_str,
             ),
+            fetch_schedule_context(team1.entity_id, team2.entity_id, date),
             return_exceptions=True,
         )
 
@@ -729,6 +780,7 @@ async def get_game_context(
         form1 = results[2] if not isinstance(results[2], Exception) else {}
         form2 = results[3] if not isinstance(results[3], Exception) else {}
         h2h = results[4] if not isinstance(results[4], Exception) else {}
+        schedule = results[5] if not isinstance(results[5], Exception) else {}
 
         # Track component status
         if not isinstance(results[0], Exception):
@@ -761,6 +813,12 @@ async def get_game_context(
             components_failed.append("head_to_head")
             logger.warning(f"Head-to-head component failed: {results[4]}")
 
+        if not isinstance(results[5], Exception):
+            components_loaded.append("schedule")
+        else:
+            components_failed.append("schedule")
+            logger.warning(f"Schedule component failed: {results[5]}")
+
         # Synthesize narrative
         narrative = synthesize_narrative(
             team1_name=team1.name,
@@ -790,6 +848,7 @@ async def get_game_context(
             "advanced_stats": advanced_stats,
             "recent_form": {"team1": form1, "team2": form2},
             "head_to_head": h2h,
+            "schedule": schedule,
             "narrative": narrative,
             "metadata": {
                 "season": season_str,
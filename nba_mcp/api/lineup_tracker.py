@@ -9,6 +9,8 @@ Key Features:
 - Maintains 5-player lineup state for home/away teams
 - Handles edge cases (starting lineups, overtime, missing data)
 - Links lineups to LeagueDashLineups for advanced stats correlation
+- Columnar engine: substitutions found with vectorized masks, lineup state
+  forward-filled as integer player-ID arrays, stint boundaries emitted
 """
 
 from __future__ import annotations
@@ -18,6 +20,7 @@ import re
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
@@ -108,12 +111,12 @@ class LineupState:
     event_num: int = 0
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for DataFrame attachment"""
+        """Convert to dictionary for DataFrame attachment (lists are snapshots)"""
         return {
-            "CURRENT_LINEUP_HOME": self.home_lineup.player_names,
-            "CURRENT_LINEUP_AWAY": self.away_lineup.player_names,
-            "CURRENT_LINEUP_HOME_IDS": self.home_lineup.player_ids,
-            "CURRENT_LINEUP_AWAY_IDS": self.away_lineup.player_ids,
+            "CURRENT_LINEUP_HOME": list(self.home_lineup.player_names),
+            "CURRENT_LINEUP_AWAY": list(self.away_lineup.player_names),
+            "CURRENT_LINEUP_HOME_IDS": list(self.home_lineup.player_ids),
+            "CURRENT_LINEUP_AWAY_IDS": list(self.away_lineup.player_ids),
             "LINEUP_ID_HOME": self.home_lineup.lineup_id,
             "LINEUP_ID_AWAY": self.away_lineup.lineup_id,
             "LINEUP_DISPLAY_HOME": self.home_lineup.lineup_display,
@@ -121,6 +124,21 @@ class LineupState:
         }
 
 
+LINEUP_COLUMNS = [
+    "CURRENT_LINEUP_HOME",
+    "CURRENT_LINEUP_AWAY",
+    "CURRENT_LINEUP_HOME_IDS",
+    "CURRENT_LINEUP_AWAY_IDS",
+    "LINEUP_ID_HOME",
+    "LINEUP_ID_AWAY",
+    "LINEUP_DISPLAY_HOME",
+    "LINEUP_DISPLAY_AWAY",
+]
+
+# Width of the integer lineup arrays (players on court per team)
+LINEUP_SIZE = 5
+
+
 # ============================================================================
 # LINEUP TRACKER
 # ============================================================================
@@ -133,6 +151,11 @@ class LineupTracker:
     1. Initializing from starting lineups (period 1, first events)
     2. Processing substitution events (EVENT_TYPE = 8)
     3. Attaching current lineup to each event
+
+    process_play_by_play() uses a columnar engine: only substitution rows are
+    visited, and the lineup in effect for every other event is forward-filled
+    from integer state arrays. The original row-by-row path is kept as
+    process_play_by_play_rowwise() as the reference implementation.
     """
 
     def __init__(self, game_id: str):
@@ -144,20 +167,17 @@ class LineupTracker:
         # Track substitution history for debugging
         self.substitution_log: List[Dict[str, Any]] = []
 
-    def process_play_by_play(self, pbp_df: pd.DataFrame) -> pd.DataFrame:
-        """
-        Process play-by-play DataFrame and add lineup columns
+        # Stint boundaries (populated by the columnar engine)
+        self.stints: pd.DataFrame = pd.DataFrame()
 
-        Args:
-            pbp_df: Play-by-play DataFrame from PlayByPlayV3
+    def _prepare(self, pbp_df: pd.DataFrame) -> Tuple[pd.DataFrame, bool]:
+        """
+        Normalize columns and initialize teams/starters.
 
         Returns:
-            Enhanced DataFrame with lineup columns added
+            Tuple of (normalized DataFrame, ready) - ready is False when
+            required columns are missing (empty lineup columns already added)
         """
-        if pbp_df.empty:
-            logger.warning(f"Empty play-by-play DataFrame for game {self.game_id}")
-            return pbp_df
-
         # Normalize column names to lowercase for consistent access
         # NBA API V3 returns mixed case columns
         pbp_df = pbp_df.copy()
@@ -170,7 +190,7 @@ class LineupTracker:
             logger.error(f"Missing required columns in play-by-play: {missing}")
             logger.debug(f"Available columns: {list(pbp_df.columns)}")
             # Add empty lineup columns
-            return self._add_empty_lineup_columns(pbp_df)
+            return self._add_empty_lineup_columns(pbp_df), False
 
         # Initialize team IDs from first events
         self._initialize_team_ids(pbp_df)
@@ -178,6 +198,100 @@ class LineupTracker:
         # Initialize starting lineups (first 5 players in period 1)
         self._initialize_starting_lineups(pbp_df)
 
+        return pbp_df, True
+
+    def process_play_by_play(self, pbp_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Process play-by-play DataFrame and add lineup columns (columnar engine)
+
+        Substitution events are located with vectorized masks and applied in
+        order; every event then takes the lineup state of the most recent
+        substitution at or before it (forward fill over integer ID arrays).
+        Stint boundaries are stored on self.stints (see get_stints()).
+
+        Args:
+            pbp_df: Play-by-play DataFrame from PlayByPlayV3
+
+        Returns:
+            Enhanced DataFrame with lineup columns added (identical to
+            process_play_by_play_rowwise)
+        """
+        if pbp_df.empty:
+            logger.warning(f"Empty play-by-play DataFrame for game {self.game_id}")
+            return pbp_df
+
+        pbp_df, ready = self._prepare(pbp_df)
+        if not ready:
+            return pbp_df
+
+        n_events = len(pbp_df)
+        sub_positions = np.flatnonzero(self._substitution_mask(pbp_df))
+
+        # State 0 = starting lineups; state k = lineups after the k-th substitution
+        snapshots = [self._snapshot()]
+        periods = pbp_df["period"].to_numpy()
+        action_numbers = (
+            pbp_df["actionnumber"].to_numpy()
+            if "actionnumber" in pbp_df.columns
+            else np.zeros(n_events, dtype=np.int64)
+        )
+        descriptions = self._column_values(pbp_df, "description", "")
+        team_ids = self._column_values(pbp_df, "teamid", None)
+        person_ids = self._column_values(pbp_df, "personid", None)
+        names = self._player_name_values(pbp_df)
+
+        for pos in sub_positions:
+            self.state.period = periods[pos]
+            self.state.event_num = action_numbers[pos]
+            self._apply_substitution(
+                team_id=team_ids[pos],
+                person_id=person_ids[pos],
+                player_name=names[pos],
+                description=descriptions[pos],
+            )
+            snapshots.append(self._snapshot())
+
+        # Forward fill: each event uses the state of the last substitution at or before it
+        state_index = np.zeros(n_events, dtype=np.int64)
+        if len(sub_positions):
+            state_index[sub_positions] = 1
+            state_index = np.cumsum(state_index)
+
+        lineup_df = self._expand_snapshots(snapshots, state_index)
+        result_df = pd.concat([pbp_df.reset_index(drop=True), lineup_df], axis=1)
+
+        self.stints = self._build_stints(pbp_df, snapshots, state_index)
+
+        # Leave state pointing at the final event, as the row-wise path does
+        self.state.period = periods[-1]
+        self.state.event_num = action_numbers[-1]
+
+        logger.info(
+            f"Processed {n_events} events for game {self.game_id}, "
+            f"tracked {len(self.substitution_log)} substitutions, "
+            f"{len(self.stints)} stints"
+        )
+
+        return result_df
+
+    def process_play_by_play_rowwise(self, pbp_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Process play-by-play DataFrame row by row (reference implementation)
+
+        Args:
+            pbp_df: Play-by-play DataFrame from PlayByPlayV3
+
+        Returns:
+            Enhanced DataFrame with lineup columns added
+        """
+        if pbp_df.empty:
+            logger.warning(f"Empty play-by-play DataFrame for game {self.game_id}")
+            return pbp_df
+
+        pbp_df, ready = self._prepare(pbp_df)
+        if not ready:
+            return pbp_df
+
         # Process each event and track lineups
         lineup_data = []
         for idx, row in pbp_df.iterrows():
@@ -206,8 +320,7 @@ class LineupTracker:
     def _initialize_team_ids(self, pbp_df: pd.DataFrame):
         """Extract home and away team IDs from play-by-play data"""
         # Look for team IDs in first few events (columns are lowercase now)
-        for _, row in pbp_df.head(20).iterrows():
-            team_id = row.get("teamid")
+        for team_id in pbp_df["teamid"].head(20).tolist():
             if pd.notna(team_id):
                 team_id = int(team_id)
                 # Determine if home or away (heuristic: home team ID usually appears first in opening tip)
@@ -231,11 +344,11 @@ class LineupTracker:
         home_starters = set()
         away_starters = set()
 
-        for _, row in period_1.iterrows():
-            team_id = row.get("teamid")
-            player_id = row.get("personid")
-            player_name = row.get("playername") or row.get("playernamei", "")
+        team_ids = self._column_values(period_1, "teamid", None)
+        player_ids = self._column_values(period_1, "personid", None)
+        player_names = self._player_name_values(period_1)
 
+        for team_id, player_id, player_name in zip(team_ids, player_ids, player_names):
             if pd.isna(team_id) or pd.isna(player_id):
                 continue
 
@@ -293,8 +406,33 @@ class LineupTracker:
         - description: "SUB: Player IN for Player OUT"
         - OR separate fields for subType, personId (in), etc.
         """
-        description = row.get("description", "")
-        team_id = int(row.get("teamid", 0)) if pd.notna(row.get("teamid")) else 0
+        self._apply_substitution(
+            team_id=row.get("teamid"),
+            person_id=row.get("personid"),
+            player_name=row.get("playername") or row.get("playernamei", ""),
+            description=row.get("description", ""),
+        )
+
+    def _apply_substitution(
+        self,
+        team_id: Any,
+        person_id: Any,
+        player_name: Any,
+        description: Any,
+    ):
+        """
+        Apply one substitution to the current lineup state
+
+        Shared by the row-wise and columnar engines so both parse
+        substitutions identically.
+
+        Args:
+            team_id: Raw teamid value of the event
+            person_id: Raw personid value (player entering)
+            player_name: Name of the player entering
+            description: Event description ("SUB: Smith FOR Jones")
+        """
+        team_id = int(team_id) if pd.notna(team_id) else 0
 
         # Determine which team this substitution affects
         is_home = team_id == self.home_team_id
@@ -304,8 +442,8 @@ class LineupTracker:
         # Format examples:
         #   "SUB: Smith IN for Jones"
         #   "Smith enters for Jones"
-        in_player_id = int(row.get("personid", 0)) if pd.notna(row.get("personid")) else 0
-        in_player_name = row.get("playername") or row.get("playernamei", "")
+        in_player_id = int(person_id) if pd.notna(person_id) else 0
+        in_player_name = player_name
 
         # Try to extract OUT player from description
         out_player_id = None
@@ -341,6 +479,174 @@ class LineupTracker:
                 f"(in={in_player_id}, out={out_player_id})"
             )
 
+    # ------------------------------------------------------------------
+    # Columnar engine helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _substitution_mask(pbp_df: pd.DataFrame) -> np.ndarray:
+        """
+        Vectorized equivalent of _is_substitution over every event
+
+        Returns:
+            Boolean array, True for substitution events
+        """
+        mask = np.zeros(len(pbp_df), dtype=bool)
+
+        action_type = pbp_df["actiontype"]
+        if action_type.dtype == object or pd.api.types.is_string_dtype(action_type):
+            mask |= (
+                action_type.str.lower().str.contains("substitut", regex=False, na=False)
+            ).to_numpy(dtype=bool)
+
+        if "eventtype" in pbp_df.columns:
+            event_type = pd.to_numeric(pbp_df["eventtype"], errors="coerce").to_numpy(
+                dtype=float
+            )
+            with np.errstate(invalid="ignore"):
+                mask |= np.trunc(event_type) == 8
+
+        if "description" in pbp_df.columns:
+            description = pbp_df["description"]
+            if description.dtype == object or pd.api.types.is_string_dtype(description):
+                mask |= (
+                    description.str.upper().str.contains("SUB:", regex=False, na=False)
+                ).to_numpy(dtype=bool)
+
+        return mask
+
+    @staticmethod
+    def _column_values(pbp_df: pd.DataFrame, column: str, default: Any) -> np.ndarray:
+        """Column as an object array, or a constant array if the column is absent"""
+        if column in pbp_df.columns:
+            return pbp_df[column].to_numpy(dtype=object)
+        return np.full(len(pbp_df), default, dtype=object)
+
+    @classmethod
+    def _player_name_values(cls, pbp_df: pd.DataFrame) -> np.ndarray:
+        """Vectorized `row.get("playername") or row.get("playernamei", "")`"""
+        names = cls._column_values(pbp_df, "playername", None)
+        fallback = cls._column_values(pbp_df, "playernamei", "")
+        # Truthiness check mirrors the row-wise `or` (NaN is truthy there)
+        falsy = np.fromiter((not bool(v) for v in names), dtype=bool, count=len(names))
+        return np.where(falsy, fallback, names)
+
+    def _snapshot(self) -> Dict[str, Any]:
+        """Freeze the current lineup state"""
+        home, away = self.state.home_lineup, self.state.away_lineup
+        return {
+            "home_ids": tuple(home.player_ids),
+            "away_ids": tuple(away.player_ids),
+            "home_names": tuple(home.player_names),
+            "away_names": tuple(away.player_names),
+            "home_lineup_id": home.lineup_id,
+            "away_lineup_id": away.lineup_id,
+            "home_display": home.lineup_display,
+            "away_display": away.lineup_display,
+        }
+
+    @staticmethod
+    def _id_matrix(snapshots: List[Dict[str, Any]], key: str) -> np.ndarray:
+        """Stack per-state player IDs into an (n_states, 5) int64 array (0 = empty slot)"""
+        width = max([LINEUP_SIZE] + [len(snap[key]) for snap in snapshots])
+        matrix = np.zeros((len(snapshots), width), dtype=np.int64)
+        for i, snap in enumerate(snapshots):
+            matrix[i, : len(snap[key])] = snap[key]
+        return matrix
+
+    def _expand_snapshots(
+        self, snapshots: List[Dict[str, Any]], state_index: np.ndarray
+    ) -> pd.DataFrame:
+        """
+        Broadcast per-state lineups to every event
+
+        List-valued columns are built once per state and shared by every event
+        in that state (treat them as read-only).
+        """
+
+        def take(values: List[Any]) -> np.ndarray:
+            arr = np.empty(len(values), dtype=object)
+            arr[:] = values
+            return arr[state_index]
+
+        return pd.DataFrame(
+            {
+                "CURRENT_LINEUP_HOME": take([list(s["home_names"]) for s in snapshots]),
+                "CURRENT_LINEUP_AWAY": take([list(s["away_names"]) for s in snapshots]),
+                "CURRENT_LINEUP_HOME_IDS": take([list(s["home_ids"]) for s in snapshots]),
+                "CURRENT_LINEUP_AWAY_IDS": take([list(s["away_ids"]) for s in snapshots]),
+                "LINEUP_ID_HOME": take([s["home_lineup_id"] for s in snapshots]),
+                "LINEUP_ID_AWAY": take([s["away_lineup_id"] for s in snapshots]),
+                "LINEUP_DISPLAY_HOME": take([s["home_display"] for s in snapshots]),
+                "LINEUP_DISPLAY_AWAY": take([s["away_display"] for s in snapshots]),
+            }
+        )
+
+    def _build_stints(
+        self,
+        pbp_df: pd.DataFrame,
+        snapshots: List[Dict[str, Any]],
+        state_index: np.ndarray,
+    ) -> pd.DataFrame:
+        """
+        Compute stint boundaries: maximal runs of events with the same
+        home and away lineups within a period
+
+        Returns:
+            DataFrame with one row per stint (lineups, start/end event, clock)
+        """
+        n_events = len(pbp_df)
+        home_matrix = self._id_matrix(snapshots, "home_ids")
+        away_matrix = self._id_matrix(snapshots, "away_ids")
+        home_ids = home_matrix[state_index]
+        away_ids = away_matrix[state_index]
+        periods = pd.to_numeric(pbp_df["period"], errors="coerce").to_numpy()
+
+        changed = np.ones(n_events, dtype=bool)
+        if n_events > 1:
+            changed[1:] = (
+                (home_ids[1:] != home_ids[:-1]).any(axis=1)
+                | (away_ids[1:] != away_ids[:-1]).any(axis=1)
+                | (periods[1:] != periods[:-1])
+            )
+        starts = np.flatnonzero(changed)
+        ends = np.append(starts[1:] - 1, n_events - 1)
+
+        def at(name: str, positions: np.ndarray) -> np.ndarray:
+            if name in pbp_df.columns:
+                return pbp_df[name].to_numpy()[positions]
+            return np.full(len(positions), None, dtype=object)
+
+        start_states = state_index[starts]
+
+        return pd.DataFrame(
+            {
+                "GAME_ID": self.game_id,
+                "STINT_NUMBER": np.arange(1, len(starts) + 1),
+                "PERIOD": periods[starts],
+                "START_EVENT_NUM": at("actionnumber", starts),
+                "END_EVENT_NUM": at("actionnumber", ends),
+                "START_CLOCK": at("clock", starts),
+                "END_CLOCK": at("clock", ends),
+                "START_ROW": starts,
+                "END_ROW": ends,
+                "EVENT_COUNT": ends - starts + 1,
+                "LINEUP_ID_HOME": [snapshots[i]["home_lineup_id"] for i in start_states],
+                "LINEUP_ID_AWAY": [snapshots[i]["away_lineup_id"] for i in start_states],
+                "HOME_PLAYER_IDS": [list(snapshots[i]["home_ids"]) for i in start_states],
+                "AWAY_PLAYER_IDS": [list(snapshots[i]["away_ids"]) for i in start_states],
+            }
+        )
+
+    def get_stints(self) -> pd.DataFrame:
+        """
+        Get stint boundaries from the last process_play_by_play() call
+
+        Returns:
+            DataFrame with one row per stint (empty before processing)
+        """
+        return self.stints
+
     def _add_empty_lineup_columns(self, pbp_df: pd.DataFrame) -> pd.DataFrame:
         """Add empty lineup columns when tracking fails"""
         pbp_df["CURRENT_LINEUP_HOME"] = None
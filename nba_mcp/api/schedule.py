@@ -12,11 +12,12 @@ Features:
     - Filter by season, team, date range, season stage
     - Support for preseason, regular season, and playoffs
     - Idempotent upsert support for schedule updates
+    - Persistent, indexed snapshot revalidated with conditional GETs
+      (schedule_store.py)
 """
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from datetime import datetime, date
 from typing import Any, Dict, List, Optional, Union
@@ -292,9 +293,12 @@ def parse_schedule_to_dataframe(
 
     df = pd.DataFrame(rows)
 
-    # Sort by game date
+    # Sort by game date; game_id breaks ties so games sharing a tip-off time
+    # keep one order however the rows were filtered (ScheduleSnapshot relies on it)
     if not df.empty and "game_date_utc" in df.columns:
-        df = df.sort_values("game_date_utc").reset_index(drop=True)
+        df = df.sort_values(
+            ["game_date_utc", "game_id"], kind="stable", na_position="last"
+        ).reset_index(drop=True)
 
     logger.info(f"Parsed {len(df)} games from schedule data")
     return df
@@ -316,6 +320,10 @@ async def get_nba_schedule(
     - Filtering by season, team, date range, and season stage
     - Data normalization and sorting
 
+    The schedule is downloaded once and kept as an indexed snapshot
+    (see schedule_store); later calls revalidate it with ETag /
+    If-Modified-Since at most every few minutes and filter in memory.
+
     Args:
         season: Season identifier (optional, defaults to current season)
                 Can be:
@@ -375,8 +383,9 @@ async def get_nba_schedule(
         )
 
     Raises:
-        requests.RequestException: If fetching schedule data fails
-        ValueError: If season format is invalid
+        requests.RequestException: If fetching schedule data fails and no
+            snapshot is available
+        ValueError: If season or date format is invalid
     """
     # Determine season year
     if season is None:
@@ -422,21 +431,22 @@ async def get_nba_schedule(
                 f"Valid values: {valid_stages}"
             )
 
-    # Fetch raw data (run sync function in thread pool)
-    loop = asyncio.get_event_loop()
-    raw_data = await loop.run_in_executor(None, fetch_nba_schedule_raw, timeout)
+    # Serve from the indexed snapshot (revalidated with a conditional GET
+    # at most once per refresh interval)
+    from .schedule_store import get_schedule_store, parse_date_bound
+
+    date_from, date_to = parse_date_bound(date_from), parse_date_bound(date_to)
+    store = get_schedule_store()
+    await store.ensure_fresh(timeout)
 
-    # Parse and filter
-    df = parse_schedule_to_dataframe(
-        raw_data,
+    table = store.query(
         season_year=season_year,
         season_stage_id=season_stage_id,
-        team_abbr=team,
+        team=team,
         date_from=date_from,
         date_to=date_to,
     )
-
-    return df
+    return table.to_pandas()
 
 
 def format_schedule_markdown(df: pd.DataFrame, max_games: int = 100) -> str:
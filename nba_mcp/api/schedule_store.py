@@ -0,0 +1,523 @@
+# nba_mcp/api/schedule_store.py
+"""
+Persistent, indexed snapshot of the NBA CDN schedule.
+
+The scheduleLeagueV2 payload is several MB and changes a few times a day,
+so instead of downloading and re-parsing it on every call:
+- The parsed schedule is kept as one Arrow table (parquet on disk) together
+  with the response's ETag / Last-Modified
+- It is revalidated with a conditional GET at most once per refresh
+  interval; a 304 keeps the snapshot as-is
+- Hash indexes by team, date and game_id answer lookups without scanning
+
+If the CDN is unreachable, the last snapshot (memory or disk) is served.
+"""
+
+import asyncio
+import bisect
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import requests
+
+from .schedule import NBA_SCHEDULE_URL, parse_schedule_to_dataframe
+
+logger = logging.getLogger(__name__)
+
+# Seconds a snapshot is trusted before it is revalidated with the CDN
+DEFAULT_MIN_REFRESH_INTERVAL = 900.0
+
+DEFAULT_CACHE_DIR = Path("mcp_data/schedule")
+
+SNAPSHOT_FILE = "schedule.parquet"
+META_FILE = "schedule_meta.json"
+
+_EMPTY_ROWS = np.empty(0, dtype=np.int64)
+_SORT_KEYS = [("game_date_utc", "ascending"), ("game_id", "ascending")]
+
+
+def parse_date_bound(value: Optional[str]) -> Optional[str]:
+    """
+    Validate a YYYY-MM-DD date filter and return it zero-padded.
+
+    Raises:
+        ValueError: If the date is not in YYYY-MM-DD format
+    """
+    if value is None:
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date().isoformat()
+    except (TypeError, ValueError):
+        raise ValueError(
+            f"Invalid date format: {value}. Expected 'YYYY-MM-DD' (e.g., '2025-12-01')"
+        )
+
+
+def build_schedule_table(raw_data: Dict[str, Any]) -> pa.Table:
+    """
+    Parse the full (unfiltered) schedule JSON into an Arrow table sorted by tip-off.
+
+    Ties are broken by game_id and undated games go last, the same order
+    parse_schedule_to_dataframe uses, so lookups list games that share a
+    tip-off time exactly as the parser does.
+    """
+    table = pa.Table.from_pandas(
+        parse_schedule_to_dataframe(raw_data), preserve_index=False
+    )
+    if table.num_rows == 0 or "game_date_utc" not in table.column_names:
+        return table
+    return table.sort_by(_SORT_KEYS, null_placement="at_end")
+
+
+@dataclass(frozen=True)
+class ScheduleIndex:
+    """
+    One schedule table and its lookup indexes, built together.
+
+    Never mutated after construction: a refresh builds a new index and
+    publishes it with a single reference assignment, so a reader that grabs
+    the reference once always sees rows and indexes from the same table.
+    """
+
+    table: pa.Table
+    season_year: np.ndarray
+    season_stage_id: np.ndarray
+    team_rows: Dict[Any, np.ndarray]
+    date_rows: Dict[str, np.ndarray]
+    date_keys: List[str]
+    undated_rows: np.ndarray  # games without a tip-off time (kept under date filters)
+    game_rows: Dict[str, int]
+
+    @classmethod
+    def build(cls, table: pa.Table) -> "ScheduleIndex":
+        """Index a schedule table by team, date and game_id."""
+        num_rows = table.num_rows
+
+        def column(name: str) -> np.ndarray:
+            if name not in table.column_names:
+                return np.full(num_rows, None, dtype=object)
+            return table.column(name).to_numpy(zero_copy_only=False)
+
+        team_rows: Dict[Any, List[int]] = {}
+        for side in ("home", "away"):
+            for key_column in (f"{side}_abbr", f"{side}_id"):
+                for row, key in enumerate(column(key_column).tolist()):
+                    if key is not None and key == key:  # skip None/NaN
+                        team_rows.setdefault(key, []).append(row)
+
+        date_rows: Dict[str, List[int]] = {}
+        undated_rows: List[int] = []
+        for row, day in enumerate(column("game_date_local").tolist()):
+            if day:
+                date_rows.setdefault(day, []).append(row)
+            else:
+                undated_rows.append(row)
+
+        return cls(
+            table=table,
+            season_year=column("season_year"),
+            season_stage_id=column("season_stage_id"),
+            team_rows={key: np.array(sorted(rows)) for key, rows in team_rows.items()},
+            date_rows={key: np.array(rows) for key, rows in date_rows.items()},
+            date_keys=sorted(date_rows),
+            undated_rows=np.array(undated_rows, dtype=np.int64),
+            game_rows={
+                game_id: row
+                for row, game_id in enumerate(column("game_id").tolist())
+                if game_id is not None
+            },
+        )
+
+    def rows_between(
+        self, date_from: Optional[str], date_to: Optional[str]
+    ) -> np.ndarray:
+        """Rows dated within [date_from, date_to], plus undated games."""
+        start = bisect.bisect_left(self.date_keys, date_from) if date_from else 0
+        end = (
+            bisect.bisect_right(self.date_keys, date_to)
+            if date_to
+            else len(self.date_keys)
+        )
+        dated = (
+            [self.date_rows[day] for day in self.date_keys[start:end]]
+            if start < end
+            else []
+        )
+        if not dated and len(self.undated_rows) == 0:
+            return _EMPTY_ROWS
+        return np.sort(np.concatenate(dated + [self.undated_rows]))
+
+
+class ScheduleSnapshot:
+    """
+    The league schedule as an Arrow table plus lookup indexes.
+
+    Lookups (query, games_for_team, games_on, game, next_game) only read
+    memory; call ensure_fresh() first to revalidate with the CDN when the
+    snapshot is older than min_refresh_interval. Each lookup reads the
+    current ScheduleIndex once, so it is safe against a concurrent refresh.
+    """
+
+    def __init__(
+        self,
+        url: str = NBA_SCHEDULE_URL,
+        cache_dir: Optional[Path] = DEFAULT_CACHE_DIR,
+        min_refresh_interval: float = DEFAULT_MIN_REFRESH_INTERVAL,
+        session: Optional[requests.Session] = None,
+    ):
+        """
+        Initialize the snapshot, loading the last persisted copy if any.
+
+        Args:
+            url: Schedule JSON URL
+            cache_dir: Directory for the parquet snapshot and validators
+                (None keeps the snapshot in memory only)
+            min_refresh_interval: Seconds before the snapshot is revalidated
+            session: HTTP session (requests.Session-compatible)
+        """
+        self.url = url
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.min_refresh_interval = min_refresh_interval
+        self.session = session or requests.Session()
+
+        self._index: Optional[ScheduleIndex] = None
+        self.etag: Optional[str] = None
+        self.last_modified: Optional[str] = None
+        self.checked_at = 0.0  # last successful contact with the CDN (epoch)
+        self.last_status: Optional[str] = None
+
+        self.stats = {
+            "downloads": 0,
+            "not_modified": 0,
+            "fresh_hits": 0,
+            "stale_served": 0,
+            "errors": 0,
+            "disk_loads": 0,
+        }
+        self._lock = threading.Lock()
+        self._load_from_disk()
+
+    # ------------------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------------------
+
+    def is_fresh(self) -> bool:
+        """Whether the snapshot can be used without revalidating."""
+        return (
+            self.table is not None
+            and time.time() - self.checked_at < self.min_refresh_interval
+        )
+
+    def refresh(self, timeout: int = 30, force: bool = False) -> str:
+        """
+        Revalidate the snapshot with a conditional GET (blocking).
+
+        Concurrent callers share one request: whoever waits on the lock
+        finds the snapshot fresh and returns immediately.
+
+        Args:
+            timeout: Request timeout in seconds
+            force: Revalidate even if the snapshot is fresh
+
+        Returns:
+            "fresh", "not_modified", "downloaded" or "stale" (CDN error,
+            previous snapshot kept)
+
+        Raises:
+            requests.RequestException: If the CDN fails and there is no snapshot
+        """
+        with self._lock:
+            if not force and self.is_fresh():
+                return self._set_status("fresh")
+
+            headers = {}
+            if self.table is not None:
+                if self.etag:
+                    headers["If-None-Match"] = self.etag
+                if self.last_modified:
+                    headers["If-Modified-Since"] = self.last_modified
+
+            logger.info(f"Revalidating NBA schedule snapshot from {self.url}")
+            try:
+                response = self.session.get(self.url, headers=headers, timeout=timeout)
+                if response.status_code == 304:
+                    self.checked_at = time.time()
+                    self._write_meta()
+                    return self._set_status("not_modified")
+                response.raise_for_status()
+                raw_data = response.json()
+            except (requests.RequestException, ValueError) as e:
+                self.stats["errors"] += 1
+                if self.table is None:
+                    raise
+                # Retry after another interval rather than on every lookup
+                self.checked_at = time.time()
+                logger.warning(
+                    f"Schedule refresh failed, serving previous snapshot: {e}"
+                )
+                return self._set_status("stale")
+
+            self._install(build_schedule_table(raw_data))
+            self.etag = response.headers.get("ETag")
+            self.last_modified = response.headers.get("Last-Modified")
+            self.checked_at = time.time()
+            self._persist()
+            logger.info(f"Schedule snapshot updated: {self.table.num_rows} games")
+            return self._set_status("downloaded")
+
+    async def ensure_fresh(self, timeout: int = 30, force: bool = False) -> str:
+        """Revalidate in a worker thread if needed (see refresh())."""
+        if not force and self.is_fresh():
+            return self._set_status("fresh")
+        return await asyncio.to_thread(self.refresh, timeout, force)
+
+    def _set_status(self, status: str) -> str:
+        key = {
+            "fresh": "fresh_hits",
+            "downloaded": "downloads",
+            "stale": "stale_served",
+        }.get(status, status)
+        self.stats[key] += 1
+        self.last_status = status
+        return status
+
+    # ------------------------------------------------------------------
+    # Indexes
+    # ------------------------------------------------------------------
+
+    @property
+    def table(self) -> Optional[pa.Table]:
+        """The current schedule table (None until loaded)."""
+        index = self._index
+        return index.table if index is not None else None
+
+    def _install(self, table: pa.Table):
+        """Build indexes for a new table and publish both at once."""
+        self._index = ScheduleIndex.build(table)
+
+    def _current_index(self) -> ScheduleIndex:
+        index = self._index
+        if index is None:
+            raise RuntimeError(
+                "Schedule snapshot not loaded; call ensure_fresh() first"
+            )
+        return index
+
+    def select_rows(
+        self,
+        season_year: Optional[int] = None,
+        season_stage_id: Optional[int] = None,
+        team: Optional[Any] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+    ) -> np.ndarray:
+        """
+        Row positions matching the filters, in tip-off order.
+
+        Date filters keep games without a tip-off time (they sort last).
+
+        Args:
+            season_year: Season ending year (e.g., 2026 for 2025-26)
+            season_stage_id: 1=preseason, 2=regular, 4=playoffs
+            team: Team abbreviation (case-insensitive) or team ID
+            date_from: First game date, inclusive (YYYY-MM-DD)
+            date_to: Last game date, inclusive (YYYY-MM-DD)
+
+        Raises:
+            RuntimeError: If no snapshot has been loaded
+            ValueError: If a date is not in YYYY-MM-DD format
+        """
+        return self._select(
+            self._current_index(),
+            season_year,
+            season_stage_id,
+            team,
+            date_from,
+            date_to,
+        )
+
+    @staticmethod
+    def _select(
+        index: ScheduleIndex,
+        season_year: Optional[int] = None,
+        season_stage_id: Optional[int] = None,
+        team: Optional[Any] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+    ) -> np.ndarray:
+        date_from, date_to = parse_date_bound(date_from), parse_date_bound(date_to)
+        rows = None
+        if team is not None and team != "":
+            key = team.upper() if isinstance(team, str) else team
+            rows = index.team_rows.get(key, _EMPTY_ROWS)
+        if date_from or date_to:
+            dated = index.rows_between(date_from, date_to)
+            rows = (
+                dated
+                if rows is None
+                else np.intersect1d(rows, dated, assume_unique=True)
+            )
+        if rows is None:
+            rows = np.arange(index.table.num_rows)
+        if season_year is not None:
+            rows = rows[index.season_year[rows] == season_year]
+        if season_stage_id is not None:
+            rows = rows[index.season_stage_id[rows] == season_stage_id]
+        return rows
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def query(self, **filters) -> pa.Table:
+        """Games matching select_rows() filters as an Arrow table."""
+        index = self._current_index()
+        return index.table.take(self._select(index, **filters))
+
+    def games_for_team(self, team: Any) -> pa.Table:
+        """All games of a team (abbreviation or team ID)."""
+        return self.query(team=team)
+
+    def games_on(self, day: str) -> pa.Table:
+        """Games on a date (YYYY-MM-DD, UTC game date)."""
+        return self.query(date_from=day, date_to=day)
+
+    def game(self, game_id: str) -> Optional[Dict[str, Any]]:
+        """One game as a dict, or None if the game_id is unknown."""
+        index = self._current_index()
+        row = index.game_rows.get(game_id)
+        if row is None:
+            return None
+        return index.table.slice(row, 1).to_pylist()[0]
+
+    def next_game(
+        self,
+        team: Any,
+        opponent: Optional[Any] = None,
+        on_or_after: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        First game of a team (optionally against an opponent) on or after a date.
+
+        Args:
+            team: Team abbreviation or team ID
+            opponent: Opponent abbreviation or team ID (optional)
+            on_or_after: YYYY-MM-DD (defaults to today, UTC)
+
+        Returns:
+            Game dict, or None if no such game is scheduled
+        """
+        index = self._current_index()
+        day = on_or_after or datetime.utcnow().date().isoformat()
+        rows = self._select(index, team=team, date_from=day)
+        if opponent is not None:
+            rows = np.intersect1d(
+                rows, self._select(index, team=opponent), assume_unique=True
+            )
+        if len(rows) == 0:
+            return None
+        return index.table.slice(int(rows[0]), 1).to_pylist()[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Snapshot freshness, validators and refresh counters."""
+        table = self.table
+        return {
+            **self.stats,
+            "games": table.num_rows if table is not None else 0,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "age_seconds": time.time() - self.checked_at if table is not None else None,
+            "last_status": self.last_status,
+        }
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _write_meta(self):
+        if self.cache_dir is None:
+            return
+        meta = {
+            "url": self.url,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "checked_at": self.checked_at,
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_dir / f"{META_FILE}.tmp"
+            tmp_path.write_text(json.dumps(meta))
+            os.replace(tmp_path, self.cache_dir / META_FILE)
+        except OSError as e:
+            logger.warning(f"Could not persist schedule metadata: {e}")
+
+    def _persist(self):
+        if self.cache_dir is None:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_dir / f"{SNAPSHOT_FILE}.tmp"
+            pq.write_table(self.table, tmp_path)
+            os.replace(tmp_path, self.cache_dir / SNAPSHOT_FILE)
+        except (OSError, pa.ArrowException) as e:
+            logger.warning(f"Could not persist schedule snapshot: {e}")
+            return
+        self._write_meta()
+
+    def _load_from_disk(self):
+        if self.cache_dir is None:
+            return
+        snapshot_path = self.cache_dir / SNAPSHOT_FILE
+        meta_path = self.cache_dir / META_FILE
+        if not snapshot_path.exists() or not meta_path.exists():
+            return
+        try:
+            meta = json.loads(meta_path.read_text())
+            if meta.get("url") != self.url:
+                return
+            self._install(pq.read_table(snapshot_path))
+        except (OSError, ValueError, pa.ArrowException) as e:
+            logger.warning(
+                f"Ignoring unreadable schedule snapshot in {self.cache_dir}: {e}"
+            )
+            return
+        self.etag = meta.get("etag")
+        self.last_modified = meta.get("last_modified")
+        self.checked_at = float(meta.get("checked_at", 0.0))
+        self.stats["disk_loads"] += 1
+        logger.info(f"Loaded schedule snapshot from disk: {self.table.num_rows} games")
+
+
+# ============================================================================
+# GLOBAL SNAPSHOT
+# ============================================================================
+
+_schedule_store: Optional[ScheduleSnapshot] = None
+_store_lock = threading.Lock()
+
+
+def get_schedule_store() -> ScheduleSnapshot:
+    """Get the global schedule snapshot, created and loaded from disk on first use."""
+    global _schedule_store
+    if _schedule_store is None:
+        with _store_lock:
+            if _schedule_store is None:
+                _schedule_store = ScheduleSnapshot()
+    return _schedule_store
+
+
+def reset_schedule_store():
+    """Drop the global snapshot (recreated from disk on next use)."""
+    global _schedule_store
+    with _store_lock:
+        _schedule_store = None
@@ -9,16 +9,28 @@ Aggregates game-level data into season-level statistics with proper handling of:
 
 Supports multiple aggregation methods and handles edge cases like
 missing data, zero denominators, etc.
+
+League-wide requests are served by a grouped path: aggregate_season_table
+turns one league game log table into season rows for every player (or team)
+with a single Arrow group_by, and SeasonStatsStore materializes those tables
+per season (memory + parquet) so single-entity lookups are index hits.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
+import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Union
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 
 from nba_mcp.api.data_groupings import (
     AggregationMethod,
@@ -241,6 +253,45 @@ class SeasonStats:
 
         return result
 
+    @classmethod
+    def from_row(cls, row: Dict[str, Any], grouping_level: Optional[str] = None) -> SeasonStats:
+        """Build from one row of aggregate_season_table output"""
+        return cls(
+            season=row["SEASON_YEAR"],
+            player_id=row.get("PLAYER_ID"),
+            player_name=row.get("PLAYER_NAME"),
+            team_id=row.get("TEAM_ID"),
+            team_abbreviation=row.get("TEAM_ABBREVIATION"),
+            games_played=row["GP"],
+            wins=row["W"],
+            losses=row["L"],
+            minutes=row["MIN"],
+            points=row["PTS"],
+            rebounds=row["REB"],
+            assists=row["AST"],
+            steals=row["STL"],
+            blocks=row["BLK"],
+            turnovers=row["TOV"],
+            fgm=row["FGM"],
+            fga=row["FGA"],
+            fg_pct=row["FG_PCT"],
+            fg3m=row["FG3M"],
+            fg3a=row["FG3A"],
+            fg3_pct=row["FG3_PCT"],
+            ftm=row["FTM"],
+            fta=row["FTA"],
+            ft_pct=row["FT_PCT"],
+            ppg=row["PPG"],
+            rpg=row["RPG"],
+            apg=row["APG"],
+            spg=row["SPG"],
+            bpg=row["BPG"],
+            plus_minus=row["PLUS_MINUS"],
+            double_doubles=row["DD2"],
+            triple_doubles=row["TD3"],
+            grouping_level=grouping_level or row.get("_grouping_level", "player/season"),
+        )
+
 
 class SeasonAggregator:
     """
@@ -294,6 +345,17 @@ class SeasonAggregator:
                 "2023-24", player_id=2544, outcome="W", season_type="Playoffs"
             )
         """
+        # Full-season requests are answered from the materialized league table
+        if _is_full_season_query(additional_filters):
+            try:
+                return await self._player_season_from_store(
+                    season, player_id, team_id, additional_filters.get("season_type") or "Regular Season"
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Season stats table unavailable for {season} ({e}), aggregating fetched game logs"
+                )
+
         # Fetch game logs with comprehensive filtering
         grouping = GroupingFactory.create(GroupingLevel.PLAYER_GAME)
         filters = {"season": season, **additional_filters}
@@ -313,12 +375,9 @@ class SeasonAggregator:
 
         # Group by player if aggregating multiple players
         if player_id is None:
-            # Group by PLAYER_ID and aggregate each
-            results = []
-            for pid, player_games in game_logs.groupby("PLAYER_ID"):
-                season_stats = self._aggregate_games(player_games, season, grouping_level=grouping_level)
-                results.append(season_stats)
-            return results
+            # One grouped pass over all players
+            table = aggregate_season_table(game_logs, season, "player/season")
+            return [SeasonStats.from_row(row, grouping_level) for row in table.to_pylist()]
         else:
             # Aggregate single player
             return self._aggregate_games(game_logs, season, grouping_level=grouping_level)
@@ -357,6 +416,16 @@ class SeasonAggregator:
                 "2023-24", team_id=1610612747, PTS=(">=", 100)
             )
         """
+        if _is_full_season_query(additional_filters):
+            try:
+                return await self._team_season_from_store(
+                    season, team_id, additional_filters.get("season_type") or "Regular Season"
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Team season stats table unavailable for {season} ({e}), aggregating fetched game logs"
+                )
+
         grouping = GroupingFactory.create(GroupingLevel.TEAM_GAME)
         filters = {"season": season, **additional_filters}
         if team_id:
@@ -370,14 +439,52 @@ class SeasonAggregator:
 
         # Group by team if aggregating multiple teams
         if team_id is None:
-            results = []
-            for tid, team_games in game_logs.groupby("TEAM_ID"):
-                season_stats = self._aggregate_games(team_games, season, is_team=True)
-                results.append(season_stats)
-            return results
+            table = aggregate_season_table(game_logs, season, "team/season")
+            return [SeasonStats.from_row(row, "team/season") for row in table.to_pylist()]
         else:
             return self._aggregate_games(game_logs, season, is_team=True)
 
+    async def _player_season_from_store(
+        self,
+        season: str,
+        player_id: Optional[int],
+        team_id: Optional[int],
+        season_type: str
+    ) -> Union[Optional[SeasonStats], List[SeasonStats]]:
+        """Player season stats from the materialized league table (no per-player fetch)"""
+        store = get_season_stats_store()
+
+        if player_id and team_id:
+            row = await store.lookup(season, (player_id, team_id), "player/team/season", season_type)
+            return SeasonStats.from_row(row, "player/team/season") if row else None
+        if player_id:
+            row = await store.lookup(season, player_id, "player/season", season_type)
+            return SeasonStats.from_row(row, "player/season") if row else None
+
+        if team_id:
+            rows = [
+                row for row in await store.rows(season, "player/team/season", season_type)
+                if row["TEAM_ID"] == int(team_id)
+            ]
+        else:
+            rows = await store.rows(season, "player/season", season_type)
+        return [SeasonStats.from_row(row, "player/season") for row in rows]
+
+    async def _team_season_from_store(
+        self,
+        season: str,
+        team_id: Optional[int],
+        season_type: str
+    ) -> Union[Optional[SeasonStats], List[SeasonStats]]:
+        """Team season stats from the materialized league table"""
+        store = get_season_stats_store()
+
+        if team_id:
+            row = await store.lookup(season, team_id, "team/season", season_type)
+            return SeasonStats.from_row(row, "team/season") if row else None
+        rows = await store.rows(season, "team/season", season_type)
+        return [SeasonStats.from_row(row, "team/season") for row in rows]
+
     def _aggregate_games(
         self,
         game_logs: pd.DataFrame,
@@ -462,9 +569,18 @@ class SeasonAggregator:
             stats.spg = stats.steals / stats.games_played
             stats.bpg = stats.blocks / stats.games_played
 
-        # Special stats
-        stats.double_doubles = int(_aggregate_counting_stat(game_logs.get("DD2", pd.Series([0]))))
-        stats.triple_doubles = int(_aggregate_counting_stat(game_logs.get("TD3", pd.Series([0]))))
+        # Special stats (derived from double-digit categories if the logs lack them)
+        if "DD2" not in game_logs.columns and not is_team:
+            double_digits = sum(
+                ((game_logs[name].fillna(0) >= 10).astype(int)
+                 for name in DOUBLE_DIGIT_STATS if name in game_logs.columns),
+                pd.Series(0, index=game_logs.index),
+            )
+            stats.double_doubles = int((double_digits >= 2).sum())
+            stats.triple_doubles = int((double_digits >= 3).sum())
+        else:
+            stats.double_doubles = int(_aggregate_counting_stat(game_logs.get("DD2", pd.Series([0]))))
+            stats.triple_doubles = int(_aggregate_counting_stat(game_logs.get("TD3", pd.Series([0]))))
 
         return stats
 
@@ -490,16 +606,511 @@ class SeasonAggregator:
         if isinstance(group_by, str):
             group_by = [group_by]
 
+        is_team = "TEAM_ID" in group_by and "PLAYER_ID" not in group_by
+
+        # Known grouping keys take the single-pass grouped path
+        for level, keys in SEASON_GROUP_KEYS.items():
+            if keys == group_by:
+                result = aggregate_season_table(game_logs, None, level).to_pandas()
+                result["_grouping_level"] = "team/season" if is_team else "player/season"
+                result["_granularity"] = "season"
+                return result
+
         results = []
         for group_values, group_df in game_logs.groupby(group_by):
             season = group_df.iloc[0].get("SEASON_YEAR", "Unknown")
-            is_team = "TEAM_ID" in group_by and "PLAYER_ID" not in group_by
             season_stats = self._aggregate_games(group_df, season, is_team=is_team)
             results.append(season_stats.to_dict())
 
         return pd.DataFrame(results)
 
 
+# ============================================================================
+# GROUPED (LEAGUE-WIDE) AGGREGATION
+# ============================================================================
+
+# Group keys per grouping level
+SEASON_GROUP_KEYS: Dict[str, List[str]] = {
+    "player/season": ["PLAYER_ID"],
+    "player/team/season": ["PLAYER_ID", "TEAM_ID"],
+    "team/season": ["TEAM_ID"],
+}
+
+# Counting stats summed per group (the totals _aggregate_games computes)
+SEASON_TOTAL_STATS = [
+    "MIN", "PTS", "REB", "AST", "STL", "BLK", "TOV", "PLUS_MINUS",
+    "FGM", "FGA", "FG3M", "FG3A", "FTM", "FTA",
+]
+
+# Per-game averages: output column -> season total
+PER_GAME_STATS: Dict[str, str] = {
+    "PPG": "PTS",
+    "RPG": "REB",
+    "APG": "AST",
+    "SPG": "STL",
+    "BPG": "BLK",
+}
+
+# Columns of aggregate_season_table, in SeasonStats.to_dict order
+SEASON_TABLE_COLUMNS = [
+    "SEASON_YEAR", "PLAYER_ID", "PLAYER_NAME", "TEAM_ID", "TEAM_ABBREVIATION",
+    "GP", "W", "L", "MIN", "PTS", "REB", "AST", "STL", "BLK", "TOV",
+    "FGM", "FGA", "FG_PCT", "FG3M", "FG3A", "FG3_PCT", "FTM", "FTA", "FT_PCT",
+    "PPG", "RPG", "APG", "SPG", "BPG", "PLUS_MINUS", "DD2", "TD3",
+]
+
+# Categories that count towards a double-double / triple-double
+DOUBLE_DIGIT_STATS = ["PTS", "REB", "AST", "STL", "BLK"]
+
+
+def _stat_values(table: pa.Table, name: str) -> np.ndarray:
+    """Column as float64 with nulls/NaN as 0 (missing columns are all 0)"""
+    if name not in table.column_names:
+        return np.zeros(table.num_rows)
+    values = table[name].cast(pa.float64()).to_numpy()
+    return np.nan_to_num(values, nan=0.0)
+
+
+def _safe_ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Element-wise ratio that is 0.0 where the denominator is 0"""
+    out = np.zeros(len(numerator))
+    np.divide(numerator, denominator, out=out, where=denominator != 0)
+    return out
+
+
+def aggregate_season_table(
+    game_logs: Union[pa.Table, pd.DataFrame],
+    season: Optional[str] = None,
+    grouping_level: str = "player/season",
+) -> pa.Table:
+    """
+    Aggregate league game logs into season stats for every group in one pass
+
+    Produces the same values as _aggregate_games applied group by group:
+    summed totals, percentages recalculated from totals, per-game averages,
+    W/L and DD2/TD3 counts, with identifiers taken from each group's first
+    row. Player logs without DD2/TD3 columns have them derived from
+    double-digit PTS/REB/AST/STL/BLK games.
+
+    Args:
+        game_logs: Game-level rows (league_player_games or league_team_games)
+        season: Season label; if None, each group's first SEASON_YEAR is used
+        grouping_level: "player/season", "player/team/season" or "team/season"
+
+    Returns:
+        Arrow table with SEASON_TABLE_COLUMNS, one row per group, sorted by key
+    """
+    if grouping_level not in SEASON_GROUP_KEYS:
+        raise ValueError(
+            f"Unknown grouping level: {grouping_level}. "
+            f"Available: {', '.join(SEASON_GROUP_KEYS)}"
+        )
+    if isinstance(game_logs, pd.DataFrame):
+        game_logs = pa.Table.from_pandas(game_logs, preserve_index=False)
+
+    keys = SEASON_GROUP_KEYS[grouping_level]
+    missing = [key for key in keys if key not in game_logs.column_names]
+    if missing:
+        raise ValueError(f"Game logs are missing group key(s): {', '.join(missing)}")
+
+    is_team = grouping_level == "team/season"
+    n = game_logs.num_rows
+
+    columns: Dict[str, Any] = {key: game_logs[key].cast(pa.int64()) for key in keys}
+    columns["_GAME"] = np.ones(n)
+    for name in SEASON_TOTAL_STATS:
+        columns[name] = _stat_values(game_logs, name)
+
+    if "WL" in game_logs.column_names:
+        for outcome in ("W", "L"):
+            hits = pc.fill_null(pc.equal(game_logs["WL"], outcome), False)
+            columns[outcome] = hits.to_numpy(zero_copy_only=False).astype(np.float64)
+    else:
+        columns["W"] = columns["L"] = np.zeros(n)
+
+    if "DD2" in game_logs.column_names or is_team:
+        columns["DD2"] = _stat_values(game_logs, "DD2")
+        columns["TD3"] = _stat_values(game_logs, "TD3")
+    else:
+        double_digits = sum(
+            (_stat_values(game_logs, name) >= 10).astype(np.int64) for name in DOUBLE_DIGIT_STATS
+        )
+        columns["DD2"] = (double_digits >= 2).astype(np.float64)
+        columns["TD3"] = (double_digits >= 3).astype(np.float64)
+
+    summed = ["_GAME", *SEASON_TOTAL_STATS, "W", "L", "DD2", "TD3"]
+    label_defaults: Dict[str, Any] = {"TEAM_ABBREVIATION": ""}
+    if not is_team:
+        label_defaults = {"PLAYER_NAME": "", "TEAM_ID": 0, **label_defaults}
+    if season is None:
+        label_defaults["SEASON_YEAR"] = "Unknown"
+    labels = [name for name in label_defaults if name not in keys]
+    for name in labels:
+        if name in game_logs.column_names:
+            columns[name] = game_logs[name]
+        else:
+            columns[name] = pa.array([label_defaults[name]] * n)
+
+    grouped = (
+        pa.table(columns)
+        .group_by(keys, use_threads=False)
+        .aggregate([(name, "sum") for name in summed] + [(name, "first") for name in labels])
+        .sort_by([(key, "ascending") for key in keys])
+    )
+    size = grouped.num_rows
+    total = {name: grouped[f"{name}_sum"].to_numpy() for name in summed}
+    games = total["_GAME"]
+
+    def label(name: str) -> Any:
+        return grouped[name] if name in keys else grouped[f"{name}_first"]
+
+    out: Dict[str, Any] = {
+        "SEASON_YEAR": pa.array([season] * size, pa.string()) if season is not None else label("SEASON_YEAR"),
+        "PLAYER_ID": pa.nulls(size, pa.int64()) if is_team else label("PLAYER_ID"),
+        "PLAYER_NAME": pa.nulls(size, pa.string()) if is_team else label("PLAYER_NAME"),
+        "TEAM_ID": label("TEAM_ID") if "TEAM_ID" in keys else label("TEAM_ID").cast(pa.int64()),
+        "TEAM_ABBREVIATION": label("TEAM_ABBREVIATION"),
+        "GP": games.astype(np.int64),
+        "W": total["W"].astype(np.int64),
+        "L": total["L"].astype(np.int64),
+        "FG_PCT": _safe_ratio(total["FGM"], total["FGA"]),
+        "FG3_PCT": _safe_ratio(total["FG3M"], total["FG3A"]),
+        "FT_PCT": _safe_ratio(total["FTM"], total["FTA"]),
+        "DD2": total["DD2"].astype(np.int64),
+        "TD3": total["TD3"].astype(np.int64),
+    }
+    for name in SEASON_TOTAL_STATS:
+        out[name] = total[name]
+    for name, source in PER_GAME_STATS.items():
+        out[name] = _safe_ratio(total[source], games)
+
+    return pa.table({name: out[name] for name in SEASON_TABLE_COLUMNS})
+
+
+# Stats rank_season_table can rank on: season totals plus recalculated rates
+RANKABLE_RATE_STATS = ["FG_PCT", "FG3_PCT", "FT_PCT"]
+
+
+def rank_season_table(
+    table: pa.Table,
+    stat: str,
+    top_n: int = 10,
+    per_game: bool = True,
+    min_games: int = 0,
+    ascending: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Rank the rows of a season table by one stat
+
+    Args:
+        table: aggregate_season_table output
+        stat: Counting stat (PTS, REB, ..., DD2, TD3) or FG_PCT/FG3_PCT/FT_PCT
+        top_n: Number of entries to return
+        per_game: Rank counting stats per game instead of season totals
+        min_games: Minimum games played to qualify
+        ascending: Rank lowest first
+
+    Returns:
+        List of {"rank", "player_id", "player", "team", "games", "value"} dicts
+
+    Raises:
+        ValueError: If the stat is not in the table
+    """
+    stat = stat.upper()
+    counting = SEASON_TOTAL_STATS + ["W", "L", "DD2", "TD3"]
+    if stat not in counting and stat not in RANKABLE_RATE_STATS:
+        raise ValueError(
+            f"Cannot rank by {stat}. Available: {', '.join(counting + RANKABLE_RATE_STATS)}"
+        )
+
+    if min_games > 0:
+        table = table.filter(pc.greater_equal(table["GP"], min_games))
+
+    values = table[stat].to_numpy().astype(np.float64)
+    if per_game and stat in counting:
+        values = _safe_ratio(values, table["GP"].to_numpy().astype(np.float64))
+
+    order = np.argsort(values if ascending else -values, kind="stable")[:top_n]
+    is_team = table["PLAYER_ID"].null_count == table.num_rows
+    names = table["TEAM_ABBREVIATION" if is_team else "PLAYER_NAME"].to_pylist()
+    ids = table["PLAYER_ID"].to_pylist()
+    teams = table["TEAM_ABBREVIATION"].to_pylist()
+    games = table["GP"].to_pylist()
+
+    return [
+        {
+            "rank": rank,
+            "player_id": ids[i],
+            "player": names[i],
+            "team": teams[i],
+            "games": games[i],
+            "value": float(values[i]),
+        }
+        for rank, i in enumerate(order.tolist(), 1)
+    ]
+
+
+# ============================================================================
+# SEASON STATS STORE
+# ============================================================================
+
+DEFAULT_SEASON_STATS_CACHE_DIR = Path("mcp_data/season_stats")
+
+# Seconds a materialized table is trusted before it is rebuilt
+DEFAULT_SEASON_STATS_MAX_AGE = 6 * 3600.0
+
+# League game log source per grouping level (player levels share one fetch)
+_LEVEL_SOURCES: Dict[str, str] = {
+    "player/season": "player",
+    "player/team/season": "player",
+    "team/season": "team",
+}
+_SOURCE_ENDPOINTS: Dict[str, str] = {
+    "player": "league_player_games",
+    "team": "league_team_games",
+}
+
+LeagueLogFetcher = Callable[[str, str, str], Awaitable[Union[pa.Table, pd.DataFrame]]]
+
+
+async def _fetch_league_game_logs(source: str, season: str, season_type: str) -> pa.Table:
+    """One league-wide game log request through unified_fetch"""
+    from nba_mcp.data.unified_fetch import unified_fetch
+
+    result = await unified_fetch(
+        endpoint=_SOURCE_ENDPOINTS[source],
+        params={"season": season, "season_type": season_type},
+    )
+    return result.data
+
+
+def _is_full_season_query(filters: Dict[str, Any]) -> bool:
+    """True if no filter other than season_type narrows the games counted"""
+    return all(value is None or name == "season_type" for name, value in filters.items())
+
+
+class SeasonStatsStore:
+    """
+    Materialized per-season stats tables with an ID index
+
+    One league game log fetch builds every grouping level from that source
+    (player/season and player/team/season share the player logs). Tables are
+    kept in memory and persisted as parquet; concurrent requests for the same
+    season share one build.
+
+    Usage:
+        store = get_season_stats_store()
+        row = await store.lookup("2023-24", 2544)
+        rows = await store.rows("2023-24", "team/season")
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = DEFAULT_SEASON_STATS_CACHE_DIR,
+        max_age: float = DEFAULT_SEASON_STATS_MAX_AGE,
+        fetch_func: Optional[LeagueLogFetcher] = None,
+    ):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.max_age = max_age
+        self._fetch_func = fetch_func or _fetch_league_game_logs
+
+        self._tables: Dict[Tuple[str, str, str], pa.Table] = {}
+        self._built_at: Dict[Tuple[str, str, str], float] = {}
+        self._rows: Dict[Tuple[str, str, str], List[Dict[str, Any]]] = {}
+        self._indexes: Dict[Tuple[str, str, str], Dict[Tuple[int, ...], int]] = {}
+        self._locks: Dict[Tuple[str, str, str], asyncio.Lock] = {}
+
+        self.stats = {
+            "builds": 0,
+            "disk_loads": 0,
+            "memory_hits": 0,
+            "lookups": 0,
+            "lookup_misses": 0,
+        }
+
+    def _path(self, key: Tuple[str, str, str]) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        season, season_type, level = key
+        slug = season_type.lower().replace(" ", "_")
+        return self.cache_dir / f"{season}_{slug}_{level.replace('/', '_')}.parquet"
+
+    def _cached(self, key: Tuple[str, str, str]) -> Optional[pa.Table]:
+        if key in self._tables and time.time() - self._built_at[key] < self.max_age:
+            return self._tables[key]
+        return None
+
+    def _install(self, key: Tuple[str, str, str], table: pa.Table, built_at: float) -> None:
+        group_keys = SEASON_GROUP_KEYS[key[2]]
+        rows = table.to_pylist()
+        self._tables[key] = table
+        self._built_at[key] = built_at
+        self._rows[key] = rows
+        self._indexes[key] = {
+            tuple(int(row[k]) for k in group_keys): i for i, row in enumerate(rows)
+        }
+
+    def _load_from_disk(self, key: Tuple[str, str, str]) -> bool:
+        path = self._path(key)
+        if path is None or not path.exists():
+            return False
+        try:
+            table = pq.read_table(path)
+            metadata = table.schema.metadata or {}
+            built_at = float(metadata.get(b"built_at", path.stat().st_mtime))
+            if time.time() - built_at >= self.max_age:
+                return False
+            self._install(key, table, built_at)
+            self.stats["disk_loads"] += 1
+            return True
+        except Exception as e:
+            logger.warning(f"Could not load season stats from {path}: {e}")
+            return False
+
+    def _persist(self, key: Tuple[str, str, str], table: pa.Table, built_at: float) -> None:
+        path = self._path(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            table = table.replace_schema_metadata(
+                {**(table.schema.metadata or {}), b"built_at": str(built_at).encode()}
+            )
+            tmp_path = path.with_suffix(".parquet.tmp")
+            pq.write_table(table, tmp_path)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not persist season stats to {path}: {e}")
+
+    async def get_table(
+        self,
+        season: str,
+        grouping_level: str = "player/season",
+        season_type: str = "Regular Season",
+        refresh: bool = False,
+    ) -> pa.Table:
+        """
+        Season stats table for one grouping level, building it if needed
+
+        Args:
+            season: Season in YYYY-YY format
+            grouping_level: "player/season", "player/team/season" or "team/season"
+            season_type: "Regular Season", "Playoffs", etc.
+            refresh: Rebuild from fresh game logs even if a table is stored
+
+        Returns:
+            Arrow table from aggregate_season_table
+        """
+        if grouping_level not in _LEVEL_SOURCES:
+            raise ValueError(
+                f"Unknown grouping level: {grouping_level}. "
+                f"Available: {', '.join(_LEVEL_SOURCES)}"
+            )
+        key = (season, season_type, grouping_level)
+        table = None if refresh else self._cached(key)
+        if table is not None:
+            self.stats["memory_hits"] += 1
+            return table
+
+        source = _LEVEL_SOURCES[grouping_level]
+        lock = self._locks.setdefault((season, season_type, source), asyncio.Lock())
+        async with lock:
+            table = None if refresh else self._cached(key)
+            if table is not None:
+                self.stats["memory_hits"] += 1
+                return table
+            if not refresh and self._load_from_disk(key):
+                return self._tables[key]
+
+            start = time.perf_counter()
+            game_logs = await self._fetch_func(source, season, season_type)
+            built_at = time.time()
+            for level, level_source in _LEVEL_SOURCES.items():
+                if level_source != source:
+                    continue
+                level_key = (season, season_type, level)
+                level_table = aggregate_season_table(game_logs, season, level)
+                self._install(level_key, level_table, built_at)
+                self._persist(level_key, level_table, built_at)
+            self.stats["builds"] += 1
+
+            logger.info(
+                f"Built {source} season stats for {season} {season_type} from "
+                f"{len(game_logs)} game rows in {(time.perf_counter() - start) * 1000:.0f}ms"
+            )
+            return self._tables[key]
+
+    async def lookup(
+        self,
+        season: str,
+        entity_id: Union[int, Sequence[int]],
+        grouping_level: str = "player/season",
+        season_type: str = "Regular Season",
+    ) -> Optional[Dict[str, Any]]:
+        """
+        One row by ID (PLAYER_ID, TEAM_ID, or (PLAYER_ID, TEAM_ID) for player/team/season)
+
+        Returns:
+            Row as a dict, or None if the entity has no games that season
+        """
+        await self.get_table(season, grouping_level, season_type)
+        key = (season, season_type, grouping_level)
+        ids = tuple(int(i) for i in entity_id) if isinstance(entity_id, (list, tuple)) else (int(entity_id),)
+
+        self.stats["lookups"] += 1
+        position = self._indexes[key].get(ids)
+        if position is None:
+            self.stats["lookup_misses"] += 1
+            return None
+        return dict(self._rows[key][position])
+
+    async def rows(
+        self,
+        season: str,
+        grouping_level: str = "player/season",
+        season_type: str = "Regular Season",
+    ) -> List[Dict[str, Any]]:
+        """All rows of a season table as dicts"""
+        await self.get_table(season, grouping_level, season_type)
+        return [dict(row) for row in self._rows[(season, season_type, grouping_level)]]
+
+    def invalidate(self, season: Optional[str] = None) -> None:
+        """Drop materialized tables for one season (or all) from memory and disk"""
+        for key in [k for k in self._tables if season is None or k[0] == season]:
+            for cache in (self._tables, self._built_at, self._rows, self._indexes):
+                cache.pop(key, None)
+        if self.cache_dir is not None and self.cache_dir.exists():
+            pattern = f"{season}_*.parquet" if season else "*.parquet"
+            for path in self.cache_dir.glob(pattern):
+                path.unlink(missing_ok=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Store statistics"""
+        return {
+            **self.stats,
+            "tables": [" ".join(key) for key in self._tables],
+            "rows": sum(t.num_rows for t in self._tables.values()),
+        }
+
+
+# Global store instance
+_season_stats_store: Optional[SeasonStatsStore] = None
+
+
+def get_season_stats_store() -> SeasonStatsStore:
+    """Get or create the global season stats store"""
+    global _season_stats_store
+    if _season_stats_store is None:
+        _season_stats_store = SeasonStatsStore()
+    return _season_stats_store
+
+
+def reset_season_stats_store() -> None:
+    """Reset the global season stats store (for testing)"""
+    global _season_stats_store
+    _season_stats_store = None
+
+
 # ============================================================================
 # CONVENIENCE FUNCTIONS
 # ============================================================================
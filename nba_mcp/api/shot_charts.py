@@ -19,17 +19,31 @@ Shot Zones:
 - Short Mid-Range: 8-16 feet
 - Long Mid-Range: 16-23.75 feet (non-3PT)
 - Three-Point: >= 23.75 feet (corner 3 = 22 feet)
+
+League Shot Store:
+- One ShotChartDetail request (team_id=0, player_id=0) per season holds every
+  field goal attempt; player and team charts are position slices of it
+- Persisted as parquet partitioned by season and season type
+- Hexbin and zone summaries are np.bincount kernels over the sliced arrays
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Literal, Optional
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Literal, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from nba_api.stats.endpoints import shotchartdetail
 
 from .entity_resolver import resolve_entity
 from .errors import (
+    CircuitBreakerOpenError,
     EntityNotFoundError,
     InvalidParameterError,
     NBAApiError,
@@ -90,10 +104,12 @@ async def fetch_shot_chart_data(
             f"date_from={date_from}, date_to={date_to}"
         )
 
-        # ShotChartDetail requires both team_id and player_id
+        # ShotChartDetail requires both team_id and player_id; the request
+        # blocks, so it runs in a worker thread
         if entity_type == "player":
             # For players, set team_id to 0 (all teams)
-            shot_data = shotchartdetail.ShotChartDetail(
+            shot_data = await asyncio.to_thread(
+                shotchartdetail.ShotChartDetail,
                 team_id=0,
                 player_id=entity_id,
                 season_nullable=season,
@@ -104,7 +120,8 @@ async def fetch_shot_chart_data(
             )
         else:
             # For teams, set player_id to 0 (all players)
-            shot_data = shotchartdetail.ShotChartDetail(
+            shot_data = await asyncio.to_thread(
+                shotchartdetail.ShotChartDetail,
                 team_id=entity_id,
                 player_id=0,
                 season_nullable=season,
@@ -195,6 +212,136 @@ def validate_shot_coordinates(df: pd.DataFrame) -> pd.DataFrame:
     return valid_df
 
 
+# ============================================================================
+# Aggregation Kernels
+# ============================================================================
+
+SHOT_ZONES = ("paint", "short_mid", "long_mid", "three")
+
+# Zone distance edges in feet: paint < 8 <= short_mid < 16 <= long_mid < 23.75
+ZONE_DISTANCE_EDGES = np.array([8.0, 16.0, 23.75])
+
+
+def hexbin_from_arrays(
+    loc_x: np.ndarray,
+    loc_y: np.ndarray,
+    made: np.ndarray,
+    distance: Optional[np.ndarray] = None,
+    grid_size: int = 10,
+    min_shots: int = 5,
+) -> List[Dict[str, Any]]:
+    """
+    Bin shots into grid cells with np.bincount (one pass per statistic).
+
+    Cells are numbered row-major over the occupied bin range, so bins come
+    out ordered by (bin_x, bin_y) like a groupby on both coordinates.
+
+    Args:
+        loc_x: Shot X coordinates (tenths of feet)
+        loc_y: Shot Y coordinates (tenths of feet)
+        made: 1 for makes, 0 for misses
+        distance: Shot distances in feet (optional, adds distance_avg)
+        grid_size: Size of each bin in tenths of feet
+        min_shots: Minimum shots per bin to include
+
+    Returns:
+        List of bins in the aggregate_to_hexbin format
+    """
+    if len(loc_x) == 0:
+        return []
+
+    bin_x = np.floor_divide(loc_x + 250, grid_size).astype(np.int64)
+    bin_y = np.floor_divide(loc_y + 52.5, grid_size).astype(np.int64)
+    x0, y0 = bin_x.min(), bin_y.min()
+    height = int(bin_y.max() - y0 + 1)
+    size = int(bin_x.max() - x0 + 1) * height
+    cells = (bin_x - x0) * height + (bin_y - y0)
+
+    counts = np.bincount(cells, minlength=size)
+    makes = np.bincount(cells, weights=made, minlength=size)
+    keep = np.flatnonzero(counts >= max(min_shots, 1))
+
+    centers_x = ((keep // height + x0) * grid_size - 250 + grid_size // 2).astype(int)
+    centers_y = ((keep % height + y0) * grid_size - 52.5 + grid_size // 2).astype(int)
+    shot_counts = counts[keep]
+    made_counts = makes[keep]
+    fg_pcts = made_counts / shot_counts
+
+    distance_avgs = None
+    if distance is not None:
+        known = ~np.isnan(distance)
+        distance_sums = np.bincount(cells[known], weights=distance[known], minlength=size)
+        distance_counts = np.bincount(cells[known], minlength=size)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            distance_avgs = (distance_sums[keep] / distance_counts[keep]).tolist()
+
+    result = []
+    for i, (x, y, count, made_count, fg_pct) in enumerate(
+        zip(
+            centers_x.tolist(),
+            centers_y.tolist(),
+            shot_counts.tolist(),
+            made_counts.tolist(),
+            fg_pcts.tolist(),
+        )
+    ):
+        bin_dict = {
+            "bin_x": x,
+            "bin_y": y,
+            "shot_count": int(count),
+            "made_count": int(made_count),
+            "fg_pct": round(fg_pct, 3),
+        }
+        if distance_avgs is not None:
+            bin_dict["distance_avg"] = round(distance_avgs[i], 1)
+        result.append(bin_dict)
+
+    return result
+
+
+def zone_summary_from_arrays(
+    distance: np.ndarray,
+    made: np.ndarray,
+    is_three: Optional[np.ndarray] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Zone attempts/makes with np.searchsorted + np.bincount.
+
+    Distance bands decide paint and mid-range zones. With is_three, the
+    three-point zone is every 3PT attempt and long mid-range excludes them;
+    without it, anything >= 23.75 feet counts as a three.
+
+    Args:
+        distance: Shot distances in feet
+        made: 1 for makes, 0 for misses
+        is_three: Boolean mask of 3PT attempts (optional)
+
+    Returns:
+        Dict in the calculate_zone_summary format
+    """
+    # Codes 0-3 follow SHOT_ZONES; 4 collects shots outside every band
+    codes = np.searchsorted(ZONE_DISTANCE_EDGES, distance, side="right")
+    codes[np.isnan(distance)] = 4
+    if is_three is not None:
+        codes[(codes == 3) | ((codes == 2) & is_three)] = 4
+
+    attempts = np.bincount(codes, minlength=5)
+    makes = np.bincount(codes, weights=made, minlength=5)
+    if is_three is not None:
+        attempts[3] = np.count_nonzero(is_three)
+        makes[3] = made[is_three].sum()
+
+    def zone_stats(zone_attempts, zone_made):
+        pct = zone_made / zone_attempts if zone_attempts > 0 else 0.0
+        return {"attempts": int(zone_attempts), "made": int(zone_made), "pct": round(pct, 3)}
+
+    summary = {
+        zone: zone_stats(attempts[i], makes[i]) for i, zone in enumerate(SHOT_ZONES)
+    }
+    summary["overall"] = zone_stats(len(distance), made.sum())
+    return summary
+
+
 # ============================================================================
 # Hexbin Aggregation
 # ============================================================================
@@ -209,7 +356,7 @@ def aggregate_to_hexbin(
     Algorithm:
     1. Create 2D grid (default: 10 tenths of feet = 1 foot bins)
     2. Map each shot to grid cell: bin_x = (LOC_X + 250) // grid_size
-    3. Group shots by cell, calculate FG% per cell
+    3. Count shots, makes and distances per cell (np.bincount), FG% per cell
     4. Filter cells with < min_shots (statistical significance)
 
     Args:
@@ -249,67 +396,20 @@ def aggregate_to_hexbin(
         logger.error(f"Missing required columns for hexbin: {missing_cols}")
         return []
 
-    # Create bin assignments (vectorized for performance)
-    bin_x = ((shots["LOC_X"] + 250) // grid_size).astype(int)
-    bin_y = ((shots["LOC_Y"] + 52.5) // grid_size).astype(int)
-
-    # Add bins to dataframe
-    shots_with_bins = shots.copy()
-    shots_with_bins["bin_x"] = bin_x
-    shots_with_bins["bin_y"] = bin_y
-
-    # Group by bin and aggregate
-    agg_dict = {
-        "SHOT_MADE_FLAG": ["count", "sum"],  # count = attempts, sum = makes
-    }
-
-    # Add distance if available
-    if "SHOT_DISTANCE" in shots.columns:
-        agg_dict["SHOT_DISTANCE"] = "mean"
-
-    bins_grouped = shots_with_bins.groupby(["bin_x", "bin_y"]).agg(agg_dict)
-
-    # Flatten multi-level columns
-    bins_grouped.columns = ["_".join(col).strip() for col in bins_grouped.columns]
-    bins_grouped = bins_grouped.reset_index()
-
-    # Rename for clarity
-    bins_grouped = bins_grouped.rename(
-        columns={
-            "SHOT_MADE_FLAG_count": "shot_count",
-            "SHOT_MADE_FLAG_sum": "made_count",
-        }
+    distance = (
+        shots["SHOT_DISTANCE"].to_numpy(dtype=float)
+        if "SHOT_DISTANCE" in shots.columns
+        else None
     )
-
-    # Filter by minimum shots
-    bins_grouped = bins_grouped[bins_grouped["shot_count"] >= min_shots]
-
-    # Calculate FG%
-    bins_grouped["fg_pct"] = bins_grouped["made_count"] / bins_grouped["shot_count"]
-
-    # Convert bin coordinates to court coordinates (bin center)
-    bins_grouped["bin_x"] = (bins_grouped["bin_x"] * grid_size) - 250 + (grid_size // 2)
-    bins_grouped["bin_y"] = (
-        (bins_grouped["bin_y"] * grid_size) - 52.5 + (grid_size // 2)
+    result = hexbin_from_arrays(
+        shots["LOC_X"].to_numpy(dtype=float),
+        shots["LOC_Y"].to_numpy(dtype=float),
+        shots["SHOT_MADE_FLAG"].to_numpy(dtype=float),
+        distance,
+        grid_size=grid_size,
+        min_shots=min_shots,
     )
 
-    # Prepare output
-    result = []
-    for _, row in bins_grouped.iterrows():
-        bin_dict = {
-            "bin_x": int(row["bin_x"]),
-            "bin_y": int(row["bin_y"]),
-            "shot_count": int(row["shot_count"]),
-            "made_count": int(row["made_count"]),
-            "fg_pct": round(float(row["fg_pct"]), 3),
-        }
-
-        # Add average distance if available
-        if "SHOT_DISTANCE_mean" in row:
-            bin_dict["distance_avg"] = round(float(row["SHOT_DISTANCE_mean"]), 1)
-
-        result.append(bin_dict)
-
     logger.info(
         f"Aggregated {len(shots)} shots into {len(result)} bins (min_shots={min_shots})"
     )
@@ -358,47 +458,415 @@ def calculate_zone_summary(shots: pd.DataFrame) -> Dict[str, Any]:
         logger.error("Missing required columns for zone summary")
         return {}
 
-    def calc_zone_stats(zone_shots):
-        """Helper to calculate stats for a zone."""
-        if len(zone_shots) == 0:
-            return {"attempts": 0, "made": 0, "pct": 0.0}
-
-        attempts = len(zone_shots)
-        made = zone_shots["SHOT_MADE_FLAG"].sum()
-        pct = made / attempts if attempts > 0 else 0.0
-
-        return {"attempts": int(attempts), "made": int(made), "pct": round(pct, 3)}
-
-    # Define zones by distance
-    paint = shots[shots["SHOT_DISTANCE"] < 8]
-    short_mid = shots[(shots["SHOT_DISTANCE"] >= 8) & (shots["SHOT_DISTANCE"] < 16)]
-
-    # Long mid-range: 16-23.75 feet, but exclude 3-pointers
-    # Check if SHOT_TYPE column exists
-    if "SHOT_TYPE" in shots.columns:
-        long_mid = shots[
-            (shots["SHOT_DISTANCE"] >= 16)
-            & (shots["SHOT_DISTANCE"] < 23.75)
-            & (shots["SHOT_TYPE"] != "3PT Field Goal")
-        ]
-        three = shots[shots["SHOT_TYPE"] == "3PT Field Goal"]
-    else:
-        # Fallback: assume >= 23.75 is three (not perfect for corner 3s)
-        long_mid = shots[
-            (shots["SHOT_DISTANCE"] >= 16) & (shots["SHOT_DISTANCE"] < 23.75)
-        ]
-        three = shots[shots["SHOT_DISTANCE"] >= 23.75]
-
-    # Calculate stats for each zone
-    zone_summary = {
-        "paint": calc_zone_stats(paint),
-        "short_mid": calc_zone_stats(short_mid),
-        "long_mid": calc_zone_stats(long_mid),
-        "three": calc_zone_stats(three),
-        "overall": calc_zone_stats(shots),
+    is_three = (
+        (shots["SHOT_TYPE"] == "3PT Field Goal").to_numpy()
+        if "SHOT_TYPE" in shots.columns
+        else None
+    )
+    return zone_summary_from_arrays(
+        shots["SHOT_DISTANCE"].to_numpy(dtype=float),
+        shots["SHOT_MADE_FLAG"].to_numpy(dtype=float),
+        is_three,
+    )
+
+
+# ============================================================================
+# League Shot Store
+# ============================================================================
+
+DEFAULT_SHOT_STORE_DIR = Path("mcp_data/shot_store")
+
+# Rebuild a season's shots after this many seconds (new games are added daily)
+DEFAULT_SHOT_STORE_MAX_AGE = 6 * 3600.0
+
+# Seasons kept in memory (~200k shots each); older ones reload from parquet
+DEFAULT_SHOT_STORE_MAX_SEASONS = 4
+
+# Seconds a failed league pull is not retried (callers fetch per entity meanwhile)
+DEFAULT_SHOT_STORE_FAILURE_COOLDOWN = 300.0
+
+ShotFetcher = Callable[[str, str], Awaitable[Union[pa.Table, pd.DataFrame]]]
+
+
+async def _fetch_league_shots(season: str, season_type: str) -> pd.DataFrame:
+    """Every field goal attempt of a season in one ShotChartDetail request"""
+    shot_data = await asyncio.to_thread(
+        shotchartdetail.ShotChartDetail,
+        team_id=0,
+        player_id=0,
+        season_nullable=season,
+        season_type_all_star=season_type,
+        context_measure_simple="FGA",
+        timeout=120,
+    )
+    return shot_data.get_data_frames()[0]
+
+
+def _date_key(value: str, param_name: str) -> int:
+    """'YYYY-MM-DD' or 'MM/DD/YYYY' as a YYYYMMDD integer (GAME_DATE format)"""
+    try:
+        return int(pd.Timestamp(value).strftime("%Y%m%d"))
+    except (TypeError, ValueError):
+        raise InvalidParameterError(
+            param_name=param_name,
+            param_value=value,
+            expected="a date in 'YYYY-MM-DD' or 'MM/DD/YYYY' format",
+            examples=["2024-01-15", "01/15/2024"],
+        )
+
+
+def _group_positions(ids: np.ndarray) -> Tuple[np.ndarray, Dict[int, Tuple[int, int]]]:
+    """Stable argsort of ids plus each id's (start, stop) range in it"""
+    order = np.argsort(ids, kind="stable")
+    if len(ids) == 0:
+        return order, {}
+    sorted_ids = ids[order]
+    boundaries = np.flatnonzero(np.diff(sorted_ids)) + 1
+    starts = np.concatenate(([0], boundaries)).tolist()
+    stops = np.concatenate((boundaries, [len(ids)])).tolist()
+    return order, {
+        int(sorted_ids[start]): (start, stop) for start, stop in zip(starts, stops)
     }
 
-    return zone_summary
+
+class SeasonShots:
+    """
+    One season's league-wide shots with player and team position indexes
+
+    Positions within an entity keep the fetched (game) order, so a slice has
+    the same rows in the same order as a per-entity ShotChartDetail request.
+    """
+
+    def __init__(self, frame: pd.DataFrame, built_at: float):
+        self.frame = frame.reset_index(drop=True)
+        self.built_at = built_at
+
+        if "GAME_DATE" in self.frame.columns:
+            digits = self.frame["GAME_DATE"].astype(str).str.replace("-", "").str[:8]
+            self.game_dates = pd.to_numeric(digits, errors="coerce").fillna(0).to_numpy(np.int64)
+        else:
+            self.game_dates = np.zeros(len(self.frame), dtype=np.int64)
+
+        self._indexes = {}
+        for entity_type, column in (("player", "PLAYER_ID"), ("team", "TEAM_ID")):
+            ids = (
+                self.frame[column].to_numpy(np.int64)
+                if column in self.frame.columns
+                else np.zeros(0, dtype=np.int64)
+            )
+            self._indexes[entity_type] = _group_positions(ids)
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def positions(
+        self,
+        entity_id: int,
+        entity_type: Literal["player", "team"] = "player",
+        date_from: Optional[int] = None,
+        date_to: Optional[int] = None,
+    ) -> np.ndarray:
+        """Row positions of one entity's shots, optionally within YYYYMMDD bounds"""
+        order, ranges = self._indexes[entity_type]
+        start, stop = ranges.get(int(entity_id), (0, 0))
+        positions = order[start:stop]
+        if date_from is not None or date_to is not None:
+            dates = self.game_dates[positions]
+            mask = np.ones(len(positions), dtype=bool)
+            if date_from is not None:
+                mask &= dates >= date_from
+            if date_to is not None:
+                mask &= dates <= date_to
+            positions = positions[mask]
+        return positions
+
+    def shots(self, positions: np.ndarray) -> pd.DataFrame:
+        """Rows at positions as a new DataFrame"""
+        return self.frame.iloc[positions].reset_index(drop=True)
+
+
+class ShotStore:
+    """
+    League-wide shot data per season, sliced by player or team
+
+    One ShotChartDetail request with team_id=0 and player_id=0 returns every
+    field goal attempt of the season. It is validated once, kept in memory
+    with player and team indexes, and persisted as parquet partitioned by
+    season and season type; concurrent requests for a season share one build.
+    At most max_seasons seasons stay in memory (least recently used are
+    dropped and reload from disk). A failed league pull is not retried for
+    failure_cooldown seconds, so callers fall back per entity without waiting.
+
+    Usage:
+        store = get_shot_store()
+        shots = await store.get_shots(201939, "player", "2023-24")
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = DEFAULT_SHOT_STORE_DIR,
+        max_age: float = DEFAULT_SHOT_STORE_MAX_AGE,
+        fetch_func: Optional[ShotFetcher] = None,
+        max_seasons: int = DEFAULT_SHOT_STORE_MAX_SEASONS,
+        failure_cooldown: float = DEFAULT_SHOT_STORE_FAILURE_COOLDOWN,
+    ):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.max_age = max_age
+        self.max_seasons = max_seasons
+        self.failure_cooldown = failure_cooldown
+        self._fetch_func = fetch_func or _fetch_league_shots
+
+        self._seasons: "OrderedDict[Tuple[str, str], SeasonShots]" = OrderedDict()
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        self._failed_at: Dict[Tuple[str, str], float] = {}
+
+        self.stats = {
+            "builds": 0,
+            "disk_loads": 0,
+            "memory_hits": 0,
+            "slices": 0,
+            "evictions": 0,
+            "failures": 0,
+            "cooldown_skips": 0,
+        }
+
+    def _path(self, key: Tuple[str, str]) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        season, season_type = key
+        slug = season_type.lower().replace(" ", "_")
+        return self.cache_dir / f"season={season}" / f"season_type={slug}" / "shots.parquet"
+
+    def _cached(self, key: Tuple[str, str]) -> Optional[SeasonShots]:
+        shots = self._seasons.get(key)
+        if shots is not None and time.time() - shots.built_at < self.max_age:
+            self._seasons.move_to_end(key)
+            return shots
+        return None
+
+    def _remember(self, key: Tuple[str, str], shots: SeasonShots) -> None:
+        self._seasons[key] = shots
+        self._seasons.move_to_end(key)
+        while len(self._seasons) > self.max_seasons:
+            evicted, _ = self._seasons.popitem(last=False)
+            self._locks.pop(evicted, None)
+            self.stats["evictions"] += 1
+
+    def _check_cooldown(self, key: Tuple[str, str]) -> None:
+        failed_at = self._failed_at.get(key)
+        if failed_at is None:
+            return
+        remaining = self.failure_cooldown - (time.time() - failed_at)
+        if remaining <= 0:
+            del self._failed_at[key]
+            return
+        self.stats["cooldown_skips"] += 1
+        raise CircuitBreakerOpenError(
+            endpoint=f"league shots {' '.join(key)}", retry_after=max(1, int(remaining))
+        )
+
+    def _load_from_disk(self, key: Tuple[str, str]) -> Optional[SeasonShots]:
+        path = self._path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            table = pq.read_table(path, partitioning=None)
+            metadata = table.schema.metadata or {}
+            built_at = float(metadata.get(b"built_at", path.stat().st_mtime))
+            if time.time() - built_at >= self.max_age:
+                return None
+            self.stats["disk_loads"] += 1
+            return SeasonShots(table.to_pandas(), built_at)
+        except Exception as e:
+            logger.warning(f"Could not load shots from {path}: {e}")
+            return None
+
+    def _persist(self, key: Tuple[str, str], frame: pd.DataFrame, built_at: float) -> None:
+        path = self._path(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            table = table.replace_schema_metadata(
+                {**(table.schema.metadata or {}), b"built_at": str(built_at).encode()}
+            )
+            tmp_path = path.with_suffix(".parquet.tmp")
+            pq.write_table(table, tmp_path)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not persist shots to {path}: {e}")
+
+    async def get_season(
+        self,
+        season: str,
+        season_type: str = "Regular Season",
+        refresh: bool = False,
+    ) -> SeasonShots:
+        """
+        League-wide shots for a season, fetching them if needed
+
+        Args:
+            season: Season in YYYY-YY format
+            season_type: "Regular Season", "Playoffs", etc.
+            refresh: Refetch even if the season is stored
+
+        Returns:
+            SeasonShots with validated coordinates
+
+        Raises:
+            CircuitBreakerOpenError: If the league pull failed within failure_cooldown
+        """
+        key = (season, season_type)
+        shots = None if refresh else self._cached(key)
+        if shots is not None:
+            self.stats["memory_hits"] += 1
+            return shots
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            shots = None if refresh else self._cached(key)
+            if shots is not None:
+                self.stats["memory_hits"] += 1
+                return shots
+            shots = None if refresh else self._load_from_disk(key)
+            if shots is not None:
+                self._remember(key, shots)
+                return shots
+
+            if not refresh:
+                self._check_cooldown(key)
+            start = time.perf_counter()
+            try:
+                data = await self._fetch_func(season, season_type)
+            except Exception:
+                self._failed_at[key] = time.time()
+                self.stats["failures"] += 1
+                raise
+            self._failed_at.pop(key, None)
+            frame = data.to_pandas() if isinstance(data, pa.Table) else data
+            frame = validate_shot_coordinates(frame.reset_index(drop=True))
+            built_at = time.time()
+            shots = SeasonShots(frame, built_at)
+            self._remember(key, shots)
+            self._persist(key, shots.frame, built_at)
+            self.stats["builds"] += 1
+
+            logger.info(
+                f"Built league shots for {season} {season_type}: {len(shots)} shots "
+                f"in {(time.perf_counter() - start) * 1000:.0f}ms"
+            )
+            return shots
+
+    async def get_shots(
+        self,
+        entity_id: int,
+        entity_type: Literal["player", "team"],
+        season: str,
+        season_type: str = "Regular Season",
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        One player's or team's shots, sliced from the league-wide season
+
+        Args:
+            entity_id: Player ID or Team ID
+            entity_type: "player" or "team"
+            season: Season in YYYY-YY format
+            season_type: "Regular Season", "Playoffs", etc.
+            date_from: Start date, inclusive ('YYYY-MM-DD' or 'MM/DD/YYYY')
+            date_to: End date, inclusive ('YYYY-MM-DD' or 'MM/DD/YYYY')
+
+        Returns:
+            DataFrame with the ShotChartDetail columns (empty if no shots)
+
+        Raises:
+            InvalidParameterError: If a date cannot be parsed
+        """
+        lower = _date_key(date_from, "date_from") if date_from else None
+        upper = _date_key(date_to, "date_to") if date_to else None
+
+        shots = await self.get_season(season, season_type)
+        self.stats["slices"] += 1
+        return shots.shots(shots.positions(entity_id, entity_type, lower, upper))
+
+    def invalidate(self, season: Optional[str] = None) -> None:
+        """Drop stored shots for one season (or all) from memory and disk"""
+        for key in [k for k in self._seasons if season is None or k[0] == season]:
+            del self._seasons[key]
+        for key in [k for k in self._failed_at if season is None or k[0] == season]:
+            del self._failed_at[key]
+        if self.cache_dir is not None and self.cache_dir.exists():
+            pattern = f"season={season}/*/shots.parquet" if season else "season=*/*/shots.parquet"
+            for path in self.cache_dir.glob(pattern):
+                path.unlink(missing_ok=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Store statistics"""
+        return {
+            **self.stats,
+            "seasons": [" ".join(key) for key in self._seasons],
+            "shots": sum(len(shots) for shots in self._seasons.values()),
+        }
+
+
+# Global store instance
+_shot_store: Optional[ShotStore] = None
+
+
+def get_shot_store() -> ShotStore:
+    """Get or create the global shot store"""
+    global _shot_store
+    if _shot_store is None:
+        _shot_store = ShotStore()
+    return _shot_store
+
+
+def reset_shot_store() -> None:
+    """Reset the global shot store (for testing)"""
+    global _shot_store
+    _shot_store = None
+
+
+async def load_entity_shots(
+    entity_id: int,
+    entity_type: Literal["player", "team"],
+    season: str,
+    season_type: str,
+    date_from: Optional[str],
+    date_to: Optional[str],
+) -> pd.DataFrame:
+    """
+    One entity's validated shots from the league shot store.
+
+    Falls back to a per-entity ShotChartDetail request when the league-wide
+    season cannot be fetched or loaded.
+
+    Returns:
+        DataFrame with the ShotChartDetail columns (empty if no shots)
+    """
+    try:
+        return await get_shot_store().get_shots(
+            entity_id, entity_type, season, season_type, date_from, date_to
+        )
+    except InvalidParameterError:
+        raise
+    except Exception as e:
+        logger.warning(
+            f"League shot store unavailable for {season} {season_type}, "
+            f"fetching entity_id={entity_id} directly: {e}"
+        )
+
+    shots_df = await fetch_shot_chart_data(
+        entity_id=entity_id,
+        entity_type=entity_type,
+        season=season,
+        season_type=season_type,
+        date_from=date_from,
+        date_to=date_to,
+    )
+    return validate_shot_coordinates(shots_df)
 
 
 # ============================================================================
@@ -493,8 +961,8 @@ async def get_shot_chart(
         f"Fetching shot chart for {entity.name} ({entity.entity_type}) - {season_str}"
     )
 
-    # Fetch raw shot data
-    shots_df = await fetch_shot_chart_data(
+    # Slice the entity's shots from the league-wide season (validated once)
+    shots_df = await load_entity_shots(
         entity_id=entity.entity_id,
         entity_type=entity_type,
         season=season_str,
@@ -503,9 +971,6 @@ async def get_shot_chart(
         date_to=date_to,
     )
 
-    # Validate coordinates
-    shots_df = validate_shot_coordinates(shots_df)
-
     # Calculate metadata
     total_shots = len(shots_df)
     made_shots = shots_df["SHOT_MADE_FLAG"].sum() if not shots_df.empty else 0
@@ -604,3 +1069,64 @@ async def get_shot_chart(
         logger.warning(f"DEBUG: date_to NOT in final result")
 
     return result
+
+
+async def compare_shot_charts(
+    entity_names: List[str],
+    entity_type: Literal["player", "team"] = "player",
+    season: Optional[str] = None,
+    season_type: str = "Regular Season",
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    granularity: Literal["raw", "hexbin", "both", "summary"] = "summary",
+) -> Dict[str, Any]:
+    """
+    Shot charts for several players (or teams) from one league-wide season.
+
+    Every chart is a slice of the same stored season, so comparing N players
+    costs one ShotChartDetail request at most instead of N.
+
+    Args:
+        entity_names: Player or team names (fuzzy matching supported)
+        entity_type: "player" or "team"
+        season: Season in YYYY-YY format (current season if None)
+        season_type: "Regular Season", "Playoffs", etc.
+        date_from: Start date for filtering shots (optional)
+        date_to: End date for filtering shots (optional)
+        granularity: Output format per entity (see get_shot_chart)
+
+    Returns:
+        Dict with "season", "season_type" and "charts" (one get_shot_chart
+        result per entity, in input order)
+
+    Raises:
+        InvalidParameterError: If fewer than two names are given
+        EntityNotFoundError: If an entity is not found
+    """
+    if len(entity_names) < 2:
+        raise InvalidParameterError(
+            param_name="entity_names",
+            param_value=entity_names,
+            expected="at least two names to compare",
+            examples=['["Stephen Curry", "Damian Lillard"]'],
+        )
+
+    charts = []
+    for name in entity_names:
+        charts.append(
+            await get_shot_chart(
+                entity_name=name,
+                entity_type=entity_type,
+                season=season,
+                season_type=season_type,
+                date_from=date_from,
+                date_to=date_to,
+                granularity=granularity,
+            )
+        )
+
+    return {
+        "season": charts[0]["season"],
+        "season_type": season_type,
+        "charts": charts,
+    }
@@ -2129,6 +2129,17 @@ class FetchChunkedInput(BaseModel):
         )
     )
 
+    prefetch_depth: int = Field(
+        2,
+        ge=0,
+        description=(
+            "Number of upcoming chunks fetched concurrently while the current "
+            "chunk is processed. 0 = sequential. "
+            "Default: 2. "
+            "Optional"
+        )
+    )
+
     class Config:
         json_schema_extra = {
             "examples": [
@@ -0,0 +1,549 @@
+# nba_mcp/api/tools/live_pbp_stream.py
+"""
+Incremental live play-by-play from the NBA CDN with fan-out.
+
+The CDN feed (playbyplay_{game_id}.json) always contains the full action
+list, appended in actionNumber order. Instead of re-downloading and
+re-diffing it on every tick:
+- LiveActionTracker remembers the last actionNumber and the feed's ETag;
+  each poll sends If-None-Match (304 = nothing new) and only the tail of
+  the action list past the last actionNumber is examined
+- LiveGamePoller runs one asyncio poll loop per game and fans new actions
+  out to every subscriber (MCP sessions) and to cursor readers
+- The poll interval adapts: fast while actions arrive, backing off during
+  stoppages (timeouts, period breaks) and after the game ends
+
+Usage:
+    hub = get_live_pbp_hub()
+    async with hub.subscribe("0022500123") as events:
+        async for action in events:
+            print(action["actionNumber"], action["description"])
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+import httpx
+import requests
+
+from nba_mcp.api.errors import RateLimitError
+from nba_mcp.api.headers import get_live_data_headers
+from nba_mcp.rate_limit.host_limiter import CDN_HOST, Priority, get_host_limiter
+
+logger = logging.getLogger(__name__)
+
+LIVE_PBP_URL = (
+    "https://cdn.nba.com/static/json/liveData/playbyplay/playbyplay_{game_id}.json"
+)
+
+# Poll intervals (seconds)
+MIN_POLL_INTERVAL = 2.0  # actions are arriving
+MAX_POLL_INTERVAL = 15.0  # ceiling while play is stopped
+BREAK_POLL_INTERVAL = 30.0  # between periods, pregame
+FINAL_POLL_INTERVAL = 60.0  # after the game ends
+BACKOFF_FACTOR = 1.5
+
+# Polls after the game ends (late corrections) before the poller stops
+FINAL_POLLS = 2
+
+# Events buffered per subscriber before the oldest are dropped
+SUBSCRIBER_QUEUE_SIZE = 1000
+
+# Seconds a poller started by cursor reads keeps running without readers
+CURSOR_IDLE_TIMEOUT = 120.0
+
+STOPPAGE_ACTION_TYPES = {"timeout", "instantreplay"}
+
+
+@dataclass
+class LiveFetchResult:
+    """One conditional GET of the live feed."""
+
+    status_code: int
+    actions: Optional[List[Dict[str, Any]]]  # None when unchanged / not yet available
+    etag: Optional[str]
+
+
+def extract_live_actions(payload: Dict[str, Any], game_id: str) -> List[Dict[str, Any]]:
+    """
+    Action list from either live feed shape.
+
+    Raises:
+        RuntimeError: If the payload has neither shape
+    """
+    if "liveData" in payload and "plays" in payload["liveData"]:
+        return payload["liveData"]["plays"]["play"]
+    if "game" in payload and "actions" in payload["game"]:
+        return payload["game"]["actions"]
+    raise RuntimeError(
+        f"Unrecognized live‑pbp shape for {game_id}: {list(payload.keys())}"
+    )
+
+
+def _conditional_headers(etag: Optional[str]) -> Dict[str, str]:
+    headers = get_live_data_headers()
+    if etag:
+        headers["If-None-Match"] = etag
+    return headers
+
+
+def _to_result(
+    game_id: str, status_code: int, headers: Any, payload_func
+) -> LiveFetchResult:
+    etag = headers.get("ETag")
+    if status_code == 304:
+        return LiveFetchResult(304, None, etag)
+    if status_code in (403, 404):
+        # The CDN publishes the feed shortly before tip-off
+        return LiveFetchResult(status_code, None, None)
+    if status_code != 200:
+        raise RuntimeError(
+            f"HTTP {status_code} from live play-by-play feed for {game_id}"
+        )
+    return LiveFetchResult(200, extract_live_actions(payload_func(), game_id), etag)
+
+
+def fetch_live_actions(
+    game_id: str, etag: Optional[str] = None, timeout: float = 5.0
+) -> LiveFetchResult:
+    """
+    Conditional GET of the live feed (blocking).
+
+    Args:
+        game_id: 10-digit game ID
+        etag: ETag of the last response (sent as If-None-Match)
+        timeout: Request timeout in seconds
+
+    Raises:
+        RuntimeError: On unexpected status codes or payload shapes
+        requests.RequestException: On network errors
+    """
+    url = LIVE_PBP_URL.format(game_id=game_id)
+    response = requests.get(url, headers=_conditional_headers(etag), timeout=timeout)
+    return _to_result(game_id, response.status_code, response.headers, response.json)
+
+
+async def fetch_live_actions_async(
+    client: httpx.AsyncClient,
+    game_id: str,
+    etag: Optional[str] = None,
+    timeout: float = 5.0,
+) -> LiveFetchResult:
+    """Conditional GET on a shared httpx client (see fetch_live_actions)."""
+    url = LIVE_PBP_URL.format(game_id=game_id)
+    response = await client.get(
+        url, headers=_conditional_headers(etag), timeout=timeout
+    )
+    return _to_result(game_id, response.status_code, response.headers, response.json)
+
+
+class LiveActionTracker:
+    """
+    Delta detection for one game's live action list.
+
+    Relies on the feed appending actions in actionNumber order, so new
+    actions are found by walking back from the end: O(new actions), no
+    per-poll set of everything seen so far.
+    """
+
+    def __init__(self, game_id: str):
+        self.game_id = game_id
+        self.last_action_number = 0
+        self.etag: Optional[str] = None
+        self.final = False
+        self.last_action: Optional[Dict[str, Any]] = None
+
+    def update(self, result: LiveFetchResult) -> List[Dict[str, Any]]:
+        """Record a fetch result and return the actions not seen before."""
+        if result.etag:
+            self.etag = result.etag
+        if not result.actions:
+            return []
+        return self.new_actions(result.actions)
+
+    def new_actions(self, actions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Actions with actionNumber above the last one seen (and advance)."""
+        start = len(actions)
+        while (
+            start > 0
+            and actions[start - 1].get("actionNumber", 0) > self.last_action_number
+        ):
+            start -= 1
+        new = actions[start:]
+        if new:
+            self.last_action_number = new[-1].get(
+                "actionNumber", self.last_action_number
+            )
+            self.last_action = new[-1]
+            if any(_is_game_end(action) for action in new):
+                self.final = True
+        return new
+
+
+def _is_game_end(action: Dict[str, Any]) -> bool:
+    return (
+        str(action.get("actionType", "")).lower() == "game"
+        and str(action.get("subType", "")).lower() == "end"
+    )
+
+
+def _is_period_end(action: Dict[str, Any]) -> bool:
+    return (
+        str(action.get("actionType", "")).lower() == "period"
+        and str(action.get("subType", "")).lower() == "end"
+    )
+
+
+class Subscription:
+    """Async iterator over one subscriber's new actions (ends when the game ends)."""
+
+    _DONE = object()
+
+    def __init__(self, poller: "LiveGamePoller", maxsize: int = SUBSCRIBER_QUEUE_SIZE):
+        self.poller = poller
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.dropped = 0
+        self.closed = False
+        self.ended = False
+
+    def _push(self, action: Dict[str, Any]):
+        if self.queue.full():
+            self.queue.get_nowait()  # slow consumer: drop the oldest
+            self.dropped += 1
+        self.queue.put_nowait(action)
+
+    def _end(self):
+        self.ended = True
+        if not self.queue.full():
+            self.queue.put_nowait(self._DONE)  # wakes a waiting consumer
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        if (self.closed or self.ended) and self.queue.empty():
+            raise StopAsyncIteration
+        item = await self.queue.get()
+        if item is self._DONE:
+            raise StopAsyncIteration
+        return item
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
+        return False
+
+    def close(self):
+        """Unsubscribe (the game's poller stops when nobody is listening)."""
+        if not self.closed:
+            self.closed = True
+            self.poller.unsubscribe(self)
+
+
+class LiveGamePoller:
+    """
+    One upstream poll loop for a game, shared by all subscribers.
+
+    Every action seen is kept (a game has ~500-700), so late subscribers
+    and cursor readers can catch up without another request.
+    """
+
+    def __init__(
+        self,
+        game_id: str,
+        fetch: Callable[[str, Optional[str]], Awaitable[LiveFetchResult]],
+        min_interval: float = MIN_POLL_INTERVAL,
+        max_interval: float = MAX_POLL_INTERVAL,
+        break_interval: float = BREAK_POLL_INTERVAL,
+        final_interval: float = FINAL_POLL_INTERVAL,
+        final_polls: int = FINAL_POLLS,
+        idle_timeout: float = CURSOR_IDLE_TIMEOUT,
+        on_finish: Optional[Callable[["LiveGamePoller"], None]] = None,
+    ):
+        self.game_id = game_id
+        self._fetch = fetch
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.break_interval = break_interval
+        self.final_interval = final_interval
+        self.final_polls = final_polls
+        self.idle_timeout = idle_timeout
+        self._on_finish = on_finish
+
+        self.tracker = LiveActionTracker(game_id)
+        self.actions: List[Dict[str, Any]] = []
+        self.subscribers: Set[Subscription] = set()
+        self.interval = min_interval
+        self.last_read: Optional[float] = None  # last cursor read
+        self.finished = False
+        self._task: Optional[asyncio.Task] = None
+        self._polls_after_final = 0
+        self.stats = {
+            "polls": 0,
+            "not_modified": 0,
+            "errors": 0,
+            "rate_limited": 0,
+            "actions": 0,
+            "deliveries": 0,
+        }
+
+    # ------------------------------------------------------------------
+
+    def start(self):
+        """Start the poll loop if it isn't running."""
+        if self._task is None or self._task.done():
+            self.finished = False
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """Cancel the poll loop and end all subscriptions."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._finish()
+
+    def subscribe(
+        self, after_action_number: int = 0, maxsize: int = SUBSCRIBER_QUEUE_SIZE
+    ) -> Subscription:
+        """New subscriber; actions already seen past the cursor are queued first."""
+        subscription = Subscription(self, maxsize=maxsize)
+        for action in self._actions_after(after_action_number):
+            subscription._push(action)
+        if self.finished:
+            subscription._end()
+        else:
+            self.subscribers.add(subscription)
+            self.start()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        """Drop a subscriber; the last one out stops the loop unless cursors read."""
+        self.subscribers.discard(subscription)
+        if self._idle() and self._task is not None and not self._task.done():
+            self._task.cancel()
+
+    def events_since(
+        self, after_action_number: int = 0, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Actions seen so far with actionNumber above the cursor (keeps polling)."""
+        self.last_read = time.monotonic()
+        events = self._actions_after(after_action_number)
+        return events[:limit] if limit is not None else events
+
+    def _actions_after(self, after_action_number: int) -> List[Dict[str, Any]]:
+        lo, hi = 0, len(self.actions)
+        while lo < hi:  # actions are in actionNumber order
+            mid = (lo + hi) // 2
+            if self.actions[mid].get("actionNumber", 0) <= after_action_number:
+                lo = mid + 1
+            else:
+                hi = mid
+        return self.actions[lo:]
+
+    # ------------------------------------------------------------------
+
+    def _next_interval(
+        self, new_actions: List[Dict[str, Any]], not_available: bool
+    ) -> float:
+        last = self.tracker.last_action
+        if self.tracker.final:
+            return self.final_interval
+        if not_available or (last is not None and _is_period_end(last)):
+            return self.break_interval
+        if new_actions:
+            if (
+                str(new_actions[-1].get("actionType", "")).lower()
+                in STOPPAGE_ACTION_TYPES
+            ):
+                return self.max_interval
+            return self.min_interval
+        return min(self.interval * BACKOFF_FACTOR, self.max_interval)
+
+    async def poll_once(self) -> List[Dict[str, Any]]:
+        """One conditional GET; publishes and returns the new actions."""
+        self.stats["polls"] += 1
+        result = await self._fetch(self.game_id, self.tracker.etag)
+        if result.status_code == 304:
+            self.stats["not_modified"] += 1
+        new_actions = self.tracker.update(result)
+        if new_actions:
+            self.actions.extend(new_actions)
+            self.stats["actions"] += len(new_actions)
+            for subscription in list(self.subscribers):
+                for action in new_actions:
+                    subscription._push(action)
+                self.stats["deliveries"] += len(new_actions)
+        self.interval = self._next_interval(
+            new_actions, result.actions is None and result.status_code != 304
+        )
+        return new_actions
+
+    def _idle(self) -> bool:
+        if self.subscribers:
+            return False
+        return (
+            self.last_read is None
+            or time.monotonic() - self.last_read > self.idle_timeout
+        )
+
+    async def _run(self):
+        try:
+            while not self._idle():
+                try:
+                    new_actions = await self.poll_once()
+                except RateLimitError as e:
+                    # The host limiter shed this poll; wait it out and keep streaming
+                    self.stats["rate_limited"] += 1
+                    self.interval = max(self.interval, e.retry_after or 0)
+                    logger.info(
+                        f"Live PBP poll for {self.game_id} deferred "
+                        f"{self.interval:.0f}s by rate limiter"
+                    )
+                except (httpx.HTTPError, RuntimeError, ValueError) as e:
+                    self.stats["errors"] += 1
+                    self.interval = min(self.interval * 2, self.break_interval)
+                    logger.warning(f"Live PBP poll failed for {self.game_id}: {e}")
+                else:
+                    if self.tracker.final:
+                        if new_actions:
+                            self._polls_after_final = 0
+                        else:
+                            self._polls_after_final += 1
+                        if self._polls_after_final > self.final_polls:
+                            logger.info(
+                                f"Live PBP for {self.game_id} is final; poller stopped"
+                            )
+                            break
+                await asyncio.sleep(self.interval)
+        finally:
+            self._finish()
+
+    def _finish(self):
+        self.finished = True
+        for subscription in list(self.subscribers):
+            subscription._end()
+        self.subscribers.clear()
+        if self._on_finish is not None:
+            self._on_finish(self)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "subscribers": len(self.subscribers),
+            "last_action_number": self.tracker.last_action_number,
+            "interval": self.interval,
+            "final": self.tracker.final,
+            "running": self._task is not None and not self._task.done(),
+        }
+
+
+class LivePBPHub:
+    """
+    Live pollers by game ID (one upstream poll per game).
+
+    A poller leaves the hub when it finishes: after the game goes final,
+    when its last subscriber leaves, or once cursor reads stop.
+    """
+
+    def __init__(
+        self,
+        fetch: Optional[
+            Callable[[str, Optional[str]], Awaitable[LiveFetchResult]]
+        ] = None,
+        timeout: float = 5.0,
+        **poller_kwargs,
+    ):
+        """
+        Args:
+            fetch: async (game_id, etag) -> LiveFetchResult (defaults to the
+                CDN over a shared httpx.AsyncClient)
+            timeout: Request timeout in seconds for the default fetch
+            **poller_kwargs: Interval settings passed to LiveGamePoller
+        """
+        self._fetch = fetch or self._fetch_cdn
+        self.timeout = timeout
+        self.poller_kwargs = poller_kwargs
+        self.pollers: Dict[str, LiveGamePoller] = {}
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def _fetch_cdn(self, game_id: str, etag: Optional[str]) -> LiveFetchResult:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient()
+        await get_host_limiter().acquire(CDN_HOST, priority=Priority.BACKGROUND)
+        return await fetch_live_actions_async(self._client, game_id, etag, self.timeout)
+
+    def poller(self, game_id: str) -> LiveGamePoller:
+        """The game's running poller (created on first use)."""
+        poller = self.pollers.get(game_id)
+        if poller is None:
+            poller = LiveGamePoller(
+                game_id, self._fetch, on_finish=self._discard, **self.poller_kwargs
+            )
+            self.pollers[game_id] = poller
+        return poller
+
+    def _discard(self, poller: LiveGamePoller):
+        if self.pollers.get(poller.game_id) is poller:
+            del self.pollers[poller.game_id]
+
+    def subscribe(self, game_id: str, after_action_number: int = 0) -> Subscription:
+        """Stream a game's new actions (past the cursor) as they arrive."""
+        return self.poller(game_id).subscribe(after_action_number)
+
+    async def events_since(
+        self, game_id: str, after_action_number: int = 0, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Cursor read for request/response callers (MCP tools).
+
+        The first read of a game polls once so it returns data immediately;
+        the poller then keeps running while reads continue. A game that is
+        already final is answered from that one poll and not kept.
+        """
+        poller = self.poller(game_id)
+        if poller._task is None:
+            if poller.stats["polls"] == 0:
+                await poller.poll_once()
+            if poller.tracker.final:
+                events = poller.events_since(after_action_number, limit)
+                await poller.stop()
+                return events
+            poller.start()
+        return poller.events_since(after_action_number, limit)
+
+    async def close(self):
+        """Stop all pollers and close the HTTP client."""
+        for poller in list(self.pollers.values()):
+            await poller.stop()
+        self.pollers.clear()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {game_id: poller.get_stats() for game_id, poller in self.pollers.items()}
+
+
+_live_pbp_hub: Optional[LivePBPHub] = None
+
+
+def get_live_pbp_hub() -> LivePBPHub:
+    """Get the shared live play-by-play hub."""
+    global _live_pbp_hub
+    if _live_pbp_hub is None:
+        _live_pbp_hub = LivePBPHub()
+    return _live_pbp_hub
+
+
+def reset_live_pbp_hub():
+    """Drop the shared hub (running pollers are not stopped; use close())."""
+    global _live_pbp_hub
+    _live_pbp_hub = None
@@ -4,13 +4,16 @@ import json
 import logging
 import re
 import sys
+import threading
 import time
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import date
 from datetime import date as _date
 from datetime import datetime, timezone
 from typing import Any, Callable, Dict, Iterable, List, Literal, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 import requests
 
@@ -26,6 +29,11 @@ from nba_api.stats.endpoints import boxscoretraditionalv2 as _BSv2
 from nba_api.stats.endpoints import scoreboardv2 as _SBv2
 from nba_api.stats.static import teams as _static_teams
 
+from nba_mcp.api.tools.live_pbp_stream import (
+    LiveActionTracker,
+    extract_live_actions,
+    fetch_live_actions,
+)
 from nba_mcp.api.tools.nba_api_utils import (
     _resolve_team_ids,
     format_game,
@@ -74,10 +82,276 @@ def get_games_on_date(game_date: date) -> list[str]:
     return df["GAME_ID"].astype(str).tolist()
 
 
+# ── Shared per-game play-by-play cache ──────────────────────────────────────
+
+# Seconds an unfinished game's play-by-play is reused (Final games never expire)
+LIVE_PBP_TTL = 10.0
+
+# Games kept in memory (least recently used are evicted)
+PBP_CACHE_MAX_GAMES = 64
+
+# Highest period requested from PlayByPlayV3 (regulation + six overtimes)
+FULL_GAME_END_PERIOD = 10
+
+_CLOCK_PATTERN = r"PT(\d+)M([\d\.]+)S"
+
+
+def _normalize_pbp_frames(dfs: List[pd.DataFrame]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Pick the PlayByPlay frame out of a PlayByPlayV3 response and normalize it
+    to snake_case with guaranteed 'period' and 'clock' columns.
+
+    Returns:
+        (play-by-play, AvailableVideo)
+    """
+    # debug what came back
+    logger.debug(f"[DEBUG fetch] got {len(dfs)} frame(s) from PlayByPlayV3")
+    for i, frame in enumerate(dfs):
+        logger.debug(f"[DEBUG fetch] frame[{i}] columns: {frame.columns.tolist()}")
+
+    # pick the frame that actually has period+clock
+    pbp_df = None
+    for frame in dfs:
+        lower_cols = [c.lower() for c in frame.columns]
+        if "period" in lower_cols and (
+            "clock" in lower_cols or "pctimestring" in lower_cols
+        ):
+            pbp_df = frame
+            break
+
+    if pbp_df is None:
+        logger.debug("⚠️ couldn't detect PBP frame; defaulting to dfs[1]")
+        if len(dfs) < 2:
+            raise RuntimeError(
+                f"Expected ≥2 frames from PlayByPlayV3, got {len(dfs)}"
+            )
+        pbp_df = dfs[1]
+
+    df = pbp_df.copy()
+    df.columns = [_camel_to_snake(c) for c in df.columns]
+    df = df.rename(columns={"pctimestring": "clock", "quarter": "period"})
+
+    missing = [c for c in ("period", "clock") if c not in df.columns]
+    if missing:
+        raise RuntimeError(f"Missing expected column(s) in PBP: {missing}")
+
+    return df.reset_index(drop=True), dfs[0]
+
+
+def _fetch_pbp_frames(game_id: str, timeout: float = 30.0) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """One PlayByPlayV3 request for the whole game → (play-by-play, AvailableVideo)."""
+    resp = PlayByPlayV3(
+        game_id=game_id,
+        start_period=1,
+        end_period=FULL_GAME_END_PERIOD,
+        timeout=timeout,
+    )
+    return _normalize_pbp_frames(resp.get_data_frames())
+
+
+def _is_final_pbp(df: pd.DataFrame) -> bool:
+    """True if the play-by-play contains the game-end event."""
+    if df.empty:
+        return False
+    if "action_type" in df.columns and "sub_type" in df.columns:
+        action = df["action_type"].astype(str).str.lower()
+        sub_type = df["sub_type"].astype(str).str.lower()
+        if ((action == "game") & (sub_type == "end")).any():
+            return True
+    if "description" in df.columns:
+        return bool(df["description"].astype(str).str.contains("game end", case=False).any())
+    return False
+
+
+def _clock_seconds(clock: pd.Series) -> np.ndarray:
+    """ISO clocks ("PT11M42.00S") → seconds remaining (0.0 if unparseable)."""
+    parts = clock.astype(str).str.extract(_CLOCK_PATTERN)
+    minutes = pd.to_numeric(parts[0], errors="coerce")
+    seconds = pd.to_numeric(parts[1], errors="coerce")
+    return (minutes * 60 + seconds).fillna(0.0).to_numpy(dtype=float)
+
+
+@dataclass
+class PBPGameFrames:
+    """
+    One game's play-by-play, shared by every caller.
+
+    Frames are read-only: slices and indexes are built once per period range.
+    """
+
+    game_id: str
+    pbp: pd.DataFrame
+    available_video: pd.DataFrame
+    is_final: bool
+    fetched_at: float
+    _slices: Dict[Tuple[int, int], pd.DataFrame] = field(default_factory=dict, repr=False)
+    _clock_indexes: Dict[Tuple[int, int], Dict[Any, Tuple[np.ndarray, np.ndarray]]] = field(
+        default_factory=dict, repr=False
+    )
+
+    def frame(self, start_period: int = 1, end_period: Optional[int] = None) -> pd.DataFrame:
+        """Events with start_period <= period <= end_period (default 4), positional index."""
+        key = (start_period, end_period or 4)
+        sliced = self._slices.get(key)
+        if sliced is None:
+            mask = self.pbp["period"].between(key[0], key[1])
+            sliced = self.pbp[mask].reset_index(drop=True)
+            self._slices[key] = sliced
+        return sliced
+
+    def _clock_index(self, key: Tuple[int, int]) -> Dict[Any, Tuple[np.ndarray, np.ndarray]]:
+        """
+        Per period: (event positions, negated running minimum of the clock).
+
+        The running minimum makes the search exact even if a clock goes up
+        between events: the first event at or before a time is the first
+        position where the minimum so far drops to that time.
+        """
+        index = self._clock_indexes.get(key)
+        if index is None:
+            df = self.frame(*key)
+            seconds = _clock_seconds(df["clock"])
+            periods = df["period"].to_numpy()
+            index = {}
+            for period in pd.unique(periods):
+                positions = np.flatnonzero(periods == period)
+                index[period] = (positions, -np.minimum.accumulate(seconds[positions]))
+            self._clock_indexes[key] = index
+        return index
+
+    def event_index(
+        self,
+        period: int,
+        clock: str,
+        start_period: int = 1,
+        end_period: Optional[int] = None,
+    ) -> int:
+        """
+        Position (in frame(start_period, end_period)) of the first event in
+        `period` at or before the "mm:ss" clock; 0 if there is none.
+        """
+        mins, secs = map(int, clock.split(":"))
+        target = mins * 60 + secs
+
+        entry = self._clock_index((start_period, end_period or 4)).get(period)
+        if entry is None:
+            return 0
+        positions, neg_running_min = entry
+        i = int(np.searchsorted(neg_running_min, -target, side="left"))
+        return int(positions[i]) if i < len(positions) else 0
+
+
+class PBPFrameCache:
+    """
+    Per-game play-by-play frames fetched with one PlayByPlayV3 request and
+    shared by PlayByPlayFetcher, get_playbyplay_v3 and PastGamesPlaybyPlay.
+
+    Final games are immutable and never refetched; unfinished games are
+    reused for LIVE_PBP_TTL seconds. Concurrent callers for the same game
+    wait for a single request.
+    """
+
+    def __init__(
+        self,
+        max_games: int = PBP_CACHE_MAX_GAMES,
+        live_ttl: float = LIVE_PBP_TTL,
+        fetch_func: Callable[[str, float], Tuple[pd.DataFrame, pd.DataFrame]] = None,
+    ):
+        self.max_games = max_games
+        self.live_ttl = live_ttl
+        self._fetch = fetch_func or _fetch_pbp_frames
+        self._games: "OrderedDict[str, PBPGameFrames]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._game_locks: Dict[str, threading.Lock] = {}
+        self.stats = {"hits": 0, "misses": 0, "refreshes": 0, "evictions": 0}
+
+    def _cached(self, game_id: str) -> Optional[PBPGameFrames]:
+        with self._lock:
+            entry = self._games.get(game_id)
+            if entry is None:
+                return None
+            if not entry.is_final and time.time() - entry.fetched_at >= self.live_ttl:
+                return None
+            self._games.move_to_end(game_id)
+            self.stats["hits"] += 1
+            return entry
+
+    def get(self, game_id: str, timeout: float = 30.0) -> PBPGameFrames:
+        """Frames for a game, fetching them at most once (per TTL if unfinished)."""
+        entry = self._cached(game_id)
+        if entry is not None:
+            return entry
+
+        with self._lock:
+            game_lock = self._game_locks.setdefault(game_id, threading.Lock())
+        with game_lock:
+            # Another thread may have fetched it while we waited
+            entry = self._cached(game_id)
+            if entry is not None:
+                return entry
+
+            pbp, available_video = self._fetch(game_id, timeout)
+            entry = PBPGameFrames(
+                game_id=game_id,
+                pbp=pbp,
+                available_video=available_video,
+                is_final=_is_final_pbp(pbp),
+                fetched_at=time.time(),
+            )
+            with self._lock:
+                self.stats["refreshes" if game_id in self._games else "misses"] += 1
+                self._games[game_id] = entry
+                self._games.move_to_end(game_id)
+                while len(self._games) > self.max_games:
+                    evicted, _ = self._games.popitem(last=False)
+                    self._game_locks.pop(evicted, None)
+                    self.stats["evictions"] += 1
+            logger.debug(
+                f"PBP cache: fetched {game_id} ({len(pbp)} events, final={entry.is_final})"
+            )
+            return entry
+
+    def invalidate(self, game_id: Optional[str] = None):
+        """Drop one game (or all games) from the cache."""
+        with self._lock:
+            if game_id is None:
+                self._games.clear()
+            else:
+                self._games.pop(game_id, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and cached game counts."""
+        with self._lock:
+            return {
+                **self.stats,
+                "games": len(self._games),
+                "final_games": sum(1 for e in self._games.values() if e.is_final),
+            }
+
+
+_pbp_cache: Optional[PBPFrameCache] = None
+
+
+def get_pbp_cache() -> PBPFrameCache:
+    """Get the shared play-by-play frame cache."""
+    global _pbp_cache
+    if _pbp_cache is None:
+        _pbp_cache = PBPFrameCache()
+    return _pbp_cache
+
+
+def reset_pbp_cache():
+    """Drop the shared play-by-play frame cache."""
+    global _pbp_cache
+    _pbp_cache = None
+
+
 class PlayByPlayFetcher:
     """
     Fetch play‐by‐play via PlayByPlayV3, normalize to snake_case,
     and optionally stream events one by one.
+
+    Games are fetched once through the shared PBPFrameCache and sliced to
+    the requested periods locally.
     """
 
     def __init__(
@@ -95,45 +369,8 @@ class PlayByPlayFetcher:
     def fetch(self) -> pd.DataFrame:
         """Return a DataFrame of all events between start & end periods,
         with guaranteed 'period' and 'clock' columns."""
-        resp = PlayByPlayV3(
-            game_id=self.game_id,
-            start_period=self.start_period,
-            end_period=self.end_period,
-        )
-        dfs = resp.get_data_frames()
-
-        # debug what came back
-        logger.debug(f"[DEBUG fetch] got {len(dfs)} frame(s) from PlayByPlayV3")
-        for i, frame in enumerate(dfs):
-            logger.debug(f"[DEBUG fetch] frame[{i}] columns:", frame.columns.tolist())
-
-        # pick the frame that actually has period+clock
-        pbp_df = None
-        for frame in dfs:
-            lower_cols = [c.lower() for c in frame.columns]
-            if "period" in lower_cols and (
-                "clock" in lower_cols or "pctimestring" in lower_cols
-            ):
-                pbp_df = frame
-                break
-
-        if pbp_df is None:
-            logger.debug("⚠️ couldn't detect PBP frame; defaulting to dfs[1]")
-            if len(dfs) < 2:
-                raise RuntimeError(
-                    f"Expected ≥2 frames from PlayByPlayV3, got {len(dfs)}"
-                )
-            pbp_df = dfs[1]
-
-        df = pbp_df.copy()
-        df.columns = [_camel_to_snake(c) for c in df.columns]
-        df = df.rename(columns={"pctimestring": "clock", "quarter": "period"})
-
-        missing = [c for c in ("period", "clock") if c not in df.columns]
-        if missing:
-            raise RuntimeError(f"Missing expected column(s) in PBP: {missing}")
-
-        return df
+        frames = get_pbp_cache().get(self.game_id)
+        return frames.frame(self.start_period, self.end_period).copy()
 
     def stream(self, batch_size: int = 1) -> Any:
         """
@@ -141,7 +378,7 @@ class PlayByPlayFetcher:
         Yields dicts of each event (or lists of events, if batch_size > 1),
         starting at self.start_event_idx.
         """
-        df = self.fetch()
+        df = get_pbp_cache().get(self.game_id).frame(self.start_period, self.end_period)
         total = len(df)
         idx = self.start_event_idx
         while idx < total:
@@ -337,19 +574,14 @@ def get_playbyplay_v3(
     Wrap the new PlayByPlayFetcher so we get a snake_case
     DataFrame for PlayByPlay, plus the raw AvailableVideo.
     """
-    # 1) normalized play-by-play
-    df = PlayByPlayFetcher(game_id, start_period, end_period).fetch()
+    # normalized play-by-play and the raw AvailableVideo set come from
+    # the same (cached) PlayByPlayV3 response
+    frames = get_pbp_cache().get(game_id, timeout)
 
-    # 2) still need the AvailableVideo set raw
-    resp = PlayByPlayV3(
-        game_id=game_id, start_period=start_period, end_period=end_period
-    )
-    avail_df = resp.get_data_frames()[0]
-
-    # 3) return same dict shape as before
+    # return same dict shape as before
     return {
-        "AvailableVideo": avail_df.to_dict("records"),
-        "PlayByPlay": df.to_dict("records"),
+        "AvailableVideo": frames.available_video.to_dict("records"),
+        "PlayByPlay": frames.frame(start_period, end_period).to_dict("records"),
     }
 
 
@@ -360,16 +592,7 @@ def get_live_playbyplay(game_id: str, timeout: float = 5.0) -> List[Dict[str, An
 
     # FIXED: Include required headers explicitly
     payload = fetch_json(url, headers=_STATS_HEADERS, timeout=timeout)
-
-    if "liveData" in payload and "plays" in payload["liveData"]:
-        return payload["liveData"]["plays"]["play"]
-
-    if "game" in payload and "actions" in payload["game"]:
-        return payload["game"]["actions"]
-
-    raise RuntimeError(
-        f"Unrecognized live‑pbp shape for {game_id}: {list(payload.keys())}"
-    )
+    return extract_live_actions(payload, game_id)
 
 
 def get_live_boxscore(game_id: str, timeout: float = 5.0) -> Dict[str, Any]:
@@ -517,14 +740,15 @@ def diff_new_events(
 def stream_live_pbp(game_id: str, interval: float = 3.0):
     """
     Example generator: yields each new play as it appears in the live JSON feed.
+
+    Polls with If-None-Match and only yields actions past the last
+    actionNumber seen. For many consumers of the same game use the asyncio
+    hub in live_pbp_stream (one upstream poll per game, adaptive interval).
     """
-    cache: List[Dict[str, Any]] = []
+    tracker = LiveActionTracker(game_id)
     while True:
-        plays = get_live_playbyplay(game_id)
-        new = diff_new_events(cache, plays, key="eventId")
-        for evt in new:
+        for evt in tracker.update(fetch_live_actions(game_id, etag=tracker.etag)):
             yield evt
-        cache = plays
         time.sleep(interval)
 
 
@@ -912,7 +1136,7 @@ def debug_play_structure(game_id: str) -> None:
 class GameStream:
     def __init__(self, game_id: str):
         self.game_id = game_id
-        self.cache = []
+        self.tracker = LiveActionTracker(game_id)
 
     @staticmethod
     def get_today_games(timeout: float = 10.0) -> List[Dict[str, Any]]:
@@ -957,11 +1181,13 @@ class GameStream:
 
     def stream_new_events(self, interval: float = 3.0):
         while True:
-            plays = self.safe_fetch_live_pbp()
-            new = diff_new_events(self.cache, plays, key="eventId")
-            for evt in new:
-                yield evt
-            self.cache = plays
+            try:
+                result = fetch_live_actions(self.game_id, etag=self.tracker.etag)
+            except Exception as e:
+                logger.debug(f"[DEBUG] Error fetching live pbp for {self.game_id}: {e}")
+            else:
+                for evt in self.tracker.update(result):
+                    yield evt
             time.sleep(interval)
 
     def build_payload(
@@ -1409,25 +1635,21 @@ class PastGamesPlaybyPlay:
         timeout: float = 10.0,
     ) -> dict[str, Any]:
         """
-        Fetch historical play-by-play via PlayByPlayFetcher,
+        Fetch historical play-by-play from the shared PBPFrameCache,
         returning either DataFrames or record dicts.
         """
-        # 1) normalized PBP
-        df = PlayByPlayFetcher(self.game_id, start_period, end_period).fetch()
-
-        # 2) raw AvailableVideo
-        resp = PlayByPlayV3(
-            game_id=self.game_id, start_period=start_period, end_period=end_period
-        )
-        avail_df = resp.get_data_frames()[0]
+        # 1) normalized PBP + raw AvailableVideo from one cached response
+        frames = get_pbp_cache().get(self.game_id, timeout)
+        df = frames.frame(start_period, end_period)
+        avail_df = frames.available_video
 
-        # 3) return exactly the same API shape
+        # 2) return exactly the same API shape
         if as_records:
             return {
                 "AvailableVideo": avail_df.to_dict("records"),
                 "PlayByPlay": df.to_dict("records"),
             }
-        return {"AvailableVideo": avail_df, "PlayByPlay": df}
+        return {"AvailableVideo": avail_df.copy(), "PlayByPlay": df.copy()}
 
     # ---------- niceties -----------------------------------------------------
     def describe(self, timeout: float = 10.0) -> None:
@@ -1754,23 +1976,14 @@ class PastGamesPlaybyPlay:
         start_period: int = 1,
         end_period: Optional[int] = None,
     ) -> int:
-        """Locate the first event at or before a given quarter & clock."""
-        df = PlayByPlayFetcher(
-            game_id=self.game_id, start_period=start_period, end_period=end_period or 4
-        ).fetch()
+        """Locate the first event at or before a given quarter & clock.
 
-        # debug print (you can remove once you're confident)
-        logger.debug("[DEBUG] PBP columns: %s", df.columns.tolist())
-
-        # parse the target time (mm:ss → seconds)
-        mins, secs = map(int, clock.split(":"))
-        target = mins * 60 + secs
-
-        for idx, row in df.iterrows():
-            # now that fetch() guarantees 'period' & 'clock'
-            if row["period"] == period and self._iso_to_seconds(row["clock"]) <= target:
-                return idx
-        return 0
+        Uses the cached game's sorted clock index (binary search), so the
+        game is not refetched or scanned row by row.
+        """
+        return get_pbp_cache().get(self.game_id).event_index(
+            period, clock, start_period=start_period, end_period=end_period or 4
+        )
 
     def _fmt_top(self, stat: str) -> str:
         summary = group_live_game(self.game_id, recent_n=5)
@@ -5,21 +5,32 @@ Caching layer for NBA MCP.
 Provides Redis-based caching with TTL tiers, fallback cache, and compression.
 
 Features:
-- Redis cache with connection pooling
-- In-memory LRU fallback cache
-- Automatic compression for large payloads
+- Redis cache with connection pooling (async client, MGET/pipelined batches)
+- Circuit breaker with background health checks and automatic recovery
+- In-memory LRU fallback cache (byte-budgeted)
+- Binary codecs: Arrow IPC + zstd for tables/DataFrames, orjson/msgpack
+  for objects, legacy gzip/JSON still readable
 - Smart TTL selection based on season
 - Cache statistics and monitoring
 """
 
+from .codecs import (
+    Codec,
+    CodecError,
+    decode_value,
+    encode_value,
+    register_codec,
+)
 from .redis_cache import (
     CacheTier,
     LRUCache,
     RedisCache,
+    RedisCircuitBreaker,
     cached,
     close_cache,
     compress_value,
     decompress_value,
+    estimate_size,
     generate_cache_key,
     get_cache,
     get_smart_tier,
@@ -29,6 +40,7 @@ from .redis_cache import (
 
 __all__ = [
     "RedisCache",
+    "RedisCircuitBreaker",
     "LRUCache",
     "CacheTier",
     "cached",
@@ -37,6 +49,12 @@ __all__ = [
     "get_smart_tier",
     "compress_value",
     "decompress_value",
+    "estimate_size",
+    "Codec",
+    "CodecError",
+    "encode_value",
+    "decode_value",
+    "register_codec",
     "initialize_cache",
     "get_cache",
     "close_cache",
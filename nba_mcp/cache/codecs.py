@@ -0,0 +1,391 @@
+# nba_mcp/cache/codecs.py
+"""
+Binary value codecs for the Redis cache.
+
+Every value written by RedisCache starts with a 6-byte header:
+
+    b"\\x93NBA" | codec id (1 byte) | body compression (1 byte)
+
+The first byte (0x93) can never start JSON text or a gzip stream, so values
+written before this format (JSON, or gzip'd JSON) are still read back.
+
+Codecs (first one able to encode a value wins):
+- Arrow IPC (zstd) for pyarrow Tables and pandas DataFrames; the body is
+  compressed per buffer by Arrow itself and decodes zero-copy
+- orjson, then msgpack (if installed), then json for dicts/lists/scalars;
+  bodies above the threshold are compressed with zstd (gzip if zstandard
+  is unavailable). orjson writes NaN/Infinity as null, so float stats that
+  were NaN read back as None (the old json.dumps path kept NaN)
+- Raw bytes
+
+Codecs are pluggable with register_codec(), e.g. prefer LZ4 (faster,
+slightly larger) for tables:
+
+    register_codec(ArrowTableCodec("lz4"), prefer=True)
+"""
+
+import gzip
+import json
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+MAGIC = b"\x93NBA"
+HEADER_SIZE = len(MAGIC) + 2
+GZIP_MAGIC = b"\x1f\x8b"
+
+# Body compression ids (header byte 6)
+COMPRESSION_NONE = 0
+COMPRESSION_ZSTD = 1
+COMPRESSION_GZIP = 2
+COMPRESSION_NAMES = {
+    COMPRESSION_NONE: "none",
+    COMPRESSION_ZSTD: "zstd",
+    COMPRESSION_GZIP: "gzip",
+}
+
+ZSTD_LEVEL = 3
+
+
+class CodecError(ValueError):
+    """Raised when a cached value cannot be encoded or decoded."""
+
+    pass
+
+
+# ============================================================================
+# CODECS
+# ============================================================================
+
+
+class Codec(ABC):
+    """
+    One serialization format.
+
+    Subclasses must implement can_encode, encode and decode; a codec missing
+    one of them fails when it is constructed.
+
+    Attributes:
+        codec_id: Byte stored in the header (unique, 1-255)
+        name: Human-readable name (stats, benchmarks)
+        compressible: Whether the body may be compressed on top
+    """
+
+    codec_id: int = 0
+    name: str = ""
+    compressible: bool = True
+
+    @abstractmethod
+    def can_encode(self, value: Any) -> bool:
+        """Whether this codec handles the value's type."""
+
+    @abstractmethod
+    def encode(self, value: Any) -> bytes:
+        """Serialize a value (raise TypeError/ValueError if unsupported)."""
+
+    @abstractmethod
+    def decode(self, body: bytes) -> Any:
+        """Deserialize a body produced by encode()."""
+
+
+class ArrowTableCodec(Codec):
+    """pyarrow Tables as Arrow IPC streams with per-buffer compression."""
+
+    compressible = False
+    _IDS = {"zstd": 1, "lz4": 2}
+
+    def __init__(self, compression: str = "zstd"):
+        if compression not in self._IDS:
+            raise ValueError(f"Unsupported Arrow compression: {compression}")
+        self.compression = compression
+        self.codec_id = self._IDS[compression]
+        self.name = f"arrow-{compression}"
+        self._options = pa.ipc.IpcWriteOptions(
+            compression="lz4_frame" if compression == "lz4" else compression
+        )
+
+    def can_encode(self, value: Any) -> bool:
+        return isinstance(value, pa.Table)
+
+    def _to_table(self, value: Any) -> pa.Table:
+        return value
+
+    def encode(self, value: Any) -> bytes:
+        table = self._to_table(value)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema, options=self._options) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+    def decode(self, body: bytes) -> Any:
+        return pa.ipc.open_stream(pa.py_buffer(body)).read_all()
+
+
+class DataFrameCodec(ArrowTableCodec):
+    """pandas DataFrames via Arrow IPC (index and dtypes kept in pandas metadata)."""
+
+    _IDS = {"zstd": 3, "lz4": 4}
+
+    def __init__(self, compression: str = "zstd"):
+        super().__init__(compression)
+        self.name = f"pandas-arrow-{compression}"
+
+    def can_encode(self, value: Any) -> bool:
+        return isinstance(value, pd.DataFrame)
+
+    def _to_table(self, value: Any) -> pa.Table:
+        return pa.Table.from_pandas(value)
+
+    def decode(self, body: bytes) -> Any:
+        return super().decode(body).to_pandas()
+
+
+class OrjsonCodec(Codec):
+    """
+    JSON-compatible values via orjson (numpy values and non-str keys allowed).
+
+    NaN and Infinity are written as null (standard JSON) and decode to None,
+    whereas json.dumps wrote the non-standard NaN token and read back a float.
+    """
+
+    codec_id = 16
+    name = "orjson"
+    _OPTIONS = (
+        (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+        if ORJSON_AVAILABLE
+        else 0
+    )
+
+    def can_encode(self, value: Any) -> bool:
+        return ORJSON_AVAILABLE
+
+    def encode(self, value: Any) -> bytes:
+        return orjson.dumps(value, option=self._OPTIONS)
+
+    def decode(self, body: bytes) -> Any:
+        return orjson.loads(body)
+
+
+class MsgpackCodec(Codec):
+    """msgpack for values orjson rejects (e.g., bytes inside dicts)."""
+
+    codec_id = 17
+    name = "msgpack"
+
+    def can_encode(self, value: Any) -> bool:
+        return MSGPACK_AVAILABLE
+
+    def encode(self, value: Any) -> bytes:
+        return msgpack.packb(value, use_bin_type=True)
+
+    def decode(self, body: bytes) -> Any:
+        return msgpack.unpackb(body, raw=False, strict_map_key=False)
+
+
+class JsonCodec(Codec):
+    """Standard-library JSON (always available)."""
+
+    codec_id = 18
+    name = "json"
+
+    def can_encode(self, value: Any) -> bool:
+        return True
+
+    def encode(self, value: Any) -> bytes:
+        return json.dumps(value).encode("utf-8")
+
+    def decode(self, body: bytes) -> Any:
+        return json.loads(body)
+
+
+class BytesCodec(Codec):
+    """Raw bytes, stored as-is."""
+
+    codec_id = 32
+    name = "bytes"
+
+    def can_encode(self, value: Any) -> bool:
+        return isinstance(value, (bytes, bytearray, memoryview))
+
+    def encode(self, value: Any) -> bytes:
+        return bytes(value)
+
+    def decode(self, body: bytes) -> Any:
+        return body
+
+
+# ============================================================================
+# REGISTRY
+# ============================================================================
+
+_codecs_by_id: Dict[int, Codec] = {}
+_encode_order: List[Codec] = []
+
+
+def register_codec(codec: Codec, prefer: bool = False, encode: bool = True):
+    """
+    Register a codec for decoding and (optionally) encoding.
+
+    Args:
+        codec: Codec instance (its codec_id must be unique or replace an
+            existing codec with the same id)
+        prefer: Try this codec before the registered ones when encoding
+        encode: Use it for encoding at all (False: decode-only)
+    """
+    _codecs_by_id[codec.codec_id] = codec
+    _encode_order[:] = [c for c in _encode_order if c.codec_id != codec.codec_id]
+    if encode:
+        if prefer:
+            _encode_order.insert(0, codec)
+        else:
+            _encode_order.append(codec)
+
+
+def get_codec(codec_id: int) -> Optional[Codec]:
+    """Codec registered under an id."""
+    return _codecs_by_id.get(codec_id)
+
+
+register_codec(ArrowTableCodec("zstd"))
+register_codec(ArrowTableCodec("lz4"), encode=False)
+register_codec(DataFrameCodec("zstd"))
+register_codec(DataFrameCodec("lz4"), encode=False)
+register_codec(BytesCodec())
+register_codec(OrjsonCodec(), encode=ORJSON_AVAILABLE)
+register_codec(MsgpackCodec(), encode=MSGPACK_AVAILABLE)
+register_codec(JsonCodec())
+
+
+# ============================================================================
+# ENCODE / DECODE
+# ============================================================================
+
+
+def _compress(body: bytes) -> Tuple[bytes, int]:
+    if ZSTD_AVAILABLE:
+        return (
+            zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(body),
+            COMPRESSION_ZSTD,
+        )
+    return gzip.compress(body), COMPRESSION_GZIP
+
+
+def _decompress(body: bytes, compression: int) -> bytes:
+    if compression == COMPRESSION_NONE:
+        return body
+    if compression == COMPRESSION_ZSTD:
+        if not ZSTD_AVAILABLE:
+            raise CodecError("Value is zstd-compressed but zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompress(body)
+    if compression == COMPRESSION_GZIP:
+        return gzip.decompress(body)
+    raise CodecError(f"Unknown compression id: {compression}")
+
+
+def encode_value(value: Any, compression_threshold: Optional[int] = 1024) -> bytes:
+    """
+    Serialize a value with the first codec that accepts it.
+
+    Args:
+        value: Value to cache
+        compression_threshold: Compress bodies larger than this many bytes
+            (None disables body compression; Arrow codecs always compress
+            their buffers)
+
+    Returns:
+        Header + body
+
+    Raises:
+        TypeError: If no registered codec can encode the value
+    """
+    errors = []
+    for codec in _encode_order:
+        if not codec.can_encode(value):
+            continue
+        try:
+            body = codec.encode(value)
+        except (TypeError, ValueError, OverflowError, pa.ArrowException) as e:
+            errors.append(f"{codec.name}: {e}")
+            continue
+
+        compression = COMPRESSION_NONE
+        if (
+            codec.compressible
+            and compression_threshold is not None
+            and len(body) > compression_threshold
+        ):
+            body, compression = _compress(body)
+        return MAGIC + bytes((codec.codec_id, compression)) + body
+
+    raise TypeError(f"No codec can encode {type(value).__name__}: {'; '.join(errors)}")
+
+
+def decode_value(data: bytes) -> Any:
+    """
+    Deserialize a cached value (current format, legacy gzip'd JSON, or JSON).
+
+    Raises:
+        CodecError: If the value is corrupt or its codec isn't registered
+    """
+    if data[: len(MAGIC)] == MAGIC:
+        if len(data) < HEADER_SIZE:
+            raise CodecError("Truncated cache value header")
+        codec = _codecs_by_id.get(data[4])
+        if codec is None:
+            raise CodecError(f"Unknown codec id: {data[4]}")
+        try:
+            return codec.decode(_decompress(data[HEADER_SIZE:], data[5]))
+        except CodecError:
+            raise
+        except Exception as e:
+            raise CodecError(f"{codec.name} decode failed: {e}") from e
+
+    # Legacy values: gzip'd JSON or plain JSON
+    try:
+        if data[:2] == GZIP_MAGIC:
+            data = gzip.decompress(data)
+        return json.loads(data)
+    except Exception as e:
+        raise CodecError(f"Legacy value decode failed: {e}") from e
+
+
+def describe_value(data: bytes) -> Tuple[str, str]:
+    """
+    (codec name, body compression) of a cached value, from its header.
+
+    Legacy values are reported as ("legacy-json", "gzip" | "none").
+    """
+    if data[: len(MAGIC)] == MAGIC and len(data) >= HEADER_SIZE:
+        codec = _codecs_by_id.get(data[4])
+        name = codec.name if codec else f"unknown-{data[4]}"
+        return name, COMPRESSION_NAMES.get(data[5], "unknown")
+    return "legacy-json", "gzip" if data[:2] == GZIP_MAGIC else "none"
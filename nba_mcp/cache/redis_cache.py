@@ -9,30 +9,43 @@ Provides intelligent caching based on data freshness requirements:
 - Static data (7d): Player names, team info
 
 Features:
-- Connection pooling
-- In-memory fallback cache (LRU)
-- Response compression (gzip)
+- Connection pooling (asyncio client for async callers, sync client kept)
+- MGET / pipelined SETEX for batch lookups and writes
+- Circuit breaker with background health checks and automatic recovery
+- In-memory fallback cache (LRU, byte-budgeted) for values Redis does not hold
+- Binary codecs (Arrow IPC + zstd for tables, orjson/msgpack for objects;
+  legacy gzip/JSON values still readable, see codecs.py)
 - Stale-while-revalidate
 - Cache statistics
 - Automatic key generation
 """
 
+import asyncio
 import gzip
 import hashlib
+import heapq
 import json
 import logging
+import pickle
+import sys
+import threading
 import time
 from collections import OrderedDict
 from datetime import datetime, timedelta
 from enum import Enum
 from functools import wraps
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import redis
+import redis.asyncio as aioredis
 from redis.connection import ConnectionPool
 
+from .codecs import CodecError, decode_value, describe_value, encode_value
+
 logger = logging.getLogger(__name__)
 
+_MISSING = object()
+
 
 # ============================================================================
 # TTL TIERS
@@ -56,25 +69,94 @@ class CacheTier(Enum):
 # ============================================================================
 
 
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # 256 MB
+DEFAULT_SWEEP_INTERVAL = 30.0  # seconds between proactive expiry sweeps
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Estimate the in-memory size of a cached value in bytes.
+
+    Arrow tables/batches report their buffer sizes, pandas objects their
+    deep memory usage, bytes their length; anything else is estimated from
+    its pickled size.
+
+    Args:
+        value: Value to measure
+
+    Returns:
+        Approximate size in bytes
+    """
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int) and type(value).__module__.startswith("pyarrow"):
+        return nbytes
+
+    memory_usage = getattr(value, "memory_usage", None)
+    if callable(memory_usage) and type(value).__module__.startswith("pandas"):
+        try:
+            usage = memory_usage(deep=True)
+            return int(usage.sum() if hasattr(usage, "sum") else usage)
+        except Exception:
+            pass
+
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+
 class LRUCache:
     """
-    In-memory LRU cache with TTL support.
+    In-memory LRU cache with TTL support and a byte budget.
 
-    Used as fallback when Redis is unavailable. Provides basic caching
-    functionality with automatic eviction of least recently used items.
+    Used as fallback when Redis is unavailable. Each entry is sized on insert
+    (see estimate_size) and least recently used entries are evicted until the
+    total fits within max_bytes. Expired entries are swept proactively (at most
+    every sweep_interval seconds, on access) rather than only when read.
     """
 
-    def __init__(self, max_size: int = 1000):
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        sweep_interval: float = DEFAULT_SWEEP_INTERVAL,
+    ):
         """
         Initialize LRU cache.
 
         Args:
-            max_size: Maximum number of items to store
+            max_size: Optional maximum number of items (None = bytes only)
+            max_bytes: Maximum total size of cached values in bytes
+            sweep_interval: Minimum seconds between expiry sweeps
         """
         self.cache: OrderedDict = OrderedDict()
         self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.sweep_interval = sweep_interval
         self.ttls: Dict[str, float] = {}  # key -> expiration timestamp
-        logger.info(f"In-memory LRU cache initialized (max_size={max_size})")
+        self.sizes: Dict[str, int] = {}  # key -> estimated bytes
+        self.total_bytes = 0
+
+        # (expiration, key) min-heap; stale entries are skipped when popped
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._last_sweep = time.monotonic()
+        self._lock = threading.RLock()
+
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "sets": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "rejected": 0,
+        }
+        logger.info(
+            f"In-memory LRU cache initialized (max_bytes={max_bytes / 1024 / 1024:.0f} MB, "
+            f"max_size={max_size})"
+        )
 
     def get(self, key: str) -> Optional[Any]:
         """
@@ -86,65 +168,155 @@ class LRUCache:
         Returns:
             Cached value or None if not found/expired
         """
-        if key not in self.cache:
-            return None
-
-        # Check if expired
-        if key in self.ttls and time.time() > self.ttls[key]:
-            self.cache.pop(key)
-            self.ttls.pop(key, None)
-            return None
-
-        # Move to end (mark as recently used)
-        self.cache.move_to_end(key)
-        return self.cache[key]
+        with self._lock:
+            self._maybe_sweep()
+
+            if key not in self.cache:
+                self.stats["misses"] += 1
+                return None
+
+            # Check if expired
+            if time.time() > self.ttls.get(key, float("inf")):
+                self._remove(key)
+                self.stats["expirations"] += 1
+                self.stats["misses"] += 1
+                return None
+
+            # Move to end (mark as recently used)
+            self.cache.move_to_end(key)
+            self.stats["hits"] += 1
+            return self.cache[key]
 
     def set(self, key: str, value: Any, ttl: int):
         """
         Set value in cache with TTL.
 
+        Values larger than the whole byte budget are not cached.
+
         Args:
             key: Cache key
             value: Value to cache
             ttl: Time to live in seconds
         """
-        # Remove if already exists
-        if key in self.cache:
-            self.cache.pop(key)
-
-        # Add to cache
-        self.cache[key] = value
-        self.ttls[key] = time.time() + ttl
-
-        # Evict oldest if over max size
-        if len(self.cache) > self.max_size:
-            oldest_key = next(iter(self.cache))
-            self.cache.pop(oldest_key)
-            self.ttls.pop(oldest_key, None)
+        size = estimate_size(value)
+
+        with self._lock:
+            # Remove if already exists
+            if key in self.cache:
+                self._remove(key)
+
+            if size > self.max_bytes:
+                self.stats["rejected"] += 1
+                logger.debug(
+                    f"LRU cache: {key} ({size} bytes) exceeds budget, not cached"
+                )
+                return
+
+            # Add to cache
+            expires_at = time.time() + ttl
+            self.cache[key] = value
+            self.ttls[key] = expires_at
+            self.sizes[key] = size
+            self.total_bytes += size
+            heapq.heappush(self._expiry_heap, (expires_at, key))
+            self.stats["sets"] += 1
+
+            self._maybe_sweep()
+
+            # Evict least recently used until within budget
+            while self.cache and (
+                self.total_bytes > self.max_bytes
+                or (self.max_size is not None and len(self.cache) > self.max_size)
+            ):
+                oldest_key = next(iter(self.cache))
+                self._remove(oldest_key)
+                self.stats["evictions"] += 1
 
     def delete(self, key: str):
         """Delete key from cache."""
-        self.cache.pop(key, None)
-        self.ttls.pop(key, None)
+        with self._lock:
+            self._remove(key)
 
     def clear(self):
         """Clear all cache entries."""
-        self.cache.clear()
-        self.ttls.clear()
+        with self._lock:
+            self.cache.clear()
+            self.ttls.clear()
+            self.sizes.clear()
+            self._expiry_heap.clear()
+            self.total_bytes = 0
 
     def size(self) -> int:
         """Get current cache size."""
         return len(self.cache)
 
+    def sweep_expired(self) -> int:
+        """
+        Remove every expired entry.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            now = time.time()
+            removed = 0
+            heap = self._expiry_heap
+            while heap and heap[0][0] <= now:
+                expires_at, key = heapq.heappop(heap)
+                # Skip heap entries superseded by a later set() or delete()
+                if self.ttls.get(key) == expires_at:
+                    self._remove(key)
+                    removed += 1
+
+            # Rebuild if superseded entries dominate the heap
+            if len(heap) > 2 * len(self.cache) + 64:
+                self._expiry_heap = [(self.ttls[k], k) for k in self.cache]
+                heapq.heapify(self._expiry_heap)
+
+            self._last_sweep = time.monotonic()
+            self.stats["expirations"] += removed
+            if removed:
+                logger.debug(f"LRU cache swept {removed} expired entries")
+            return removed
+
+    def _maybe_sweep(self):
+        """Sweep expired entries if the sweep interval has elapsed."""
+        if time.monotonic() - self._last_sweep >= self.sweep_interval:
+            self.sweep_expired()
+
+    def _remove(self, key: str):
+        """Drop a key and release its bytes (caller holds the lock)."""
+        if self.cache.pop(key, _MISSING) is not _MISSING:
+            self.total_bytes -= self.sizes.pop(key, 0)
+        self.ttls.pop(key, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with counters, item count and byte usage
+        """
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "items": len(self.cache),
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "hit_rate": self.stats["hits"] / lookups if lookups else 0.0,
+        }
+
 
 # ============================================================================
-# COMPRESSION HELPERS
+# COMPRESSION HELPERS (legacy JSON + gzip format)
 # ============================================================================
+# RedisCache now writes values through the codec layer (codecs.py); these
+# produce/read the previous format, which decode_value still accepts.
 
 
 def compress_value(value: Any, threshold: int = 1024) -> tuple[bytes, bool]:
     """
-    Compress value if larger than threshold.
+    Compress value if larger than threshold (legacy format).
 
     Args:
         value: Value to compress (will be JSON serialized)
@@ -164,7 +336,7 @@ def compress_value(value: Any, threshold: int = 1024) -> tuple[bytes, bool]:
 
 def decompress_value(data: bytes, was_compressed: bool) -> Any:
     """
-    Decompress value if needed.
+    Decompress value if needed (legacy format).
 
     Args:
         data: Compressed or uncompressed data
@@ -210,6 +382,112 @@ def generate_cache_key(
     return f"nba_mcp:{version}:{tool_name}:{param_hash}"
 
 
+# ============================================================================
+# CIRCUIT BREAKER
+# ============================================================================
+
+DEFAULT_SOCKET_TIMEOUT = 2.0  # seconds (connect and per-command)
+DEFAULT_HEALTH_CHECK_INTERVAL = 5.0  # seconds between background pings
+DEFAULT_FAILURE_THRESHOLD = 3  # consecutive failures before the circuit opens
+DEFAULT_RECOVERY_TIMEOUT = 5.0  # seconds before an open circuit lets a probe through
+
+
+class RedisCircuitBreaker:
+    """
+    Circuit breaker guarding Redis calls.
+
+    States:
+    - CLOSED: Requests go to Redis
+    - OPEN: Redis is skipped (fallback cache only)
+    - HALF_OPEN: One probe request is let through after recovery_timeout
+
+    Unlike api.errors.CircuitBreaker this never raises: callers ask
+    allow_request() and serve from the fallback cache when it says no.
+    A successful request or background health check closes the circuit.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        recovery_timeout: float = DEFAULT_RECOVERY_TIMEOUT,
+    ):
+        """
+        Args:
+            failure_threshold: Consecutive failures before opening the circuit
+            recovery_timeout: Seconds before a half-open probe is allowed
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = "CLOSED"  # CLOSED, OPEN, HALF_OPEN
+        self.failure_count = 0
+        self.trips = 0
+        self.recoveries = 0
+        self._opened_at = 0.0
+        self._probe_started = 0.0
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """Whether a request may go to Redis now."""
+        with self._lock:
+            if self.state == "CLOSED":
+                return True
+            now = time.monotonic()
+            if self.state == "OPEN":
+                if now - self._opened_at < self.recovery_timeout:
+                    return False
+                self.state = "HALF_OPEN"
+                self._probe_started = now
+                logger.info("Redis circuit half-open, probing")
+                return True
+            # HALF_OPEN: one probe at a time (re-allow if a probe never reported)
+            if now - self._probe_started >= self.recovery_timeout:
+                self._probe_started = now
+                return True
+            return False
+
+    def record_success(self):
+        """Record a successful Redis call (closes the circuit)."""
+        with self._lock:
+            if self.state != "CLOSED":
+                self.recoveries += 1
+                logger.info("Redis recovered, circuit closed")
+            self.state = "CLOSED"
+            self.failure_count = 0
+
+    def record_failure(self):
+        """Record a failed Redis call (may open the circuit)."""
+        with self._lock:
+            self.failure_count += 1
+            if self.state == "HALF_OPEN" or (
+                self.state == "CLOSED" and self.failure_count >= self.failure_threshold
+            ):
+                self._open()
+
+    def trip(self):
+        """Open the circuit immediately (e.g., Redis unreachable at startup)."""
+        with self._lock:
+            if self.state != "OPEN":
+                self._open()
+
+    def _open(self):
+        self.state = "OPEN"
+        self._opened_at = time.monotonic()
+        self.trips += 1
+        logger.warning(
+            f"Redis circuit opened after {self.failure_count} failure(s); "
+            f"using fallback cache, retrying in {self.recovery_timeout:.0f}s"
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Breaker state and counters."""
+        return {
+            "state": self.state,
+            "failure_count": self.failure_count,
+            "trips": self.trips,
+            "recoveries": self.recoveries,
+        }
+
+
 # ============================================================================
 # REDIS CACHE CLIENT
 # ============================================================================
@@ -218,6 +496,16 @@ def generate_cache_key(
 class RedisCache:
     """
     Redis cache client with TTL tiers, fallback cache, and compression.
+
+    Two APIs over the same keys:
+    - Async (aget/aset/aget_many/aset_many/adelete): pooled redis.asyncio
+      client, MGET and pipelined SETEX for batches. Used by the decorators
+      and CacheManager.
+    - Sync (get/set/get_many/set_many/delete): kept for legacy callers.
+
+    Availability is tracked by a circuit breaker fed by every call and by a
+    background health check (started with the async client), so Redis
+    outages fall back to the in-memory cache and recover automatically.
     """
 
     def __init__(
@@ -228,7 +516,13 @@ class RedisCache:
         decode_responses: bool = False,  # Changed to False for compression support
         enable_compression: bool = True,
         compression_threshold: int = 1024,
-        fallback_cache_size: int = 1000,
+        fallback_cache_size: Optional[int] = None,
+        fallback_cache_bytes: int = DEFAULT_MAX_BYTES,
+        db: Optional[int] = None,
+        socket_timeout: float = DEFAULT_SOCKET_TIMEOUT,
+        health_check_interval: float = DEFAULT_HEALTH_CHECK_INTERVAL,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        recovery_timeout: float = DEFAULT_RECOVERY_TIMEOUT,
     ):
         """
         Initialize Redis cache client with fallback and compression.
@@ -236,35 +530,61 @@ class RedisCache:
         Args:
             url: Redis connection URL
             password: Redis password (optional)
-            max_connections: Max connections in pool
+            max_connections: Max connections per pool (sync and async)
             decode_responses: Auto-decode bytes to strings (must be False for compression)
-            enable_compression: Enable gzip compression for large payloads
+            enable_compression: Compress large object payloads (tables are always
+                stored as compressed Arrow IPC)
             compression_threshold: Size threshold for compression (bytes)
-            fallback_cache_size: Size of in-memory fallback cache
+            fallback_cache_size: Optional item limit for the in-memory fallback cache
+            fallback_cache_bytes: Byte budget for the in-memory fallback cache
+            db: Redis database number (overrides the URL's)
+            socket_timeout: Connect/command timeout in seconds
+            health_check_interval: Seconds between background pings (0 disables)
+            failure_threshold: Consecutive failures before Redis is skipped
+            recovery_timeout: Seconds before a skipped Redis is probed again
         """
         self.url = url
         self.password = password
         self.enable_compression = enable_compression
         self.compression_threshold = compression_threshold
+        self.socket_timeout = socket_timeout
+        self.health_check_interval = health_check_interval
+        self.breaker = RedisCircuitBreaker(failure_threshold, recovery_timeout)
+
+        self._pool_kwargs: Dict[str, Any] = {
+            "password": password,
+            "max_connections": max_connections,
+            "decode_responses": decode_responses,
+            "socket_connect_timeout": socket_timeout,
+            "socket_timeout": socket_timeout,
+        }
+        if db is not None:
+            self._pool_kwargs["db"] = db
 
-        # Create Redis client
+        # Sync client (legacy API)
         try:
-            self.pool = ConnectionPool.from_url(
-                url,
-                password=password,
-                max_connections=max_connections,
-                decode_responses=decode_responses,
-            )
+            self.pool = ConnectionPool.from_url(url, **self._pool_kwargs)
             self.client = redis.Redis(connection_pool=self.pool)
-            self.redis_available = self.client.ping()
-            logger.info(f"Redis cache initialized: {url}")
         except Exception as e:
-            logger.warning(f"Redis unavailable: {e}. Using fallback cache only.")
+            logger.warning(f"Invalid Redis configuration: {e}. Using fallback cache only.")
+            self.pool = None
             self.client = None
-            self.redis_available = False
+
+        # Async client, created per event loop on first use
+        self._async_client: Optional[aioredis.Redis] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._health_task: Optional[asyncio.Task] = None
+
+        if self.client is not None and self.ping():
+            logger.info(f"Redis cache initialized: {url}")
+        elif self.client is not None:
+            self.breaker.trip()
+            logger.warning("Redis unavailable. Using fallback cache until it recovers.")
 
         # Create fallback cache
-        self.fallback = LRUCache(max_size=fallback_cache_size)
+        self.fallback = LRUCache(
+            max_size=fallback_cache_size, max_bytes=fallback_cache_bytes
+        )
 
         # Statistics
         self.stats = {
@@ -276,8 +596,77 @@ class RedisCache:
             "redis_hits": 0,
             "fallback_hits": 0,
             "compression_saves": 0,
+            "batch_gets": 0,
+            "batch_sets": 0,
+            "health_checks": 0,
         }
 
+    @property
+    def redis_available(self) -> bool:
+        """Whether Redis is currently in use (circuit closed)."""
+        return self.client is not None and self.breaker.state == "CLOSED"
+
+    # ------------------------------------------------------------------
+    # Serialization and bookkeeping shared by both APIs
+    # ------------------------------------------------------------------
+
+    def _encode(self, key: str, value: Any) -> Optional[bytes]:
+        """Serialize a value for Redis (None if no codec can encode it)."""
+        threshold = self.compression_threshold if self.enable_compression else None
+        try:
+            data = encode_value(value, threshold)
+        except TypeError as e:
+            logger.debug(f"Value for {key} not serializable ({e}); kept in fallback only")
+            return None
+        codec_name, compression = describe_value(data)
+        if compression != "none" or codec_name.startswith(("arrow", "pandas")):
+            self.stats["compression_saves"] += 1
+        return data
+
+    def _decode(self, key: str, data: bytes) -> Any:
+        """Deserialize a Redis value (_MISSING if it is corrupt)."""
+        try:
+            return decode_value(data)
+        except CodecError as e:
+            self.stats["errors"] += 1
+            logger.warning(f"Corrupt Redis value for {key}: {e}")
+            return _MISSING
+
+    def _redis_error(self, operation: str, error: Exception):
+        """Count a failed Redis call against the circuit breaker."""
+        self.stats["errors"] += 1
+        self.breaker.record_failure()
+        logger.error(f"Redis {operation} error: {error}, falling back to memory cache")
+
+    def _redis_hit(self, key: str):
+        self.stats["hits"] += 1
+        self.stats["redis_hits"] += 1
+        logger.debug(f"Cache HIT (Redis): {key}")
+
+    def _get_fallback(self, key: str) -> Optional[Any]:
+        """Look a key up in the fallback cache, recording hit/miss."""
+        value = self.fallback.get(key)
+        if value is not None:
+            self.stats["hits"] += 1
+            self.stats["fallback_hits"] += 1
+            logger.debug(f"Cache HIT (fallback): {key}")
+            return value
+
+        self.stats["misses"] += 1
+        logger.debug(f"Cache MISS: {key}")
+        return None
+
+    def _set_fallback(self, key: str, value: Any, ttl: int):
+        # Only values Redis does not hold (outage, failed write, unencodable)
+        try:
+            self.fallback.set(key, value, ttl)
+        except Exception as e:
+            logger.warning(f"Fallback cache SET error: {e}")
+
+    # ------------------------------------------------------------------
+    # Sync API (legacy)
+    # ------------------------------------------------------------------
+
     def get(self, key: str) -> Optional[Any]:
         """
         Get value from cache (Redis with fallback).
@@ -288,133 +677,453 @@ class RedisCache:
         Returns:
             Cached value or None if not found
         """
-        # Try Redis first if available
-        if self.redis_available and self.client:
+        if self.client is not None and self.breaker.allow_request():
             try:
-                value = self.client.get(key)
-
-                if value is not None:
-                    self.stats["hits"] += 1
-                    self.stats["redis_hits"] += 1
-                    logger.debug(f"Cache HIT (Redis): {key}")
-
-                    # Decompress if needed
-                    if self.enable_compression and value.startswith(b'\x1f\x8b'):  # gzip magic number
-                        return decompress_value(value, was_compressed=True)
-                    else:
-                        return json.loads(value)
-
+                data = self.client.get(key)
+                self.breaker.record_success()
             except Exception as e:
-                self.stats["errors"] += 1
-                logger.error(f"Redis GET error: {e}, falling back to memory cache")
-                self.redis_available = False
+                self._redis_error("GET", e)
+                data = None
 
-        # Try fallback cache
-        value = self.fallback.get(key)
-        if value is not None:
-            self.stats["hits"] += 1
-            self.stats["fallback_hits"] += 1
-            logger.debug(f"Cache HIT (fallback): {key}")
-            return value
+            if data is not None:
+                value = self._decode(key, data)
+                if value is not _MISSING:
+                    self._redis_hit(key)
+                    return value
 
-        # Cache miss
-        self.stats["misses"] += 1
-        logger.debug(f"Cache MISS: {key}")
-        return None
+        return self._get_fallback(key)
 
     def set(
         self, key: str, value: Any, ttl: int, tier: Optional[CacheTier] = None
     ) -> bool:
         """
-        Set value in cache with TTL (Redis + fallback).
+        Set value in cache with TTL (Redis, or fallback if Redis can't take it).
 
         Args:
             key: Cache key
-            value: Value to cache (will be JSON serialized)
+            value: Value to cache (serialized by the codec layer, see codecs.py)
             ttl: Time to live in seconds
             tier: Optional tier for logging
 
         Returns:
             True if successful, False otherwise
         """
-        # Always set in fallback cache for resilience
-        try:
-            self.fallback.set(key, value, ttl)
-        except Exception as e:
-            logger.warning(f"Fallback cache SET error: {e}")
-
-        # Try Redis if available
-        if self.redis_available and self.client:
+        if self.client is not None and self.breaker.allow_request():
+            data = self._encode(key, value)
+            if data is None:
+                self._set_fallback(key, value, ttl)
+                return False
             try:
-                # Compress if enabled and value is large
-                if self.enable_compression:
-                    data, was_compressed = compress_value(value, self.compression_threshold)
-                    if was_compressed:
-                        self.stats["compression_saves"] += 1
-                else:
-                    data = json.dumps(value).encode('utf-8')
-                    was_compressed = False
-
                 self.client.setex(key, ttl, data)
-                self.stats["sets"] += 1
-
-                if tier:
-                    comp_str = " [compressed]" if was_compressed else ""
-                    logger.debug(f"Cache SET (Redis): {key} (TTL={ttl}s, tier={tier}){comp_str}")
-                else:
-                    logger.debug(f"Cache SET (Redis): {key} (TTL={ttl}s)")
-
-                return True
-
+                self.breaker.record_success()
             except Exception as e:
-                self.stats["errors"] += 1
-                logger.error(f"Redis SET error: {e}, using fallback only")
-                self.redis_available = False
+                self._redis_error("SET", e)
+                self._set_fallback(key, value, ttl)
                 return False
 
-        # Redis unavailable, fallback already set
+            self.fallback.delete(key)  # drop a copy left from an outage
+            self.stats["sets"] += 1
+            tier_str = f", tier={tier}" if tier else ""
+            logger.debug(f"Cache SET (Redis): {key} (TTL={ttl}s{tier_str})")
+            return True
+
+        # Redis unavailable
+        self._set_fallback(key, value, ttl)
         if tier:
             logger.debug(f"Cache SET (fallback only): {key} (TTL={ttl}s, tier={tier})")
         return True
 
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Get several keys with one MGET (fallback for the rest).
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Dict of key → value for the keys found
+        """
+        found: Dict[str, Any] = {}
+        if keys and self.client is not None and self.breaker.allow_request():
+            try:
+                values = self.client.mget(keys)
+                self.breaker.record_success()
+                self.stats["batch_gets"] += 1
+            except Exception as e:
+                self._redis_error("MGET", e)
+                values = []
+            self._collect_redis_values(keys, values, found)
+
+        for key in keys:
+            if key not in found:
+                value = self._get_fallback(key)
+                if value is not None:
+                    found[key] = value
+        return found
+
+    def set_many(
+        self, items: Dict[str, Any], ttl: int, tier: Optional[CacheTier] = None
+    ) -> bool:
+        """
+        Set several keys with one pipelined round trip (fallback for the
+        values Redis can't take).
+
+        Args:
+            items: Dict of key → value
+            ttl: Time to live in seconds
+            tier: Optional tier for logging
+
+        Returns:
+            True if every value reached Redis (or Redis is skipped), False otherwise
+        """
+        if not items or self.client is None or not self.breaker.allow_request():
+            self._fallback_unstored(items, {}, ttl)
+            return True
+
+        encoded = self._encode_many(items)
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key, data in encoded.items():
+                pipe.setex(key, ttl, data)
+            pipe.execute()
+            self.breaker.record_success()
+        except Exception as e:
+            self._redis_error("pipelined SET", e)
+            self._fallback_unstored(items, {}, ttl)
+            return False
+
+        self._fallback_unstored(items, encoded, ttl)
+        self._record_batch_set(encoded, ttl, tier)
+        return len(encoded) == len(items)
+
     def delete(self, key: str) -> bool:
         """Delete key from cache (Redis + fallback)."""
-        # Delete from fallback
         self.fallback.delete(key)
 
-        # Delete from Redis if available
-        if self.redis_available and self.client:
+        if self.client is not None and self.breaker.allow_request():
             try:
                 self.client.delete(key)
+                self.breaker.record_success()
                 self.stats["deletes"] += 1
                 logger.debug(f"Cache DELETE: {key}")
                 return True
             except Exception as e:
-                self.stats["errors"] += 1
-                logger.error(f"Redis DELETE error: {e}", exc_info=True)
-                self.redis_available = False
+                self._redis_error("DELETE", e)
                 return False
         return True
 
     def clear(self) -> bool:
         """Clear all cache entries (Redis + fallback)."""
-        # Clear fallback
         self.fallback.clear()
 
-        # Clear Redis if available
-        if self.redis_available and self.client:
+        if self.client is not None and self.breaker.allow_request():
             try:
                 self.client.flushdb()
+                self.breaker.record_success()
                 logger.info("Cache cleared (Redis + fallback)")
                 return True
             except Exception as e:
-                logger.error(f"Redis CLEAR error: {e}", exc_info=True)
-                self.redis_available = False
+                self._redis_error("CLEAR", e)
                 return False
 
         logger.info("Cache cleared (fallback only)")
         return True
 
+    def ping(self) -> bool:
+        """Check if Redis is accessible (updates the circuit breaker)."""
+        try:
+            self.client.ping()
+            self.breaker.record_success()
+            return True
+        except Exception as e:
+            self.breaker.record_failure()
+            logger.error(f"Redis ping failed: {e}")
+            return False
+
+    def _collect_redis_values(
+        self, keys: List[str], values: List[Optional[bytes]], found: Dict[str, Any]
+    ):
+        """Decode MGET results into `found`."""
+        for key, data in zip(keys, values):
+            if data is None:
+                continue
+            value = self._decode(key, data)
+            if value is not _MISSING:
+                self._redis_hit(key)
+                found[key] = value
+
+    def _encode_many(self, items: Dict[str, Any]) -> Dict[str, bytes]:
+        encoded = {}
+        for key, value in items.items():
+            data = self._encode(key, value)
+            if data is not None:
+                encoded[key] = data
+        return encoded
+
+    def _fallback_unstored(self, items: Dict[str, Any], stored: Dict[str, bytes], ttl: int):
+        """Keep values Redis did not take in memory; drop outage copies of the rest."""
+        for key, value in items.items():
+            if key in stored:
+                self.fallback.delete(key)
+            else:
+                self._set_fallback(key, value, ttl)
+
+    def _record_batch_set(self, encoded: Dict[str, bytes], ttl: int, tier: Optional[CacheTier]):
+        self.stats["sets"] += len(encoded)
+        self.stats["batch_sets"] += 1
+        tier_str = f", tier={tier}" if tier else ""
+        logger.debug(f"Cache SET (Redis pipeline): {len(encoded)} keys (TTL={ttl}s{tier_str})")
+
+    # ------------------------------------------------------------------
+    # Async API
+    # ------------------------------------------------------------------
+
+    def _get_async_client(self) -> Optional["aioredis.Redis"]:
+        """Pooled async client for the running loop (starts health checks)."""
+        if self.client is None:
+            return None  # Invalid configuration
+
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            try:
+                pool = aioredis.ConnectionPool.from_url(self.url, **self._pool_kwargs)
+                self._async_client = aioredis.Redis(connection_pool=pool)
+            except Exception as e:
+                logger.warning(f"Async Redis client unavailable: {e}")
+                return None
+            self._async_loop = loop
+            self._health_task = None
+
+        self.start_health_checks()
+        return self._async_client
+
+    def _async_client_if_allowed(self) -> Optional["aioredis.Redis"]:
+        client = self._get_async_client()
+        if client is None or not self.breaker.allow_request():
+            return None
+        return client
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """
+        Get value from cache without blocking the event loop.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None if not found
+        """
+        client = self._async_client_if_allowed()
+        if client is not None:
+            try:
+                data = await client.get(key)
+                self.breaker.record_success()
+            except Exception as e:
+                self._redis_error("GET", e)
+                data = None
+
+            if data is not None:
+                value = self._decode(key, data)
+                if value is not _MISSING:
+                    self._redis_hit(key)
+                    return value
+
+        return self._get_fallback(key)
+
+    async def aget_with_ttl(self, key: str) -> Tuple[Optional[Any], Optional[float]]:
+        """
+        Get a value and its remaining Redis TTL in one pipelined round trip.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            (value, seconds left); seconds left is None for fallback hits,
+            misses and keys without an expiry
+        """
+        client = self._async_client_if_allowed()
+        if client is not None:
+            try:
+                async with client.pipeline(transaction=False) as pipe:
+                    pipe.get(key)
+                    pipe.pttl(key)
+                    data, pttl = await pipe.execute()
+                self.breaker.record_success()
+            except Exception as e:
+                self._redis_error("GET", e)
+                data = None
+
+            if data is not None:
+                value = self._decode(key, data)
+                if value is not _MISSING:
+                    self._redis_hit(key)
+                    return value, pttl / 1000 if pttl and pttl > 0 else None
+
+        return self._get_fallback(key), None
+
+    async def aset(
+        self, key: str, value: Any, ttl: int, tier: Optional[CacheTier] = None
+    ) -> bool:
+        """
+        Set value in cache with TTL without blocking the event loop.
+
+        Args:
+            key: Cache key
+            value: Value to cache (serialized by the codec layer, see codecs.py)
+            ttl: Time to live in seconds
+            tier: Optional tier for logging
+
+        Returns:
+            True if successful, False otherwise
+        """
+        client = self._async_client_if_allowed()
+        if client is None:
+            self._set_fallback(key, value, ttl)
+            return True
+
+        data = self._encode(key, value)
+        if data is None:
+            self._set_fallback(key, value, ttl)
+            return False
+        try:
+            await client.setex(key, ttl, data)
+            self.breaker.record_success()
+        except Exception as e:
+            self._redis_error("SET", e)
+            self._set_fallback(key, value, ttl)
+            return False
+
+        # Redis holds the value; don't also keep it in process memory
+        self.fallback.delete(key)
+        self.stats["sets"] += 1
+        tier_str = f", tier={tier}" if tier else ""
+        logger.debug(f"Cache SET (Redis): {key} (TTL={ttl}s{tier_str})")
+        return True
+
+    async def aget_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Get several keys with one MGET round trip (fallback for the rest).
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Dict of key → value for the keys found
+        """
+        found: Dict[str, Any] = {}
+        client = self._async_client_if_allowed() if keys else None
+        if client is not None:
+            try:
+                values = await client.mget(keys)
+                self.breaker.record_success()
+                self.stats["batch_gets"] += 1
+            except Exception as e:
+                self._redis_error("MGET", e)
+                values = []
+            self._collect_redis_values(keys, values, found)
+
+        for key in keys:
+            if key not in found:
+                value = self._get_fallback(key)
+                if value is not None:
+                    found[key] = value
+        return found
+
+    async def aset_many(
+        self, items: Dict[str, Any], ttl: int, tier: Optional[CacheTier] = None
+    ) -> bool:
+        """
+        Set several keys with one pipelined round trip (fallback for the
+        values Redis can't take).
+
+        Args:
+            items: Dict of key → value
+            ttl: Time to live in seconds
+            tier: Optional tier for logging
+
+        Returns:
+            True if every value reached Redis (or Redis is skipped), False otherwise
+        """
+        client = self._async_client_if_allowed() if items else None
+        if client is None:
+            self._fallback_unstored(items, {}, ttl)
+            return True
+
+        encoded = self._encode_many(items)
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                for key, data in encoded.items():
+                    pipe.setex(key, ttl, data)
+                await pipe.execute()
+            self.breaker.record_success()
+        except Exception as e:
+            self._redis_error("pipelined SET", e)
+            self._fallback_unstored(items, {}, ttl)
+            return False
+
+        self._fallback_unstored(items, encoded, ttl)
+        self._record_batch_set(encoded, ttl, tier)
+        return len(encoded) == len(items)
+
+    async def adelete(self, key: str) -> bool:
+        """Delete key from cache (Redis + fallback) without blocking."""
+        self.fallback.delete(key)
+
+        client = self._async_client_if_allowed()
+        if client is None:
+            return True
+        try:
+            await client.delete(key)
+            self.breaker.record_success()
+        except Exception as e:
+            self._redis_error("DELETE", e)
+            return False
+        self.stats["deletes"] += 1
+        logger.debug(f"Cache DELETE: {key}")
+        return True
+
+    # ------------------------------------------------------------------
+    # Background health checks
+    # ------------------------------------------------------------------
+
+    async def check_health(self) -> bool:
+        """Ping Redis once and feed the result to the circuit breaker."""
+        client = self._get_async_client()
+        if client is None:
+            return False
+
+        self.stats["health_checks"] += 1
+        try:
+            await asyncio.wait_for(client.ping(), timeout=self.socket_timeout)
+        except Exception as e:
+            self.breaker.record_failure()
+            logger.debug(f"Redis health check failed: {e}")
+            return False
+        self.breaker.record_success()
+        return True
+
+    def start_health_checks(self):
+        """Start the background health check on the running loop (idempotent)."""
+        if self.health_check_interval <= 0:
+            return
+        task = self._health_task
+        if task is None or task.done():
+            self._health_task = asyncio.get_running_loop().create_task(
+                self._health_check_loop()
+            )
+
+    async def _health_check_loop(self):
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            await self.check_health()
+
+    def stop_health_checks(self) -> Optional[asyncio.Task]:
+        """Cancel the background health check (returns the cancelled task)."""
+        task, self._health_task = self._health_task, None
+        if task is not None:
+            task.cancel()
+        return task
+
     def get_stats(self) -> Dict[str, Any]:
         """
         Get cache statistics including fallback and compression metrics.
@@ -439,26 +1148,44 @@ class RedisCache:
             "miss_ratio": 1.0 - hit_ratio,
             "fallback_ratio": fallback_ratio,
             "fallback_cache_size": self.fallback.size(),
+            "fallback_cache_bytes": self.fallback.total_bytes,
             "redis_available": self.redis_available,
+            "circuit": self.breaker.get_stats(),
         }
 
-    def ping(self) -> bool:
-        """Check if Redis is accessible."""
-        try:
-            self.client.ping()
-            return True
-        except Exception as e:
-            logger.error(f"Redis ping failed: {e}")
-            return False
-
     def close(self):
-        """Close Redis connection pool."""
+        """Stop health checks and close the Redis connection pools."""
+        self.stop_health_checks()
+        self._async_client = None
+        self._async_loop = None
         try:
-            self.pool.disconnect()
+            if self.pool is not None:
+                self.pool.disconnect()
             logger.info("Redis connection pool closed")
         except Exception as e:
             logger.error(f"Error closing Redis pool: {e}")
 
+    async def aclose(self):
+        """
+        Close the async pool as well (call from the loop that used it).
+
+        Unlike close(), waits for the cancelled health check task to finish,
+        so nothing is left running on the loop.
+        """
+        client = self._async_client
+        task = self.stop_health_checks()
+        self.close()
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if client is not None:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.error(f"Error closing async Redis pool: {e}")
+
 
 # ============================================================================
 # SMART TTL SELECTION
@@ -540,8 +1267,8 @@ def cached(tier: CacheTier, key_fn: Optional[Callable] = None, version: str = "v
             # Get cache instance (assumes global cache)
             cache = get_cache()
 
-            if cache is None or not cache.ping():
-                # Cache unavailable - call function directly
+            if cache is None:
+                # Cache not initialized - call function directly
                 logger.warning("Cache unavailable, calling function directly")
                 return await func(*args, **kwargs)
 
@@ -553,8 +1280,9 @@ def cached(tier: CacheTier, key_fn: Optional[Callable] = None, version: str = "v
                 params = kwargs.copy()
                 key = generate_cache_key(func.__name__, params, version)
 
-            # Try to get from cache
-            cached_value = cache.get(key)
+            # Try to get from cache (Redis outages are handled by the
+            # circuit breaker, which falls back to the memory cache)
+            cached_value = await cache.aget(key)
             if cached_value is not None:
                 logger.info(f"Cache hit for {func.__name__}")
                 return cached_value
@@ -565,7 +1293,7 @@ def cached(tier: CacheTier, key_fn: Optional[Callable] = None, version: str = "v
 
             # Store in cache
             if result is not None:
-                cache.set(key, result, tier.value, tier)
+                await cache.aset(key, result, tier.value, tier)
 
             return result
 
@@ -582,7 +1310,10 @@ _cache_instance: Optional[RedisCache] = None
 
 
 def initialize_cache(
-    url: str = "redis://localhost:6379/0", password: Optional[str] = None, **kwargs
+    url: str = "redis://localhost:6379/0",
+    password: Optional[str] = None,
+    redis_url: Optional[str] = None,
+    **kwargs,
 ) -> RedisCache:
     """
     Initialize global cache instance.
@@ -590,13 +1321,16 @@ def initialize_cache(
     Args:
         url: Redis connection URL
         password: Redis password
-        **kwargs: Additional Redis client options
+        redis_url: Alias for url (used by the server's startup code)
+        **kwargs: Additional RedisCache options (e.g., db, health_check_interval)
 
     Returns:
         RedisCache instance
     """
     global _cache_instance
-    _cache_instance = RedisCache(url, password, **kwargs)
+    if _cache_instance is not None:
+        _cache_instance.close()
+    _cache_instance = RedisCache(redis_url or url, password, **kwargs)
     return _cache_instance
 
 
@@ -642,14 +1376,14 @@ async def with_cache(
     """
     cache = get_cache()
 
-    if cache is None or not cache.ping():
+    if cache is None:
         return await func()
 
     # Generate key
     key = generate_cache_key(tool_name, params, version)
 
     # Try cache
-    cached_value = cache.get(key)
+    cached_value = await cache.aget(key)
     if cached_value is not None:
         return cached_value
 
@@ -658,6 +1392,6 @@ async def with_cache(
 
     # Store in cache
     if result is not None:
-        cache.set(key, result, tier.value, tier)
+        await cache.aset(key, result, tier.value, tier)
 
     return result
@@ -0,0 +1,300 @@
+"""
+Memory-mapped Arrow IPC cache tier for NBA MCP.
+
+Tier 1 for Arrow tables in CacheManager, sitting in front of Redis/LRU:
+- Tables are written once as uncompressed Arrow IPC files
+- Reads are zero-copy views over pa.memory_map (no deserialization, and the
+  OS page cache is shared by every worker process on the host)
+- Budgeted in bytes on disk rather than item count
+- Cross-process safe: atomic renames for writes, file mtimes for LRU order,
+  expiry stored in the file's schema metadata
+
+Point cache_dir at /dev/shm to keep the tier entirely in shared memory.
+Failures gracefully degrade to the next tier.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+# Schema metadata key holding the absolute expiry time (unix seconds)
+EXPIRES_AT_KEY = b"nba_mcp.expires_at"
+FILE_SUFFIX = ".arrow"
+
+
+@dataclass
+class ArrowIPCCacheConfig:
+    """Configuration for the memory-mapped Arrow IPC tier."""
+
+    cache_dir: Path = field(
+        default_factory=lambda: Path(tempfile.gettempdir()) / "nba_mcp_arrow_cache"
+    )
+    max_size_mb: int = 2048
+    eviction_target: float = 0.9  # Evict down to this fraction of the budget
+    rescan_interval: float = 60.0  # Seconds between size re-syncs with the directory
+
+    def __post_init__(self):
+        """Ensure cache_dir is a Path object."""
+        if not isinstance(self.cache_dir, Path):
+            self.cache_dir = Path(self.cache_dir)
+
+    @property
+    def max_bytes(self) -> int:
+        return self.max_size_mb * 1024 * 1024
+
+
+class ArrowIPCCache:
+    """
+    Byte-budgeted, memory-mapped Arrow IPC file cache.
+
+    The API mirrors LRUCache (get/set/delete with a TTL in seconds), but
+    values must be pyarrow Tables.
+    """
+
+    def __init__(self, config: Optional[ArrowIPCCacheConfig] = None):
+        """
+        Initialize the IPC tier.
+
+        Args:
+            config: Tier configuration (defaults to a temp directory, 2 GB)
+        """
+        self.config = config or ArrowIPCCacheConfig()
+        self.cache_dir = self.config.cache_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "sets": 0,
+            "expired": 0,
+            "evictions": 0,
+            "errors": 0,
+            "rescans": 0,
+        }
+
+        # Running estimate of the directory size: updated per write/remove by
+        # this process, re-synced by a scan when it crosses the budget or is
+        # older than rescan_interval (other processes write here too)
+        self._size_lock = threading.Lock()
+        self._tracked_bytes = 0
+        self._scanned_at = 0.0
+        self._rescan()
+
+        logger.info(
+            f"Arrow IPC cache initialized at {self.cache_dir} "
+            f"(max_size: {self.config.max_size_mb} MB)"
+        )
+
+    def _path_for(self, key: str) -> Path:
+        """File path for a cache key (hashed, so any key is filesystem-safe)."""
+        digest = hashlib.sha1(key.encode()).hexdigest()
+        return self.cache_dir / f"{digest}{FILE_SUFFIX}"
+
+    def get(self, key: str) -> Optional[pa.Table]:
+        """
+        Get a table as a zero-copy view over the memory-mapped file.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            pyarrow Table or None if missing/expired
+        """
+        path = self._path_for(key)
+        try:
+            source = pa.memory_map(str(path), "r")
+        except FileNotFoundError:
+            self.stats["misses"] += 1
+            return None
+        except Exception as e:
+            logger.warning(f"Arrow IPC cache open failed for {key}: {e}")
+            self.stats["errors"] += 1
+            return None
+
+        try:
+            table = pa.ipc.open_file(source).read_all()
+        except Exception as e:
+            # Partially written or corrupted file: drop it
+            logger.warning(f"Arrow IPC cache read failed for {key}: {e}")
+            self.stats["errors"] += 1
+            self._unlink(path)
+            return None
+
+        metadata = dict(table.schema.metadata or {})
+        expires_at = float(metadata.pop(EXPIRES_AT_KEY, b"inf"))
+        if time.time() > expires_at:
+            self.stats["expired"] += 1
+            self.stats["misses"] += 1
+            self._unlink(path)
+            return None
+
+        # Mark as recently used for cross-process LRU ordering
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+        self.stats["hits"] += 1
+        return table.replace_schema_metadata(metadata or None)
+
+    def set(self, key: str, value: pa.Table, ttl: int):
+        """
+        Write a table to the tier (atomic replace), then enforce the byte budget.
+
+        Args:
+            key: Cache key
+            value: pyarrow Table
+            ttl: Time to live in seconds
+        """
+        if not isinstance(value, pa.Table):
+            return
+
+        metadata = dict(value.schema.metadata or {})
+        metadata[EXPIRES_AT_KEY] = str(time.time() + ttl).encode()
+        table = value.replace_schema_metadata(metadata)
+
+        path = self._path_for(key)
+        tmp_path = path.with_name(
+            f".{path.stem}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp"
+        )
+        try:
+            with pa.OSFile(str(tmp_path), "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            new_size = tmp_path.stat().st_size
+            old_size = self._file_size(path)
+            os.replace(tmp_path, path)
+            self.stats["sets"] += 1
+            self._track(new_size - old_size)
+        except Exception as e:
+            logger.warning(f"Arrow IPC cache write failed for {key}: {e}")
+            self.stats["errors"] += 1
+            self._unlink(tmp_path)
+            return
+
+        self._evict_if_needed()
+
+    def delete(self, key: str):
+        """Remove a key from the tier."""
+        self._unlink(self._path_for(key))
+
+    def clear(self):
+        """Remove every cached file."""
+        for path, size, _ in self._entries():
+            self._unlink(path, size)
+
+    def _entries(self) -> List[Tuple[Path, int, float]]:
+        """(path, size_bytes, mtime) for every cached file."""
+        entries = []
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(FILE_SUFFIX):
+                        try:
+                            st = entry.stat()
+                        except FileNotFoundError:
+                            continue  # Removed by another process
+                        entries.append((Path(entry.path), st.st_size, st.st_mtime))
+        except FileNotFoundError:
+            pass
+        return entries
+
+    def total_bytes(self) -> int:
+        """Bytes currently used by the tier (all processes)."""
+        return sum(size for _, size, _ in self._entries())
+
+    def _rescan(self) -> List[Tuple[Path, int, float]]:
+        """Scan the directory and reset the size estimate from it."""
+        entries = self._entries()
+        with self._size_lock:
+            self._tracked_bytes = sum(size for _, size, _ in entries)
+            self._scanned_at = time.monotonic()
+        self.stats["rescans"] += 1
+        return entries
+
+    def _track(self, delta: int):
+        with self._size_lock:
+            self._tracked_bytes = max(self._tracked_bytes + delta, 0)
+
+    @staticmethod
+    def _file_size(path: Path) -> int:
+        try:
+            return path.stat().st_size
+        except OSError:
+            return 0
+
+    def _evict_if_needed(self):
+        """
+        Evict least recently used files until under the byte budget.
+
+        Writes only compare the running estimate against the budget; the
+        directory is scanned when the estimate crosses it or goes stale.
+        """
+        with self._size_lock:
+            within_budget = self._tracked_bytes <= self.config.max_bytes
+            recent = time.monotonic() - self._scanned_at < self.config.rescan_interval
+        if within_budget and recent:
+            return
+
+        entries = self._rescan()
+        total = sum(size for _, size, _ in entries)
+        if total <= self.config.max_bytes:
+            return
+
+        target = self.config.max_bytes * self.config.eviction_target
+        for path, size, _ in sorted(entries, key=lambda e: e[2]):
+            if total <= target:
+                break
+            if self._unlink(path, size):
+                total -= size
+                self.stats["evictions"] += 1
+
+        logger.debug(f"Arrow IPC cache evicted down to {total / 1024 / 1024:.1f} MB")
+
+    def _unlink(self, path: Path, size: Optional[int] = None) -> bool:
+        """
+        Remove a file, ignoring races with other processes.
+
+        Existing memory maps stay valid on POSIX; on Windows a mapped file
+        cannot be removed and is retried on the next eviction pass.
+
+        Args:
+            path: File to remove
+            size: Its size if already known (cached files only)
+        """
+        tracked = path.suffix == FILE_SUFFIX
+        if tracked and size is None:
+            size = self._file_size(path)
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            logger.debug(f"Arrow IPC cache could not remove {path.name}: {e}")
+            return False
+        if tracked:
+            self._track(-size)
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Tier statistics (counters are per process, sizes are host-wide)."""
+        entries = self._entries()
+        return {
+            **self.stats,
+            "files": len(entries),
+            "total_bytes": sum(size for _, size, _ in entries),
+            "tracked_bytes": self._tracked_bytes,
+            "max_bytes": self.config.max_bytes,
+            "cache_dir": str(self.cache_dir),
+        }
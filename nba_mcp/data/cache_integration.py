@@ -2,7 +2,8 @@
 Cache integration for unified dataset fetching.
 
 Integrates 3-tier caching system:
-- Tier 1: In-memory LRU (fastest, volatile)
+- Tier 1: In-memory LRU (fastest, volatile), or memory-mapped Arrow IPC
+  files shared by all worker processes on the host (optional)
 - Tier 2: Redis (fast, volatile)
 - Tier 3: Parquet files (persistent, survives restarts) ← Phase 2H-D
 
@@ -11,6 +12,7 @@ Features:
 - Automatic TTL selection
 - Cache key generation
 - Persistent Parquet cache layer (Phase 2H-D)
+- Single-flight misses (concurrent callers share one fetch)
 - Cache statistics
 
 Integration with unified_fetch:
@@ -30,6 +32,7 @@ from datetime import datetime
 import pyarrow as pa
 
 from nba_mcp.cache.redis_cache import RedisCache, CacheTier, LRUCache
+from nba_mcp.data.arrow_ipc_cache import ArrowIPCCache, ArrowIPCCacheConfig
 from nba_mcp.data.dataset_manager import ProvenanceInfo
 from nba_mcp.data.parquet_cache import ParquetCacheBackend, ParquetCacheConfig
 
@@ -45,6 +48,7 @@ class CacheManager:
     - Cache key generation from endpoint + params
     - Integration with existing Redis cache
     - In-memory fallback
+    - Single-flight de-duplication of concurrent misses
     - Cache statistics
     """
 
@@ -64,19 +68,27 @@ class CacheManager:
             logger.info("Cache manager initialized with Redis backend")
         except Exception as e:
             logger.warning(f"Redis unavailable, using in-memory cache: {e}")
-            self.lru_cache = LRUCache(max_size=1000)
+            self.lru_cache = LRUCache()
             self.cache_backend = "memory"
 
+        # Tier 1 (optional): memory-mapped Arrow IPC files
+        self.arrow_cache: Optional[ArrowIPCCache] = None
+
         # Tier 3: Parquet cache backend (Phase 2H-D)
         self.parquet_backend: Optional[ParquetCacheBackend] = None
         self._parquet_enabled = False
 
+        # In-flight lookups (cache key → shared task) for single-flight misses
+        self._in_flight: Dict[str, asyncio.Task] = {}
+
         # Cache statistics
         self.stats = {
             "hits": 0,
             "misses": 0,
             "errors": 0,
-            "bypassed": 0
+            "bypassed": 0,
+            "coalesced": 0,
+            "arrow_backfills": 0
         }
 
         # Endpoint → TTL tier mapping
@@ -88,6 +100,7 @@ class CacheManager:
             # Daily data (1h) - changes daily
             "team_standings": CacheTier.DAILY,
             "league_leaders": CacheTier.DAILY,
+            "all_time_leaders": CacheTier.DAILY,
 
             # Historical data (24h) - rarely changes
             "player_career_stats": CacheTier.HISTORICAL,
@@ -100,6 +113,12 @@ class CacheManager:
             # (we can add entity lookups here later)
         }
 
+        # Endpoints whose Parquet (Tier 3) entries always expire with their
+        # TTL, even for historical data (see get_parquet_max_age)
+        self.parquet_ttl_endpoints = {
+            "team_lineups",
+        }
+
     def generate_cache_key(self, endpoint: str, params: Dict[str, Any]) -> str:
         """
         Generate a deterministic cache key from endpoint and params.
@@ -155,6 +174,45 @@ class CacheManager:
         # Default to daily cache
         return CacheTier.DAILY.value
 
+    def get_parquet_max_age(self, endpoint: str, params: Dict[str, Any]) -> Optional[int]:
+        """
+        Age (seconds) after which a Parquet (Tier 3) entry is stale.
+
+        Staleness follows the season in the request, not the endpoint tier:
+        only requests for past seasons persist until evicted by size (unless
+        the endpoint is in parquet_ttl_endpoints). Current-season requests,
+        and requests without a season, expire with the endpoint's TTL capped
+        at DAILY, since e.g. a current-season game log keeps changing even
+        though the endpoint is mapped to the HISTORICAL tier.
+
+        Args:
+            endpoint: Endpoint name
+            params: Parameters
+
+        Returns:
+            Max age in seconds, or None if the entry never expires
+        """
+        ttl = self.get_ttl_for_endpoint(endpoint, params)
+        if endpoint in self.parquet_ttl_endpoints:
+            return ttl
+        if self._is_past_season_request(params):
+            return None
+        return min(ttl, CacheTier.DAILY.value)
+
+    def _is_past_season_request(self, params: Dict[str, Any]) -> bool:
+        """True if every season in params ended before the current one."""
+        seasons = params.get("season") or params.get("seasons")
+        if not seasons:
+            return False
+        if isinstance(seasons, str):
+            seasons = [seasons]
+
+        current_start = int(self._get_current_season()[:4])
+        try:
+            return all(int(str(season)[:4]) < current_start for season in seasons)
+        except (TypeError, ValueError):
+            return False
+
     def _get_current_season(self) -> str:
         """Get current NBA season string (e.g., '2024-25')."""
         now = datetime.now()
@@ -202,6 +260,33 @@ class CacheManager:
         self._parquet_enabled = True
         logger.info(f"✅ Parquet cache enabled at {cache_dir} (max: {max_size_mb}MB, compression: {compression})")
 
+    def enable_arrow_ipc_cache(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_size_mb: int = 2048,
+    ) -> None:
+        """
+        Enable the memory-mapped Arrow IPC tier in front of Redis/LRU.
+
+        Reads are zero-copy views over memory-mapped files, so large league-wide
+        tables are neither deserialized nor duplicated per process. While
+        enabled, tables are no longer kept in the in-process LRU.
+
+        Args:
+            cache_dir: Directory for IPC files (use /dev/shm for pure shared memory;
+                default: system temp dir)
+            max_size_mb: Byte budget for the tier in MB
+
+        Example:
+            >>> cache_mgr = get_cache_manager()
+            >>> cache_mgr.enable_arrow_ipc_cache(Path("/dev/shm/nba_mcp"), max_size_mb=1024)
+        """
+        config = ArrowIPCCacheConfig(max_size_mb=max_size_mb)
+        if cache_dir is not None:
+            config.cache_dir = Path(cache_dir)
+        self.arrow_cache = ArrowIPCCache(config)
+        logger.info(f"✅ Arrow IPC cache enabled at {config.cache_dir} (max: {max_size_mb}MB)")
+
     async def get_or_fetch(
         self,
         endpoint: str,
@@ -223,6 +308,12 @@ class CacheManager:
             - data: PyArrow Table or None if error
             - from_cache: True if from cache, False if freshly fetched
 
+        Concurrent calls that miss Tier 1/2 for the same cache key share a
+        single Tier 3 lookup / fetch: the first caller starts it, later callers
+        wait on it (counted as "coalesced") and all receive the same result,
+        including a failed fetch. The shared fetch is not cancelled when one
+        of its callers is.
+
         Example:
             data, from_cache = await cache_mgr.get_or_fetch(
                 "player_career_stats",
@@ -255,10 +346,40 @@ class CacheManager:
             logger.warning(f"Cache get error: {e}")
             self.stats["errors"] += 1
 
+        # Single-flight: join an in-flight lookup for the same key
+        task = self._in_flight.get(cache_key)
+        if task is not None:
+            self.stats["coalesced"] += 1
+            logger.debug(f"Coalesced request for {endpoint} (key: {cache_key[:20]}...)")
+        else:
+            task = asyncio.ensure_future(
+                self._load_or_fetch(endpoint, params, cache_key, fetch_func)
+            )
+            self._in_flight[cache_key] = task
+            task.add_done_callback(lambda done: self._finish_flight(cache_key, done))
+
+        return await asyncio.shield(task)
+
+    def _finish_flight(self, cache_key: str, task: asyncio.Task):
+        """Drop a completed lookup from the in-flight table."""
+        if self._in_flight.get(cache_key) is task:
+            del self._in_flight[cache_key]
+
+    async def _load_or_fetch(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        cache_key: str,
+        fetch_func: Callable,
+    ) -> Tuple[Optional[pa.Table], bool]:
+        """Tier 3 lookup, then fetch and populate all tiers (one per cache key at a time)."""
         # Tier 3: Check Parquet cache (persistent layer)
         if self._parquet_enabled and self.parquet_backend:
             try:
-                parquet_data = await self.parquet_backend.get(endpoint, params)
+                max_age = self.get_parquet_max_age(endpoint, params)
+                parquet_data = await self.parquet_backend.get(
+                    endpoint, params, max_age_seconds=max_age
+                )
                 if parquet_data is not None:
                     self.stats["hits"] += 1
                     logger.info(f"✅ Cache HIT (Tier 3 Parquet) for {endpoint} - loaded {len(parquet_data)} rows from persistent cache")
@@ -307,38 +428,60 @@ class CacheManager:
 
     async def _get_from_cache(self, key: str) -> Optional[pa.Table]:
         """Get data from cache backend."""
+        if self.arrow_cache is not None:
+            table = self.arrow_cache.get(key)
+            if table is not None or not self._shares_via_redis():
+                return table
+
         if self.cache_backend == "redis":
-            # Redis stores serialized Arrow tables
-            cached_bytes = self.redis_cache.get(key)
-            if cached_bytes:
-                # Deserialize Arrow table
-                import pyarrow as pa
-                return pa.ipc.open_stream(cached_bytes).read_all()
-            return None
+            # Tables are stored as compressed Arrow IPC by the codec layer
+            if self.arrow_cache is None:
+                return await self.redis_cache.aget(key)
+            table, remaining = await self.redis_cache.aget_with_ttl(key)
+            if table is not None and remaining is not None and remaining >= 1:
+                # Backfill Tier 1 so later reads on this host are zero-copy,
+                # expiring with the Redis entry rather than a fresh TTL
+                await self._set_in_arrow_cache(key, table, int(remaining))
+                self.stats["arrow_backfills"] += 1
+            return table
         else:
             # In-memory LRU cache
             return self.lru_cache.get(key)
 
+    def _shares_via_redis(self) -> bool:
+        """Whether a live Redis server backs Tier 2 (for sharing across hosts)."""
+        return self.cache_backend == "redis" and bool(
+            getattr(self.redis_cache, "redis_available", False)
+        )
+
     async def _set_in_cache(self, key: str, data: pa.Table, ttl: int):
         """Set data in cache backend."""
+        if self.arrow_cache is not None:
+            await self._set_in_arrow_cache(key, data, ttl)
+            if not self._shares_via_redis():
+                return
+
         try:
             if self.cache_backend == "redis":
-                # Serialize Arrow table to bytes
-                import pyarrow as pa
-                import io
-
-                sink = io.BytesIO()
-                writer = pa.ipc.RecordBatchStreamWriter(sink, data.schema)
-                writer.write_table(data)
-                writer.close()
-
-                self.redis_cache.set(key, sink.getvalue(), ttl)
+                await self.redis_cache.aset(key, data, ttl)
             else:
                 # In-memory LRU cache
                 self.lru_cache.set(key, data, ttl)
         except Exception as e:
             logger.warning(f"Cache set error: {e}")
 
+    async def _set_in_arrow_cache(self, key: str, data: pa.Table, ttl: int):
+        """Write to the Arrow IPC tier off the event loop (errors are logged)."""
+        try:
+            await asyncio.to_thread(self.arrow_cache.set, key, data, ttl)
+        except Exception as e:
+            logger.warning(f"Arrow IPC cache set error: {e}")
+
+    def close(self):
+        """Persist pending Parquet access metadata and close the Tier 3 store (shutdown)."""
+        if self.parquet_backend is not None:
+            self.parquet_backend.close()
+
     async def invalidate(self, endpoint: str, params: Optional[Dict[str, Any]] = None):
         """
         Invalidate cache for an endpoint.
@@ -351,11 +494,12 @@ class CacheManager:
             # Invalidate specific key
             cache_key = self.generate_cache_key(endpoint, params)
             try:
+                if self.arrow_cache is not None:
+                    self.arrow_cache.delete(cache_key)
                 if self.cache_backend == "redis":
-                    self.redis_cache.delete(cache_key)
+                    await self.redis_cache.adelete(cache_key)
                 else:
-                    self.lru_cache.cache.pop(cache_key, None)
-                    self.lru_cache.ttls.pop(cache_key, None)
+                    self.lru_cache.delete(cache_key)
                 logger.info(f"Invalidated cache for {endpoint}")
             except Exception as e:
                 logger.warning(f"Cache invalidation error: {e}")
@@ -380,8 +524,12 @@ class CacheManager:
             "misses": self.stats["misses"],
             "errors": self.stats["errors"],
             "bypassed": self.stats["bypassed"],
+            "coalesced_waiters": self.stats["coalesced"],
+            "arrow_backfills": self.stats["arrow_backfills"],
+            "in_flight": len(self._in_flight),
             "total_requests": total_requests,
-            "hit_rate_percent": round(hit_rate, 2)
+            "hit_rate_percent": round(hit_rate, 2),
+            "arrow_ipc": self.arrow_cache.get_stats() if self.arrow_cache else None
         }
 
     def reset_stats(self):
@@ -390,7 +538,9 @@ class CacheManager:
             "hits": 0,
             "misses": 0,
             "errors": 0,
-            "bypassed": 0
+            "bypassed": 0,
+            "coalesced": 0,
+            "arrow_backfills": 0
         }
 
 
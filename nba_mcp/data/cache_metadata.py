@@ -0,0 +1,395 @@
+"""
+Indexed metadata store for the Parquet cache (Tier 3).
+
+Replaces the per-endpoint manifest.json files with a single SQLite database:
+- One row per cached Parquet file, keyed on (endpoint, file_hash)
+- Indexes on endpoint, last_accessed and size_bytes
+- Transactional writes (WAL mode), so concurrent hits no longer race on a file
+- Access counters batched in memory and flushed on an interval
+- Automatic one-time migration of legacy manifest.json files
+
+A cache hit only touches an in-memory dict; the database is written when the
+pending access batch is flushed (interval elapsed, eviction, stats, close).
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Columns stored natively; everything else in a file's metadata goes to `extra`
+_CORE_FIELDS = (
+    "params",
+    "created_at",
+    "last_accessed",
+    "size_bytes",
+    "row_count",
+    "access_count",
+    "compression",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    endpoint TEXT NOT NULL,
+    file_hash TEXT NOT NULL,
+    params TEXT NOT NULL DEFAULT '{}',
+    created_at REAL NOT NULL,
+    last_accessed REAL NOT NULL,
+    size_bytes INTEGER NOT NULL DEFAULT 0,
+    row_count INTEGER NOT NULL DEFAULT 0,
+    access_count INTEGER NOT NULL DEFAULT 0,
+    compression TEXT,
+    extra TEXT NOT NULL DEFAULT '{}',
+    PRIMARY KEY (endpoint, file_hash)
+);
+CREATE INDEX IF NOT EXISTS idx_cache_entries_endpoint ON cache_entries (endpoint);
+CREATE INDEX IF NOT EXISTS idx_cache_entries_last_accessed ON cache_entries (last_accessed);
+CREATE INDEX IF NOT EXISTS idx_cache_entries_size ON cache_entries (size_bytes);
+"""
+
+
+def _to_epoch(value: Any, default: float) -> float:
+    """Convert an ISO timestamp (legacy manifests) or number to unix seconds."""
+    if value is None or value == "":
+        return default
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return datetime.fromisoformat(str(value)).timestamp()
+    except ValueError:
+        return default
+
+
+class CacheMetadataStore:
+    """
+    SQLite-backed metadata index for Parquet cache files.
+
+    All methods are synchronous and thread-safe; the async cache backend
+    calls them through asyncio.to_thread. The only exception is
+    record_access(), which is a cheap in-memory update meant for the hot path.
+    """
+
+    def __init__(self, db_path: Path, flush_interval: float = 5.0):
+        """
+        Open (or create) the metadata database.
+
+        Args:
+            db_path: Path to the SQLite database file
+            flush_interval: Seconds between flushes of batched access counters
+        """
+        self.db_path = Path(db_path)
+        self.flush_interval = flush_interval
+
+        self._lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        # (endpoint, file_hash) -> [access_count_delta, last_accessed]
+        self._pending_access: Dict[Tuple[str, str], List[float]] = {}
+        self._last_flush = time.monotonic()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def upsert(self, endpoint: str, file_hash: str, metadata: Dict[str, Any]):
+        """
+        Insert or replace the metadata row for a cached file.
+
+        Args:
+            endpoint: Endpoint name
+            file_hash: Cache key hash
+            metadata: File metadata (same fields the old manifest stored)
+        """
+        now = time.time()
+        extra = {k: v for k, v in metadata.items() if k not in _CORE_FIELDS}
+        row = (
+            endpoint,
+            file_hash,
+            json.dumps(metadata.get("params", {}), sort_keys=True, default=str),
+            _to_epoch(metadata.get("created_at"), now),
+            _to_epoch(metadata.get("last_accessed"), now),
+            int(metadata.get("size_bytes", 0)),
+            int(metadata.get("row_count", 0)),
+            int(metadata.get("access_count", 0)),
+            metadata.get("compression"),
+            json.dumps(extra, default=str),
+        )
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (endpoint, file_hash, params, "
+                "created_at, last_accessed, size_bytes, row_count, access_count, "
+                "compression, extra) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                row,
+            )
+
+        # A rewrite supersedes any accesses batched for the previous file
+        with self._pending_lock:
+            self._pending_access.pop((endpoint, file_hash), None)
+
+    def record_access(self, endpoint: str, file_hash: str):
+        """
+        Record a cache hit in memory (no I/O).
+
+        Args:
+            endpoint: Endpoint name
+            file_hash: Cache key hash
+        """
+        with self._pending_lock:
+            pending = self._pending_access.get((endpoint, file_hash))
+            if pending is None:
+                self._pending_access[(endpoint, file_hash)] = [1, time.time()]
+            else:
+                pending[0] += 1
+                pending[1] = time.time()
+
+    def flush_due(self) -> bool:
+        """Whether batched access counters are due to be written."""
+        return (
+            bool(self._pending_access)
+            and time.monotonic() - self._last_flush >= self.flush_interval
+        )
+
+    def flush(self) -> int:
+        """
+        Write batched access counters to the database in one transaction.
+
+        Returns:
+            Number of entries updated
+        """
+        with self._pending_lock:
+            pending = self._pending_access
+            self._pending_access = {}
+            self._last_flush = time.monotonic()
+
+        if not pending:
+            return 0
+
+        rows = [
+            (int(delta), last_accessed, endpoint, file_hash)
+            for (endpoint, file_hash), (delta, last_accessed) in pending.items()
+        ]
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "UPDATE cache_entries SET access_count = access_count + ?, "
+                    "last_accessed = MAX(last_accessed, ?) "
+                    "WHERE endpoint = ? AND file_hash = ?",
+                    rows,
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return len(rows)
+
+    def remove(self, endpoint: str, file_hash: Optional[str] = None):
+        """
+        Remove one entry, or every entry for an endpoint.
+
+        Args:
+            endpoint: Endpoint name
+            file_hash: Cache key hash (None removes the whole endpoint)
+        """
+        with self._pending_lock:
+            if file_hash is None:
+                for key in [k for k in self._pending_access if k[0] == endpoint]:
+                    del self._pending_access[key]
+            else:
+                self._pending_access.pop((endpoint, file_hash), None)
+
+        with self._lock:
+            if file_hash is None:
+                self._conn.execute(
+                    "DELETE FROM cache_entries WHERE endpoint = ?", (endpoint,)
+                )
+            else:
+                self._conn.execute(
+                    "DELETE FROM cache_entries WHERE endpoint = ? AND file_hash = ?",
+                    (endpoint, file_hash),
+                )
+
+    def remove_many(self, keys: List[Tuple[str, str]]):
+        """
+        Remove several (endpoint, file_hash) entries in one transaction.
+
+        Args:
+            keys: List of (endpoint, file_hash) pairs
+        """
+        if not keys:
+            return
+        with self._pending_lock:
+            for key in keys:
+                self._pending_access.pop(key, None)
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "DELETE FROM cache_entries WHERE endpoint = ? AND file_hash = ?",
+                    keys,
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def clear(self):
+        """Remove every entry."""
+        with self._pending_lock:
+            self._pending_access.clear()
+        with self._lock:
+            self._conn.execute("DELETE FROM cache_entries")
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get(self, endpoint: str, file_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the metadata for one cached file (including unflushed accesses).
+
+        Args:
+            endpoint: Endpoint name
+            file_hash: Cache key hash
+
+        Returns:
+            Metadata dict or None if the entry is unknown
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM cache_entries WHERE endpoint = ? AND file_hash = ?",
+                (endpoint, file_hash),
+            ).fetchone()
+        if row is None:
+            return None
+
+        entry = self._row_to_dict(row)
+        with self._pending_lock:
+            pending = self._pending_access.get((endpoint, file_hash))
+            if pending is not None:
+                entry["access_count"] += int(pending[0])
+                entry["last_accessed"] = max(entry["last_accessed"], pending[1])
+        return entry
+
+    def total_size(self) -> int:
+        """Total size in bytes of all tracked files."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COALESCE(SUM(size_bytes), 0) FROM cache_entries"
+            ).fetchone()
+        return int(row[0])
+
+    def entries_by_access(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        List entries ordered by last access (oldest first), via the index.
+
+        Args:
+            limit: Maximum number of entries to return (None for all)
+
+        Returns:
+            List of dicts with endpoint, file_hash, last_accessed, size_bytes
+        """
+        sql = (
+            "SELECT endpoint, file_hash, last_accessed, size_bytes "
+            "FROM cache_entries ORDER BY last_accessed ASC"
+        )
+        args: Tuple[Any, ...] = ()
+        if limit is not None:
+            sql += " LIMIT ?"
+            args = (limit,)
+        with self._lock:
+            rows = self._conn.execute(sql, args).fetchall()
+        return [dict(row) for row in rows]
+
+    def endpoint_summary(self) -> List[Dict[str, Any]]:
+        """
+        Per-endpoint file counts and sizes.
+
+        Returns:
+            List of dicts with endpoint, total_files, total_size_bytes
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT endpoint, COUNT(*) AS total_files, "
+                "COALESCE(SUM(size_bytes), 0) AS total_size_bytes "
+                "FROM cache_entries GROUP BY endpoint ORDER BY endpoint"
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def pending_count(self) -> int:
+        """Number of entries with unflushed access counters."""
+        return len(self._pending_access)
+
+    # ------------------------------------------------------------------
+    # Migration
+    # ------------------------------------------------------------------
+
+    def migrate_manifests(self, endpoints_dir: Path) -> int:
+        """
+        Import legacy endpoints/<endpoint>/manifest.json files.
+
+        Each manifest is renamed to manifest.json.migrated once imported, so
+        the migration runs at most once per endpoint. Corrupted manifests are
+        skipped with a warning (their Parquet files simply become untracked).
+
+        Args:
+            endpoints_dir: The cache's endpoints directory
+
+        Returns:
+            Number of file entries imported
+        """
+        imported = 0
+        if not endpoints_dir.exists():
+            return imported
+
+        for manifest_path in endpoints_dir.glob("*/manifest.json"):
+            try:
+                manifest = json.loads(manifest_path.read_text())
+                endpoint = manifest.get("endpoint") or manifest_path.parent.name
+                for file_hash, metadata in manifest.get("files", {}).items():
+                    if not (manifest_path.parent / f"{file_hash}.parquet").exists():
+                        continue
+                    self.upsert(endpoint, file_hash, metadata)
+                    imported += 1
+                manifest_path.rename(manifest_path.with_suffix(".json.migrated"))
+            except Exception as e:
+                logger.warning(f"Skipping unreadable manifest {manifest_path}: {e}")
+
+        if imported:
+            logger.info(f"Migrated {imported} Parquet cache entries from manifest.json")
+        return imported
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def close(self):
+        """Flush pending access counters and close the database."""
+        try:
+            self.flush()
+        finally:
+            with self._lock:
+                self._conn.close()
+
+    @staticmethod
+    def _row_to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        """Convert a database row back into the manifest-style metadata dict."""
+        entry = dict(row)
+        entry["params"] = json.loads(entry.get("params") or "{}")
+        entry.update(json.loads(entry.pop("extra", None) or "{}"))
+        return entry
@@ -924,6 +924,111 @@ class DataCatalog:
             )
         )
 
+        self._add_endpoint(
+            EndpointMetadata(
+                name="team_lineups",
+                display_name="Team 5-Man Lineups",
+                category=EndpointCategory.TEAM_STATS,
+                description="Season totals for every 5-man lineup a team used (LeagueDashLineups)",
+                parameters=[
+                    ParameterSchema(
+                        name="team",
+                        type="string",
+                        required=True,
+                        description="Team name, abbreviation or NBA team ID",
+                        example="Lakers",
+                    ),
+                    ParameterSchema(
+                        name="season",
+                        type="string",
+                        required=True,
+                        description="Season in YYYY-YY format",
+                        example="2023-24",
+                    ),
+                    ParameterSchema(
+                        name="season_type",
+                        type="string",
+                        required=False,
+                        description="Regular Season or Playoffs",
+                        enum=["Regular Season", "Playoffs"],
+                        default="Regular Season",
+                    ),
+                ],
+                primary_keys=["GROUP_ID"],
+                output_columns=[
+                    "GROUP_ID",
+                    "GROUP_NAME",
+                    "TEAM_ID",
+                    "GP",
+                    "W",
+                    "L",
+                    "MIN",
+                    "PTS",
+                    "PLUS_MINUS",
+                    "FGM",
+                    "FGA",
+                    "FG_PCT",
+                    "FG3M",
+                    "FG3A",
+                    "FG3_PCT",
+                ],
+                sample_params={"team": "Lakers", "season": "2023-24"},
+                supports_season_filter=True,
+                typical_row_count=250,
+                chunk_strategy="season",
+            )
+        )
+
+        self._add_endpoint(
+            EndpointMetadata(
+                name="all_time_leaders",
+                display_name="All-Time Leaders",
+                category=EndpointCategory.LEAGUE_DATA,
+                description="Career leaders in any statistical category (AllTimeLeadersGrids)",
+                parameters=[
+                    ParameterSchema(
+                        name="stat_category",
+                        type="string",
+                        required=True,
+                        description="Statistical category",
+                        enum=[
+                            "PTS", "AST", "REB", "STL", "BLK", "FGM", "FGA", "FG_PCT",
+                            "FG3M", "FG3A", "FG3_PCT", "FTM", "FTA", "FT_PCT",
+                            "OREB", "DREB", "TOV", "PF", "GP",
+                        ],
+                        example="PTS",
+                    ),
+                    ParameterSchema(
+                        name="top_n",
+                        type="integer",
+                        required=False,
+                        description="Number of leaders to return",
+                        default=10,
+                    ),
+                    ParameterSchema(
+                        name="active_only",
+                        type="boolean",
+                        required=False,
+                        description="Only include active players",
+                        default=False,
+                    ),
+                ],
+                primary_keys=["STAT_CATEGORY", "PLAYER_ID"],
+                output_columns=[
+                    "STAT_CATEGORY",
+                    "RANK",
+                    "PLAYER_ID",
+                    "PLAYER_NAME",
+                    "VALUE",
+                    "IS_ACTIVE",
+                ],
+                sample_params={"stat_category": "PTS", "top_n": 10},
+                typical_row_count=10,
+                max_row_count=250,
+                chunk_strategy="none",
+            )
+        )
+
         # Add join relationships
         self._add_relationships()
 
@@ -62,6 +62,8 @@ class EndpointRegistration:
         tags: Tags for categorization (e.g., ["player", "stats"])
         supports_batch: Whether endpoint supports batch operations
         cache_ttl_seconds: How long to cache results (0 = no cache)
+        upstream_host: Host the handler calls, used to pace requests
+            (None if it makes no upstream request)
     """
     name: str
     handler: EndpointHandler
@@ -71,6 +73,7 @@ class EndpointRegistration:
     tags: Set[str] = field(default_factory=set)
     supports_batch: bool = False
     cache_ttl_seconds: int = 0
+    upstream_host: Optional[str] = "stats.nba.com"
 
     def __post_init__(self):
         """Validate the registration on creation."""
@@ -153,6 +156,7 @@ class EndpointRegistry:
         tags: Optional[Set[str]] = None,
         supports_batch: bool = False,
         cache_ttl_seconds: int = 0,
+        upstream_host: Optional[str] = "stats.nba.com",
     ) -> EndpointRegistration:
         """
         Register an endpoint handler.
@@ -166,6 +170,7 @@ class EndpointRegistry:
             tags: Tags for categorization
             supports_batch: Whether endpoint supports batch operations
             cache_ttl_seconds: Cache TTL (0 = no cache)
+            upstream_host: Host the handler calls (None if it makes no request)
 
         Returns:
             EndpointRegistration object
@@ -187,6 +192,7 @@ class EndpointRegistry:
             tags=tags or set(),
             supports_batch=supports_batch,
             cache_ttl_seconds=cache_ttl_seconds,
+            upstream_host=upstream_host,
         )
 
         # Store registration
@@ -353,6 +359,7 @@ def register_endpoint(
     tags: Optional[Set[str]] = None,
     supports_batch: bool = False,
     cache_ttl_seconds: int = 0,
+    upstream_host: Optional[str] = "stats.nba.com",
 ):
     """
     Decorator for registering endpoint handlers.
@@ -365,6 +372,7 @@ def register_endpoint(
         tags: Tags for categorization
         supports_batch: Whether endpoint supports batch operations
         cache_ttl_seconds: Cache TTL (0 = no cache)
+        upstream_host: Host the handler calls (None if it makes no request)
 
     Returns:
         Decorator function
@@ -394,6 +402,7 @@ def register_endpoint(
             tags=tags,
             supports_batch=supports_batch,
             cache_ttl_seconds=cache_ttl_seconds,
+            upstream_host=upstream_host,
         )
 
         return func
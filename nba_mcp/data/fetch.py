@@ -34,6 +34,7 @@ from nba_mcp.api.errors import EntityNotFoundError, NBAApiError
 from nba_mcp.data.catalog import get_catalog
 from nba_mcp.data.dataset_manager import ProvenanceInfo
 from nba_mcp.data.endpoint_registry import register_endpoint, get_registry
+from nba_mcp.rate_limit.host_limiter import get_host_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -115,6 +116,12 @@ async def fetch_endpoint(
         parameters=params,
     )
 
+    # Queue for the upstream host's rate limit (raises RateLimitError only
+    # if the queue cannot drain before the deadline)
+    upstream_host = registry.get_registration(endpoint).upstream_host
+    if upstream_host:
+        await get_host_limiter().acquire(upstream_host)
+
     start_time = time.time()
 
     try:
@@ -337,7 +344,8 @@ async def _fetch_team_game_log(
     required_params=[],
     optional_params=["target_date"],
     description="Get current or historical game scores and status",
-    tags={"game", "live", "scores"}
+    tags={"game", "live", "scores"},
+    upstream_host=None,
 )
 async def _fetch_live_scores(
     params: Dict[str, Any], provenance: ProvenanceInfo
@@ -444,17 +452,21 @@ async def _fetch_shot_chart(
         provenance.nba_api_calls += 1
 
         # Import here to avoid circular dependency
-        from nba_mcp.api.shot_charts import fetch_shot_chart_data
+        from nba_mcp.api.shot_charts import get_shot_store, load_entity_shots
 
-        # Fetch raw shot data
-        shot_df = await fetch_shot_chart_data(
+        # Slice raw shot data from the league-wide season (fetched at most once)
+        store = get_shot_store()
+        hits_before = store.stats["memory_hits"] + store.stats["disk_loads"]
+        shot_df = await load_entity_shots(
             entity_id=entity.entity_id,
             entity_type=entity_type,
             season=season or "2024-25",
+            season_type="Regular Season",
             date_from=date_from,
             date_to=date_to,
         )
-        provenance.nba_api_calls += 1
+        if store.stats["memory_hits"] + store.stats["disk_loads"] == hits_before:
+            provenance.nba_api_calls += 1
 
         if shot_df.empty:
             logger.warning(f"No shot chart data found for {entity_name}")
@@ -1022,6 +1034,115 @@ async def _fetch_league_team_games(
         raise NBAApiError(f"Failed to fetch league team games: {e}")
 
 
+@register_endpoint(
+    "team_lineups",
+    required_params=["team", "season"],
+    optional_params=["season_type"],
+    description="Get season totals for every 5-man lineup a team used",
+    tags={"team", "lineup", "stats"}
+)
+async def _fetch_team_lineups(
+    params: Dict[str, Any], provenance: ProvenanceInfo
+) -> pd.DataFrame:
+    """
+    Fetch 5-man lineup totals for one team and season.
+
+    Backs get_lineup_stats / get_lineup_stats_multi_season. Routed through
+    unified_fetch so results get TTL expiry (1h current season, 24h past
+    seasons) and Parquet persistence, and seasons can be fetched concurrently
+    (the blocking API call runs in a worker thread).
+
+    Args:
+        params: Must contain 'team' (name or ID, resolved to 'team_id') and
+            'season', optional 'season_type'
+        provenance: Provenance tracking
+
+    Returns:
+        DataFrame with one row per lineup (GROUP_NAME, MIN, PTS, PLUS_MINUS, ...)
+    """
+    team_id = params.get("team_id") or params.get("team")
+    season = params.get("season")
+    season_type = params.get("season_type") or "Regular Season"
+
+    try:
+        team_id = int(team_id)
+    except (TypeError, ValueError):
+        raise ValueError(f"Could not resolve team '{params.get('team')}' for team_lineups")
+
+    if not season:
+        raise ValueError("season is required for team_lineups")
+
+    try:
+        from nba_api.stats.endpoints import leaguedashlineups
+
+        result = await asyncio.to_thread(
+            leaguedashlineups.LeagueDashLineups,
+            team_id_nullable=team_id,
+            season=season,
+            season_type_nullable=season_type,
+            measure_type_detailed_defense="Base",
+            per_mode_detailed="Totals",
+        )
+        df = result.get_data_frames()[0]
+        provenance.nba_api_calls += 1
+
+        logger.info(
+            f"[team_lineups] Retrieved {len(df)} lineups for team {team_id} ({season})"
+        )
+
+        return df
+
+    except Exception as e:
+        raise NBAApiError(f"Failed to fetch team lineups: {e}")
+
+
+@register_endpoint(
+    "all_time_leaders",
+    required_params=["stat_category"],
+    optional_params=["top_n", "active_only"],
+    description="Get all-time career leaders for a statistical category",
+    tags={"league", "leaders", "career", "stats"}
+)
+async def _fetch_all_time_leaders(
+    params: Dict[str, Any], provenance: ProvenanceInfo
+) -> pd.DataFrame:
+    """
+    Fetch all-time career leaders.
+
+    Served from the pre-ranked all-time leaders snapshot, which is rebuilt
+    from one AllTimeLeadersGrids pull (every stat at once) when stale.
+
+    Args:
+        params: Must contain 'stat_category', optional 'top_n' (default 10)
+            and 'active_only' (default False)
+        provenance: Provenance tracking
+
+    Returns:
+        DataFrame with STAT_CATEGORY, RANK, PLAYER_ID, PLAYER_NAME, VALUE, IS_ACTIVE
+    """
+    stat_category = params.get("stat_category")
+    top_n = int(params.get("top_n") or 10)
+    active_only = bool(params.get("active_only", False))
+
+    if not stat_category:
+        raise ValueError("stat_category is required")
+
+    # Import here to avoid circular dependency
+    from nba_mcp.api.all_time_leaders import get_all_time_leaders_store
+    from nba_mcp.api.errors import InvalidParameterError
+
+    store = get_all_time_leaders_store()
+    try:
+        if await store.ensure_fresh() == "built":
+            provenance.nba_api_calls += 1
+        return store.top_table(stat_category, top_n, active_only).to_pandas()
+
+    except InvalidParameterError as e:
+        raise ValueError(str(e))
+    except Exception as e:
+        raise NBAApiError(f"Failed to fetch all-time leaders: {e}")
+
+
 def validate_parameters(endpoint: str, params: Dict[str, Any]) -> None:
     """
     Validate parameters against endpoint schema.
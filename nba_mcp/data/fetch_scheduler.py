@@ -0,0 +1,277 @@
+"""
+Shared fetch scheduler for fan-out NBA API requests.
+
+Multi-season queries (e.g., a 20-season career) used to fire one request per
+season at once and get throttled by stats.nba.com. Every fan-out now goes
+through a single process-wide scheduler:
+- Global concurrency cap shared by all callers
+- Adaptive limit (AIMD): throttling (HTTP 429/403, timeouts) halves the
+  limit and pauses new requests with exponential backoff; consecutive
+  successes grow it back one slot at a time
+- Throttled requests are retried; other errors propagate immediately
+- Results can be consumed as they complete (as_completed)
+"""
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Optional,
+    Tuple,
+)
+
+from nba_mcp.api.errors import NBAApiError, RateLimitError
+
+logger = logging.getLogger(__name__)
+
+# Status codes stats.nba.com uses when it throttles a client
+THROTTLE_STATUS_CODES = {403, 429, 503}
+
+# Message fragments of wrapped throttling/timeout errors (requests, nba_api)
+THROTTLE_MARKERS = ("429", "too many requests", "timed out", "timeout")
+
+
+def is_throttle_error(error: BaseException) -> bool:
+    """
+    Whether an error means the upstream API is throttling or overloaded.
+
+    Args:
+        error: Exception raised by a fetch
+
+    Returns:
+        True for rate limits (429/403/503) and timeouts, including wrapped ones
+    """
+    if isinstance(error, (RateLimitError, asyncio.TimeoutError, TimeoutError)):
+        return True
+
+    if isinstance(error, NBAApiError):
+        if error.details.get("status_code") in THROTTLE_STATUS_CODES:
+            return True
+
+    response = getattr(error, "response", None)
+    if getattr(response, "status_code", None) in THROTTLE_STATUS_CODES:
+        return True
+
+    message = str(error).lower()
+    return any(marker in message for marker in THROTTLE_MARKERS)
+
+
+@dataclass
+class SchedulerConfig:
+    """Configuration for the shared fetch scheduler."""
+
+    max_concurrency: int = 4  # Upper bound on concurrent upstream requests
+    min_concurrency: int = 1
+    increase_after: int = 4  # Consecutive successes before growing the limit
+    max_retries: int = 3  # Retries per request on throttling
+    base_delay: float = 1.0  # First backoff (seconds), doubled per throttle
+    max_delay: float = 30.0
+
+
+class FetchScheduler:
+    """
+    Process-wide scheduler bounding concurrent upstream fetches.
+
+    Example:
+        scheduler = get_fetch_scheduler()
+        async for season, (result, error) in scheduler.as_completed(
+            {s: (fetch_season, (s,)) for s in seasons}
+        ):
+            ...
+    """
+
+    def __init__(self, config: Optional[SchedulerConfig] = None):
+        """
+        Initialize scheduler.
+
+        Args:
+            config: Scheduler configuration (defaults: 4 concurrent, 3 retries)
+        """
+        self.config = config or SchedulerConfig()
+        self.limit = self.config.max_concurrency
+        self.active = 0
+        self._successes = 0
+        self._backoff_level = 0
+        self._resume_at = 0.0  # Monotonic time before which no request starts
+        self._condition: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.stats = {
+            "requests": 0,
+            "throttled": 0,
+            "retries": 0,
+            "failures": 0,
+            "peak_active": 0,
+        }
+
+    def _get_condition(self) -> asyncio.Condition:
+        """Condition bound to the running loop (recreated if the loop changes)."""
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+            self.active = 0
+        return self._condition
+
+    async def _acquire(self):
+        """Wait for a free slot and for any backoff pause to end."""
+        condition = self._get_condition()
+        async with condition:
+            while True:
+                pause = self._resume_at - time.monotonic()
+                if pause > 0:
+                    # Re-check after the pause; others may extend it meanwhile
+                    try:
+                        await asyncio.wait_for(condition.wait(), timeout=pause)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                if self.active < self.limit:
+                    break
+                await condition.wait()
+
+            self.active += 1
+            self.stats["peak_active"] = max(self.stats["peak_active"], self.active)
+
+    async def _release(self, throttled: bool):
+        """Free a slot and adapt the concurrency limit."""
+        condition = self._get_condition()
+        async with condition:
+            self.active = max(0, self.active - 1)
+            config = self.config
+
+            if throttled:
+                self._successes = 0
+                self.limit = max(config.min_concurrency, self.limit // 2)
+                delay = min(
+                    config.base_delay * (2**self._backoff_level), config.max_delay
+                )
+                delay *= random.uniform(0.8, 1.2)  # Jitter so retries don't re-burst
+                self._backoff_level += 1
+                self._resume_at = max(self._resume_at, time.monotonic() + delay)
+                logger.warning(
+                    f"Upstream throttling: concurrency limit → {self.limit}, "
+                    f"pausing new requests for {delay:.1f}s"
+                )
+            else:
+                self._backoff_level = 0
+                self._successes += 1
+                if (
+                    self._successes >= config.increase_after
+                    and self.limit < config.max_concurrency
+                ):
+                    self.limit += 1
+                    self._successes = 0
+                    logger.debug(f"Fetch concurrency limit raised to {self.limit}")
+
+            condition.notify_all()
+
+    async def run(self, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """
+        Run one fetch under the scheduler, retrying on throttling.
+
+        Args:
+            func: Async callable performing the upstream request
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Result of func
+
+        Raises:
+            The last error if retries are exhausted, or any non-throttle error
+        """
+        self.stats["requests"] += 1
+        attempt = 0
+        while True:
+            await self._acquire()
+            throttled = False
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                throttled = is_throttle_error(e)
+                if throttled:
+                    self.stats["throttled"] += 1
+                if not throttled or attempt >= self.config.max_retries:
+                    self.stats["failures"] += 1
+                    raise
+                attempt += 1
+                self.stats["retries"] += 1
+                logger.info(f"Retrying throttled request (attempt {attempt + 1}): {e}")
+            finally:
+                await self._release(throttled)
+
+    async def as_completed(
+        self,
+        jobs: Dict[Any, Tuple[Callable[..., Awaitable[Any]], Iterable[Any]]],
+    ) -> AsyncIterator[Tuple[Any, Tuple[Any, Optional[BaseException]]]]:
+        """
+        Run jobs under the scheduler and yield them as they complete.
+
+        Failed jobs are yielded with their error instead of raising, so one
+        bad season doesn't discard the others. Pending jobs are cancelled if
+        the caller stops iterating early.
+
+        Args:
+            jobs: key → (async callable, args)
+
+        Yields:
+            Tuple of (key, (result, error)) in completion order
+        """
+
+        async def run_job(key, func, args):
+            try:
+                return key, (await self.run(func, *args), None)
+            except Exception as e:
+                return key, (None, e)
+
+        tasks = [
+            asyncio.create_task(run_job(key, func, tuple(args)))
+            for key, (func, args) in jobs.items()
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Scheduler statistics."""
+        return {
+            **self.stats,
+            "limit": self.limit,
+            "active": self.active,
+            "max_concurrency": self.config.max_concurrency,
+            "paused_for": max(0.0, self._resume_at - time.monotonic()),
+        }
+
+
+# ============================================================================
+# GLOBAL SCHEDULER
+# ============================================================================
+
+_fetch_scheduler: Optional[FetchScheduler] = None
+
+
+def get_fetch_scheduler() -> FetchScheduler:
+    """Get the shared fetch scheduler (created on first use)."""
+    global _fetch_scheduler
+    if _fetch_scheduler is None:
+        _fetch_scheduler = FetchScheduler()
+    return _fetch_scheduler
+
+
+def reset_fetch_scheduler():
+    """Drop the shared scheduler (useful for testing)."""
+    global _fetch_scheduler
+    _fetch_scheduler = None
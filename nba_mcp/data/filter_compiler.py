@@ -0,0 +1,384 @@
+"""
+Compiled post-fetch filters for NBA MCP.
+
+Turns the generic filter spec used by unified_fetch
+({"column": [operator, value], ...}) into a pyarrow.compute expression:
+- Compiled once per distinct spec and cached (specs repeat across calls)
+- Evaluated with Table.filter: no SQL string building, no connection setup
+- Values are bound as Arrow scalars, never interpolated into SQL
+
+When Arrow cannot evaluate a compiled expression (e.g., a numeric literal
+passed as a string, which needs an implicit cast), the filter runs on a
+pooled DuckDB connection with a parameterized query instead. Both paths
+record timings (see get_filter_stats).
+"""
+
+import itertools
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+import duckdb
+import pyarrow as pa
+import pyarrow.compute as pc
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_OPERATORS = ("==", "!=", ">", ">=", "<", "<=", "IN", "BETWEEN", "LIKE")
+
+# Compiled expressions kept (distinct filter specs)
+COMPILE_CACHE_SIZE = 512
+
+# Cursors kept open on the shared DuckDB connection
+DUCKDB_POOL_SIZE = 4
+
+
+@dataclass
+class FilterTiming:
+    """How a filter was executed and how long it took."""
+
+    path: str  # "arrow" or "duckdb"
+    elapsed_ms: float
+    rows_in: int
+    rows_out: int
+    compile_cached: bool
+
+
+# ============================================================================
+# SPEC VALIDATION AND COMPILATION
+# ============================================================================
+
+
+def _normalize(filters: Dict[str, List[Any]]) -> Tuple[Tuple[str, str, Any], ...]:
+    """
+    Validate a filter spec and convert it to a hashable, canonical form.
+
+    Raises:
+        ValueError: If a condition is malformed or uses an unknown operator
+    """
+    conditions = []
+    for column, filter_spec in filters.items():
+        if not isinstance(filter_spec, (list, tuple)) or len(filter_spec) < 2:
+            raise ValueError(
+                f"Invalid filter for '{column}': must be [operator, value]"
+            )
+
+        operator = str(filter_spec[0]).upper()
+        if operator == "=":
+            operator = "=="
+        value = filter_spec[1]
+
+        if operator not in SUPPORTED_OPERATORS:
+            raise ValueError(
+                f"Unsupported operator: {operator}. "
+                f"Supported: {', '.join(SUPPORTED_OPERATORS)}"
+            )
+        if operator == "IN" and not isinstance(value, (list, tuple)):
+            raise ValueError(f"IN operator requires a list, got {type(value)}")
+        if operator == "BETWEEN" and (
+            not isinstance(value, (list, tuple)) or len(value) != 2
+        ):
+            raise ValueError("BETWEEN operator requires [min, max]")
+        if operator == "LIKE" and not isinstance(value, str):
+            raise ValueError("LIKE operator requires a string pattern")
+
+        if isinstance(value, list):
+            value = tuple(value)
+        conditions.append((column, operator, value))
+
+    return tuple(conditions)
+
+
+def _condition_expression(column: str, operator: str, value: Any) -> pc.Expression:
+    """Arrow expression for one condition."""
+    field = pc.field(column)
+    if operator == "==":
+        return field == pc.scalar(value)
+    if operator == "!=":
+        return field != pc.scalar(value)
+    if operator == ">":
+        return field > pc.scalar(value)
+    if operator == ">=":
+        return field >= pc.scalar(value)
+    if operator == "<":
+        return field < pc.scalar(value)
+    if operator == "<=":
+        return field <= pc.scalar(value)
+    if operator == "IN":
+        if not value:
+            return pc.scalar(False)
+        return field.isin(pa.array(list(value)))
+    if operator == "BETWEEN":
+        low, high = value
+        return (field >= pc.scalar(low)) & (field <= pc.scalar(high))
+    # LIKE
+    return pc.match_like(field, value)
+
+
+@lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def _compile(conditions: Tuple[Tuple[str, str, Any], ...]) -> pc.Expression:
+    """Combined (AND) Arrow expression for normalized conditions (cached)."""
+    expressions = [_condition_expression(*condition) for condition in conditions]
+    combined = expressions[0]
+    for expression in expressions[1:]:
+        combined = combined & expression
+    return combined
+
+
+def compile_filters(filters: Dict[str, List[Any]]) -> pc.Expression:
+    """
+    Compile a filter spec into a pyarrow.compute expression.
+
+    Args:
+        filters: {"column": [operator, value], ...}
+
+    Returns:
+        Expression usable with Table.filter / Dataset.to_table(filter=...)
+
+    Raises:
+        ValueError: If the filter spec is invalid
+
+    Example:
+        >>> expr = compile_filters({"PTS": [">=", 20], "WL": ["==", "W"]})
+        >>> table.filter(expr)
+    """
+    return _compile(_normalize(filters))
+
+
+# ============================================================================
+# DUCKDB FALLBACK (POOLED, PARAMETERIZED)
+# ============================================================================
+
+
+def _quote_identifier(name: str) -> str:
+    """Quote a column name for SQL."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _to_sql(conditions: Tuple[Tuple[str, str, Any], ...]) -> Tuple[str, List[Any]]:
+    """Parameterized WHERE clause and its parameters."""
+    clauses, params = [], []
+    for column, operator, value in conditions:
+        column_sql = _quote_identifier(column)
+        if operator == "IN":
+            if not value:
+                clauses.append("FALSE")
+                continue
+            clauses.append(f"{column_sql} IN ({', '.join('?' for _ in value)})")
+            params.extend(value)
+        elif operator == "BETWEEN":
+            clauses.append(f"{column_sql} BETWEEN ? AND ?")
+            params.extend(value)
+        else:
+            sql_operator = "=" if operator == "==" else operator
+            clauses.append(f"{column_sql} {sql_operator} ?")
+            params.append(value)
+    return " AND ".join(clauses), params
+
+
+class DuckDBPool:
+    """
+    Reusable cursors over one in-memory DuckDB connection.
+
+    Creating a cursor on an existing database is far cheaper than
+    duckdb.connect(':memory:'), and each cursor is safe to use from one
+    thread at a time.
+    """
+
+    def __init__(self, size: int = DUCKDB_POOL_SIZE):
+        self.size = size
+        self._connection: Optional[duckdb.DuckDBPyConnection] = None
+        self._idle: "queue.LifoQueue[duckdb.DuckDBPyConnection]" = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._names = itertools.count()
+
+    def _acquire(self) -> duckdb.DuckDBPyConnection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                if self._connection is None:
+                    self._connection = duckdb.connect(":memory:")
+                return self._connection.cursor()
+
+    def _release(self, cursor: duckdb.DuckDBPyConnection):
+        if self._idle.qsize() < self.size:
+            self._idle.put(cursor)
+        else:
+            cursor.close()
+
+    def query(
+        self, tables: Dict[str, pa.Table], sql: str, params: Optional[List[Any]] = None
+    ) -> pa.Table:
+        """
+        Run a parameterized query over Arrow tables on a pooled cursor.
+
+        Registrations are cursor-local, so the names in `tables` only have to
+        be unique within this query.
+
+        Args:
+            tables: View name → Arrow table referenced by the SQL
+            sql: Query text with ? placeholders
+            params: Values bound to the placeholders
+
+        Returns:
+            Query result as an Arrow table
+        """
+        cursor = self._acquire()
+        try:
+            for name, table in tables.items():
+                cursor.register(name, table)
+            result = cursor.execute(sql, params or []).fetch_arrow_table()
+            for name in tables:
+                cursor.unregister(name)
+        except Exception:
+            # Don't return a cursor in an unknown state to the pool
+            cursor.close()
+            raise
+        self._release(cursor)
+        return result
+
+    def filter(self, table: pa.Table, where_clause: str, params: List[Any]) -> pa.Table:
+        """Run SELECT * ... WHERE over an Arrow table on a pooled cursor."""
+        name = f"arrow_table_{next(self._names)}"
+        return self.query(
+            {name: table}, f"SELECT * FROM {name} WHERE {where_clause}", params
+        )
+
+    def close(self):
+        """Close all cursors and the shared connection."""
+        while not self._idle.empty():
+            self._idle.get_nowait().close()
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+_duckdb_pool = DuckDBPool()
+
+
+def get_duckdb_pool() -> DuckDBPool:
+    """Get the shared pool of DuckDB cursors."""
+    return _duckdb_pool
+
+
+# ============================================================================
+# EXECUTION
+# ============================================================================
+
+_stats_lock = threading.Lock()
+_stats: Dict[str, Any] = {}
+
+
+def reset_filter_stats():
+    """Reset filter timing statistics."""
+    with _stats_lock:
+        _stats.clear()
+        _stats.update(
+            {
+                "arrow": {"calls": 0, "total_ms": 0.0},
+                "duckdb": {"calls": 0, "total_ms": 0.0},
+            }
+        )
+
+
+reset_filter_stats()
+
+
+def _record(timing: FilterTiming):
+    with _stats_lock:
+        path_stats = _stats[timing.path]
+        path_stats["calls"] += 1
+        path_stats["total_ms"] += timing.elapsed_ms
+
+
+def get_filter_stats() -> Dict[str, Any]:
+    """
+    Filter execution statistics per path.
+
+    Returns:
+        {"arrow": {...}, "duckdb": {...}, "compile_cache": {...}} with call
+        counts, total and average milliseconds
+    """
+    with _stats_lock:
+        stats = {
+            path: {
+                **values,
+                "avg_ms": (
+                    values["total_ms"] / values["calls"] if values["calls"] else 0.0
+                ),
+            }
+            for path, values in _stats.items()
+        }
+    info = _compile.cache_info()
+    stats["compile_cache"] = {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+    }
+    return stats
+
+
+def filter_table(
+    table: pa.Table, filters: Dict[str, List[Any]]
+) -> Tuple[pa.Table, FilterTiming]:
+    """
+    Filter a table with a compiled Arrow expression (DuckDB fallback).
+
+    Args:
+        table: PyArrow Table to filter
+        filters: {"column": [operator, value], ...} (conditions are ANDed)
+
+    Returns:
+        Tuple of (filtered table, timing)
+
+    Raises:
+        ValueError: If the spec is invalid, a column is missing, or neither
+            path can evaluate the filter
+    """
+    start = time.perf_counter()
+    conditions = _normalize(filters)
+
+    for column, _, _ in conditions:
+        if column not in table.column_names:
+            raise ValueError(
+                f"Column '{column}' not found in table. "
+                f"Available: {', '.join(table.column_names)}"
+            )
+
+    misses_before = _compile.cache_info().misses
+    expression = _compile(conditions)
+    compile_cached = _compile.cache_info().misses == misses_before
+
+    try:
+        filtered = table.filter(expression)
+        path = "arrow"
+    except (pa.ArrowNotImplementedError, pa.ArrowInvalid, pa.ArrowTypeError) as e:
+        logger.debug(f"Arrow filter not applicable ({e}), using DuckDB")
+        where_clause, params = _to_sql(conditions)
+        try:
+            filtered = _duckdb_pool.filter(table, where_clause, params)
+        except Exception as duckdb_error:
+            raise ValueError(
+                f"Filter execution failed: {duckdb_error}"
+            ) from duckdb_error
+        path = "duckdb"
+
+    timing = FilterTiming(
+        path=path,
+        elapsed_ms=(time.perf_counter() - start) * 1000,
+        rows_in=table.num_rows,
+        rows_out=filtered.num_rows,
+        compile_cached=compile_cached,
+    )
+    _record(timing)
+    logger.debug(
+        f"Filter ({path}): {timing.rows_in} → {timing.rows_out} rows "
+        f"in {timing.elapsed_ms:.2f}ms"
+    )
+    return filtered, timing
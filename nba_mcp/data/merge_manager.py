@@ -362,9 +362,9 @@ class MergeManager:
             Tuple of (data_with_metrics, merge_statistics)
         """
         from nba_mcp.api.advanced_metrics_calculator import (
-            calculate_game_score,
-            calculate_true_shooting_pct,
-            calculate_effective_fg_pct,
+            effective_fg_pct_array,
+            game_score_array,
+            true_shooting_pct_array,
         )
 
         # Convert to DataFrame for metric calculation
@@ -390,23 +390,17 @@ class MergeManager:
         # Calculate metrics (if columns exist)
         if metrics is None or "TRUE_SHOOTING_PCT" in metrics:
             if all(c in df.columns for c in ["PTS", "FGA", "FTA"]):
-                metrics_df["TRUE_SHOOTING_PCT"] = df.apply(
-                    lambda row: calculate_true_shooting_pct(row["PTS"], row["FGA"], row["FTA"]), axis=1
-                )
+                metrics_df["TRUE_SHOOTING_PCT"] = true_shooting_pct_array(df["PTS"], df["FGA"], df["FTA"])
 
         if metrics is None or "EFFECTIVE_FG_PCT" in metrics:
             if all(c in df.columns for c in ["FGM", "FG3M", "FGA"]):
-                metrics_df["EFFECTIVE_FG_PCT"] = df.apply(
-                    lambda row: calculate_effective_fg_pct(row["FGM"], row["FG3M"], row["FGA"]), axis=1
-                )
+                metrics_df["EFFECTIVE_FG_PCT"] = effective_fg_pct_array(df["FGM"], df["FG3M"], df["FGA"])
 
         if metrics is None or "GAME_SCORE" in metrics:
             required_cols = ["PTS", "FGM", "FGA", "FTM", "FTA", "OREB", "DREB",
                            "STL", "AST", "BLK", "PF", "TOV"]
             if all(c in df.columns for c in required_cols):
-                metrics_df["GAME_SCORE"] = df.apply(
-                    lambda row: calculate_game_score(row.to_dict()), axis=1
-                )
+                metrics_df["GAME_SCORE"] = game_score_array(df)
 
         # Merge back onto original data
         return self.merge(
@@ -6,12 +6,17 @@ Handles large dataset fetching by:
 - Yielding results incrementally
 - Providing progress tracking
 - Supporting multiple chunking strategies (date, season, game)
+- Prefetching upcoming chunks concurrently while the caller processes the
+  current one (bounded by prefetch_depth, paced by the rate limiter)
 
 This enables fetching datasets of any size without memory issues.
 """
 
 import asyncio
 import logging
+import time
+from collections import deque
+from contextlib import aclosing
 from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 from datetime import date, datetime, timedelta
 from dataclasses import dataclass
@@ -19,6 +24,7 @@ import pyarrow as pa
 
 from nba_mcp.data.fetch import fetch_endpoint, FetchError
 from nba_mcp.data.introspection import get_introspector, EndpointCapabilities
+from nba_mcp.rate_limit.host_limiter import Priority, current_priority, upstream_priority
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +40,19 @@ class ChunkInfo:
     date_range: Optional[Tuple[date, date]] = None
     season: Optional[str] = None
     game_id: Optional[str] = None
+    fetch_seconds: Optional[float] = None  # Upstream fetch duration for this chunk
+    wait_seconds: Optional[float] = None  # Time the consumer waited (0 if prefetched)
+    prefetch_depth: int = 0  # Chunks fetched ahead while this one was consumed
+
+
+# Default number of chunks fetched ahead of the one being consumed
+DEFAULT_PREFETCH_DEPTH = 2
+
+# Rate limiter bucket consulted before each chunk request
+RATE_LIMIT_KEY = "fetch_chunked"
+
+# Longest rate-limit wait to absorb before giving up on a chunk (seconds)
+MAX_RATE_LIMIT_WAIT = 60.0
 
 
 class DatasetPaginator:
@@ -44,11 +63,21 @@ class DatasetPaginator:
     1. Date-based: Split by date ranges (for time-series data)
     2. Season-based: Fetch one season at a time (for historical data)
     3. Game-based: Process one game at a time (for detailed play-by-play)
+
+    Chunks are fetched through a prefetch pipeline: while the caller processes
+    chunk N, chunks N+1..N+prefetch_depth are already in flight. Chunks are
+    always yielded in order.
     """
 
-    def __init__(self):
-        """Initialize the paginator."""
+    def __init__(self, prefetch_depth: int = DEFAULT_PREFETCH_DEPTH):
+        """
+        Initialize the paginator.
+
+        Args:
+            prefetch_depth: Default number of chunks to fetch ahead (0 = sequential)
+        """
         self._introspector = get_introspector()
+        self.prefetch_depth = prefetch_depth
 
     async def fetch_chunked(
         self,
@@ -57,6 +86,7 @@ class DatasetPaginator:
         chunk_strategy: Optional[str] = None,
         max_chunk_size: int = 5000,
         check_size_limit: bool = True,
+        prefetch_depth: Optional[int] = None,
     ) -> AsyncIterator[Tuple[pa.Table, ChunkInfo]]:
         """
         Fetch dataset in chunks, yielding tables incrementally.
@@ -71,6 +101,8 @@ class DatasetPaginator:
             chunk_strategy: Strategy to use ("date", "season", "game", "none", or None for auto)
             max_chunk_size: Maximum rows per chunk (used for auto-chunking decisions)
             check_size_limit: Show size info message if large dataset (default: True)
+            prefetch_depth: Chunks to fetch ahead of the one being consumed
+                (None uses the paginator default, 0 fetches sequentially)
 
         Yields:
             Tuple of (Arrow table, ChunkInfo) for each chunk
@@ -106,24 +138,38 @@ class DatasetPaginator:
                 f"Must be 'date', 'season', 'game', 'none', or None (auto)"
             )
 
+        depth = self.prefetch_depth if prefetch_depth is None else prefetch_depth
+        depth = max(0, depth)
+
         # Execute chunking based on strategy
         if chunk_strategy == "date":
-            async for chunk in self._fetch_by_date(endpoint, params, caps):
-                yield chunk
+            async with aclosing(
+                self._fetch_by_date(endpoint, params, caps, depth)
+            ) as chunks:
+                async for chunk in chunks:
+                    yield chunk
         elif chunk_strategy == "season":
-            async for chunk in self._fetch_by_season(endpoint, params, caps):
-                yield chunk
+            async with aclosing(
+                self._fetch_by_season(endpoint, params, caps, depth)
+            ) as chunks:
+                async for chunk in chunks:
+                    yield chunk
         elif chunk_strategy == "game":
-            async for chunk in self._fetch_by_game(endpoint, params, caps):
-                yield chunk
+            async with aclosing(
+                self._fetch_by_game(endpoint, params, caps, depth)
+            ) as chunks:
+                async for chunk in chunks:
+                    yield chunk
         else:  # "none"
             # Fetch all at once (no chunking)
-            table, provenance = await fetch_endpoint(endpoint, params)
+            table, fetch_seconds = await self._fetch_chunk(endpoint, params)
             chunk_info = ChunkInfo(
                 chunk_number=1,
                 total_chunks=1,
                 params=params,
                 row_count=table.num_rows,
+                fetch_seconds=fetch_seconds,
+                wait_seconds=fetch_seconds,
             )
             yield table, chunk_info
 
@@ -218,6 +264,7 @@ class DatasetPaginator:
         endpoint: str,
         params: Dict[str, Any],
         caps: EndpointCapabilities,
+        prefetch_depth: int = 0,
     ) -> AsyncIterator[Tuple[pa.Table, ChunkInfo]]:
         """
         Chunk by date ranges (monthly or custom intervals).
@@ -226,6 +273,7 @@ class DatasetPaginator:
             endpoint: Endpoint name
             params: Base parameters
             caps: Endpoint capabilities
+            prefetch_depth: Chunks to fetch ahead of the one being consumed
 
         Yields:
             Tuple of (table, chunk_info) for each date range
@@ -258,37 +306,24 @@ class DatasetPaginator:
 
         logger.info(f"Date-based chunking: {total_chunks} chunks from {date_from} to {date_to}")
 
-        for chunk_num, (chunk_start, chunk_end) in enumerate(chunks, start=1):
+        specs = []
+        for chunk_start, chunk_end in chunks:
             # Update params with date range
             chunk_params = params.copy()
             chunk_params["date_from"] = chunk_start.strftime("%Y-%m-%d")
             chunk_params["date_to"] = chunk_end.strftime("%Y-%m-%d")
+            specs.append((chunk_params, {"date_range": (chunk_start, chunk_end)}))
 
-            logger.debug(f"Fetching chunk {chunk_num}/{total_chunks}: {chunk_start} to {chunk_end}")
-
-            try:
-                table, provenance = await fetch_endpoint(endpoint, chunk_params)
-
-                chunk_info = ChunkInfo(
-                    chunk_number=chunk_num,
-                    total_chunks=total_chunks,
-                    params=chunk_params,
-                    row_count=table.num_rows,
-                    date_range=(chunk_start, chunk_end),
-                )
-
-                yield table, chunk_info
-
-            except FetchError as e:
-                logger.warning(f"Chunk {chunk_num} failed: {e}")
-                # Continue with next chunk
-                continue
+        async with aclosing(self._pipeline(endpoint, specs, prefetch_depth)) as pipeline:
+            async for chunk in pipeline:
+                yield chunk
 
     async def _fetch_by_season(
         self,
         endpoint: str,
         params: Dict[str, Any],
         caps: EndpointCapabilities,
+        prefetch_depth: int = 0,
     ) -> AsyncIterator[Tuple[pa.Table, ChunkInfo]]:
         """
         Chunk by NBA seasons.
@@ -297,6 +332,7 @@ class DatasetPaginator:
             endpoint: Endpoint name
             params: Base parameters
             caps: Endpoint capabilities
+            prefetch_depth: Chunks to fetch ahead of the one being consumed
 
         Yields:
             Tuple of (table, chunk_info) for each season
@@ -320,36 +356,23 @@ class DatasetPaginator:
         total_chunks = len(seasons)
         logger.info(f"Season-based chunking: {total_chunks} seasons")
 
-        for chunk_num, season in enumerate(seasons, start=1):
+        specs = []
+        for season in seasons:
             # Update params with season
             chunk_params = params.copy()
             chunk_params["season"] = season
+            specs.append((chunk_params, {"season": season}))
 
-            logger.debug(f"Fetching chunk {chunk_num}/{total_chunks}: season {season}")
-
-            try:
-                table, provenance = await fetch_endpoint(endpoint, chunk_params)
-
-                chunk_info = ChunkInfo(
-                    chunk_number=chunk_num,
-                    total_chunks=total_chunks,
-                    params=chunk_params,
-                    row_count=table.num_rows,
-                    season=season,
-                )
-
-                yield table, chunk_info
-
-            except FetchError as e:
-                logger.warning(f"Season {season} failed: {e}")
-                # Continue with next season
-                continue
+        async with aclosing(self._pipeline(endpoint, specs, prefetch_depth)) as pipeline:
+            async for chunk in pipeline:
+                yield chunk
 
     async def _fetch_by_game(
         self,
         endpoint: str,
         params: Dict[str, Any],
         caps: EndpointCapabilities,
+        prefetch_depth: int = 0,
     ) -> AsyncIterator[Tuple[pa.Table, ChunkInfo]]:
         """
         Chunk by individual games.
@@ -358,6 +381,7 @@ class DatasetPaginator:
             endpoint: Endpoint name
             params: Base parameters
             caps: Endpoint capabilities
+            prefetch_depth: Chunks to fetch ahead of the one being consumed
 
         Yields:
             Tuple of (table, chunk_info) for each game
@@ -380,30 +404,136 @@ class DatasetPaginator:
         total_chunks = len(game_ids)
         logger.info(f"Game-based chunking: {total_chunks} games")
 
-        for chunk_num, game_id in enumerate(game_ids, start=1):
+        specs = []
+        for game_id in game_ids:
             # Update params with game ID
             chunk_params = params.copy()
             chunk_params["game_id"] = game_id
+            specs.append((chunk_params, {"game_id": game_id}))
+
+        async with aclosing(self._pipeline(endpoint, specs, prefetch_depth)) as pipeline:
+            async for chunk in pipeline:
+                yield chunk
 
-            logger.debug(f"Fetching chunk {chunk_num}/{total_chunks}: game {game_id}")
+    async def _pipeline(
+        self,
+        endpoint: str,
+        specs: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+        prefetch_depth: int,
+    ) -> AsyncIterator[Tuple[pa.Table, ChunkInfo]]:
+        """
+        Fetch chunks with bounded read-ahead, yielding them in order.
 
-            try:
-                table, provenance = await fetch_endpoint(endpoint, chunk_params)
+        While the caller processes chunk N, up to prefetch_depth later chunks
+        are already being fetched. A chunk that fails with FetchError is
+        skipped (logged), matching the sequential behaviour. Outstanding
+        fetches are cancelled if the caller stops iterating early.
+
+        Args:
+            endpoint: Endpoint name
+            specs: List of (chunk_params, extra ChunkInfo fields) in yield order
+            prefetch_depth: Chunks to fetch ahead (0 = strictly sequential)
+
+        Yields:
+            Tuple of (table, chunk_info) for each successful chunk
+        """
+        total_chunks = len(specs)
+        upcoming = iter(enumerate(specs, start=1))
+        in_flight: deque = deque()
+
+        def top_up(limit: int):
+            while len(in_flight) < limit:
+                try:
+                    chunk_num, (chunk_params, extra) = next(upcoming)
+                except StopIteration:
+                    return
+                logger.debug(f"Fetching chunk {chunk_num}/{total_chunks}: {extra}")
+                # Read-ahead chunks queue behind interactive upstream requests
+                priority = Priority.BACKGROUND if in_flight else current_priority()
+                with upstream_priority(priority):
+                    task = asyncio.create_task(self._fetch_chunk(endpoint, chunk_params))
+                in_flight.append((chunk_num, chunk_params, extra, task))
+
+        try:
+            while True:
+                top_up(prefetch_depth + 1)
+                if not in_flight:
+                    break
+
+                chunk_num, chunk_params, extra, task = in_flight.popleft()
+                wait_start = time.perf_counter()
+                try:
+                    table, fetch_seconds = await task
+                except FetchError as e:
+                    logger.warning(f"Chunk {chunk_num} ({extra}) failed: {e}")
+                    # Continue with next chunk
+                    continue
+                wait_seconds = time.perf_counter() - wait_start
+
+                # Keep the read-ahead window full while the caller works
+                top_up(prefetch_depth)
 
                 chunk_info = ChunkInfo(
                     chunk_number=chunk_num,
                     total_chunks=total_chunks,
                     params=chunk_params,
                     row_count=table.num_rows,
-                    game_id=game_id,
+                    fetch_seconds=fetch_seconds,
+                    wait_seconds=wait_seconds,
+                    prefetch_depth=prefetch_depth,
+                    **extra,
                 )
-
                 yield table, chunk_info
+        finally:
+            for _, _, _, task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(
+                    *(task for _, _, _, task in in_flight), return_exceptions=True
+                )
+
+    async def _fetch_chunk(
+        self, endpoint: str, chunk_params: Dict[str, Any]
+    ) -> Tuple[pa.Table, float]:
+        """
+        Fetch a single chunk, waiting for rate limiter capacity first.
+
+        Args:
+            endpoint: Endpoint name
+            chunk_params: Parameters for this chunk
+
+        Returns:
+            Tuple of (table, fetch duration in seconds)
+        """
+        await self._wait_for_rate_limit()
+        start = time.perf_counter()
+        table, provenance = await fetch_endpoint(endpoint, chunk_params)
+        return table, time.perf_counter() - start
 
-            except FetchError as e:
-                logger.warning(f"Game {game_id} failed: {e}")
-                # Continue with next game
-                continue
+    async def _wait_for_rate_limit(self):
+        """
+        Pace chunk requests through the global rate limiter.
+
+        Instead of failing when the bucket is empty, wait for the advertised
+        retry_after and try again. No-op when no limiter is configured.
+        """
+        from nba_mcp.rate_limit.token_bucket import get_rate_limiter
+
+        limiter = get_rate_limiter()
+        if limiter is None:
+            return
+
+        while True:
+            allowed, retry_after = limiter.check_limit(RATE_LIMIT_KEY)
+            if allowed:
+                return
+            if retry_after and retry_after > MAX_RATE_LIMIT_WAIT:
+                raise FetchError(
+                    f"Rate limit for {RATE_LIMIT_KEY} requires waiting "
+                    f"{retry_after:.0f}s (quota exhausted)"
+                )
+            logger.debug(f"Chunk fetch paced by rate limiter ({retry_after:.2f}s)")
+            await asyncio.sleep(retry_after or 1.0)
 
     def _generate_date_chunks(
         self, start_date: date, end_date: date, chunk_size_days: int = 30
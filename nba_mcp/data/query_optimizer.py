@@ -16,24 +16,37 @@ Performance Impact:
 - Reduced memory usage through early filtering
 - Optimal execution plans for chained operations
 
-Integration with unified_fetch:
-    from nba_mcp.data.query_optimizer import QueryOptimizer
-
-    optimizer = QueryOptimizer()
-    plan = optimizer.optimize([
-        {"op": "fetch", "endpoint": "team_game_log", "params": {...}},
-        {"op": "filter", "filters": {"WL": ["==", "W"]}},
-        {"op": "join", "right": another_dataset, "on": "TEAM_ID"}
-    ])
-    result = await plan.execute()
+Dataset execution (build_dataset):
+    execute_dataset() compiles a {sources, joins, filters, select} spec into
+    a physical plan: sources are fetched concurrently, filters are pushed into
+    the source they reference (unless a join null-extends that source), each
+    source is projected to the columns the query needs, and the whole
+    join/filter/select chain runs as one parameterized DuckDB query.
+
+    from nba_mcp.data.query_optimizer import get_query_optimizer
+
+    result = await get_query_optimizer().execute_dataset({
+        "sources": [
+            {"endpoint": "team_game_log", "params": {...}},
+            {"endpoint": "team_standings", "params": {"season": "2023-24"}},
+        ],
+        "joins": [{"on": "TEAM_ID", "how": "left"}],
+        "filters": [{"column": "WL", "op": "=", "value": "W"}],
+        "select": ["GAME_DATE", "TEAM_ID", "PTS", "W"],
+    })
+    result.table, result.plan.describe()
 """
 
+import asyncio
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 import pyarrow as pa
 
+from nba_mcp.data.filter_compiler import _quote_identifier, get_duckdb_pool
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,6 +58,37 @@ class OperationType(Enum):
     AGGREGATE = "aggregate"
     SORT = "sort"
     LIMIT = "limit"
+    PROJECT = "project"
+
+
+# build_dataset join types → SQL
+JOIN_TYPES = {
+    "inner": "INNER JOIN",
+    "left": "LEFT JOIN",
+    "right": "RIGHT JOIN",
+    "outer": "FULL OUTER JOIN",
+    "cross": "CROSS JOIN",
+}
+
+# build_dataset filter operators → SQL
+SPEC_FILTER_OPERATORS = {
+    "=": "=",
+    "==": "=",
+    "!=": "!=",
+    "<": "<",
+    ">": ">",
+    "<=": "<=",
+    ">=": ">=",
+    "IN": "IN",
+    "NOT IN": "NOT IN",
+    "LIKE": "LIKE",
+}
+
+
+class DatasetSpecError(ValueError):
+    """Raised when a build_dataset spec is invalid."""
+
+    pass
 
 
 @dataclass
@@ -58,6 +102,7 @@ class QueryOperation:
         estimated_cost: Estimated execution cost (lower is better)
         estimated_rows: Estimated number of rows output
         dependencies: List of operation IDs this depends on
+        actual_rows: Rows observed when the plan ran (None until executed)
     """
     op_type: OperationType
     params: Dict[str, Any]
@@ -65,6 +110,7 @@ class QueryOperation:
     estimated_rows: int = 0
     dependencies: List[str] = field(default_factory=list)
     op_id: Optional[str] = None
+    actual_rows: Optional[int] = None
 
     def __post_init__(self):
         """Generate operation ID if not provided."""
@@ -82,15 +128,76 @@ class ExecutionPlan:
         operations: List of operations in execution order
         total_estimated_cost: Total estimated cost of execution
         optimization_applied: List of optimizations applied
+        sql: Query the plan compiled to (dataset plans only)
+        timings: Phase timings in milliseconds (fetch_ms, query_ms, ...)
     """
     operations: List[QueryOperation]
     total_estimated_cost: float = 0.0
     optimization_applied: List[str] = field(default_factory=list)
+    sql: Optional[str] = None
+    timings: Dict[str, float] = field(default_factory=dict)
 
     def __post_init__(self):
         """Calculate total estimated cost."""
         self.total_estimated_cost = sum(op.estimated_cost for op in self.operations)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable view of the plan."""
+        return {
+            "operations": [
+                {
+                    "op_id": op.op_id,
+                    "op": op.op_type.value,
+                    "params": op.params,
+                    "estimated_cost": round(op.estimated_cost, 3),
+                    "estimated_rows": op.estimated_rows,
+                    "actual_rows": op.actual_rows,
+                    "dependencies": op.dependencies,
+                }
+                for op in self.operations
+            ],
+            "total_estimated_cost": round(self.total_estimated_cost, 3),
+            "optimization_applied": self.optimization_applied,
+            "sql": self.sql,
+            "timings": {k: round(v, 2) for k, v in self.timings.items()},
+        }
+
+    def describe(self) -> List[str]:
+        """Markdown lines describing the plan (for tool output)."""
+        lines = [
+            "| # | Operation | Details | Est. Cost | Est. Rows | Actual Rows |",
+            "|---|-----------|---------|-----------|-----------|-------------|",
+        ]
+        for i, op in enumerate(self.operations, 1):
+            details = op.params.get("summary", "")
+            actual = f"{op.actual_rows:,}" if op.actual_rows is not None else "-"
+            lines.append(
+                f"| {i} | {op.op_type.value} | {details} | {op.estimated_cost:.2f} "
+                f"| {op.estimated_rows:,} | {actual} |"
+            )
+        lines.append("")
+        lines.append(f"- **Total Estimated Cost**: {self.total_estimated_cost:.2f}")
+        lines.append(
+            f"- **Optimizations**: {', '.join(self.optimization_applied) or 'none'}"
+        )
+        if self.timings:
+            lines.append(
+                "- **Timings**: "
+                + ", ".join(f"{k.removesuffix('_ms')} {v:.2f}ms" for k, v in self.timings.items())
+            )
+        if self.sql:
+            lines.extend(["", "```sql", self.sql, "```"])
+        return lines
+
+
+@dataclass
+class DatasetResult:
+    """Output of QueryOptimizer.execute_dataset."""
+
+    table: pa.Table
+    plan: ExecutionPlan
+    provenance: List[Any] = field(default_factory=list)  # One per source
+
 
 class CostEstimator:
     """
@@ -113,6 +220,7 @@ class CostEstimator:
         OperationType.AGGREGATE: 5.0,     # Aggregation is moderately expensive
         OperationType.SORT: 5.0,          # Sorting is moderately expensive
         OperationType.LIMIT: 0.1,         # Limit is very cheap
+        OperationType.PROJECT: 0.1,       # Column pruning is nearly free
     }
 
     def __init__(self):
@@ -565,6 +673,409 @@ class QueryOptimizer:
                 op.estimated_rows = rows
                 current_rows = rows
 
+    # ------------------------------------------------------------------
+    # Dataset execution (build_dataset)
+    # ------------------------------------------------------------------
+
+    async def execute_dataset(
+        self,
+        spec: Dict[str, Any],
+        fetch_func: Optional[
+            Callable[[str, Dict[str, Any]], Awaitable[Tuple[Any, Any]]]
+        ] = None,
+    ) -> DatasetResult:
+        """
+        Fetch, join, filter and select a build_dataset spec as one plan.
+
+        Sources are fetched concurrently through the shared fetch scheduler,
+        then the join/filter/select chain runs as a single DuckDB query over
+        the fetched Arrow tables (no intermediate tables are materialized).
+
+        Args:
+            spec: {"sources": [{endpoint, params}], "joins": [{on, how}],
+                "filters": [{column, op, value}], "select": [columns]}
+            fetch_func: async (endpoint, params) -> (table, provenance);
+                defaults to fetch_endpoint
+
+        Returns:
+            DatasetResult with the final table, the executed plan and
+            per-source provenance
+
+        Raises:
+            DatasetSpecError: If the spec is invalid or references columns
+                the fetched sources don't have
+        """
+        from nba_mcp.data.fetch_scheduler import get_fetch_scheduler
+
+        sources, joins, filters, select = self._validate_dataset_spec(spec)
+        fetch_func = fetch_func or _fetch_arrow
+        scheduler = get_fetch_scheduler()
+
+        # 1. Fetch every source concurrently
+        start = time.perf_counter()
+        fetched = await asyncio.gather(
+            *(scheduler.run(fetch_func, s["endpoint"], s["params"]) for s in sources)
+        )
+        fetch_ms = (time.perf_counter() - start) * 1000
+
+        tables, provenance = [], []
+        for data, prov in fetched:
+            if not isinstance(data, pa.Table):
+                data = pa.Table.from_pandas(data, preserve_index=False)
+            tables.append(data)
+            provenance.append(prov)
+
+        # 2. Compile the physical plan against the fetched schemas
+        start = time.perf_counter()
+        plan, views, params = self._plan_dataset(sources, tables, joins, filters, select)
+        plan_ms = (time.perf_counter() - start) * 1000
+
+        # 3. Run the whole chain as one query on a pooled cursor
+        start = time.perf_counter()
+        result = await asyncio.to_thread(get_duckdb_pool().query, views, plan.sql, params)
+        query_ms = (time.perf_counter() - start) * 1000
+
+        plan.operations[-1].actual_rows = result.num_rows
+        plan.timings = {"fetch_ms": fetch_ms, "plan_ms": plan_ms, "query_ms": query_ms}
+
+        logger.info(
+            f"Dataset built: {len(sources)} sources, {result.num_rows} rows, "
+            f"optimizations={plan.optimization_applied}, "
+            f"fetch={fetch_ms:.1f}ms query={query_ms:.1f}ms"
+        )
+        return DatasetResult(table=result, plan=plan, provenance=provenance)
+
+    def _validate_dataset_spec(
+        self, spec: Dict[str, Any]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Tuple[str, str, Any]], List[str]]:
+        """
+        Validate a build_dataset spec before anything is fetched.
+
+        Returns:
+            Tuple of (sources, joins, filters as (column, sql_op, value), select)
+
+        Raises:
+            DatasetSpecError: If the spec is malformed
+        """
+        if not spec.get("sources"):
+            raise DatasetSpecError("'sources' required in spec")
+
+        sources = []
+        for i, source in enumerate(spec["sources"], 1):
+            if not source.get("endpoint"):
+                raise DatasetSpecError(f"Source {i} missing 'endpoint'")
+            sources.append({"endpoint": source["endpoint"], "params": source.get("params") or {}})
+
+        joins = []
+        for i, join in enumerate(spec.get("joins") or [], 1):
+            on = join.get("on")
+            how = str(join.get("how", "left")).lower()
+            if how not in JOIN_TYPES:
+                raise DatasetSpecError(
+                    f"Join {i}: invalid join type '{how}'. "
+                    f"Must be one of: {', '.join(JOIN_TYPES)}"
+                )
+            if not on and how != "cross":
+                raise DatasetSpecError(f"Join {i} missing 'on'")
+            if on and not isinstance(on, (str, list, dict)):
+                raise DatasetSpecError(f"Join {i}: unsupported 'on' type: {type(on).__name__}")
+            if i >= len(sources):
+                raise DatasetSpecError(
+                    f"Join {i} has no source to join (spec has {len(sources)} sources)"
+                )
+            joins.append({"on": on, "how": how})
+
+        filters = []
+        for j, condition in enumerate(spec.get("filters") or [], 1):
+            if not isinstance(condition, dict) or "column" not in condition or "op" not in condition:
+                raise DatasetSpecError(f"Filter {j} must be {{column, op, value}}")
+            op = " ".join(str(condition["op"]).upper().split())
+            if op not in SPEC_FILTER_OPERATORS:
+                raise DatasetSpecError(
+                    f"Filter {j}: unsupported operator '{condition['op']}'. "
+                    f"Supported: {', '.join(SPEC_FILTER_OPERATORS)}"
+                )
+            value = condition.get("value")
+            if op in ("IN", "NOT IN") and not isinstance(value, (list, tuple)):
+                raise DatasetSpecError(f"Filter {j}: {op} requires a list value")
+            filters.append((condition["column"], SPEC_FILTER_OPERATORS[op], value))
+
+        return sources, joins, filters, list(spec.get("select") or [])
+
+    def _plan_dataset(
+        self,
+        sources: List[Dict[str, Any]],
+        tables: List[pa.Table],
+        joins: List[Dict[str, Any]],
+        filters: List[Tuple[str, str, Any]],
+        select: List[str],
+    ) -> Tuple[ExecutionPlan, Dict[str, pa.Table], List[Any]]:
+        """
+        Compile a validated spec into an execution plan and one SQL query.
+
+        Join i joins the accumulated result with source i. Each source becomes
+        a CTE carrying its pushed-down filters and projected columns. A filter
+        is pushed into the first source that has its column unless a join
+        null-extends that source (right side of LEFT, left side of RIGHT,
+        both sides of OUTER), where filtering early would change the result.
+
+        Returns:
+            Tuple of (plan, views to register, query parameters)
+
+        Raises:
+            DatasetSpecError: If a referenced column doesn't exist
+        """
+        estimator = self.cost_estimator
+        # Without joins only the first source takes part (as before)
+        active = range(len(joins) + 1)
+        columns = [set(tables[k].column_names) for k in active]
+
+        def owner(column: str, among) -> Optional[int]:
+            """First source in `among` with the column."""
+            return next((k for k in among if column in columns[k]), None)
+
+        # Join conditions, USING keys and null-extended sources
+        using_keys: Set[str] = set()
+        null_supplying: Set[int] = set()
+        needed: List[Set[str]] = [set() for _ in active]
+        join_clauses = []
+        for i, join in enumerate(joins, 1):
+            on, how = join["on"], join["how"]
+            left = range(i)
+            if how == "left":
+                null_supplying.add(i)
+            elif how == "right":
+                null_supplying.update(left)
+            elif how == "outer":
+                null_supplying.update(range(i + 1))
+
+            if how == "cross":
+                join_clauses.append(f"CROSS JOIN s{i}")
+            elif isinstance(on, dict):
+                conditions = []
+                for left_column, right_column in on.items():
+                    k = owner(left_column, left)
+                    if k is None:
+                        raise DatasetSpecError(
+                            f"Join {i}: column '{left_column}' not found in the left side"
+                        )
+                    if right_column not in columns[i]:
+                        raise DatasetSpecError(
+                            f"Join {i}: column '{right_column}' not found in source {i + 1}"
+                        )
+                    needed[k].add(left_column)
+                    needed[i].add(right_column)
+                    conditions.append(
+                        f"s{k}.{_quote_identifier(left_column)} = "
+                        f"s{i}.{_quote_identifier(right_column)}"
+                    )
+                join_clauses.append(f"{JOIN_TYPES[how]} s{i} ON {' AND '.join(conditions)}")
+            else:
+                keys = [on] if isinstance(on, str) else list(on)
+                for key in keys:
+                    k = owner(key, left)
+                    if k is None or key not in columns[i]:
+                        raise DatasetSpecError(
+                            f"Join {i}: column '{key}' must exist on both sides"
+                        )
+                    needed[k].add(key)
+                    needed[i].add(key)
+                using_keys.update(keys)
+                join_clauses.append(
+                    f"{JOIN_TYPES[how]} s{i} USING "
+                    f"({', '.join(_quote_identifier(key) for key in keys)})"
+                )
+
+        def reference(column: str) -> str:
+            """Column reference in the final query (merged USING keys unqualified)."""
+            if column in using_keys:
+                return _quote_identifier(column)
+            return f"s{owner(column, active)}.{_quote_identifier(column)}"
+
+        # Filter pushdown
+        pushed: List[List[Tuple[str, List[Any]]]] = [[] for _ in active]
+        residual: List[Tuple[str, List[Any]]] = []
+        for j, (column, op, value) in enumerate(filters, 1):
+            k = owner(column, active)
+            if k is None:
+                raise DatasetSpecError(f"Filter {j}: column '{column}' not found in any source")
+            if k in null_supplying:
+                needed[k].add(column)
+                residual.append(_condition_sql(reference(column), op, value))
+            else:
+                pushed[k].append(_condition_sql(_quote_identifier(column), op, value))
+
+        # Projection pushdown
+        if select:
+            for column in select:
+                k = owner(column, active)
+                if k is None:
+                    raise DatasetSpecError(f"Selected column '{column}' not found in any source")
+                if column not in using_keys:
+                    needed[k].add(column)
+            select_sql = ", ".join(f"{reference(c)} AS {_quote_identifier(c)}" for c in select)
+        else:
+            select_sql = "*"
+
+        ctes, params = [], []
+        projected: Dict[int, List[str]] = {}
+        for k in active:
+            names = tables[k].column_names
+            if select:
+                # A source no column is needed from still contributes rows
+                kept = [c for c in names if c in needed[k]] or names[:1]
+                if len(kept) < len(names):
+                    projected[k] = kept
+            cte = (
+                f"SELECT {', '.join(_quote_identifier(c) for c in projected[k])}"
+                if k in projected
+                else "SELECT *"
+            ) + f" FROM src_{k}"
+            if pushed[k]:
+                cte += " WHERE " + " AND ".join(sql for sql, _ in pushed[k])
+                for _, values in pushed[k]:
+                    params.extend(values)
+            ctes.append(f"s{k} AS ({cte})")
+
+        sql_lines = ["WITH " + ",\n     ".join(ctes), f"SELECT {select_sql}", "FROM s0"]
+        sql_lines.extend(join_clauses)
+        if residual:
+            sql_lines.append("WHERE " + " AND ".join(sql for sql, _ in residual))
+            for _, values in residual:
+                params.extend(values)
+
+        # Operations with costs from the actual fetched row counts
+        operations: List[QueryOperation] = []
+        last_op: Dict[int, str] = {}
+        rows: Dict[int, int] = {}
+        for k, source in enumerate(sources):
+            cost, _ = estimator.estimate_fetch_cost(source["endpoint"], source["params"])
+            rows[k] = tables[k].num_rows
+            unused = "" if k in active else " (unused: no join)"
+            op = QueryOperation(
+                op_type=OperationType.FETCH,
+                params={
+                    "summary": f"`{source['endpoint']}` as s{k}{unused}",
+                    "endpoint": source["endpoint"],
+                    "params": source["params"],
+                },
+                estimated_cost=cost,
+                estimated_rows=rows[k],
+                actual_rows=rows[k],
+                op_id=f"fetch_s{k}",
+            )
+            operations.append(op)
+            last_op[k] = op.op_id
+
+        for k in active:
+            if pushed[k]:
+                cost, rows[k] = estimator.estimate_filter_cost(rows[k], len(pushed[k]))
+                op = QueryOperation(
+                    op_type=OperationType.FILTER,
+                    params={
+                        "summary": f"s{k}: " + " AND ".join(sql for sql, _ in pushed[k]),
+                        "pushed_down": True,
+                    },
+                    estimated_cost=cost,
+                    estimated_rows=rows[k],
+                    dependencies=[last_op[k]],
+                    op_id=f"filter_s{k}",
+                )
+                operations.append(op)
+                last_op[k] = op.op_id
+            if k in projected:
+                op = QueryOperation(
+                    op_type=OperationType.PROJECT,
+                    params={
+                        "summary": f"s{k}: {len(projected[k])}/{tables[k].num_columns} columns",
+                        "columns": projected[k],
+                    },
+                    estimated_cost=estimator.BASE_COSTS[OperationType.PROJECT],
+                    estimated_rows=rows[k],
+                    dependencies=[last_op[k]],
+                    op_id=f"project_s{k}",
+                )
+                operations.append(op)
+                last_op[k] = op.op_id
+
+        current_rows, current_op = rows[0], last_op[0]
+        for i, join in enumerate(joins, 1):
+            cost, estimated = estimator.estimate_join_cost(current_rows, rows[i], join["how"])
+            if join["how"] == "cross":
+                estimated = current_rows * rows[i]
+            op = QueryOperation(
+                op_type=OperationType.JOIN,
+                params={"summary": join_clauses[i - 1], "on": join["on"], "how": join["how"]},
+                estimated_cost=cost,
+                estimated_rows=estimated,
+                dependencies=[current_op, last_op[i]],
+                op_id=f"join_{i}",
+            )
+            operations.append(op)
+            current_rows, current_op = estimated, op.op_id
+
+        if residual:
+            cost, current_rows = estimator.estimate_filter_cost(current_rows, len(residual))
+            op = QueryOperation(
+                op_type=OperationType.FILTER,
+                params={
+                    "summary": " AND ".join(sql for sql, _ in residual),
+                    "pushed_down": False,
+                },
+                estimated_cost=cost,
+                estimated_rows=current_rows,
+                dependencies=[current_op],
+                op_id="filter_final",
+            )
+            operations.append(op)
+            current_op = op.op_id
+
+        if select:
+            operations.append(
+                QueryOperation(
+                    op_type=OperationType.PROJECT,
+                    params={"summary": f"{len(select)} columns", "columns": select},
+                    estimated_cost=estimator.BASE_COSTS[OperationType.PROJECT],
+                    estimated_rows=current_rows,
+                    dependencies=[current_op],
+                    op_id="project_final",
+                )
+            )
+
+        optimizations = []
+        if len(sources) > 1:
+            optimizations.append("concurrent_fetch")
+        if joins and any(pushed):
+            optimizations.append("filter_pushdown_before_joins")
+        if projected:
+            optimizations.append("projection_pushdown")
+        optimizations.append("single_query_execution")
+
+        plan = ExecutionPlan(
+            operations=operations,
+            optimization_applied=optimizations,
+            sql="\n".join(sql_lines),
+        )
+        views = {f"src_{k}": tables[k] for k in active}
+        return plan, views, params
+
+
+def _condition_sql(reference: str, operator: str, value: Any) -> Tuple[str, List[Any]]:
+    """Parameterized SQL for one build_dataset filter condition."""
+    if operator in ("IN", "NOT IN"):
+        values = list(value)
+        if not values:
+            return ("FALSE" if operator == "IN" else "TRUE"), []
+        return f"{reference} {operator} ({', '.join('?' for _ in values)})", values
+    return f"{reference} {operator} ?", [value]
+
+
+async def _fetch_arrow(endpoint: str, params: Dict[str, Any]) -> Tuple[pa.Table, Any]:
+    """Default build_dataset fetch: the endpoint registry, as Arrow."""
+    from nba_mcp.data.fetch import fetch_endpoint
+
+    return await fetch_endpoint(endpoint, params, as_arrow=True)
+
 
 # Global singleton instance
 _query_optimizer = None
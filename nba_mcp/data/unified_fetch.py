@@ -9,7 +9,7 @@ Features:
 - Batch fetching with parallel execution
 - Automatic parameter processing and validation
 - Entity resolution (player/team names → IDs)
-- Generic filter support (post-fetch filtering)
+- Generic filter support (post-fetch filtering, compiled to Arrow expressions)
 - Provenance tracking
 - Comprehensive error handling
 - Easy to use for frontend APIs or MCP tools
@@ -43,7 +43,6 @@ import logging
 
 import pandas as pd
 import pyarrow as pa
-import duckdb
 
 from nba_mcp.data.endpoint_registry import get_registry
 from nba_mcp.data.parameter_processor import get_processor, ParameterValidationError
@@ -51,6 +50,7 @@ from nba_mcp.data.dataset_manager import ProvenanceInfo
 from nba_mcp.data.catalog import get_catalog
 from nba_mcp.data.cache_integration import get_cache_manager
 from nba_mcp.data.filter_pushdown import get_pushdown_mapper
+from nba_mcp.data.filter_compiler import filter_table
 from nba_mcp.api.errors import NBAApiError, EntityNotFoundError
 
 logger = logging.getLogger(__name__)
@@ -311,9 +311,15 @@ async def unified_fetch(
             provenance.operations.append("post_filter:skipped (empty table)")
         else:
             try:
-                table = apply_filters(table, post_fetch_filters)
-                provenance.operations.append(f"post_filter:{len(post_fetch_filters)} conditions")
-                logger.debug(f"Applied {len(post_fetch_filters)} post-fetch filter(s)")
+                table, timing = filter_table(table, post_fetch_filters)
+                provenance.operations.append(
+                    f"post_filter:{len(post_fetch_filters)} conditions "
+                    f"({timing.path}, {timing.elapsed_ms:.2f}ms)"
+                )
+                logger.debug(
+                    f"Applied {len(post_fetch_filters)} post-fetch filter(s) via "
+                    f"{timing.path}: {timing.rows_in} → {timing.rows_out} rows"
+                )
             except Exception as e:
                 logger.warning(f"Failed to apply post-fetch filters: {e}")
                 processed.warnings.append(f"Post-fetch filter application failed: {str(e)}")
@@ -411,10 +417,12 @@ def apply_filters(
     filters: Dict[str, List[Any]]
 ) -> pa.Table:
     """
-    Apply post-fetch filters to a PyArrow table using DuckDB.
+    Apply post-fetch filters to a PyArrow table.
 
     This provides generic filtering that works on any tabular data,
-    regardless of the endpoint.
+    regardless of the endpoint. The spec is compiled (and cached) as a
+    pyarrow.compute expression; a pooled DuckDB connection with a
+    parameterized query handles anything Arrow cannot evaluate.
 
     Filter format:
         {
@@ -461,82 +469,8 @@ def apply_filters(
     if not filters:
         return table
 
-    # Build SQL WHERE clause
-    conditions = []
-    for column, filter_spec in filters.items():
-        if not isinstance(filter_spec, list) or len(filter_spec) < 2:
-            raise ValueError(
-                f"Invalid filter for '{column}': must be [operator, value]"
-            )
-
-        operator = filter_spec[0].upper()
-        value = filter_spec[1]
-
-        # Validate column exists
-        if column not in table.column_names:
-            raise ValueError(
-                f"Column '{column}' not found in table. "
-                f"Available: {', '.join(table.column_names)}"
-            )
-
-        # Build condition based on operator
-        if operator in ("==", "="):
-            if isinstance(value, str):
-                conditions.append(f'"{column}" = \'{value}\'')
-            else:
-                conditions.append(f'"{column}" = {value}')
-
-        elif operator == "!=":
-            if isinstance(value, str):
-                conditions.append(f'"{column}" != \'{value}\'')
-            else:
-                conditions.append(f'"{column}" != {value}')
-
-        elif operator in (">", ">=", "<", "<="):
-            conditions.append(f'"{column}" {operator} {value}')
-
-        elif operator == "IN":
-            if not isinstance(value, (list, tuple)):
-                raise ValueError(f"IN operator requires a list, got {type(value)}")
-            # Format list values
-            if value and isinstance(value[0], str):
-                values_str = ", ".join(f"'{v}'" for v in value)
-            else:
-                values_str = ", ".join(str(v) for v in value)
-            conditions.append(f'"{column}" IN ({values_str})')
-
-        elif operator == "BETWEEN":
-            if not isinstance(value, (list, tuple)) or len(value) != 2:
-                raise ValueError("BETWEEN operator requires [min, max]")
-            conditions.append(f'"{column}" BETWEEN {value[0]} AND {value[1]}')
-
-        elif operator == "LIKE":
-            if not isinstance(value, str):
-                raise ValueError("LIKE operator requires a string pattern")
-            conditions.append(f'"{column}" LIKE \'{value}\'')
-
-        else:
-            raise ValueError(
-                f"Unsupported operator: {operator}. "
-                f"Supported: ==, !=, >, >=, <, <=, IN, BETWEEN, LIKE"
-            )
-
-    # Combine conditions with AND
-    where_clause = " AND ".join(conditions)
-
-    # Execute filter using DuckDB with registered table
-    # FIX: DuckDB requires explicit table registration - 'table' is a keyword, not a reference
-    # We register the Arrow table temporarily, query it, then close the connection
-    try:
-        con = duckdb.connect(':memory:')
-        con.register('arrow_table', table)
-        filtered = con.execute(
-            f'SELECT * FROM arrow_table WHERE {where_clause}'
-        ).fetch_arrow_table()
-        con.close()
-        return filtered
-    except Exception as e:
-        raise ValueError(f"Filter execution failed: {str(e)}") from e
+    filtered, _ = filter_table(table, filters)
+    return filtered
 
 
 # Backward compatibility alias
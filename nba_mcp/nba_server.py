@@ -28,8 +28,13 @@ from nba_api.stats.static import players, teams
 # nba_server.py (add near the top)
 from pydantic import BaseModel, Field
 
-from nba_mcp.api.advanced_metrics_calculator import AdvancedMetricsCalculator
+from nba_mcp.api.advanced_metrics_calculator import (
+    AdvancedMetricsCalculator,
+    get_league_metrics_store,
+)
+from nba_mcp.api.all_time_leaders import ALL_TIME_STATS, get_all_time_leaders_store
 from nba_mcp.api.client import NBAApiClient
+from nba_mcp.api.entity_index import build_entity_index
 from nba_mcp.api.entity_resolver import (
     get_cache_info,
     resolve_entity,
@@ -62,16 +67,20 @@ from nba_mcp.api.models import (
 )
 from nba_mcp.api.schedule import format_schedule_markdown
 from nba_mcp.api.schedule import get_nba_schedule as fetch_nba_schedule
+from nba_mcp.api.schedule_store import get_schedule_store
 
 # Import data groupings and advanced metrics (Phase 4)
 from nba_mcp.api.season_aggregator import get_player_season_stats, get_team_season_stats
 
 # Import season context for LLM temporal awareness
 from nba_mcp.api.season_context import get_current_season, get_season_context
+from nba_mcp.api.shot_charts import compare_shot_charts as fetch_shot_chart_comparison
 from nba_mcp.api.shot_charts import get_shot_chart as fetch_shot_chart
+from nba_mcp.api.shot_charts import get_shot_store
 
 # Import date parser for natural language date support
 from nba_mcp.api.tools.date_parser import parse_and_normalize_date_params
+from nba_mcp.api.tools.live_pbp_stream import get_live_pbp_hub
 from nba_mcp.api.tools.nba_api_utils import (
     format_game,
     get_player_id,
@@ -89,14 +98,17 @@ from nba_mcp.api.tools.nba_api_utils import (
 from nba_mcp.cache.redis_cache import CacheTier, cached, get_cache, initialize_cache
 
 # Import dataset and joins features
+from nba_mcp.data.cache_integration import get_cache_manager
 from nba_mcp.data.catalog import get_catalog
 from nba_mcp.data.dataset_manager import get_manager as get_dataset_manager
 from nba_mcp.data.dataset_manager import initialize_manager, shutdown_manager
 from nba_mcp.data.fetch import fetch_endpoint, validate_parameters
-from nba_mcp.data.joins import filter_table, join_tables, join_with_stats
+from nba_mcp.data.joins import join_with_stats
+from nba_mcp.data.unified_fetch import unified_fetch
 
 # Import NLQ pipeline components
 from nba_mcp.nlq.pipeline import answer_nba_question as nlq_answer_question
+from nba_mcp.nlq.pipeline import answer_nba_questions_batch as nlq_answer_questions_batch
 from nba_mcp.nlq.pipeline import get_pipeline_status
 from nba_mcp.nlq.tool_registry import initialize_tool_registry
 
@@ -136,45 +148,10 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-# Phase 5.2 (P6 Phase 3): Caching infrastructure for lineup data (2025-11-01)
-from functools import lru_cache
-
-# Cache TTL management
-_lineup_cache_timestamps = {}
-_lineup_cache_lock = threading.Lock()
-LINEUP_CACHE_TTL_SECONDS = 3600  # 1 hour
-
-
-def _is_cache_valid(cache_key: str) -> bool:
+# Phase 5.2 (P6 Phase 3): Cached lineup data fetcher (2025-11-01)
+async def _fetch_lineup_data(team_id: int, season: str, season_type: str = "Regular Season"):
     """
-    Check if cache entry is still valid based on TTL.
-
-    Phase 5.2 (P6 Phase 3): Cache TTL validation (2025-11-01)
-    """
-    with _lineup_cache_lock:
-        if cache_key not in _lineup_cache_timestamps:
-            return False
-        timestamp = _lineup_cache_timestamps[cache_key]
-        age = (datetime.now() - timestamp).total_seconds()
-        return age < LINEUP_CACHE_TTL_SECONDS
-
-
-def _update_cache_timestamp(cache_key: str):
-    """
-    Update cache timestamp for TTL tracking.
-
-    Phase 5.2 (P6 Phase 3): Cache timestamp management (2025-11-01)
-    """
-    with _lineup_cache_lock:
-        _lineup_cache_timestamps[cache_key] = datetime.now()
-
-
-@lru_cache(maxsize=128)
-def _fetch_lineup_data_cached(team_id: int, season: str, season_type: str = "Regular Season"):
-    """
-    Cached lineup data fetcher with TTL validation.
-
-    Phase 5.2 (P6 Phase 3): Lineup Data Caching (2025-11-01)
+    Fetch lineup data through the registered `team_lineups` endpoint.
 
     Args:
         team_id: NBA team ID
@@ -184,46 +161,22 @@ def _fetch_lineup_data_cached(team_id: int, season: str, season_type: str = "Reg
     Returns:
         pandas DataFrame with lineup data
 
-    Cache Strategy:
-        - LRU cache with maxsize=128 (covers ~30 teams x 4 seasons)
-        - TTL: 1 hour (3600 seconds)
+    Cache Strategy (CacheManager via unified_fetch):
+        - Tier 1/2: LRU/Redis with real TTL expiry (1h current season, 24h past seasons)
+        - Tier 3: Parquet persistence, expiring with the same TTL
         - Cache key: (team_id, season, season_type)
-        - Thread-safe TTL checking
-
-    Performance:
-        - Cache hit: ~5ms (vs ~150-300ms API call)
-        - Expected hit rate: 60-80% for repeated queries
-        - Memory usage: ~6.4MB (128 entries * 50KB each)
+        - The API call runs in a worker thread, so seasons fetch concurrently
     """
-    cache_key = f"{team_id}_{season}_{season_type}"
-
-    # Check TTL - if expired, clear this cache entry
-    if not _is_cache_valid(cache_key):
-        # Clear this specific cache entry by calling with different args
-        # (LRU cache doesn't have direct invalidation, so we track TTL separately)
-        _update_cache_timestamp(cache_key)
-        logger.info(f"Cache MISS (expired): {cache_key}")
-    else:
-        logger.info(f"Cache HIT: {cache_key}")
-
-    # Import here to avoid circular imports
-    from nba_api.stats.endpoints import leaguedashlineups
-
-    # Fetch from NBA API
-    lineup_data = leaguedashlineups.LeagueDashLineups(
-        team_id_nullable=team_id,
-        season=season,
-        season_type_nullable=season_type,
-        measure_type_detailed_defense="Base",
-        per_mode_detailed="Totals"
+    result = await unified_fetch(
+        "team_lineups",
+        {"team": str(team_id), "season": season, "season_type": season_type},
+        resolve_entities=False,
     )
-
-    df = lineup_data.get_data_frames()[0]
-
-    # Update timestamp on fresh fetch
-    _update_cache_timestamp(cache_key)
-
-    return df
+    logger.info(
+        f"Lineup data {'cache HIT' if result.from_cache else 'fetched'}: "
+        f"{team_id}_{season}_{season_type}"
+    )
+    return result.data.to_pandas()
 
 
 # ── 1) Read configuration up‑front ────────────────────────
@@ -836,111 +789,40 @@ async def get_all_time_leaders(
         active_only,
     )
 
-    # Mapping from stat category to dataset name in AllTimeLeadersGrids
-    STAT_TO_DATASET = {
-        "PTS": "PTSLeaders",
-        "AST": "ASTLeaders",
-        "REB": "REBLeaders",
-        "STL": "STLLeaders",
-        "BLK": "BLKLeaders",
-        "FGM": "FGMLeaders",
-        "FGA": "FGALeaders",
-        "FG_PCT": "FG_PCTLeaders",
-        "FG3M": "FG3MLeaders",
-        "FG3A": "FG3ALeaders",
-        "FG3_PCT": "FG3_PCTLeaders",
-        "FTM": "FTMLeaders",
-        "FTA": "FTALeaders",
-        "FT_PCT": "FT_PCTLeaders",
-        "OREB": "OREBLeaders",
-        "DREB": "DREBLeaders",
-        "TOV": "TOVLeaders",
-        "PF": "PFLeaders",
-        "GP": "GPLeaders",
-    }
-
     # Normalize stat category (uppercase, handle common aliases)
     stat_upper = stat_category.upper()
 
     # Check if stat category is supported
-    if stat_upper not in STAT_TO_DATASET:
-        supported = ", ".join(sorted(STAT_TO_DATASET.keys()))
+    if stat_upper not in ALL_TIME_STATS:
+        supported = ", ".join(sorted(ALL_TIME_STATS.keys()))
         season_ctx = get_season_context()
         return f"📅 {season_ctx}\n\n❌ Unsupported stat category: {stat_category}\n\nSupported categories: {supported}"
 
     try:
-        # Import AllTimeLeadersGrids endpoint
-        from nba_api.stats.endpoints import alltimeleadersgrids
-
-        # Fetch all-time leaders data
-        logger.debug(f"Fetching AllTimeLeadersGrids endpoint")
-
-        import asyncio
-        all_time_data = await asyncio.to_thread(
-            alltimeleadersgrids.AllTimeLeadersGrids
-        )
-
-        # Get DataFrames
-        dfs = all_time_data.get_data_frames()
+        # Pre-ranked snapshot of every leaderboard (rebuilt from one
+        # AllTimeLeadersGrids pull only when stale)
+        store = get_all_time_leaders_store()
+        await store.ensure_fresh()
 
-        # Find the appropriate dataset
-        dataset_name = STAT_TO_DATASET[stat_upper]
-        dataset_index = None
-
-        # The datasets are returned in a specific order, we need to find the right one
-        # by matching column names
-        for idx, df in enumerate(dfs):
-            if stat_upper in df.columns:
-                dataset_index = idx
-                break
-
-        if dataset_index is None:
+        if not store.has_stat(stat_upper):
             season_ctx = get_season_context()
             return f"📅 {season_ctx}\n\n❌ Could not find {stat_upper} data in AllTimeLeadersGrids response"
 
-        df = dfs[dataset_index]
+        leaders = store.top(stat_upper, top_n, active_only=active_only)
 
-        # Check for empty DataFrame
-        if df.empty:
+        if not leaders:
             season_ctx = get_season_context()
-            return f"📅 {season_ctx}\n\nNo all-time leaders data available for {stat_upper}"
-
-        # Filter for active players if requested
-        if active_only and "IS_ACTIVE_FLAG" in df.columns:
-            df = df[df["IS_ACTIVE_FLAG"] == "Y"]
-
-            if df.empty:
-                season_ctx = get_season_context()
+            if active_only:
                 return f"📅 {season_ctx}\n\nNo active players found in all-time {stat_upper} leaders"
-
-        # Sort by rank if available, otherwise by stat value (descending)
-        rank_col = f"{stat_upper}_RANK"
-        if rank_col in df.columns:
-            df = df.sort_values(rank_col)
-        else:
-            df = df.sort_values(stat_upper, ascending=False)
-
-        # Limit to top N
-        df = df.head(top_n)
+            return f"📅 {season_ctx}\n\nNo all-time leaders data available for {stat_upper}"
 
         # Format output
         if format == "json":
-            leaders_data = []
-            for _, row in df.iterrows():
-                leader = {
-                    "player_name": str(row.get("PLAYER_NAME", "Unknown")),
-                    "player_id": int(row.get("PLAYER_ID", 0)),
-                    "value": float(row.get(stat_upper, 0)) if pd.notna(row.get(stat_upper)) else None,
-                    "rank": int(row.get(rank_col, 0)) if rank_col in df.columns else None,
-                    "is_active": str(row.get("IS_ACTIVE_FLAG", "N")) == "Y",
-                }
-                leaders_data.append(leader)
-
             response = json.dumps({
                 "stat_category": stat_upper,
-                "leaders": leaders_data,
+                "leaders": leaders,
                 "active_only": active_only,
-                "total_shown": len(leaders_data)
+                "total_shown": len(leaders)
             }, indent=2)
         else:
             # Text format
@@ -950,24 +832,19 @@ async def get_all_time_leaders(
             header += ":"
 
             out = [header]
-            for i, (_, row) in enumerate(df.iterrows(), 1):
-                name = row.get("PLAYER_NAME", "Unknown")
-                value = row.get(stat_upper, "N/A")
-                is_active = str(row.get("IS_ACTIVE_FLAG", "N")) == "Y"
+            for i, leader in enumerate(leaders, 1):
+                value = leader["value"]
 
                 # Format value with commas for readability
-                if isinstance(value, (int, float)) and not pd.isna(value):
-                    if stat_upper.endswith("_PCT"):
-                        # Format percentages
-                        value_str = f"{value:.1%}" if value < 1 else f"{value:.3f}"
-                    else:
-                        # Format integers with commas
-                        value_str = f"{int(value):,}"
+                if stat_upper.endswith("_PCT"):
+                    # Format percentages
+                    value_str = f"{value:.1%}" if value < 1 else f"{value:.3f}"
                 else:
-                    value_str = str(value)
+                    # Format integers with commas
+                    value_str = f"{int(value):,}"
 
-                active_tag = " (Active)" if is_active else ""
-                out.append(f"{i}. {name}: {value_str}{active_tag}")
+                active_tag = " (Active)" if leader["is_active"] else ""
+                out.append(f"{i}. {leader['player_name']}: {value_str}{active_tag}")
 
             response = "\n".join(out)
 
@@ -1485,6 +1362,7 @@ async def fetch_player_games(
     vs_conference: Optional[Literal["East", "West"]] = None,
     vs_division: Optional[str] = None,
     stat_filters: Optional[str] = None,
+    ctx: Context = None,
 ) -> str:
     """
     Fetch player game logs with comprehensive filtering using the data grouping infrastructure.
@@ -1493,7 +1371,8 @@ async def fetch_player_games(
     - Single season: "2023-24"
     - Season range: "2021-22:2023-24" (expands to all seasons in range)
     - JSON array: '["2021-22", "2022-23", "2023-24"]'
-    Multi-season queries use CONCURRENT FETCHING (3x faster for 3 seasons).
+    Multi-season queries use CONCURRENT FETCHING through a shared, rate-aware
+    scheduler, with per-season progress reported to the client.
 
     This tool exposes the powerful three-tier filtering system:
     - Tier 1: NBA API filters (reduces data transfer at source)
@@ -1631,11 +1510,12 @@ async def fetch_player_games(
                 if isinstance(value, list) and len(value) == 2:
                     filters[key] = tuple(value)
 
-        # Fetch data using concurrent multi-season fetching (3x faster for 3 seasons)
+        # Fetch data using bounded concurrent multi-season fetching (progress → ctx)
         logger.info(f"fetch_player_games: Fetching {len(seasons)} seasons with filters: {filters}")
         df = await fetch_grouping_multi_season(
             "player/game",
             seasons=seasons,
+            ctx=ctx,
             **filters
         )
 
@@ -1835,6 +1715,67 @@ async def play_by_play(
     return json.dumps(md, indent=2)
 
 
+@mcp_server.tool()
+async def get_live_play_by_play(
+    game_id: str,
+    after_action_number: int = 0,
+    max_events: int = 100,
+) -> str:
+    """
+    Get new live play-by-play actions for an in-progress game.
+
+    Incremental: pass the returned next_action_number back as
+    after_action_number to receive only actions added since the last call.
+    All callers watching a game share one upstream poll of the NBA CDN
+    (ETag revalidation, interval adapting to stoppages and Final).
+
+    Args:
+        game_id: 10-digit NBA game ID (e.g., "0022500123")
+        after_action_number: Cursor; only actions after this number are returned
+            (default: 0 = from the start of the game)
+        max_events: Maximum actions per call (default: 100)
+
+    Returns:
+        JSON ResponseEnvelope with:
+            - events: Actions (actionNumber, clock, period, description, scores, ...)
+            - next_action_number: Cursor for the next call
+            - final: Whether the game has ended
+            - poll_interval_s: Current upstream poll interval
+
+    Examples:
+        get_live_play_by_play("0022500123")
+        get_live_play_by_play("0022500123", after_action_number=412)
+    """
+    start_time = time.time()
+    try:
+        hub = get_live_pbp_hub()
+        events = await hub.events_since(game_id, after_action_number, limit=max_events)
+        poller = hub.poller(game_id)
+        next_cursor = events[-1].get("actionNumber", after_action_number) if events else after_action_number
+
+        response = success_response(
+            data={
+                "game_id": game_id,
+                "events": events,
+                "next_action_number": next_cursor,
+                "final": poller.tracker.final,
+                "poll_interval_s": poller.interval,
+            },
+            source="live",
+            cache_status="hit" if poller.stats["polls"] > 1 else "miss",
+            execution_time_ms=(time.time() - start_time) * 1000,
+        )
+        return response.to_json_string()
+
+    except Exception as e:
+        logger.exception("Error in get_live_play_by_play")
+        response = error_response(
+            error_code="NBA_API_ERROR",
+            error_message=f"Failed to fetch live play-by-play: {str(e)}",
+        )
+        return response.to_json_string()
+
+
 @mcp_server.tool()
 async def get_lineup_stats(
     team: str,
@@ -1993,9 +1934,6 @@ async def get_lineup_stats(
                 f"Please analyze teams separately. Example: get_lineup_stats(team='Lakers')"
             )
 
-        # Phase 5.2 (P6): Import NBA API endpoint for lineup stats
-        from nba_api.stats.endpoints import leaguedashlineups
-
         # Resolve team name to team ID
         try:
             team_result = await resolve_nba_entity(team, entity_type="team")
@@ -2041,7 +1979,7 @@ async def get_lineup_stats(
         logger.info(f"Fetching lineup stats for {team_name} ({season})")
 
         # Phase 5.2 (P6 Phase 3): Use cached lineup data fetcher (2025-11-01)
-        lineups_df = _fetch_lineup_data_cached(
+        lineups_df = await _fetch_lineup_data(
             team_id=team_id,
             season=season,
             season_type="Regular Season"
@@ -2236,8 +2174,8 @@ async def get_lineup_stats_multi_season(
         async def fetch_season_lineup(season_str):
             """Fetch lineup data for a single season."""
             try:
-                # Use cached fetcher
-                lineups_df = _fetch_lineup_data_cached(
+                # Use cached fetcher (non-blocking, so gather runs seasons concurrently)
+                lineups_df = await _fetch_lineup_data(
                     team_id=team_id,
                     season=season_str,
                     season_type="Regular Season"
@@ -2616,7 +2554,7 @@ async def get_advanced_metrics(
 
         response = success_response(
             data=metrics_dict,
-            source="calculated",
+            source="composed",
             cache_status="miss",
             execution_time_ms=execution_time_ms,
         )
@@ -2646,6 +2584,81 @@ async def get_advanced_metrics(
         return response.to_json_string()
 
 
+@mcp_server.tool()
+async def get_league_advanced_metrics(
+    season: str,
+    metric: str = "WIN_SHARES",
+    top_n: int = 25,
+    min_games: int = 0,
+    season_type: str = "Regular Season",
+) -> str:
+    """
+    Rank every player in a season by an advanced metric.
+
+    All players are calculated at once from one league-wide game log table
+    and the result is stored per season, so repeated rankings and
+    get_advanced_metrics lookups do not refetch anything.
+
+    Args:
+        season: Season in 'YYYY-YY' format (e.g., "2023-24")
+        metric: Metric to rank by (default: WIN_SHARES). One of
+                GAME_SCORE_TOTAL, GAME_SCORE_PER_GAME, GAME_SCORE_PER_36,
+                TRUE_SHOOTING_PCT, EFFECTIVE_FG_PCT, OFFENSIVE_WIN_SHARES,
+                DEFENSIVE_WIN_SHARES, WIN_SHARES, WIN_SHARES_PER_48, EWA
+        top_n: Number of players to return (default: 25)
+        min_games: Minimum games played to qualify (default: 0)
+        season_type: "Regular Season" or "Playoffs"
+
+    Returns:
+        JSON string with ResponseEnvelope containing the ranked players
+
+    Examples:
+        get_league_advanced_metrics("2023-24")
+        get_league_advanced_metrics("2023-24", metric="TRUE_SHOOTING_PCT", min_games=58)
+    """
+    start_time = time.time()
+
+    try:
+        store = get_league_metrics_store()
+        builds_before = store.stats["builds"]
+        leaders = await store.leaders(
+            season,
+            metric=metric,
+            top_n=top_n,
+            season_type=season_type,
+            min_games=min_games,
+        )
+
+        execution_time_ms = (time.time() - start_time) * 1000
+        response = success_response(
+            data={
+                "season": season,
+                "season_type": season_type,
+                "metric": metric,
+                "players": leaders.to_pylist(),
+            },
+            source="composed",
+            cache_status="miss" if store.stats["builds"] > builds_before else "hit",
+            execution_time_ms=execution_time_ms,
+        )
+        return response.to_json_string()
+
+    except ValueError as e:
+        response = error_response(
+            error_code="VALIDATION_ERROR",
+            error_message=str(e),
+        )
+        return response.to_json_string()
+
+    except Exception as e:
+        logger.exception("Error in get_league_advanced_metrics")
+        response = error_response(
+            error_code="CALCULATION_ERROR",
+            error_message=f"Failed to calculate league advanced metrics: {str(e)}",
+        )
+        return response.to_json_string()
+
+
 @mcp_server.tool()
 async def get_team_standings(
     season: Optional[str] = None, conference: Optional[Literal["East", "West"]] = None
@@ -3172,6 +3185,78 @@ async def get_shot_chart(
         return response.to_json_string()
 
 
+@mcp_server.tool()
+async def compare_shot_charts(
+    entity_names: List[str],
+    entity_type: Literal["player", "team"] = "player",
+    season: Optional[str] = None,
+    season_type: Literal["Regular Season", "Playoffs"] = "Regular Season",
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    granularity: Literal["raw", "hexbin", "both", "summary"] = "summary",
+) -> str:
+    """
+    Compare shot charts for several players or teams.
+
+    All charts are sliced from one league-wide shot table per season, so
+    adding players to the comparison does not add NBA API calls.
+
+    Args:
+        entity_names: Two or more player or team names
+        entity_type: "player" or "team" (default: "player")
+        season: Season in 'YYYY-YY' format. If None, uses current season.
+        season_type: "Regular Season" or "Playoffs" (default: "Regular Season")
+        date_from: Start date in 'YYYY-MM-DD' or 'MM/DD/YYYY' format (optional)
+        date_to: End date in 'YYYY-MM-DD' or 'MM/DD/YYYY' format (optional)
+        granularity: Output format per entity (default: "summary"):
+            - "raw", "hexbin", "both" or "summary" (see get_shot_chart)
+
+    Returns:
+        JSON string with ResponseEnvelope containing one chart per entity
+
+    Examples:
+        compare_shot_charts(["Stephen Curry", "Damian Lillard", "Trae Young"], season="2023-24")
+        compare_shot_charts(["Celtics", "Nuggets"], entity_type="team", granularity="hexbin")
+    """
+    start_time = time.time()
+
+    try:
+        store = get_shot_store()
+        builds_before = store.stats["builds"]
+        data = await fetch_shot_chart_comparison(
+            entity_names=entity_names,
+            entity_type=entity_type,
+            season=season,
+            season_type=season_type,
+            date_from=date_from,
+            date_to=date_to,
+            granularity=granularity,
+        )
+
+        execution_time_ms = (time.time() - start_time) * 1000
+        response = success_response(
+            data=data,
+            source="historical",
+            cache_status="miss" if store.stats["builds"] > builds_before else "hit",
+            execution_time_ms=execution_time_ms,
+        )
+        return response.to_json_string()
+
+    except (EntityNotFoundError, InvalidParameterError) as e:
+        response = error_response(
+            error_code=e.code, error_message=e.message, details=e.details
+        )
+        return response.to_json_string()
+
+    except Exception as e:
+        logger.exception("Error in compare_shot_charts")
+        response = error_response(
+            error_code="NBA_API_ERROR",
+            error_message=f"Failed to compare shot charts: {str(e)}",
+        )
+        return response.to_json_string()
+
+
 @mcp_server.tool()
 async def get_game_context(
     team1_name: str,
@@ -3347,6 +3432,8 @@ async def get_nba_schedule(
         - Schedule changes (flex scheduling, postponements) reflected automatically
         - Can be called daily to refresh schedule data
         - Idempotent: Safe to call repeatedly, always returns latest data
+        - Snapshot: the schedule is kept in memory/on disk and revalidated with
+          the CDN (ETag / If-Modified-Since) at most every 15 minutes
 
     Data Freshness:
         - Source: Official NBA CDN (https://cdn.nba.com)
@@ -3380,10 +3467,11 @@ async def get_nba_schedule(
         if format.lower() == "json":
             # Return as ResponseEnvelope
             data = df.to_dict(orient="records") if not df.empty else []
+            snapshot_status = get_schedule_store().last_status
             response = success_response(
                 data=data,
                 source="nba_cdn",
-                cache_status="miss",
+                cache_status={"downloaded": "miss", "stale": "stale"}.get(snapshot_status, "hit"),
                 execution_time_ms=execution_time_ms,
                 rows=len(df),
                 columns=len(df.columns) if not df.empty else 0,
@@ -3476,6 +3564,48 @@ async def answer_nba_question(question: str) -> str:
         return f"Sorry, I encountered an error processing your question: {str(e)}\n\nPlease try rephrasing your question or being more specific."
 
 
+@mcp_server.tool()
+async def answer_nba_questions(questions: List[str]) -> str:
+    """
+    Answer several natural language NBA questions at once.
+
+    Questions are planned together and every distinct NBA API call they need
+    runs once, so a dashboard of questions about the same season fetches its
+    standings, leaders and team stats once instead of once per question.
+
+    Args:
+        questions: Natural language questions about NBA data
+
+    Returns:
+        Markdown with one section per question and a summary of the
+        upstream calls saved by sharing fetches
+
+    Examples:
+        answer_nba_questions(["Who leads the NBA in assists?",
+                              "Eastern Conference standings",
+                              "Lakers vs Celtics"])
+        → Returns the three answers, then "Answered 3 questions with N NBA API calls (M saved)"
+    """
+    try:
+        logger.info(f"NLQ batch: {len(questions)} questions")
+        batch = await nlq_answer_questions_batch(questions)
+
+        sections = [
+            f"## {i}. {question}\n\n{answer}"
+            for i, (question, answer) in enumerate(zip(questions, batch.answers), start=1)
+        ]
+        sections.append(
+            f"---\n*Answered {len(questions)} questions with {batch.calls_executed} NBA API calls "
+            f"({batch.calls_saved} saved by sharing fetches, {batch.cache_hits} answers from cache) "
+            f"in {batch.total_time_ms:.0f}ms*"
+        )
+        return "\n\n".join(sections)
+
+    except Exception as e:
+        logger.exception("Error in answer_nba_questions")
+        return f"Sorry, I encountered an error processing your questions: {str(e)}"
+
+
 @mcp_server.tool()
 async def get_metrics_info() -> str:
     """
@@ -3992,21 +4122,25 @@ async def build_dataset(spec: Dict[str, Any]) -> str:
     """
     Build a complete dataset from multiple sources with joins, filters, and column selection.
 
-    Executes a multi-step dataset pipeline in a single call:
-    1. Fetch from multiple endpoints
-    2. Join datasets
-    3. Apply filters
-    4. Select columns
+    The spec is compiled into an optimized plan and executed in one call:
+    1. Fetch all endpoints concurrently
+    2. Push filters down to the sources they reference (when safe)
+    3. Project each source to the columns the query needs
+    4. Run the join/filter/select chain as a single DuckDB query
+
+    Only the final dataset is stored; the plan, its cost estimates and the
+    generated SQL are returned for inspection.
 
     Args:
         spec: Dataset specification with:
             - sources: List of {endpoint, params} dicts
-            - joins: List of {on, how} dicts (optional)
+            - joins: List of {on, how} dicts (optional); join i joins the
+              result so far with source i+1
             - filters: List of {column, op, value} dicts (optional)
             - select: List of column names to keep (optional)
 
     Returns:
-        Dataset handle with final processed data
+        Dataset handle with final processed data and the execution plan
 
     Example:
         build_dataset({
@@ -4026,130 +4160,42 @@ async def build_dataset(spec: Dict[str, Any]) -> str:
     try:
         import time
 
-        start_time = time.time()
-
-        # Validate spec
-        if "sources" not in spec or not spec["sources"]:
-            return "Error: 'sources' required in spec"
-
-        manager = get_dataset_manager()
-        handles = []
-        provenance_list = []
-
-        # Step 1: Fetch all sources
-        lines = ["# Building Dataset", "", "## Step 1: Fetching Sources", ""]
-
-        for i, source in enumerate(spec["sources"], 1):
-            endpoint = source.get("endpoint")
-            params = source.get("params", {})
-
-            if not endpoint:
-                return f"Error: Source {i} missing 'endpoint'"
+        from nba_mcp.data.dataset_manager import ProvenanceInfo
+        from nba_mcp.data.query_optimizer import DatasetSpecError, get_query_optimizer
 
-            lines.append(f"{i}. Fetching from `{endpoint}`...")
+        start_time = time.time()
 
+        async def fetch_source(endpoint: str, params: Dict[str, Any]):
             validate_parameters(endpoint, params)
-            table, provenance = await fetch_endpoint(endpoint, params, as_arrow=True)
-
-            handle = await manager.store(table, provenance=provenance)
-            handles.append(handle.uuid)
-            provenance_list.append(provenance)
-
-            lines.append(
-                f"   ✓ {handle.row_count:,} rows, {handle.column_count} columns"
-            )
-
-        lines.append("")
-
-        # Step 2: Perform joins if specified
-        if spec.get("joins"):
-            lines.append("## Step 2: Joining Datasets")
-            lines.append("")
-
-            current_handle = handles[0]
-            for i, join_spec in enumerate(spec["joins"], 1):
-                on = join_spec.get("on")
-                how = join_spec.get("how", "left")
-
-                if not on:
-                    return f"Error: Join {i} missing 'on'"
-
-                # Join current result with next table
-                next_handle = handles[min(i, len(handles) - 1)]
-
-                table1 = await manager.retrieve(current_handle)
-                table2 = await manager.retrieve(next_handle)
-
-                result_dict = join_with_stats([table1, table2], on, how)
-                result_table = result_dict["result"]
-                stats = result_dict["stats"]
-
-                # Store result
-                from nba_mcp.data.dataset_manager import ProvenanceInfo
-
-                prov = ProvenanceInfo(
-                    source_endpoints=[h for h in handles],
-                    operations=["join"],
-                    parameters=join_spec,
-                )
-                current_handle_obj = await manager.store(result_table, provenance=prov)
-                current_handle = current_handle_obj.uuid
-
-                lines.append(
-                    f"{i}. {how.upper()} join on {on}: {stats['output_row_count']:,} rows"
-                )
-
-            lines.append("")
-        else:
-            current_handle = handles[0]
-
-        # Step 3: Apply filters if specified
-        if spec.get("filters"):
-            lines.append("## Step 3: Applying Filters")
-            lines.append("")
+            return await fetch_endpoint(endpoint, params, as_arrow=True)
 
-            table = await manager.retrieve(current_handle)
-            filtered_table = filter_table(table, spec["filters"])
-
-            from nba_mcp.data.dataset_manager import ProvenanceInfo
-
-            prov = ProvenanceInfo(
-                source_endpoints=[h for h in handles],
-                operations=["filter"],
-                parameters={"filters": spec["filters"]},
-            )
-            filtered_handle = await manager.store(filtered_table, provenance=prov)
-            current_handle = filtered_handle.uuid
-
-            lines.append(
-                f"Applied {len(spec['filters'])} filter(s): {filtered_table.num_rows:,} rows remain"
-            )
-            lines.append("")
-
-        # Step 4: Select columns if specified
-        if spec.get("select"):
-            lines.append("## Step 4: Selecting Columns")
-            lines.append("")
-
-            table = await manager.retrieve(current_handle)
-            selected_table = table.select(spec["select"])
-
-            from nba_mcp.data.dataset_manager import ProvenanceInfo
+        try:
+            result = await get_query_optimizer().execute_dataset(spec, fetch_source)
+        except DatasetSpecError as e:
+            return f"Error: {e}"
 
-            prov = ProvenanceInfo(
-                source_endpoints=[h for h in handles],
-                operations=["select"],
-                parameters={"select": spec["select"]},
-            )
-            selected_handle = await manager.store(selected_table, provenance=prov)
-            current_handle = selected_handle.uuid
+        plan = result.plan
+        execution_time_ms = (time.time() - start_time) * 1000
 
-            lines.append(f"Selected {len(spec['select'])} column(s)")
-            lines.append("")
+        provenance = ProvenanceInfo(
+            source_endpoints=[source["endpoint"] for source in spec["sources"]],
+            operations=[op.op_id for op in plan.operations if op.op_type.value != "fetch"],
+            nba_api_calls=sum(getattr(p, "nba_api_calls", 0) for p in result.provenance),
+            execution_time_ms=execution_time_ms,
+            parameters={"spec": spec, "plan": plan.to_dict()},
+        )
+        manager = get_dataset_manager()
+        final_handle = await manager.store(result.table, provenance=provenance)
 
-        # Final result
-        final_handle = await manager.get_handle(current_handle)
-        execution_time_ms = (time.time() - start_time) * 1000
+        lines = ["# Building Dataset", "", "## Sources", ""]
+        fetch_ops = [op for op in plan.operations if op.op_type.value == "fetch"]
+        for i, op in enumerate(fetch_ops, 1):
+            lines.append(f"{i}. `{op.params['endpoint']}`: {op.actual_rows:,} rows")
+        lines.append("")
+        lines.append("## Execution Plan")
+        lines.append("")
+        lines.extend(plan.describe())
+        lines.append("")
 
         lines.append("## ✓ Dataset Built Successfully")
         lines.append("")
@@ -4674,6 +4720,7 @@ async def fetch_chunked(
     params: Dict[str, Any],
     chunk_strategy: Optional[str] = None,
     progress: bool = False,
+    prefetch_depth: int = 2,
 ) -> str:
     """
     Fetch a large NBA dataset in chunks to handle any dataset size.
@@ -4689,11 +4736,16 @@ async def fetch_chunked(
     - **none**: Fetch all at once (no chunking)
     - **None** (default): Auto-select based on endpoint capabilities
 
+    Upcoming chunks are fetched concurrently while the current one is stored
+    (up to `prefetch_depth` ahead), so a multi-season pull no longer costs the
+    sum of every API round-trip. Chunks are still returned in order.
+
     Args:
         endpoint: Endpoint name to fetch from
         params: Base parameters for the endpoint
         chunk_strategy: Chunking strategy to use (or None for auto)
         progress: If True, show progress information for each chunk
+        prefetch_depth: Chunks to fetch ahead of the current one (0 = sequential, default: 2)
 
     Returns:
         List of dataset handles, one per chunk, with chunk information
@@ -4721,10 +4773,15 @@ async def fetch_chunked(
 
         chunks = []
         total_rows = 0
+        fetch_start = time.perf_counter()
 
         # Fetch chunks
         async for table, chunk_info in paginator.fetch_chunked(
-            endpoint, params, chunk_strategy, check_size_limit=False  # Already checked
+            endpoint,
+            params,
+            chunk_strategy,
+            check_size_limit=False,  # Already checked
+            prefetch_depth=prefetch_depth,
         ):
             # Store chunk
             from nba_mcp.data.dataset_manager import ProvenanceInfo
@@ -4744,6 +4801,8 @@ async def fetch_chunked(
                 "total_chunks": chunk_info.total_chunks,
                 "rows": chunk_info.row_count,
                 "params": chunk_info.params,
+                "fetch_seconds": chunk_info.fetch_seconds,
+                "wait_seconds": chunk_info.wait_seconds,
             }
 
             if chunk_info.date_range:
@@ -4759,6 +4818,9 @@ async def fetch_chunked(
             chunks.append(chunk_meta)
             total_rows += chunk_info.row_count
 
+        elapsed = time.perf_counter() - fetch_start
+        fetch_total = sum(c["fetch_seconds"] or 0.0 for c in chunks)
+
         # Format response
         lines = [
             f"# Chunked Fetch Complete: {endpoint}",
@@ -4766,6 +4828,8 @@ async def fetch_chunked(
             f"**Total Chunks**: {len(chunks)}",
             f"**Total Rows**: {total_rows:,}",
             f"**Strategy**: {chunk_strategy or 'auto'}",
+            f"**Prefetch Depth**: {max(0, prefetch_depth)}",
+            f"**Elapsed**: {elapsed:.2f}s (sum of chunk fetches: {fetch_total:.2f}s)",
             "",
         ]
 
@@ -4799,6 +4863,11 @@ async def fetch_chunked(
                 lines.append(f"- **Season**: {chunk['season']}")
             if "game_id" in chunk:
                 lines.append(f"- **Game ID**: {chunk['game_id']}")
+            if chunk["fetch_seconds"] is not None:
+                lines.append(
+                    f"- **Timing**: fetch {chunk['fetch_seconds']:.2f}s, "
+                    f"waited {chunk['wait_seconds']:.2f}s"
+                )
 
             lines.append("")
 
@@ -6443,6 +6512,9 @@ def main():
     loop.run_until_complete(initialize_manager())
     logger.info("✓ Dataset manager initialized")
 
+    # Build entity resolution index (players/teams hash maps + trigrams)
+    build_entity_index()
+
     # Initialize NLQ tool registry with real MCP tools
     logger.info("Initializing NLQ tool registry...")
     tool_map = {
@@ -6485,6 +6557,32 @@ def main():
         logger.warning(f"Redis cache initialization failed: {e}")
         logger.warning("Continuing without cache (performance may be reduced)")
 
+    # Enable Parquet tier for unified_fetch (persistent across restarts)
+    parquet_dir = Path(os.getenv("NBA_MCP_PARQUET_CACHE_DIR", "mcp_data/parquet_cache"))
+    try:
+        get_cache_manager().enable_parquet_cache(cache_dir=parquet_dir)
+        get_cache_manager().parquet_backend.start_metadata_flusher()
+    except Exception as e:
+        logger.warning(f"Parquet cache initialization failed: {e}")
+
+    # Enable memory-mapped Arrow IPC tier (zero-copy reads shared by worker processes)
+    arrow_dir = os.getenv("NBA_MCP_ARROW_CACHE_DIR")
+    try:
+        get_cache_manager().enable_arrow_ipc_cache(
+            cache_dir=Path(arrow_dir) if arrow_dir else None,
+            max_size_mb=int(os.getenv("NBA_MCP_ARROW_CACHE_MB", "2048")),
+        )
+    except Exception as e:
+        logger.warning(f"Arrow IPC cache initialization failed: {e}")
+
+    # Keep the all-time leaders snapshot rebuilt in the background
+    try:
+        refresh_hours = float(os.getenv("NBA_MCP_ALL_TIME_LEADERS_REFRESH_HOURS", "6"))
+        get_all_time_leaders_store().start_scheduled_refresh(interval=refresh_hours * 3600)
+        logger.info(f"✓ All-time leaders refresh scheduled ({refresh_hours:g}h interval)")
+    except Exception as e:
+        logger.warning(f"All-time leaders refresh scheduling failed: {e}")
+
     # Initialize rate limiter with per-tool limits
     try:
         initialize_rate_limiter()
@@ -6638,6 +6736,9 @@ def main():
     except Exception:
         logger.exception("Failed to start MCP server (transport=%s)", transport)
         sys.exit(1)
+    finally:
+        # Persist batched Parquet cache access counters before exiting
+        get_cache_manager().close()
 
 
 def format_team_advanced_stats(data: Dict[str, Any]) -> str:
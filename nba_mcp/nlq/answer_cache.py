@@ -0,0 +1,262 @@
+# nba_mcp/nlq/answer_cache.py
+"""
+Plan and answer cache for the NLQ pipeline.
+
+Questions that parse to the same query (intent, entity IDs, stat types,
+resolved season/date range, modifiers) share a plan and, while the data
+behind it is fresh, an answer - however they were worded:
+
+- canonical_query_key(): stable key for a ParsedQuery
+- Plans are cached for CacheTier.DAILY (a plan only depends on the parse)
+- Answers are cached for the shortest tier among the plan's tools
+  (live games 30s, current-season stats 1h, past seasons 24h)
+- Only fully successful executions are cached
+
+Example:
+    cache = get_nlq_cache()
+    key = canonical_query_key(parsed)
+    entry = cache.get_answer(key)
+    if entry is None:
+        ...
+        cache.set_answer(key, response, plan, stage_seconds)
+"""
+
+import hashlib
+import json
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from ..api.season_context import get_current_season
+from ..cache.redis_cache import CacheTier, LRUCache
+from .parser import ParsedQuery
+from .planner import ExecutionPlan, ToolCall
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # 64 MB per cache level
+
+# Freshness of the data each NLQ tool returns (tools not listed: DAILY, or
+# HISTORICAL when every season they ask for is over)
+TOOL_CACHE_TIERS: Dict[str, CacheTier] = {
+    # In-progress games change every possession
+    "get_live_scores": CacheTier.LIVE,
+    "play_by_play": CacheTier.LIVE,
+    "get_box_score": CacheTier.LIVE,
+    "get_game_context": CacheTier.LIVE,
+    # Leaderboards, standings and schedules move as games finish
+    "get_league_leaders_info": CacheTier.DAILY,
+    "get_team_standings": CacheTier.DAILY,
+    "get_nba_schedule": CacheTier.DAILY,
+    # Award history only changes once a season
+    "get_nba_awards": CacheTier.HISTORICAL,
+}
+
+_SEASON_RE = re.compile(r"\d{4}-\d{2}")
+
+
+# ============================================================================
+# CACHE KEYS AND TTLS
+# ============================================================================
+
+
+def canonical_query(parsed: ParsedQuery) -> Dict[str, Any]:
+    """
+    Normalized form of a parse: what determines the plan and the answer.
+
+    The raw wording, confidence and validation feedback are left out; entity
+    and stat order are kept (they set column order and the ranking stat).
+
+    Args:
+        parsed: Parsed query
+
+    Returns:
+        JSON-serializable dict
+    """
+    return {
+        "intent": parsed.intent,
+        "entities": [
+            [entity.get("entity_type"), entity.get("entity_id", entity.get("name"))]
+            for entity in parsed.entities
+        ],
+        "stat_types": list(parsed.stat_types),
+        "time_range": parsed.time_range.to_dict() if parsed.time_range else None,
+        "modifiers": parsed.modifiers,
+    }
+
+
+def canonical_query_key(parsed: ParsedQuery) -> str:
+    """
+    Cache key for a parse.
+
+    Args:
+        parsed: Parsed query
+
+    Returns:
+        Key like "nlq:3f2a9c..."
+    """
+    payload = json.dumps(canonical_query(parsed), sort_keys=True, default=str)
+    return f"nlq:{hashlib.sha256(payload.encode()).hexdigest()[:24]}"
+
+
+def _call_seasons(params: Dict[str, Any]) -> List[str]:
+    """Season strings requested by a tool call (season, season1, seasons, ...)."""
+    seasons = []
+    for name, value in params.items():
+        if not name.startswith("season") or name.startswith("season_type"):
+            continue
+        values = value if isinstance(value, (list, tuple)) else [value]
+        for item in values:
+            seasons.extend(_SEASON_RE.findall(str(item)))
+    return seasons
+
+
+def tier_for_call(call: ToolCall, current_season: Optional[str] = None) -> CacheTier:
+    """
+    Freshness tier of the data a tool call returns.
+
+    Args:
+        call: Planned tool call
+        current_season: Current season (defaults to get_current_season())
+
+    Returns:
+        CacheTier (LIVE tools stay LIVE; past-season calls are HISTORICAL)
+    """
+    tier = TOOL_CACHE_TIERS.get(call.tool_name, CacheTier.DAILY)
+    if tier is CacheTier.LIVE:
+        return tier
+
+    seasons = _call_seasons(call.params)
+    current_season = current_season or get_current_season()
+    if seasons and all(season < current_season for season in seasons):
+        return CacheTier.HISTORICAL
+    return tier
+
+
+def answer_ttl(plan: ExecutionPlan) -> int:
+    """
+    Seconds an answer stays fresh: the shortest tier among the plan's calls.
+
+    Args:
+        plan: Execution plan that produced the answer
+
+    Returns:
+        TTL in seconds
+    """
+    if not plan.tool_calls:
+        return CacheTier.DAILY.value
+    current_season = get_current_season()
+    return min(tier_for_call(call, current_season).value for call in plan.tool_calls)
+
+
+# ============================================================================
+# CACHE
+# ============================================================================
+
+
+@dataclass
+class CacheEntry:
+    """A cached plan or answer and what it cost to produce."""
+
+    value: Any
+    stage_seconds: Dict[str, float]  # stage -> duration of the run that produced it
+    ttl: int
+    cached_at: float = field(default_factory=time.time)
+
+    @property
+    def age_seconds(self) -> float:
+        return time.time() - self.cached_at
+
+
+class NLQCache:
+    """
+    Two-level (plan, answer) cache keyed by canonical_query_key.
+
+    An answer hit skips planning, execution and synthesis; a plan hit (the
+    answer expired, e.g. a 30s live answer) still skips planning.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Maximum entries per level
+            max_bytes: Byte budget per level
+        """
+        self.plans = LRUCache(max_size=max_entries, max_bytes=max_bytes)
+        self.answers = LRUCache(max_size=max_entries, max_bytes=max_bytes)
+
+    def get_plan(self, key: str) -> Optional[CacheEntry]:
+        """Cached plan entry (value: ExecutionPlan) or None."""
+        return self.plans.get(key)
+
+    def set_plan(self, key: str, plan: ExecutionPlan, plan_seconds: float):
+        """Cache a plan for CacheTier.DAILY."""
+        ttl = CacheTier.DAILY.value
+        self.plans.set(key, CacheEntry(plan, {"plan": plan_seconds}, ttl), ttl)
+
+    def get_answer(self, key: str) -> Optional[CacheEntry]:
+        """Cached answer entry (value: SynthesizedResponse) or None."""
+        return self.answers.get(key)
+
+    def set_answer(
+        self,
+        key: str,
+        response: Any,
+        plan: ExecutionPlan,
+        stage_seconds: Dict[str, float],
+    ) -> int:
+        """
+        Cache an answer for the freshness of the plan's data.
+
+        Args:
+            key: canonical_query_key of the parse
+            response: SynthesizedResponse
+            plan: Plan that produced it (sets the TTL)
+            stage_seconds: plan/execute/synthesize durations of this run
+
+        Returns:
+            TTL in seconds
+        """
+        ttl = answer_ttl(plan)
+        self.answers.set(key, CacheEntry(response, dict(stage_seconds), ttl), ttl)
+        logger.debug(f"Cached NLQ answer {key} for {ttl}s")
+        return ttl
+
+    def clear(self):
+        """Drop all cached plans and answers."""
+        self.plans.clear()
+        self.answers.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss statistics per level."""
+        return {"plans": self.plans.get_stats(), "answers": self.answers.get_stats()}
+
+
+# ============================================================================
+# GLOBAL CACHE
+# ============================================================================
+
+_nlq_cache: Optional[NLQCache] = None
+
+
+def get_nlq_cache() -> NLQCache:
+    """Get or create the global NLQ cache."""
+    global _nlq_cache
+    if _nlq_cache is None:
+        _nlq_cache = NLQCache()
+    return _nlq_cache
+
+
+def reset_nlq_cache():
+    """Reset the global NLQ cache (for testing)."""
+    global _nlq_cache
+    _nlq_cache = None
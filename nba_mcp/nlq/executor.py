@@ -4,20 +4,44 @@ Tool Executor for NBA MCP NLQ.
 
 Executes tool calls with intelligent parallelization, error handling,
 and result aggregation.
+
+Plans run as a DAG over ToolCall.depends_on: each call starts as soon as
+the calls it depends on have finished (not when its whole parallel_group
+has), identical calls run once, every call has a deadline, and at most
+MAX_CONCURRENT_TOOLS run at a time across all plans in the process (a
+max_concurrency argument can lower the cap further for one plan).
+iter_plan_results() streams results in completion order; execute_plan()
+collects them in plan order.
 """
 
 import asyncio
+import inspect
+import json
 import logging
 import time
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set, Tuple
 
-from ..api.errors import NBAMCPError
+from ..api.errors import ErrorCode, NBAMCPError
 from ..api.models import ResponseEnvelope, error_response, success_response
 from .planner import ExecutionPlan, ToolCall
 
 logger = logging.getLogger(__name__)
 
+MAX_CONCURRENT_TOOLS = 8  # process-wide, shared by every running plan
+DEFAULT_TOOL_TIMEOUT = 30.0  # seconds
+
+# Deadlines for tools that are much faster or slower than the default
+TOOL_TIMEOUTS: Dict[str, float] = {
+    "get_live_scores": 10.0,
+    "get_box_score": 15.0,
+    "get_game_context": 20.0,
+    "play_by_play": 20.0,
+    "get_shot_chart": 60.0,
+    "get_player_game_stats": 45.0,
+    "get_player_performance_splits": 45.0,
+}
+
 
 # ============================================================================
 # EXECUTION RESULT
@@ -69,6 +93,7 @@ class ExecutionResult:
     tool_results: Dict[str, ToolResult] = field(default_factory=dict)
     total_time_ms: float = 0.0
     all_success: bool = True
+    deduplicated_calls: int = 0  # Identical tool calls served by another call's result
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -76,6 +101,7 @@ class ExecutionResult:
             "tool_results": {k: v.to_dict() for k, v in self.tool_results.items()},
             "total_time_ms": self.total_time_ms,
             "all_success": self.all_success,
+            "deduplicated_calls": self.deduplicated_calls,
         }
 
 
@@ -90,12 +116,38 @@ from .tool_registry import get_tool, list_tools
 # ============================================================================
 
 
-async def execute_tool(tool_call: ToolCall) -> ToolResult:
+def tool_timeout(tool_name: str) -> float:
+    """Deadline in seconds for one call of a tool."""
+    return TOOL_TIMEOUTS.get(tool_name, DEFAULT_TOOL_TIMEOUT)
+
+
+def tool_call_signature(tool_call: ToolCall) -> Tuple[str, str]:
+    """
+    Identity of a tool call: tool name plus normalized params.
+
+    Two calls with the same signature return the same data, so a plan only
+    needs to run one of them.
+
+    Args:
+        tool_call: Tool call specification
+
+    Returns:
+        (tool_name, params serialized with sorted keys)
+    """
+    return tool_call.tool_name, json.dumps(
+        tool_call.params, sort_keys=True, default=str
+    )
+
+
+async def execute_tool(
+    tool_call: ToolCall, timeout: Optional[float] = None
+) -> ToolResult:
     """
     Execute a single tool call.
 
     Args:
         tool_call: Tool call specification
+        timeout: Deadline in seconds (None = no deadline)
 
     Returns:
         ToolResult with data or error
@@ -120,7 +172,7 @@ async def execute_tool(tool_call: ToolCall) -> ToolResult:
             )
 
         # Execute tool
-        result = await tool_func(**tool_call.params)
+        result = await asyncio.wait_for(tool_func(**tool_call.params), timeout)
 
         execution_time_ms = (time.time() - start_time) * 1000
 
@@ -151,6 +203,21 @@ async def execute_tool(tool_call: ToolCall) -> ToolResult:
             retry_after=e.retry_after,
         )
 
+    except asyncio.TimeoutError:
+        execution_time_ms = (time.time() - start_time) * 1000
+        deadline = f"its {timeout:.0f}s deadline" if timeout else "an upstream deadline"
+        error_msg = f"{ErrorCode.UPSTREAM_TIMEOUT}: {tool_name} exceeded {deadline}"
+        logger.error(f"Tool {tool_name} failed: {error_msg}")
+
+        return ToolResult(
+            tool_name=tool_name,
+            success=False,
+            error=error_msg,
+            execution_time_ms=execution_time_ms,
+            error_code=ErrorCode.UPSTREAM_TIMEOUT,
+            error_details={"timeout_seconds": timeout},
+        )
+
     except Exception as e:
         # Unexpected error
         # Phase 6.8: Preserve exception type for debugging
@@ -190,7 +257,7 @@ async def execute_parallel_group(tool_calls: List[ToolCall]) -> List[ToolResult]
     logger.info(f"Executing {len(tool_calls)} tools in parallel")
 
     # Execute all tools concurrently
-    tasks = [execute_tool(tc) for tc in tool_calls]
+    tasks = [execute_tool(tc, timeout=tool_timeout(tc.tool_name)) for tc in tool_calls]
     results = await asyncio.gather(*tasks, return_exceptions=True)
 
     # Handle any exceptions that occurred
@@ -217,18 +284,255 @@ async def execute_parallel_group(tool_calls: List[ToolCall]) -> List[ToolResult]
 # ============================================================================
 
 
-async def execute_plan(plan: ExecutionPlan) -> ExecutionResult:
+def _result_keys(tool_calls: List[ToolCall]) -> List[str]:
+    """Result keys in plan order: tool_name, then tool_name_2, tool_name_3, ..."""
+    keys = []
+    counts: Dict[str, int] = {}
+    for tc in tool_calls:
+        counts[tc.tool_name] = counts.get(tc.tool_name, 0) + 1
+        count = counts[tc.tool_name]
+        keys.append(tc.tool_name if count == 1 else f"{tc.tool_name}_{count}")
+    return keys
+
+
+def _ordered_calls(plan: ExecutionPlan) -> List[ToolCall]:
+    """Plan calls ordered by parallel_group (stable), which fixes result keys."""
+    return sorted(plan.tool_calls, key=lambda tc: tc.parallel_group)
+
+
+# A DAG node: (signature, dependency node keys); see _plan_graph
+NodeKey = Tuple[Any, ...]
+
+
+def _plan_graph(
+    plan: ExecutionPlan, plan_index: int = 0
+) -> Tuple[
+    List[ToolCall], List[NodeKey], Dict[NodeKey, ToolCall], Dict[NodeKey, Set[NodeKey]]
+]:
+    """
+    Dependency graph of one plan's calls.
+
+    Identical calls collapse into one node and depends_on names resolve to
+    this plan's calls with that tool name. A node's key is its signature plus
+    the keys of its dependencies, so graphs of several plans merged by key
+    only share a node when the call and everything it waits on are the same.
+    Calls on (or behind) a cycle get keys unique to the plan.
+
+    Returns:
+        (calls in result-key order, node key per call, nodes, dependencies per node)
+    """
+    calls = _ordered_calls(plan)
+    signatures = [tool_call_signature(tc) for tc in calls]
+    signatures_by_name: Dict[str, Set[Tuple[str, str]]] = {}
+    for tc, signature in zip(calls, signatures):
+        signatures_by_name.setdefault(tc.tool_name, set()).add(signature)
+
+    first_calls: Dict[Tuple[str, str], ToolCall] = {}
+    dep_signatures: Dict[Tuple[str, str], Set[Tuple[str, str]]] = {}
+    for tc, signature in zip(calls, signatures):
+        first_calls.setdefault(signature, tc)
+        deps = dep_signatures.setdefault(signature, set())
+        for name in tc.depends_on or []:
+            deps.update(
+                dep for dep in signatures_by_name.get(name, ()) if dep != signature
+            )
+
+    # Key nodes in dependency order; whatever is left sits on or behind a cycle
+    keys: Dict[Tuple[str, str], NodeKey] = {}
+    ready = [sig for sig, deps in dep_signatures.items() if not deps]
+    while ready:
+        for signature in ready:
+            keys[signature] = (
+                signature,
+                frozenset(keys[d] for d in dep_signatures[signature]),
+            )
+        ready = [
+            sig
+            for sig, deps in dep_signatures.items()
+            if sig not in keys and all(d in keys for d in deps)
+        ]
+    for signature in dep_signatures:
+        keys.setdefault(signature, (signature, ("cycle", plan_index)))
+
+    nodes = {keys[sig]: tc for sig, tc in first_calls.items()}
+    deps = {keys[sig]: {keys[d] for d in dep_signatures[sig]} for sig in dep_signatures}
+    return calls, [keys[sig] for sig in signatures], nodes, deps
+
+
+# (event loop, limit, semaphore) for the process-wide tool cap
+_tool_slots: Optional[Tuple[asyncio.AbstractEventLoop, int, asyncio.Semaphore]] = None
+
+
+def _global_tool_slots() -> asyncio.Semaphore:
+    """Semaphore capping running tools across all plans (one per event loop)."""
+    global _tool_slots
+    loop = asyncio.get_running_loop()
+    if (
+        _tool_slots is None
+        or _tool_slots[0] is not loop
+        or _tool_slots[1] != MAX_CONCURRENT_TOOLS
+    ):
+        _tool_slots = (
+            loop,
+            MAX_CONCURRENT_TOOLS,
+            asyncio.Semaphore(MAX_CONCURRENT_TOOLS),
+        )
+    return _tool_slots[2]
+
+
+async def _iter_dag(
+    nodes: Dict[NodeKey, ToolCall],
+    deps: Dict[NodeKey, Set[NodeKey]],
+    max_concurrency: Optional[int] = None,
+) -> AsyncIterator[Tuple[NodeKey, ToolResult, bool]]:
+    """
+    Run a dependency graph of tool calls, yielding each node's result.
+
+    Every call holds a slot of the process-wide MAX_CONCURRENT_TOOLS cap
+    while it runs, so concurrent questions share one upstream budget;
+    max_concurrency additionally caps this graph alone.
+
+    Yields:
+        (node key, ToolResult, whether the call actually ran) in completion order
+    """
+    waiting = {node: set(node_deps) for node, node_deps in deps.items()}
+    plan_slots = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+    global_slots = _global_tool_slots()
+    results: Dict[NodeKey, ToolResult] = {}
+    running: Dict[asyncio.Task, NodeKey] = {}
+
+    async def run(tool_call: ToolCall) -> ToolResult:
+        if plan_slots is not None:
+            async with plan_slots, global_slots:
+                return await execute_tool(
+                    tool_call, timeout=tool_timeout(tool_call.tool_name)
+                )
+        async with global_slots:
+            return await execute_tool(
+                tool_call, timeout=tool_timeout(tool_call.tool_name)
+            )
+
+    def failed(tool_call: ToolCall, reason: str) -> ToolResult:
+        logger.warning(f"Skipping tool {tool_call.tool_name}: {reason}")
+        return ToolResult(
+            tool_name=tool_call.tool_name,
+            success=False,
+            error=f"Skipped: {reason}",
+            error_code=ErrorCode.INTERNAL_ERROR,
+            error_details={"reason": reason},
+        )
+
+    try:
+        while waiting or running:
+            # Start every ready node; fail nodes with a failed dependency
+            progressed = True
+            while progressed:
+                progressed = False
+                for node, node_deps in list(waiting.items()):
+                    failed_deps = {
+                        nodes[d].tool_name
+                        for d in node_deps
+                        if d in results and not results[d].success
+                    }
+                    if failed_deps:
+                        del waiting[node]
+                        results[node] = failed(
+                            nodes[node],
+                            f"dependency {', '.join(sorted(failed_deps))} failed",
+                        )
+                        yield node, results[node], False
+                        progressed = True
+                    elif all(d in results for d in node_deps):
+                        del waiting[node]
+                        running[asyncio.create_task(run(nodes[node]))] = node
+
+            if not running:
+                # Whatever is still waiting depends on itself through a cycle
+                for node in list(waiting):
+                    results[node] = failed(nodes[node], "circular dependency")
+                    yield node, results[node], False
+                waiting.clear()
+                break
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                node = running.pop(task)
+                try:
+                    results[node] = task.result()
+                except Exception as e:
+                    logger.error(f"Tool {nodes[node].tool_name} raised exception: {e}")
+                    results[node] = ToolResult(
+                        tool_name=nodes[node].tool_name,
+                        success=False,
+                        error=f"Execution exception: {str(e)}",
+                    )
+                yield node, results[node], True
+    finally:
+        for task in running:
+            task.cancel()
+        # Wait for the cancellations to unwind so no call outlives the stream
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+
+
+async def iter_plan_results(
+    plan: ExecutionPlan, max_concurrency: Optional[int] = None
+) -> AsyncIterator[Tuple[str, ToolResult]]:
+    """
+    Execute a plan as a dependency DAG, yielding results as they complete.
+
+    Strategy:
+    1. Collapse identical calls (same tool_name and params) into one node
+    2. Edges come from depends_on (tool names); unknown names are ignored
+    3. Start each node as soon as its dependencies succeeded, with at most
+       MAX_CONCURRENT_TOOLS tools running process-wide (max_concurrency for
+       this plan) and a per-tool deadline (tool_timeout)
+    4. Nodes whose dependency failed, or that sit on a cycle, fail without running
+
+    Closing the iterator early cancels the calls still running.
+
+    Args:
+        plan: Execution plan
+        max_concurrency: Extra cap on running tools for this call (the
+            process-wide MAX_CONCURRENT_TOOLS always applies)
+
+    Yields:
+        (result key, ToolResult) in completion order; a de-duplicated call
+        yields one pair per key it serves
+    """
+    calls, call_nodes, nodes, deps = _plan_graph(plan)
+    keys_by_node: Dict[NodeKey, List[str]] = {}
+    for key, node in zip(_result_keys(calls), call_nodes):
+        keys_by_node.setdefault(node, []).append(key)
+
+    dag = _iter_dag(nodes, deps, max_concurrency)
+    try:
+        async for node, tool_result, _ in dag:
+            for key in keys_by_node[node]:
+                yield key, tool_result
+    finally:
+        await dag.aclose()
+
+
+async def execute_plan(
+    plan: ExecutionPlan,
+    max_concurrency: Optional[int] = None,
+    on_result: Optional[Callable[[str, ToolResult], Any]] = None,
+) -> ExecutionResult:
     """
     Execute an execution plan with optimal parallelization.
 
     Strategy:
-    1. Group tool calls by parallel_group
-    2. Execute groups in order (group 0, then group 1, etc.)
-    3. Within each group, execute tools in parallel
-    4. Aggregate results
+    1. Run the plan as a dependency DAG (see iter_plan_results)
+    2. Report each result to on_result as soon as it arrives
+    3. Aggregate results in plan order (parallel_group, then position)
 
     Args:
         plan: Execution plan
+        max_concurrency: Extra cap on running tools for this call (the
+            process-wide MAX_CONCURRENT_TOOLS always applies)
+        on_result: Optional callback (sync or async) called with (key, ToolResult)
+            in completion order
 
     Returns:
         ExecutionResult with all tool results
@@ -238,54 +542,134 @@ async def execute_plan(plan: ExecutionPlan) -> ExecutionResult:
         f"Executing plan with {len(plan.tool_calls)} tool calls (parallelizable: {plan.can_parallelize})"
     )
 
-    # Group tool calls by parallel_group
-    groups: Dict[int, List[ToolCall]] = {}
-    for tc in plan.tool_calls:
-        group_id = tc.parallel_group
-        if group_id not in groups:
-            groups[group_id] = []
-        groups[group_id].append(tc)
-
-    # Execute groups in order
-    all_results = {}
-    tool_call_index = 0
-    for group_id in sorted(groups.keys()):
-        group_tools = groups[group_id]
-        logger.info(
-            f"Executing parallel group {group_id} with {len(group_tools)} tools"
-        )
+    completed: Dict[str, ToolResult] = {}
+    async for key, tool_result in iter_plan_results(plan, max_concurrency):
+        completed[key] = tool_result
+        if on_result is not None:
+            callback_result = on_result(key, tool_result)
+            if inspect.isawaitable(callback_result):
+                await callback_result
 
-        # Execute group in parallel
-        group_results = await execute_parallel_group(group_tools)
+    result = build_execution_result(plan, completed, start_time)
+    logger.info(
+        f"Plan execution complete: {len(result.tool_results)} results, all_success={result.all_success}, time={result.total_time_ms:.1f}ms"
+    )
+    return result
 
-        # Store results with unique keys (tool_name + index for duplicates)
-        for result in group_results:
-            # Create unique key for duplicate tool names
-            key = result.tool_name
-            if key in all_results:
-                # Add suffix for duplicate
-                suffix = 2
-                while f"{key}_{suffix}" in all_results:
-                    suffix += 1
-                key = f"{key}_{suffix}"
-            all_results[key] = result
-            tool_call_index += 1
 
-    # Calculate total time
-    total_time_ms = (time.time() - start_time) * 1000
+def build_execution_result(
+    plan: ExecutionPlan, completed: Dict[str, ToolResult], start_time: float
+) -> ExecutionResult:
+    """
+    Assemble an ExecutionResult from results gathered so far.
 
-    # Check if all succeeded
-    all_success = all(r.success for r in all_results.values())
+    Results are stored in plan order, whatever order they finished in; keys
+    still pending are left out, so this also builds partial results.
 
-    logger.info(
-        f"Plan execution complete: {len(all_results)} results, all_success={all_success}, time={total_time_ms:.1f}ms"
+    Args:
+        plan: Execution plan
+        completed: Result key -> ToolResult (e.g. from iter_plan_results)
+        start_time: time.time() when execution started
+
+    Returns:
+        ExecutionResult
+    """
+    all_results = {
+        key: completed[key]
+        for key in _result_keys(_ordered_calls(plan))
+        if key in completed
+    }
+    deduplicated_calls = len(plan.tool_calls) - len(
+        {tool_call_signature(tc) for tc in plan.tool_calls}
     )
 
     return ExecutionResult(
         plan=plan,
         tool_results=all_results,
-        total_time_ms=total_time_ms,
-        all_success=all_success,
+        total_time_ms=(time.time() - start_time) * 1000,
+        all_success=all(r.success for r in all_results.values()),
+        deduplicated_calls=deduplicated_calls,
+    )
+
+
+@dataclass
+class BatchExecutionResult:
+    """Results of several plans executed as one de-duplicated plan."""
+
+    results: List[ExecutionResult]  # One per plan, same order
+    calls_planned: int  # Tool calls across all plans
+    calls_executed: int  # Distinct tool calls actually run
+    total_time_ms: float = 0.0
+
+    @property
+    def calls_saved(self) -> int:
+        return self.calls_planned - self.calls_executed
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "results": [r.to_dict() for r in self.results],
+            "calls_planned": self.calls_planned,
+            "calls_executed": self.calls_executed,
+            "calls_saved": self.calls_saved,
+            "total_time_ms": self.total_time_ms,
+        }
+
+
+async def execute_plans(
+    plans: List[ExecutionPlan], max_concurrency: Optional[int] = None
+) -> BatchExecutionResult:
+    """
+    Execute several plans jointly, running each distinct tool call once.
+
+    The plans' dependency graphs are merged into one DAG: a call runs once
+    for every plan that makes it with the same dependencies (depends_on
+    names resolve within each plan, so one plan's failures never skip
+    another plan's calls). Each plan then gets its own ExecutionResult with
+    the usual result keys.
+
+    Args:
+        plans: Execution plans (e.g. one per question in a batch)
+        max_concurrency: Extra cap on running tools for this call (the
+            process-wide MAX_CONCURRENT_TOOLS always applies)
+
+    Returns:
+        BatchExecutionResult with per-plan results and call counts
+    """
+    start_time = time.time()
+
+    nodes: Dict[NodeKey, ToolCall] = {}
+    deps: Dict[NodeKey, Set[NodeKey]] = {}
+    plan_calls = []
+    for index, plan in enumerate(plans):
+        calls, call_nodes, plan_nodes, plan_deps = _plan_graph(plan, index)
+        plan_calls.append((calls, call_nodes))
+        for node, tc in plan_nodes.items():
+            nodes.setdefault(node, tc)
+            deps.setdefault(node, plan_deps[node])
+
+    calls_planned = sum(len(plan.tool_calls) for plan in plans)
+    logger.info(
+        f"Executing {len(plans)} plans as one: {calls_planned} tool calls, {len(nodes)} distinct"
+    )
+
+    by_node: Dict[NodeKey, ToolResult] = {}
+    calls_executed = 0
+    async for node, tool_result, executed in _iter_dag(nodes, deps, max_concurrency):
+        by_node[node] = tool_result
+        calls_executed += executed
+
+    results = []
+    for plan, (calls, call_nodes) in zip(plans, plan_calls):
+        completed = {
+            key: by_node[node] for key, node in zip(_result_keys(calls), call_nodes)
+        }
+        results.append(build_execution_result(plan, completed, start_time))
+
+    return BatchExecutionResult(
+        results=results,
+        calls_planned=calls_planned,
+        calls_executed=calls_executed,
+        total_time_ms=(time.time() - start_time) * 1000,
     )
 
 
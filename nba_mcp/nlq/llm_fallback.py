@@ -540,7 +540,7 @@ async def generate_plan(parsed: ParsedQuery) -> List[ToolCall]:
                 ToolCall(
                     tool_name=tool["tool_name"],
                     params=normalize_parameters(tool.get("params", {})),  # Apply parameter normalization
-                    parallel_group=idx,  # Sequential execution
+                    parallel_group=idx,  # Keeps the LLM's tool order in the results
                 )
                 for idx, tool in enumerate(tools)
             ]
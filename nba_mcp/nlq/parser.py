@@ -9,13 +9,17 @@ Extracts structured components from natural language:
 - Query intent (comparison, leaders, game context, etc.)
 
 Uses pattern matching + optional LLM fallback for ambiguous queries.
+Every pattern is compiled at import time; a query is lowercased, tokenized
+and scanned for known phrases once (analyze_query) and the resulting
+QueryAnalysis is shared by all extractors.
 """
 
 import logging
 import re
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
-from typing import Any, Dict, List, Literal, Optional
+from functools import cached_property
+from typing import Any, Dict, FrozenSet, Iterable, List, Literal, NamedTuple, Optional, Tuple, Union
 
 from ..api.entity_resolver import resolve_entity, suggest_players, suggest_teams
 from ..api.errors import EntityNotFoundError
@@ -239,21 +243,25 @@ STAT_PATTERNS = {
 }
 
 
-def extract_stat_types(query: str) -> List[str]:
+def extract_stat_types(query: Union[str, "QueryAnalysis"]) -> List[str]:
     """
     Extract stat categories from query using pattern matching.
 
+    A STAT_PATTERNS key matches wherever it occurs as a substring; all keys
+    are found in the single phrase scan of analyze_query.
+
     Args:
-        query: Natural language query
+        query: Natural language query (or its QueryAnalysis)
 
     Returns:
         List of stat category codes (e.g., ["PTS", "AST"])
     """
-    query_lower = query.lower()
+    analysis = _as_analysis(query)
     stats = set()
 
-    for pattern, codes in STAT_PATTERNS.items():
-        if pattern in query_lower:
+    for pattern in analysis.phrases:
+        codes = STAT_PATTERNS.get(pattern)
+        if codes:
             stats.update(codes)
 
     # If no specific stats mentioned, return empty (planner will decide)
@@ -428,8 +436,160 @@ INTENT_PATTERNS = {
 }
 
 
+# ============================================================================
+# QUERY ANALYSIS (compiled matchers, one scan per query)
+# ============================================================================
+
+# Literal phrases the extractors test for (`phrase in query`). They are found
+# in the same scan as the STAT_PATTERNS keys; QueryAnalysis.has() falls back
+# to a substring search for phrases not listed here.
+_KEYWORDS = (
+    # Time ranges and calendar anchors
+    "tonight", "today", "yesterday", "tomorrow",
+    "this season", "current season", "last season", "previous season",
+    "last week", "last month", "career", "all-time", "history",
+    "january", "february", "march", "april", "may", "june", "july",
+    "august", "september", "october", "november", "december",
+    "since christmas", "after christmas", "before christmas",
+    "since new year", "after new year", "before new year",
+    "since thanksgiving", "after thanksgiving", "before thanksgiving",
+    "since all-star", "after all-star", "before all-star",
+    "since all star", "after all star", "before all star",
+    "since mlk day", "after mlk day", "before mlk day",
+    "since", "after", "before", "playoffs", "postseason", "pre", "during", "in",
+    # Modifiers
+    "per game", "ppg", "per 75", "per possession", "per 100", "per 36", "per 48",
+    "home", "away", "road", "playoff", "regular season", "preseason", "pre-season",
+    "atlantic", "central", "southeast", "pacific", "northwest", "southwest",
+    "who will win", "first half", "second half", "overtime", "ot",
+    "starter", "starting", "bench", "reserve",
+    "starting lineup", "starting five", "starting unit",
+    "bench lineup", "bench unit", "second unit",
+    # Statistical filters
+    "three", "3pt", "3-pt", "field goal", "fg", "free throw", "ft",
+    "turnover", "triple", "double",
+)
+
+_PHRASES: FrozenSet[str] = frozenset(STAT_PATTERNS) | frozenset(_KEYWORDS)
+
+
+def _trie_pattern(phrases: Iterable[str]) -> str:
+    """
+    Regex alternation of literal phrases, factored into a trie.
+
+    Branches at each node start with different characters, so the engine
+    follows a single path per start position and, preferring to extend,
+    returns the longest phrase starting there.
+    """
+    trie: Dict[str, Any] = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+# Longest phrase starting at each position (zero-width, so matches overlap)
+_PHRASE_MATCHER = re.compile(f"(?=({_trie_pattern(_PHRASES)}))")
+
+# The phrases starting at a position are the prefixes of the longest one
+_PHRASE_PREFIXES: Dict[str, FrozenSet[str]] = {
+    phrase: frozenset(phrase[:i] for i in range(1, len(phrase) + 1) if phrase[:i] in _PHRASES)
+    for phrase in _PHRASES
+}
+
+# One alternation per intent, in priority order: a single search per intent
+# (the engine skips ahead to the patterns' possible first characters)
+# instead of one re.search per pattern
+_INTENT_MATCHERS: List[Tuple[str, "re.Pattern[str]"]] = [
+    (intent, re.compile("|".join(f"(?:{pattern})" for pattern in patterns)))
+    for intent, patterns in INTENT_PATTERNS.items()
+]
+
+# Name-like tokens, including hyphens and apostrophes
+# Examples: "Karl-Anthony Towns", "De'Aaron Fox", "O'Neal"
+_TOKEN_RE = re.compile(r"\b[A-Za-z]+(?:['-][A-Za-z]+)*\b")
+_WORD_RE = re.compile(r"\w+")
+
+
+class QueryToken(NamedTuple):
+    """A name-like token and its offsets in the raw query."""
+
+    text: str
+    start: int
+    end: int
+
+
+@dataclass(frozen=True)
+class QueryAnalysis:
+    """
+    A query lowercased, tokenized and scanned once, shared by all extractors.
+
+    Attributes:
+        raw: Original query
+        lower: Lowercased query
+        phrases: STAT_PATTERNS keys and keywords occurring in the query
+        tokens: Name-like tokens with offsets (entity resolution windows)
+        words: Lowercased \\w+ runs (whole-word checks)
+
+    tokens and words are computed on first use.
+    """
+
+    raw: str
+    lower: str
+    phrases: FrozenSet[str]
+
+    @cached_property
+    def tokens(self) -> Tuple[QueryToken, ...]:
+        return tuple(QueryToken(m.group(), m.start(), m.end()) for m in _TOKEN_RE.finditer(self.raw))
+
+    @cached_property
+    def words(self) -> FrozenSet[str]:
+        return frozenset(_WORD_RE.findall(self.lower))
+
+    def has(self, *phrases: str) -> bool:
+        """True if any phrase occurs in the lowercased query (as a substring)."""
+        for phrase in phrases:
+            if phrase in self.phrases or (phrase not in _PHRASES and phrase in self.lower):
+                return True
+        return False
+
+    def has_word(self, *words: str) -> bool:
+        """True if any word occurs as a whole word (like r"\\bword\\b")."""
+        return any(word in self.words for word in words)
+
+
+def analyze_query(query: str) -> QueryAnalysis:
+    """
+    Lowercase and phrase-scan a query once for all extractors.
+
+    Args:
+        query: Natural language query
+
+    Returns:
+        QueryAnalysis to pass to the extractors
+    """
+    lower = query.lower()
+    longest = {match.group(1) for match in _PHRASE_MATCHER.finditer(lower)}
+    phrases = frozenset().union(*(_PHRASE_PREFIXES[phrase] for phrase in longest))
+    return QueryAnalysis(raw=query, lower=lower, phrases=phrases)
+
+
+def _as_analysis(query: Union[str, QueryAnalysis]) -> QueryAnalysis:
+    return query if isinstance(query, QueryAnalysis) else analyze_query(query)
+
+
 def classify_intent(
-    query: str,
+    query: Union[str, QueryAnalysis],
 ) -> Literal[
     "leaders",
     "comparison",
@@ -450,20 +610,23 @@ def classify_intent(
     """
     Classify query intent using pattern matching.
 
+    Intents are checked in INTENT_PATTERNS order, each with one precompiled
+    alternation of its patterns.
+
     Args:
-        query: Natural language query
+        query: Natural language query (or its QueryAnalysis)
 
     Returns:
         Intent classification (includes Phase 2.2 intents: rankings, streaks, milestones, awards)
     """
-    query_lower = query.lower()
+    query_lower = _as_analysis(query).lower
 
-    # Check patterns in priority order
-    for intent, patterns in INTENT_PATTERNS.items():
-        for pattern in patterns:
-            if re.search(pattern, query_lower):
-                logger.debug(f"Matched intent '{intent}' with pattern: {pattern}")
-                return intent
+    # Check intents in priority order
+    for intent, matcher in _INTENT_MATCHERS:
+        match = matcher.search(query_lower)
+        if match:
+            logger.debug(f"Matched intent '{intent}' on: {match.group(0)!r}")
+            return intent
 
     # If comparison keywords found in entity count, default to comparison
     # This will be refined after entity extraction
@@ -476,7 +639,7 @@ def classify_intent(
 # ============================================================================
 
 
-def parse_calendar_anchor(query: str, today: date) -> Optional[TimeRange]:
+def parse_calendar_anchor(query: Union[str, QueryAnalysis], today: date) -> Optional[TimeRange]:
     """
     Parse calendar anchor expressions (Phase 5.3 NLQ Enhancement).
 
@@ -487,13 +650,13 @@ def parse_calendar_anchor(query: str, today: date) -> Optional[TimeRange]:
     - "since Thanksgiving"
 
     Args:
-        query: Natural language query
+        query: Natural language query (or its QueryAnalysis)
         today: Current date
 
     Returns:
         TimeRange object or None
     """
-    query_lower = query.lower()
+    analysis = _as_analysis(query)
     current_year = today.year
 
     # NBA season year (starts in October)
@@ -510,26 +673,27 @@ def parse_calendar_anchor(query: str, today: date) -> Optional[TimeRange]:
     }
 
     # Check for "since X" or "after X" patterns
-    for anchor_name, anchor_date in anchors.items():
-        if f"since {anchor_name}" in query_lower or f"after {anchor_name}" in query_lower:
-            return TimeRange(
-                start_date=anchor_date,
-                end_date=today,
-                relative=f"since_{anchor_name.replace(' ', '_')}"
-            )
-        if f"before {anchor_name}" in query_lower:
-            # Get season start (October 1st of season year)
-            season_start = date(season_year, 10, 1)
-            return TimeRange(
-                start_date=season_start,
-                end_date=anchor_date,
-                relative=f"before_{anchor_name.replace(' ', '_')}"
-            )
+    if analysis.has("since", "after", "before"):
+        for anchor_name, anchor_date in anchors.items():
+            if analysis.has(f"since {anchor_name}", f"after {anchor_name}"):
+                return TimeRange(
+                    start_date=anchor_date,
+                    end_date=today,
+                    relative=f"since_{anchor_name.replace(' ', '_')}"
+                )
+            if analysis.has(f"before {anchor_name}"):
+                # Get season start (October 1st of season year)
+                season_start = date(season_year, 10, 1)
+                return TimeRange(
+                    start_date=season_start,
+                    end_date=anchor_date,
+                    relative=f"before_{anchor_name.replace(' ', '_')}"
+                )
 
     # Playoff anchor (April-June)
-    if "playoffs" in query_lower or "postseason" in query_lower:
+    if analysis.has("playoffs", "postseason"):
         playoff_start = date(season_year + 1, 4, 15)  # Approximate playoff start
-        if "before" in query_lower or "pre" in query_lower:
+        if analysis.has("before", "pre"):
             # Regular season before playoffs
             season_start = date(season_year, 10, 1)
             return TimeRange(
@@ -537,7 +701,7 @@ def parse_calendar_anchor(query: str, today: date) -> Optional[TimeRange]:
                 end_date=playoff_start,
                 relative="before_playoffs"
             )
-        elif "during" in query_lower or "in" in query_lower:
+        elif analysis.has("during", "in"):
             # During playoffs
             playoff_end = date(season_year + 1, 6, 30)
             return TimeRange(
@@ -549,7 +713,18 @@ def parse_calendar_anchor(query: str, today: date) -> Optional[TimeRange]:
     return None
 
 
-def parse_time_range(query: str) -> Optional[TimeRange]:
+_WEEKS_RE = re.compile(r"(?:last|past) (\w+) weeks?")
+_SEASON_RE = re.compile(r"(\d{4})-(\d{2})")
+_LAST_GAMES_RE = re.compile(r"last (\d+) games?")
+
+MONTH_NAMES = {
+    "january": 1, "february": 2, "march": 3, "april": 4,
+    "may": 5, "june": 6, "july": 7, "august": 8,
+    "september": 9, "october": 10, "november": 11, "december": 12
+}
+
+
+def parse_time_range(query: Union[str, QueryAnalysis]) -> Optional[TimeRange]:
     """
     Parse time expressions from query.
 
@@ -562,35 +737,36 @@ def parse_time_range(query: str) -> Optional[TimeRange]:
     - Phase 5.3: "since Christmas", "after All-Star break", "last three weeks"
 
     Args:
-        query: Natural language query
+        query: Natural language query (or its QueryAnalysis)
 
     Returns:
         TimeRange object or None
     """
-    query_lower = query.lower()
+    analysis = _as_analysis(query)
+    query_lower = analysis.lower
     today = date.today()
 
     # Phase 5.3: Check calendar anchors first (since Christmas, after All-Star, etc.)
-    calendar_result = parse_calendar_anchor(query, today)
+    calendar_result = parse_calendar_anchor(analysis, today)
     if calendar_result:
         return calendar_result
 
     # Tonight/Today (Phase 4.1: Enhanced relative time)
-    if "tonight" in query_lower or "today" in query_lower:
+    if analysis.has("tonight", "today"):
         return TimeRange(start_date=today, end_date=today, relative="tonight")
 
     # Yesterday (Phase 4.1)
-    if "yesterday" in query_lower:
+    if analysis.has("yesterday"):
         yesterday = today - timedelta(days=1)
         return TimeRange(start_date=yesterday, end_date=yesterday, relative="yesterday")
 
     # Tomorrow (Phase 4.1)
-    if "tomorrow" in query_lower:
+    if analysis.has("tomorrow"):
         tomorrow = today + timedelta(days=1)
         return TimeRange(start_date=tomorrow, end_date=tomorrow, relative="tomorrow")
 
     # Phase 5.3: Relative period parsing ("last three weeks", "past two weeks")
-    weeks_match = re.search(r"(?:last|past) (\w+) weeks?", query_lower)
+    weeks_match = _WEEKS_RE.search(query_lower)
     if weeks_match:
         weeks_word = weeks_match.group(1)
         # Convert word to number
@@ -607,55 +783,50 @@ def parse_time_range(query: str) -> Optional[TimeRange]:
         )
 
     # Phase 5.2 (P2): Check for multi-season ranges FIRST
-    season_range = parse_season_range(query)
+    season_range = parse_season_range(analysis)
     if season_range and len(season_range) > 1:
         # Multi-season query detected
         return TimeRange(seasons=season_range, relative="multi_season")
 
     # This season / current season
-    if "this season" in query_lower or "current season" in query_lower:
+    if analysis.has("this season", "current season"):
         year = today.year if today.month >= 10 else today.year - 1
         season = f"{year}-{str(year + 1)[-2:]}"
         return TimeRange(season=season, relative="this_season")
 
     # Last season / previous season (Phase 4.1)
-    if "last season" in query_lower or "previous season" in query_lower:
+    if analysis.has("last season", "previous season"):
         year = today.year if today.month >= 10 else today.year - 1
         last_year = year - 1
         season = f"{last_year}-{str(last_year + 1)[-2:]}"
         return TimeRange(season=season, relative="last_season")
 
     # Specific season (YYYY-YY format)
-    season_match = re.search(r"(\d{4})-(\d{2})", query)
+    season_match = _SEASON_RE.search(analysis.raw)
     if season_match:
         season = season_match.group(0)
         return TimeRange(season=season)
 
     # Last N games
-    last_games_match = re.search(r"last (\d+) games?", query_lower)
+    last_games_match = _LAST_GAMES_RE.search(query_lower)
     if last_games_match:
         n_games = int(last_games_match.group(1))
         return TimeRange(relative=f"last_{n_games}_games")
 
     # Last week/month
-    if "last week" in query_lower:
+    if analysis.has("last week"):
         return TimeRange(
             start_date=today - timedelta(days=7), end_date=today, relative="last_week"
         )
 
-    if "last month" in query_lower:
+    if analysis.has("last month"):
         return TimeRange(
             start_date=today - timedelta(days=30), end_date=today, relative="last_month"
         )
 
     # Month names (Phase 4.1: "in December", "January games")
-    month_names = {
-        "january": 1, "february": 2, "march": 3, "april": 4,
-        "may": 5, "june": 6, "july": 7, "august": 8,
-        "september": 9, "october": 10, "november": 11, "december": 12
-    }
-    for month_name, month_num in month_names.items():
-        if month_name in query_lower:
+    for month_name, month_num in MONTH_NAMES.items():
+        if analysis.has(month_name):
             # Determine year (use current year for current/future months, last year for past months)
             current_month = today.month
             if month_num > current_month:
@@ -678,7 +849,7 @@ def parse_time_range(query: str) -> Optional[TimeRange]:
             )
 
     # Career/all-time
-    if "career" in query_lower or "all-time" in query_lower or "history" in query_lower:
+    if analysis.has("career", "all-time", "history"):
         return TimeRange(relative="career")
 
     # Default: current season
@@ -692,7 +863,7 @@ def parse_time_range(query: str) -> Optional[TimeRange]:
 # ============================================================================
 
 
-async def extract_entities(query: str) -> List[Dict[str, Any]]:
+async def extract_entities(query: Union[str, QueryAnalysis]) -> List[Dict[str, Any]]:
     """
     Extract and resolve entities (players, teams) from query.
 
@@ -701,10 +872,11 @@ async def extract_entities(query: str) -> List[Dict[str, Any]]:
     - Supports 2-word city names (San Antonio, Golden State)
     - Handles hyphenated names (already supported in regex)
 
-    Uses entity resolver with fuzzy matching.
+    Uses entity resolver with fuzzy matching. Each window is a dict/trigram
+    index lookup; suggestions are skipped since misses are expected here.
 
     Args:
-        query: Natural language query
+        query: Natural language query (or its QueryAnalysis)
 
     Returns:
         List of resolved entities with metadata
@@ -758,9 +930,8 @@ async def extract_entities(query: str) -> List[Dict[str, Any]]:
         "rebounds",
     }
 
-    # Split query into tokens (includes hyphens and apostrophes)
-    # Examples: "Karl-Anthony Towns", "De'Aaron Fox", "O'Neal"
-    tokens = re.findall(r"\b[A-Za-z]+(?:['-][A-Za-z]+)*\b", query)
+    # Query tokens (includes hyphens and apostrophes)
+    tokens = [token.text for token in _as_analysis(query).tokens]
 
     # Phase 5.3: Enhanced multi-token entity resolution
     # Try to resolve tokens in descending order: 3-word → 2-word → 1-word
@@ -779,7 +950,9 @@ async def extract_entities(query: str) -> List[Dict[str, Any]]:
         if i + 2 < len(tokens):
             three_word = f"{tokens[i]} {tokens[i+1]} {tokens[i+2]}"
             try:
-                entity_ref = resolve_entity(three_word, min_confidence=0.7)
+                entity_ref = resolve_entity(
+                    three_word, min_confidence=0.7, return_suggestions=False
+                )
                 entities.append(
                     {
                         "entity_type": entity_ref.entity_type,
@@ -802,7 +975,9 @@ async def extract_entities(query: str) -> List[Dict[str, Any]]:
         if not resolved and i + 1 < len(tokens):
             two_word = f"{tokens[i]} {tokens[i+1]}"
             try:
-                entity_ref = resolve_entity(two_word, min_confidence=0.7)
+                entity_ref = resolve_entity(
+                    two_word, min_confidence=0.7, return_suggestions=False
+                )
                 entities.append(
                     {
                         "entity_type": entity_ref.entity_type,
@@ -824,7 +999,9 @@ async def extract_entities(query: str) -> List[Dict[str, Any]]:
         # Try single word (skip if it's a stop word)
         if not resolved and token not in STOP_WORDS:
             try:
-                entity_ref = resolve_entity(tokens[i], min_confidence=0.7)
+                entity_ref = resolve_entity(
+                    tokens[i], min_confidence=0.7, return_suggestions=False
+                )
                 entities.append(
                     {
                         "entity_type": entity_ref.entity_type,
@@ -850,7 +1027,32 @@ async def extract_entities(query: str) -> List[Dict[str, Any]]:
 # ============================================================================
 
 
-def extract_stat_filters(query: str) -> Optional[Dict[str, List[Any]]]:
+# "30+ points", "above 50%", "below 40%", "at least 10 rebounds"
+_PLUS_FILTER_RE = re.compile(r"(\d+)\+\s*(?:points?|pts?|rebounds?|rebs?|assists?|asts?|steals?|stls?|blocks?|blks?|turnovers?|tovs?|minutes?|mins?)")
+_ABOVE_PCT_RE = re.compile(r"(?:above|over|more than|greater than)\s+(\d+)%")
+_BELOW_PCT_RE = re.compile(r"(?:below|under|less than)\s+(\d+)%")
+_AT_LEAST_FILTER_RE = re.compile(r"at least (\d+)\s*(?:points?|pts?|rebounds?|rebs?|assists?|asts?)")
+
+# Stat word -> code, checked in order
+_FILTER_STAT_CODES = [
+    (re.compile(r"points?|pts?"), "PTS"),
+    (re.compile(r"rebounds?|rebs?"), "REB"),
+    (re.compile(r"assists?|asts?"), "AST"),
+    (re.compile(r"steals?|stls?"), "STL"),
+    (re.compile(r"blocks?|blks?"), "BLK"),
+    (re.compile(r"turnovers?|tovs?"), "TOV"),
+    (re.compile(r"minutes?|mins?"), "MIN"),
+]
+
+
+def _filter_stat_code(stat_text: str, candidates=_FILTER_STAT_CODES) -> Optional[str]:
+    for stat_re, code in candidates:
+        if stat_re.search(stat_text):
+            return code
+    return None
+
+
+def extract_stat_filters(query: Union[str, QueryAnalysis]) -> Optional[Dict[str, List[Any]]]:
     """
     Extract statistical filters from queries like:
     - "games with 30+ points"
@@ -860,7 +1062,7 @@ def extract_stat_filters(query: str) -> Optional[Dict[str, List[Any]]]:
     Phase 5.1: Added to integrate fetch_player_games into NLQ pipeline
 
     Args:
-        query: Natural language query
+        query: Natural language query (or its QueryAnalysis)
 
     Returns:
         Dict mapping stat codes to [operator, value] pairs
@@ -876,87 +1078,66 @@ def extract_stat_filters(query: str) -> Optional[Dict[str, List[Any]]]:
         >>> extract_stat_filters("10+ rebounds and 5+ assists")
         {"REB": [">=", 10], "AST": [">=", 5]}
     """
-    query_lower = query.lower()
+    analysis = _as_analysis(query)
+    query_lower = analysis.lower
     filters = {}
 
     # Pattern 1: "X+ statname" → >= X
     # Examples: "30+ points", "10+ rebounds", "5+ assists"
-    pattern1 = r"(\d+)\+\s*(?:points?|pts?|rebounds?|rebs?|assists?|asts?|steals?|stls?|blocks?|blks?|turnovers?|tovs?|minutes?|mins?)"
-    matches1 = re.finditer(pattern1, query_lower)
-    for match in matches1:
+    for match in _PLUS_FILTER_RE.finditer(query_lower):
         value = int(match.group(1))
         stat_text = match.group(0)[len(match.group(1))+1:].strip()  # Remove number+
 
         # Map to stat code
-        if re.search(r"points?|pts?", stat_text):
-            filters["PTS"] = [">=", value]
-        elif re.search(r"rebounds?|rebs?", stat_text):
-            filters["REB"] = [">=", value]
-        elif re.search(r"assists?|asts?", stat_text):
-            filters["AST"] = [">=", value]
-        elif re.search(r"steals?|stls?", stat_text):
-            filters["STL"] = [">=", value]
-        elif re.search(r"blocks?|blks?", stat_text):
-            filters["BLK"] = [">=", value]
-        elif re.search(r"turnovers?|tovs?", stat_text):
-            filters["TOV"] = [">=", value]
-        elif re.search(r"minutes?|mins?", stat_text):
-            filters["MIN"] = [">=", value]
+        code = _filter_stat_code(stat_text)
+        if code:
+            filters[code] = [">=", value]
 
     # Pattern 2: "above/over/more than X%" → >= X/100
     # Examples: "shot above 50%", "above 40% from three"
-    pattern2 = r"(?:above|over|more than|greater than)\s+(\d+)%"
-    matches2 = re.finditer(pattern2, query_lower)
-    for match in matches2:
+    for match in _ABOVE_PCT_RE.finditer(query_lower):
         value = float(match.group(1)) / 100
 
         # Determine stat based on context
-        if "three" in query_lower or "3pt" in query_lower or "3-pt" in query_lower:
+        if analysis.has("three", "3pt", "3-pt"):
             filters["FG3_PCT"] = [">=", value]
-        elif "field goal" in query_lower or "fg" in query_lower:
+        elif analysis.has("field goal", "fg"):
             filters["FG_PCT"] = [">=", value]
-        elif "free throw" in query_lower or "ft" in query_lower:
+        elif analysis.has("free throw", "ft"):
             filters["FT_PCT"] = [">=", value]
         else:
             # Default to FG%
             filters["FG_PCT"] = [">=", value]
 
     # Pattern 3: "below/under/less than X%" → <= X/100
-    pattern3 = r"(?:below|under|less than)\s+(\d+)%"
-    matches3 = re.finditer(pattern3, query_lower)
-    for match in matches3:
+    for match in _BELOW_PCT_RE.finditer(query_lower):
         value = float(match.group(1)) / 100
 
-        if "three" in query_lower or "3pt" in query_lower:
+        if analysis.has("three", "3pt"):
             filters["FG3_PCT"] = ["<=", value]
-        elif "field goal" in query_lower or "fg" in query_lower:
+        elif analysis.has("field goal", "fg"):
             filters["FG_PCT"] = ["<=", value]
-        elif "turnover" in query_lower:
+        elif analysis.has("turnover"):
             filters["TOV_PCT"] = ["<=", value]
         else:
             filters["FG_PCT"] = ["<=", value]
 
     # Pattern 4: "at least X" → >= X
-    pattern4 = r"at least (\d+)\s*(?:points?|pts?|rebounds?|rebs?|assists?|asts?)"
-    matches4 = re.finditer(pattern4, query_lower)
-    for match in matches4:
+    for match in _AT_LEAST_FILTER_RE.finditer(query_lower):
         value = int(match.group(1))
         stat_text = match.group(0)[len("at least ")+len(match.group(1)):].strip()
 
-        if re.search(r"points?|pts?", stat_text):
-            filters["PTS"] = [">=", value]
-        elif re.search(r"rebounds?|rebs?", stat_text):
-            filters["REB"] = [">=", value]
-        elif re.search(r"assists?|asts?", stat_text):
-            filters["AST"] = [">=", value]
+        code = _filter_stat_code(stat_text, _FILTER_STAT_CODES[:3])
+        if code:
+            filters[code] = [">=", value]
 
     # Pattern 5: "double-double" / "triple-double"
-    if "triple" in query_lower and "double" in query_lower:
+    if analysis.has("triple") and analysis.has("double"):
         # Triple-double: 10+ in 3 categories (typically PTS, REB, AST)
         filters["PTS"] = [">=", 10]
         filters["REB"] = [">=", 10]
         filters["AST"] = [">=", 10]
-    elif "double" in query_lower and "double" in query_lower:
+    elif analysis.has("double"):
         # Double-double: 10+ in 2 categories (typically PTS/REB or PTS/AST)
         # We'll just filter for high scorers with rebounds
         filters["PTS"] = [">=", 10]
@@ -970,7 +1151,12 @@ def extract_stat_filters(query: str) -> Optional[Dict[str, List[Any]]]:
 # ============================================================================
 
 
-def parse_season_range(query: str) -> Optional[List[str]]:
+_SEASON_SPAN_RE = re.compile(r"(\d{4})-(\d{2})\s+(?:to|through|thru|-)\s+(\d{4})-(\d{2})")
+_LAST_SEASONS_RE = re.compile(r"last (\d+) seasons?")
+_PREVIOUS_SEASONS_RE = re.compile(r"(?:previous|past) (\d+) seasons?")
+
+
+def parse_season_range(query: Union[str, QueryAnalysis]) -> Optional[List[str]]:
     """
     Parse season ranges from queries for multi-season support.
 
@@ -982,7 +1168,7 @@ def parse_season_range(query: str) -> Optional[List[str]]:
     - "last 3 seasons" → ["2022-23", "2023-24", "2024-25"]
 
     Args:
-        query: Natural language query
+        query: Natural language query (or its QueryAnalysis)
 
     Returns:
         List of season strings in YYYY-YY format, or None if no range found
@@ -994,12 +1180,12 @@ def parse_season_range(query: str) -> Optional[List[str]]:
         >>> parse_season_range("Compare Curry's last 3 seasons")
         ["2022-23", "2023-24", "2024-25"]
     """
-    query_lower = query.lower()
+    analysis = _as_analysis(query)
+    query_lower = analysis.lower
     seasons = []
 
     # Pattern 1: Explicit season range "YYYY-YY to/through YYYY-YY"
-    pattern1 = r"(\d{4})-(\d{2})\s+(?:to|through|thru|-)\s+(\d{4})-(\d{2})"
-    match1 = re.search(pattern1, query)
+    match1 = _SEASON_SPAN_RE.search(analysis.raw)
     if match1:
         start_year = int(match1.group(1))
         start_suffix = match1.group(2)
@@ -1017,8 +1203,7 @@ def parse_season_range(query: str) -> Optional[List[str]]:
         return seasons
 
     # Pattern 2: Relative season ranges "last N seasons"
-    pattern2 = r"last (\d+) seasons?"
-    match2 = re.search(pattern2, query_lower)
+    match2 = _LAST_SEASONS_RE.search(query_lower)
     if match2:
         n_seasons = int(match2.group(1))
 
@@ -1044,8 +1229,7 @@ def parse_season_range(query: str) -> Optional[List[str]]:
         return seasons
 
     # Pattern 3: "previous N seasons"
-    pattern3 = r"(?:previous|past) (\d+) seasons?"
-    match3 = re.search(pattern3, query_lower)
+    match3 = _PREVIOUS_SEASONS_RE.search(query_lower)
     if match3:
         n_seasons = int(match3.group(1))
 
@@ -1075,12 +1259,39 @@ def parse_season_range(query: str) -> Optional[List[str]]:
 # ============================================================================
 
 
-def extract_modifiers(query: str) -> Dict[str, Any]:
+_TOP_N_RE = re.compile(r"top (\d+)")
+_OPPONENT_RE = re.compile(r"(?:vs|versus|against)\s+([A-Za-z]+(?:\s+[A-Za-z]+)?)")
+_WITH_PLAYER_RE = re.compile(r"(?:with|including)\s+([A-Za-z\s]+?)(?:\s+lineup|\s+and|\s+,|$)")
+_WITHOUT_PLAYER_RE = re.compile(r"(?:without|excluding|except)\s+([A-Za-z\s]+?)(?:\s+lineup|\s+and|\s+,|$)")
+_PLAYER_SUFFIX_RE = re.compile(r"\s+(lineup|stats|statistics|analysis)$")
+_MIN_GAMES_RE = re.compile(r"(?:min(?:imum)?|at least)\s+(\d+)\s+games?")
+_LAST_N_GAMES_RE = re.compile(r"(?:last|past|recent)\s+(\d+)\s+games?")
+_CLUTCH_RE = re.compile(r"\bclutch\b|\bcrunch time\b|final \d+ minutes?|close games?")
+_WORST_N_RE = re.compile(r"(?:worst|bottom)\s+(\d+)")
+
+# "in January", "during December", "November games" (one alternative per
+# start position, so every mention is seen; the earliest month wins)
+_MONTH_ALTERNATION = "|".join(MONTH_NAMES)
+_MONTH_FILTER_RE = re.compile(
+    rf"(?=\b(?:in|during)\s+({_MONTH_ALTERNATION})\b|\b({_MONTH_ALTERNATION})\s+games?\b)"
+)
+
+DIVISIONS = {
+    "atlantic": "Atlantic",
+    "central": "Central",
+    "southeast": "Southeast",
+    "pacific": "Pacific",
+    "northwest": "Northwest",
+    "southwest": "Southwest",
+}
+
+
+def extract_modifiers(query: Union[str, QueryAnalysis]) -> Dict[str, Any]:
     """
     Extract query modifiers (top N, normalization mode, conference, etc.).
 
     Args:
-        query: Natural language query
+        query: Natural language query (or its QueryAnalysis)
 
     Returns:
         Dictionary of modifiers
@@ -1091,107 +1302,100 @@ def extract_modifiers(query: str) -> Dict[str, Any]:
         - Opponent filters
     """
     modifiers = {}
-    query_lower = query.lower()
+    analysis = _as_analysis(query)
+    query_lower = analysis.lower
 
     # Top N
-    top_n_match = re.search(r"top (\d+)", query_lower)
+    top_n_match = _TOP_N_RE.search(query_lower)
     if top_n_match:
         modifiers["top_n"] = int(top_n_match.group(1))
 
     # Per-game vs per-possession
-    if "per game" in query_lower or "ppg" in query_lower:
+    if analysis.has("per game", "ppg"):
         modifiers["normalization"] = "per_game"
-    elif "per 75" in query_lower or "per possession" in query_lower:
+    elif analysis.has("per 75", "per possession"):
         modifiers["normalization"] = "per_75"
-    elif "per 100" in query_lower:
+    elif analysis.has("per 100"):
         modifiers["normalization"] = "per_100"
-    elif "per 36" in query_lower:
+    elif analysis.has("per 36"):
         modifiers["normalization"] = "per_36"
-    elif "per 48" in query_lower:
+    elif analysis.has("per 48"):
         modifiers["normalization"] = "per_48"
 
     # Home/away
-    if "home" in query_lower:
+    if analysis.has("home"):
         modifiers["location"] = "home"
-    elif "away" in query_lower or "road" in query_lower:
+    elif analysis.has("away", "road"):
         modifiers["location"] = "away"
 
     # Playoffs vs regular season (Phase 2.4: Enhanced)
-    if "playoff" in query_lower or "postseason" in query_lower:
+    if analysis.has("playoff", "postseason"):
         modifiers["season_type"] = "playoffs"
-    elif "regular season" in query_lower:
+    elif analysis.has("regular season"):
         modifiers["season_type"] = "regular"
-    elif "preseason" in query_lower or "pre-season" in query_lower:
+    elif analysis.has("preseason", "pre-season"):
         modifiers["season_type"] = "preseason"
 
     # Conference filter (Phase 2.4)
-    if re.search(r"\beastern\b|\beast\b", query_lower):
+    if analysis.has_word("eastern", "east"):
         modifiers["conference"] = "East"
-    elif re.search(r"\bwestern\b|\bwest\b", query_lower):
+    elif analysis.has_word("western", "west"):
         modifiers["conference"] = "West"
 
     # Division filter (Phase 2.4)
-    divisions = {
-        "atlantic": "Atlantic",
-        "central": "Central",
-        "southeast": "Southeast",
-        "pacific": "Pacific",
-        "northwest": "Northwest",
-        "southwest": "Southwest",
-    }
-    for div_key, div_name in divisions.items():
-        if div_key in query_lower:
+    for div_key, div_name in DIVISIONS.items():
+        if analysis.has(div_key):
             modifiers["division"] = div_name
             break
 
     # Opponent filter (Phase 2.4)
     # Pattern: "vs Lakers", "against Celtics", "versus Warriors"
-    opponent_match = re.search(r"(?:vs|versus|against)\s+([A-Za-z]+(?:\s+[A-Za-z]+)?)", query_lower)
+    opponent_match = _OPPONENT_RE.search(query_lower)
     if opponent_match:
         modifiers["opponent"] = opponent_match.group(1).strip()
 
     # Win/Loss outcome (Phase 2.4)
-    if re.search(r"\bwins?\b|\bwon\b", query_lower) and not re.search(r"who will win", query_lower):
+    if analysis.has_word("win", "wins", "won") and not analysis.has("who will win"):
         modifiers["outcome"] = "W"
-    elif re.search(r"\bloss(?:es)?\b|\blost\b", query_lower):
+    elif analysis.has_word("loss", "losses", "lost"):
         modifiers["outcome"] = "L"
 
     # First/Second half (Phase 2.4)
-    if "first half" in query_lower:
+    if analysis.has("first half"):
         modifiers["game_segment"] = "First Half"
-    elif "second half" in query_lower:
+    elif analysis.has("second half"):
         modifiers["game_segment"] = "Second Half"
-    elif "overtime" in query_lower or "ot" in query_lower:
+    elif analysis.has("overtime", "ot"):
         modifiers["game_segment"] = "Overtime"
 
     # Starter/bench (Phase 2.4)
-    if "starter" in query_lower or "starting" in query_lower:
+    if analysis.has("starter", "starting"):
         modifiers["starter_bench"] = "Starters"
-    elif "bench" in query_lower or "reserve" in query_lower:
+    elif analysis.has("bench", "reserve"):
         modifiers["starter_bench"] = "Bench"
 
     # Phase 5.2 (P6 Phase 2): Lineup modifiers
     # lineup_type (starting/bench)
-    if "starting lineup" in query_lower or "starting five" in query_lower or "starting unit" in query_lower:
+    if analysis.has("starting lineup", "starting five", "starting unit"):
         modifiers["lineup_type"] = "starting"
-    elif "bench lineup" in query_lower or "bench unit" in query_lower or "second unit" in query_lower:
+    elif analysis.has("bench lineup", "bench unit", "second unit"):
         modifiers["lineup_type"] = "bench"
 
     # with_player (lineups including player)
-    with_player_match = re.search(r"(?:with|including)\s+([A-Za-z\s]+?)(?:\s+lineup|\s+and|\s+,|$)", query_lower)
+    with_player_match = _WITH_PLAYER_RE.search(query_lower)
     if with_player_match:
         player_name = with_player_match.group(1).strip()
         # Clean up common words
-        player_name = re.sub(r"\s+(lineup|stats|statistics|analysis)$", "", player_name)
+        player_name = _PLAYER_SUFFIX_RE.sub("", player_name)
         if player_name and len(player_name) > 2:  # Avoid single letters
             modifiers["with_player"] = player_name
 
     # without_player (lineups excluding player)
-    without_player_match = re.search(r"(?:without|excluding|except)\s+([A-Za-z\s]+?)(?:\s+lineup|\s+and|\s+,|$)", query_lower)
+    without_player_match = _WITHOUT_PLAYER_RE.search(query_lower)
     if without_player_match:
         player_name = without_player_match.group(1).strip()
         # Clean up common words
-        player_name = re.sub(r"\s+(lineup|stats|statistics|analysis)$", "", player_name)
+        player_name = _PLAYER_SUFFIX_RE.sub("", player_name)
         if player_name and len(player_name) > 2:  # Avoid single letters
             modifiers["without_player"] = player_name
 
@@ -1199,43 +1403,40 @@ def extract_modifiers(query: str) -> Dict[str, Any]:
 
     # Minimum games filter (Phase 5.3)
     # Examples: "min 10 games", "at least 20 games", "minimum 15 games"
-    min_games_match = re.search(r"(?:min(?:imum)?|at least)\s+(\d+)\s+games?", query_lower)
+    min_games_match = _MIN_GAMES_RE.search(query_lower)
     if min_games_match:
         modifiers["min_games"] = int(min_games_match.group(1))
 
     # Last N games (Phase 5.3)
     # Examples: "last 10 games", "past 5 games", "recent 20 games"
-    last_n_match = re.search(r"(?:last|past|recent)\s+(\d+)\s+games?", query_lower)
+    last_n_match = _LAST_N_GAMES_RE.search(query_lower)
     if last_n_match:
         modifiers["last_n_games"] = int(last_n_match.group(1))
 
     # Clutch time filter (Phase 5.3)
     # Examples: "clutch stats", "final 5 minutes", "crunch time", "close games"
-    if re.search(r"\bclutch\b|\bcrunch time\b|final \d+ minutes?|close games?", query_lower):
+    if _CLUTCH_RE.search(query_lower):
         modifiers["clutch"] = True
 
     # Month filter (Phase 5.3)
     # Examples: "in January", "during December", "November games"
-    months = {
-        "january": 1, "february": 2, "march": 3, "april": 4,
-        "may": 5, "june": 6, "july": 7, "august": 8,
-        "september": 9, "october": 10, "november": 11, "december": 12
-    }
-    for month_name, month_num in months.items():
-        if re.search(rf"\b(?:in|during)\s+{month_name}\b", query_lower) or re.search(rf"\b{month_name}\s+games?\b", query_lower):
-            modifiers["month"] = month_num
-            break
+    months = [
+        MONTH_NAMES[match.group(1) or match.group(2)]
+        for match in _MONTH_FILTER_RE.finditer(query_lower)
+    ]
+    if months:
+        modifiers["month"] = min(months)
 
     # Best/Worst N (Phase 5.3)
     # Examples: "worst 5 performances", "bottom 10 teams"
-    worst_match = re.search(r"(?:worst|bottom)\s+(\d+)", query_lower)
+    worst_match = _WORST_N_RE.search(query_lower)
     if worst_match:
         modifiers["worst_n"] = int(worst_match.group(1))
         modifiers["sort_order"] = "ascending"  # For worst/bottom queries
 
     # Statistical filters (Phase 5.1: Audit Improvements)
     # Detect queries like "games with 30+ points" or "shot above 50%"
-    stat_filters = extract_stat_filters(query)
+    stat_filters = extract_stat_filters(analysis)
     if stat_filters:
         modifiers["stat_filters"] = stat_filters
 
@@ -1354,12 +1555,15 @@ async def parse_query(query: str) -> ParsedQuery:
     """
     logger.info(f"Parsing query: '{query}'")
 
+    # Step 0: Lowercase, tokenize and phrase-scan once for all extractors
+    analysis = analyze_query(query)
+
     # Step 1: Classify intent
-    intent = classify_intent(query)
+    intent = classify_intent(analysis)
     logger.debug(f"Classified intent: {intent}")
 
     # Step 2: Extract entities
-    entities = await extract_entities(query)
+    entities = await extract_entities(analysis)
     logger.debug(f"Extracted {len(entities)} entities: {[e['name'] for e in entities]}")
 
     # Refine intent based on entity count
@@ -1375,15 +1579,15 @@ async def parse_query(query: str) -> ParsedQuery:
         logger.debug(f"Refined intent to '{intent}' based on entity type")
 
     # Step 3: Extract stat types
-    stat_types = extract_stat_types(query)
+    stat_types = extract_stat_types(analysis)
     logger.debug(f"Extracted stat types: {stat_types}")
 
     # Step 4: Parse time range
-    time_range = parse_time_range(query)
+    time_range = parse_time_range(analysis)
     logger.debug(f"Parsed time range: {time_range}")
 
     # Step 5: Extract modifiers
-    modifiers = extract_modifiers(query)
+    modifiers = extract_modifiers(analysis)
     logger.debug(f"Extracted modifiers: {modifiers}")
 
     # Step 6: Calculate confidence
@@ -2,13 +2,19 @@
 """
 Complete NLQ Pipeline Interface.
 
-Provides a simple async function to answer NBA questions in natural language.
+Provides a simple async function to answer NBA questions in natural language,
+a streaming variant that re-synthesizes as tool results arrive, and batch helpers.
 """
 
+import asyncio
+import dataclasses
 import logging
-from typing import Optional
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
-from .executor import execute_plan
+from .answer_cache import CacheEntry, NLQCache, canonical_query_key, get_nlq_cache
+from .executor import build_execution_result, execute_plan, execute_plans, iter_plan_results
 from .parser import parse_query, validate_parsed_query
 from .planner import plan_query_execution
 from .synthesizer import SynthesizedResponse, synthesize_response
@@ -16,12 +22,103 @@ from .synthesizer import SynthesizedResponse, synthesize_response
 logger = logging.getLogger(__name__)
 
 
+def _metrics_manager():
+    """The Prometheus metrics manager, or None if metrics are not initialized."""
+    try:
+        from nba_mcp.observability.metrics import get_metrics_manager
+
+        return get_metrics_manager()
+    except Exception:
+        return None
+
+
+def _record_stages(stage_seconds: dict, cache_status: Optional[str] = None):
+    """Record stage durations (or, for hits, the time saved) if metrics are on."""
+    metrics = _metrics_manager()
+    if metrics is None:
+        return
+    for stage, duration in stage_seconds.items():
+        metrics.record_nlq_stage(stage, duration, cache_status)
+
+
+def _question_execute_seconds(result) -> float:
+    """
+    One question's share of a batch execution, for the answer cache.
+
+    The batch's wall time covers every question, so each cached answer
+    keeps only the longest of its own tool calls: a lower bound on what
+    running it alone would take, and never more than the batch itself.
+    """
+    durations = [r.execution_time_ms for r in result.tool_results.values()]
+    return max(durations, default=0.0) / 1000
+
+
+def _validation_error(query: str, validation) -> str:
+    """Error message for a query that failed parse validation."""
+    error_msg = f"Unable to understand query: '{query}'.\n\n"
+    error_msg += "**Errors:**\n"
+    for error in validation.errors:
+        error_msg += f"- {error}\n"
+    if validation.hints:
+        error_msg += "\n**Suggestions:**\n"
+        for hint in validation.hints:
+            error_msg += f"- {hint}\n"
+    logger.warning(f"Validation failed: {validation.errors}")
+    return error_msg
+
+
+def _cached_response(entry: CacheEntry, query: str) -> SynthesizedResponse:
+    """A cached answer re-addressed to this wording of the question."""
+    _record_stages(entry.stage_seconds, "hit")
+    cached = entry.value
+    return dataclasses.replace(
+        cached,
+        raw_query=query,
+        metadata={
+            **cached.metadata,
+            "cache": {"status": "hit", "age_seconds": round(entry.age_seconds, 1)},
+        },
+    )
+
+
+async def _plan_with_cache(
+    parsed, cache: Optional[NLQCache], cache_key: Optional[str]
+) -> Tuple[Any, float]:
+    """Plan a parsed query, reusing the cached plan when there is one."""
+    cached_plan = cache.get_plan(cache_key) if cache else None
+    if cached_plan is not None:
+        _record_stages(cached_plan.stage_seconds, "hit")
+        return cached_plan.value, cached_plan.stage_seconds["plan"]
+
+    stage_start = time.perf_counter()
+    plan = await plan_query_execution(parsed)
+    plan_seconds = time.perf_counter() - stage_start
+    _record_stages({"plan": plan_seconds}, "miss" if cache else None)
+    if cache:
+        cache.set_plan(cache_key, plan, plan_seconds)
+    return plan, plan_seconds
+
+
+def _error_response(query: str, intent: str, message: str) -> SynthesizedResponse:
+    """An error message wrapped as a zero-confidence response."""
+    return SynthesizedResponse(
+        raw_query=query,
+        intent=intent,
+        answer=message,
+        confidence=0.0,
+        sources=[],
+        metadata={"error": True},
+    )
+
+
 # ============================================================================
 # MAIN PIPELINE
 # ============================================================================
 
 
-async def answer_nba_question(query: str, return_metadata: bool = False) -> str:
+async def answer_nba_question(
+    query: str, return_metadata: bool = False, use_cache: bool = True
+) -> str:
     """
     Answer a natural language question about NBA data.
 
@@ -31,9 +128,14 @@ async def answer_nba_question(query: str, return_metadata: bool = False) -> str:
     3. Executing tools (with parallelization)
     4. Synthesizing a formatted response
 
+    Questions that parse to the same canonical query share a cached plan and,
+    while the underlying data is fresh (see answer_cache), a cached answer;
+    an answer hit skips planning, execution and synthesis.
+
     Args:
         query: Natural language question (e.g., "Who leads the NBA in assists?")
         return_metadata: If True, return full response with metadata. If False, return just the answer.
+        use_cache: If False, bypass the plan/answer cache
 
     Returns:
         Formatted answer string (markdown) or full response dict if return_metadata=True
@@ -52,7 +154,9 @@ async def answer_nba_question(query: str, return_metadata: bool = False) -> str:
 
     try:
         # Step 1: Parse
+        stage_start = time.perf_counter()
         parsed = await parse_query(query)
+        _record_stages({"parse": time.perf_counter() - stage_start})
         logger.debug(
             f"Parsed: intent={parsed.intent}, confidence={parsed.confidence:.2f}"
         )
@@ -60,35 +164,51 @@ async def answer_nba_question(query: str, return_metadata: bool = False) -> str:
         # Validate parse quality (Phase 2.5: Enhanced validation with hints)
         validation = validate_parsed_query(parsed)
         if not validation.valid:
-            error_msg = f"Unable to understand query: '{query}'.\n\n"
-            error_msg += "**Errors:**\n"
-            for error in validation.errors:
-                error_msg += f"- {error}\n"
-            if validation.hints:
-                error_msg += "\n**Suggestions:**\n"
-                for hint in validation.hints:
-                    error_msg += f"- {hint}\n"
-            logger.warning(f"Validation failed: {validation.errors}")
-            return error_msg
+            return _validation_error(query, validation)
+
+        cache = get_nlq_cache() if use_cache else None
+        cache_key = canonical_query_key(parsed) if use_cache else None
+        stage_seconds = {}
+
+        cached_answer = cache.get_answer(cache_key) if cache else None
+        if cached_answer is not None:
+            response = _cached_response(cached_answer, query)
+            logger.info(f"NLQ answer cache hit: {cache_key}")
+            return response.to_dict() if return_metadata else response.answer
 
         # Step 2: Plan
-        plan = await plan_query_execution(parsed)
+        plan, stage_seconds["plan"] = await _plan_with_cache(parsed, cache, cache_key)
         logger.debug(
             f"Plan: {len(plan.tool_calls)} tools, template={plan.template_used}"
         )
 
         # Step 3: Execute
+        stage_start = time.perf_counter()
         result = await execute_plan(plan)
+        stage_seconds["execute"] = time.perf_counter() - stage_start
         logger.debug(
             f"Execution: {result.total_time_ms:.1f}ms, success={result.all_success}"
         )
 
         # Step 4: Synthesize
+        stage_start = time.perf_counter()
         response = await synthesize_response(parsed, result)
+        stage_seconds["synthesize"] = time.perf_counter() - stage_start
         logger.info(
             f"Completed: {len(response.answer)} chars, confidence={response.confidence:.2f}"
         )
 
+        cache_status = "miss" if cache else None
+        _record_stages(
+            {stage: stage_seconds[stage] for stage in ("execute", "synthesize")}, cache_status
+        )
+        if cache and result.all_success:
+            ttl = cache.set_answer(cache_key, response, plan, stage_seconds)
+            response = dataclasses.replace(
+                response,
+                metadata={**response.metadata, "cache": {"status": "miss", "ttl_seconds": ttl}},
+            )
+
         # Return answer or full response
         if return_metadata:
             return response.to_dict()
@@ -106,14 +226,217 @@ async def answer_nba_question(query: str, return_metadata: bool = False) -> str:
         return error_msg
 
 
+# ============================================================================
+# STREAMING
+# ============================================================================
+
+
+async def stream_nba_answer(
+    query: str, use_cache: bool = True
+) -> AsyncIterator[SynthesizedResponse]:
+    """
+    Answer a question progressively, re-synthesizing as tool results arrive.
+
+    While tool calls are still running, each completed result yields a partial
+    response (metadata: partial=True, completed, total); the last response is
+    the complete answer. Cached answers and errors are yielded once.
+
+    Args:
+        query: Natural language question
+        use_cache: If False, bypass the answer cache
+
+    Yields:
+        SynthesizedResponse objects, most complete last
+
+    Example:
+        async for response in stream_nba_answer("Compare LeBron and Durant over the last 3 seasons"):
+            render(response.answer)
+    """
+    intent = "unknown"
+    try:
+        parsed = await parse_query(query)
+        intent = parsed.intent
+        validation = validate_parsed_query(parsed)
+        if not validation.valid:
+            yield _error_response(query, intent, _validation_error(query, validation))
+            return
+
+        cache = get_nlq_cache() if use_cache else None
+        cache_key = canonical_query_key(parsed) if use_cache else None
+        cached_answer = cache.get_answer(cache_key) if cache else None
+        if cached_answer is not None:
+            yield _cached_response(cached_answer, query)
+            return
+
+        plan = await plan_query_execution(parsed)
+        total = len(plan.tool_calls)
+        start_time = time.time()
+        completed = {}
+        async for key, tool_result in iter_plan_results(plan):
+            completed[key] = tool_result
+            if len(completed) < total:
+                partial = await synthesize_response(
+                    parsed, build_execution_result(plan, completed, start_time)
+                )
+                partial.metadata.update(partial=True, completed=len(completed), total=total)
+                yield partial
+
+        result = build_execution_result(plan, completed, start_time)
+        response = await synthesize_response(parsed, result)
+        response.metadata.update(partial=False, completed=total, total=total)
+        if cache and result.all_success:
+            cache.set_answer(cache_key, response, plan, {"execute": result.total_time_ms / 1000})
+        yield response
+
+    except ValueError as e:
+        logger.error(f"Error processing query: {str(e)}", exc_info=True)
+        yield _error_response(query, intent, f"Error processing query: {str(e)}")
+
+    except Exception as e:
+        logger.exception("Unexpected error in streaming NLQ pipeline")
+        yield _error_response(query, intent, f"Unexpected error: {type(e).__name__}: {str(e)}")
+
+
 # ============================================================================
 # BATCH PROCESSING
 # ============================================================================
 
 
+@dataclass
+class BatchAnswers:
+    """Answers to a batch of questions and the upstream calls sharing saved."""
+
+    answers: List[Any]  # Answer strings (or response dicts), same order as the questions
+    cache_hits: int  # Questions answered from the answer cache
+    calls_planned: int  # Tool calls the uncached questions' plans asked for
+    calls_executed: int  # Distinct tool calls actually run
+    total_time_ms: float = 0.0
+
+    @property
+    def calls_saved(self) -> int:
+        return self.calls_planned - self.calls_executed
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "answers": self.answers,
+            "cache_hits": self.cache_hits,
+            "calls_planned": self.calls_planned,
+            "calls_executed": self.calls_executed,
+            "calls_saved": self.calls_saved,
+            "total_time_ms": self.total_time_ms,
+        }
+
+
+async def answer_nba_questions_batch(
+    queries: List[str],
+    return_metadata: bool = False,
+    max_concurrency: Optional[int] = None,
+    use_cache: bool = True,
+) -> BatchAnswers:
+    """
+    Answer many questions with one shared, de-duplicated set of tool calls.
+
+    All questions are parsed and planned first; their plans are merged so
+    each distinct tool call (same tool, same params) runs once with bounded
+    concurrency, and every question's synthesizer gets its own results.
+    Twenty questions about one season fetch its standings once, not twenty
+    times. Cached answers are served without planning.
+
+    Args:
+        queries: Natural language questions
+        return_metadata: If True, answers are full response dicts
+        max_concurrency: Extra cap on running tools for this call (the
+            process-wide MAX_CONCURRENT_TOOLS always applies)
+        use_cache: If False, bypass the plan/answer cache
+
+    Returns:
+        BatchAnswers (answers in question order, plus call counts)
+    """
+    start_time = time.time()
+    cache = get_nlq_cache() if use_cache else None
+    answers: List[Any] = [None] * len(queries)
+    cache_hits = 0
+
+    def error(i: int, message: str) -> Any:
+        return _error_response(queries[i], "unknown", message).to_dict() if return_metadata else message
+
+    # Step 1: Parse everything; answer invalid and cached questions right away
+    parsed_all = await asyncio.gather(*(parse_query(q) for q in queries), return_exceptions=True)
+    pending = []  # (index, parsed, cache_key)
+    for i, (query, parsed) in enumerate(zip(queries, parsed_all)):
+        if isinstance(parsed, Exception):
+            answers[i] = error(i, f"Error processing query: {str(parsed)}")
+            continue
+        validation = validate_parsed_query(parsed)
+        if not validation.valid:
+            answers[i] = error(i, _validation_error(query, validation))
+            continue
+        cache_key = canonical_query_key(parsed) if cache else None
+        cached_answer = cache.get_answer(cache_key) if cache else None
+        if cached_answer is not None:
+            response = _cached_response(cached_answer, query)
+            answers[i] = response.to_dict() if return_metadata else response.answer
+            cache_hits += 1
+            continue
+        pending.append((i, parsed, cache_key))
+
+    # Step 2: Plan the rest
+    planned = await asyncio.gather(
+        *(_plan_with_cache(parsed, cache, cache_key) for _, parsed, cache_key in pending),
+        return_exceptions=True,
+    )
+    to_run = []  # (index, parsed, cache_key, plan, plan_seconds)
+    for (i, parsed, cache_key), outcome in zip(pending, planned):
+        if isinstance(outcome, Exception):
+            answers[i] = error(i, f"Error processing query: {str(outcome)}")
+        else:
+            to_run.append((i, parsed, cache_key, *outcome))
+
+    # Step 3: Execute all plans as one, then synthesize each question
+    batch = await execute_plans([plan for _, _, _, plan, _ in to_run], max_concurrency)
+    # The batch ran once, so its wall time is recorded once, not per question
+    _record_stages({"execute": batch.total_time_ms / 1000}, "miss" if cache else None)
+
+    async def synthesize(item, result):
+        i, parsed, cache_key, plan, plan_seconds = item
+        stage_start = time.perf_counter()
+        response = await synthesize_response(parsed, result)
+        stage_seconds = {
+            "plan": plan_seconds,
+            "execute": _question_execute_seconds(result),
+            "synthesize": time.perf_counter() - stage_start,
+        }
+        _record_stages({"synthesize": stage_seconds["synthesize"]}, "miss" if cache else None)
+        if cache and result.all_success:
+            cache.set_answer(cache_key, response, plan, stage_seconds)
+        answers[i] = response.to_dict() if return_metadata else response.answer
+
+    outcomes = await asyncio.gather(
+        *(synthesize(item, result) for item, result in zip(to_run, batch.results)),
+        return_exceptions=True,
+    )
+    for (i, *_), outcome in zip(to_run, outcomes):
+        if isinstance(outcome, Exception):
+            answers[i] = error(i, f"Unexpected error: {type(outcome).__name__}: {str(outcome)}")
+
+    report = BatchAnswers(
+        answers=answers,
+        cache_hits=cache_hits,
+        calls_planned=batch.calls_planned,
+        calls_executed=batch.calls_executed,
+        total_time_ms=(time.time() - start_time) * 1000,
+    )
+    logger.info(
+        f"Batch of {len(queries)} questions: {report.cache_hits} cached, "
+        f"{report.calls_planned} tool calls planned, {report.calls_executed} executed "
+        f"({report.calls_saved} saved), {report.total_time_ms:.1f}ms"
+    )
+    return report
+
+
 async def answer_nba_questions(queries: list[str]) -> list[str]:
     """
-    Answer multiple NBA questions in parallel.
+    Answer multiple NBA questions, sharing tool calls between them.
 
     Args:
         queries: List of natural language questions
@@ -121,10 +444,8 @@ async def answer_nba_questions(queries: list[str]) -> list[str]:
     Returns:
         List of formatted answers (same order as queries)
     """
-    import asyncio
-
-    tasks = [answer_nba_question(q) for q in queries]
-    return await asyncio.gather(*tasks, return_exceptions=True)
+    batch = await answer_nba_questions_batch(queries)
+    return batch.answers
 
 
 # ============================================================================
@@ -147,6 +468,7 @@ def get_pipeline_status() -> dict:
     llm_config = get_llm_config()
 
     return {
+        "cache": get_nlq_cache().get_stats(),
         "status": "ready",
         "tools": get_registry_info(),
         "supported_intents": [
@@ -122,8 +122,8 @@ class ToolCall:
 
     tool_name: str
     params: Dict[str, Any]
-    depends_on: Optional[List[str]] = None  # Tool names this depends on
-    parallel_group: int = 0  # Tools with same group can run in parallel
+    depends_on: Optional[List[str]] = None  # Tool names this depends on (scheduling edges)
+    parallel_group: int = 0  # Result order; calls without depends_on all run concurrently
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -279,11 +279,12 @@ def format_leaders_table(leaders_data: List[Dict[str, Any]], stat_name: str) ->
         Formatted table as string
     """
     headers = ["Rank", "Player", stat_name]
+    value_format = ".3f" if stat_name.upper().endswith("_PCT") else ".1f"
 
     rows = []
     for i, entry in enumerate(leaders_data, 1):
         rows.append(
-            [i, entry.get("player", "Unknown"), f"{entry.get('value', 0.0):.1f}"]
+            [i, entry.get("player", "Unknown"), format(entry.get("value", 0.0), value_format)]
         )
 
     return tabulate(rows, headers=headers, tablefmt="pipe")
@@ -768,7 +769,9 @@ def _build_game_context_narrative(data: dict, parsed: ParsedQuery) -> str:
 
 
 def synthesize_rankings_query(
-    parsed: ParsedQuery, execution_result: ExecutionResult
+    parsed: ParsedQuery,
+    execution_result: ExecutionResult,
+    season_rankings: Optional[str] = None,
 ) -> str:
     """
     Synthesize response for rankings query.
@@ -780,6 +783,8 @@ def synthesize_rankings_query(
     Args:
         parsed: Parsed query
         execution_result: Tool execution results
+        season_rankings: Rankings table built from the season stats table,
+            used when the leaders tool gave nothing usable
 
     Returns:
         Formatted rankings table as markdown string
@@ -787,14 +792,53 @@ def synthesize_rankings_query(
     leaders_result = execution_result.tool_results.get("get_league_leaders_info")
 
     if not leaders_result or not leaders_result.success:
-        return "Unable to retrieve rankings at this time."
+        return season_rankings or "Unable to retrieve rankings at this time."
 
     # get_league_leaders_info returns pre-formatted markdown string
     if isinstance(leaders_result.data, str):
         return leaders_result.data
 
     # Fallback: structured data handling
-    return "Rankings data retrieved but formatting is unavailable."
+    return season_rankings or "Rankings data retrieved but formatting is unavailable."
+
+
+async def rank_from_season_stats(parsed: ParsedQuery) -> Optional[str]:
+    """
+    Rankings table from the materialized season stats (one league-wide build).
+
+    Returns None when the query can't be answered from it (no season, a
+    conference filter, an unrankable stat) or the table is unavailable.
+    """
+    from nba_mcp.api.season_aggregator import get_season_stats_store, rank_season_table
+
+    from .planner import _extract_season_type
+
+    season = parsed.time_range.season if parsed.time_range else None
+    if not season or parsed.modifiers.get("conference"):
+        return None
+
+    stat = parsed.stat_types[0] if parsed.stat_types else "PTS"
+    worst_n = parsed.modifiers.get("worst_n")
+
+    try:
+        table = await get_season_stats_store().get_table(
+            season, season_type=_extract_season_type(parsed.modifiers)
+        )
+        entries = rank_season_table(
+            table,
+            stat,
+            top_n=worst_n or parsed.modifiers.get("top_n", 25),
+            per_game=parsed.modifiers.get("normalization", "per_game") != "totals",
+            min_games=parsed.modifiers.get("min_games") or 0,
+            ascending=bool(worst_n),
+        )
+    except Exception as e:
+        logger.warning(f"Season stats rankings unavailable for {stat} ({season}): {e}")
+        return None
+
+    if not entries:
+        return None
+    return format_leaders_table(entries, stat)
 
 
 def synthesize_streaks_query(
@@ -1402,7 +1446,11 @@ async def synthesize_response(
         answer = synthesize_game_context_query(parsed, execution_result)
     # Phase 2.2: New intent types (2025-11-01)
     elif parsed.intent == "rankings":
-        answer = synthesize_rankings_query(parsed, execution_result)
+        leaders_result = execution_result.tool_results.get("get_league_leaders_info")
+        season_rankings = None
+        if not (leaders_result and leaders_result.success and isinstance(leaders_result.data, str)):
+            season_rankings = await rank_from_season_stats(parsed)
+        answer = synthesize_rankings_query(parsed, execution_result, season_rankings)
     elif parsed.intent == "streaks":
         answer = synthesize_streaks_query(parsed, execution_result)
     elif parsed.intent == "milestones":
@@ -9,8 +9,17 @@ from nba_mcp.observability.metrics import (  # Prometheus metrics
     CACHE_OPERATIONS,
     CACHE_SIZE,
     ERROR_COUNT,
+    MEMORY_CACHE_BYTES,
+    MEMORY_CACHE_EVICTIONS,
+    MEMORY_CACHE_HITS,
+    MEMORY_CACHE_MAX_BYTES,
+    REDIS_AVAILABLE,
+    REDIS_CIRCUIT_TRIPS,
+    MEMORY_CACHE_MISSES,
     NLQ_PIPELINE_STAGE_DURATION,
     NLQ_PIPELINE_TOOL_CALLS,
+    NLQ_STAGE_CACHE_LOOKUPS,
+    NLQ_STAGE_SAVED_SECONDS,
     QUOTA_REMAINING,
     QUOTA_USAGE,
     RATE_LIMIT_EVENTS,
@@ -19,6 +28,10 @@ from nba_mcp.observability.metrics import (  # Prometheus metrics
     SERVER_INFO,
     SERVER_START_TIME,
     TOKEN_BUCKET_TOKENS,
+    UPSTREAM_DEADLINE_EXCEEDED,
+    UPSTREAM_QUEUE_DEPTH,
+    UPSTREAM_TOKENS,
+    UPSTREAM_WAIT_SECONDS,
     MetricsManager,
     get_metrics_manager,
     get_metrics_snapshot,
@@ -55,12 +68,25 @@ __all__ = [
     "CACHE_OPERATIONS",
     "CACHE_HIT_RATE",
     "CACHE_SIZE",
+    "MEMORY_CACHE_HITS",
+    "MEMORY_CACHE_MISSES",
+    "MEMORY_CACHE_EVICTIONS",
+    "MEMORY_CACHE_BYTES",
+    "MEMORY_CACHE_MAX_BYTES",
+    "REDIS_AVAILABLE",
+    "REDIS_CIRCUIT_TRIPS",
     "RATE_LIMIT_EVENTS",
     "QUOTA_USAGE",
     "QUOTA_REMAINING",
     "TOKEN_BUCKET_TOKENS",
+    "UPSTREAM_QUEUE_DEPTH",
+    "UPSTREAM_WAIT_SECONDS",
+    "UPSTREAM_DEADLINE_EXCEEDED",
+    "UPSTREAM_TOKENS",
     "NLQ_PIPELINE_STAGE_DURATION",
     "NLQ_PIPELINE_TOOL_CALLS",
+    "NLQ_STAGE_CACHE_LOOKUPS",
+    "NLQ_STAGE_SAVED_SECONDS",
     "SERVER_INFO",
     "SERVER_START_TIME",
     # Tracing Manager
@@ -5,7 +5,10 @@ This module provides comprehensive metrics tracking for:
 - Request counts and durations per tool
 - Error rates by type
 - Cache hit/miss rates
+- In-memory cache bytes, evictions and expirations
 - Rate limit events
+- Upstream (per-host) limiter queue depth and wait times
+- NLQ stage durations, plan/answer cache hit rates and time saved
 - Quota usage
 
 Metrics are exposed at /metrics endpoint for Prometheus scraping.
@@ -14,7 +17,7 @@ Metrics are exposed at /metrics endpoint for Prometheus scraping.
 import functools
 import logging
 import time
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from prometheus_client import (
     CONTENT_TYPE_LATEST,
@@ -66,6 +69,37 @@ CACHE_HIT_RATE = Gauge("nba_mcp_cache_hit_rate", "Current cache hit rate (0-1)")
 
 CACHE_SIZE = Gauge("nba_mcp_cache_size_items", "Number of items in cache")
 
+REDIS_AVAILABLE = Gauge(
+    "nba_mcp_redis_available", "1 if the Redis circuit is closed, 0 if using fallback"
+)
+
+REDIS_CIRCUIT_TRIPS = Counter(
+    "nba_mcp_redis_circuit_trips_total", "Times the Redis circuit breaker opened"
+)
+
+# In-memory (LRU) cache metrics, per cache instance
+MEMORY_CACHE_HITS = Counter(
+    "nba_mcp_memory_cache_hits_total", "In-memory cache hits", ["cache"]
+)
+
+MEMORY_CACHE_MISSES = Counter(
+    "nba_mcp_memory_cache_misses_total", "In-memory cache misses", ["cache"]
+)
+
+MEMORY_CACHE_EVICTIONS = Counter(
+    "nba_mcp_memory_cache_evictions_total",
+    "In-memory cache removals",
+    ["cache", "reason"],  # reason: size, expired
+)
+
+MEMORY_CACHE_BYTES = Gauge(
+    "nba_mcp_memory_cache_bytes", "Estimated bytes held by in-memory cache", ["cache"]
+)
+
+MEMORY_CACHE_MAX_BYTES = Gauge(
+    "nba_mcp_memory_cache_max_bytes", "Byte budget of in-memory cache", ["cache"]
+)
+
 # Rate limiting metrics
 RATE_LIMIT_EVENTS = Counter(
     "nba_mcp_rate_limit_events_total",
@@ -86,6 +120,30 @@ TOKEN_BUCKET_TOKENS = Gauge(
     "nba_mcp_token_bucket_tokens", "Available tokens in bucket", ["tool_name"]
 )
 
+# Upstream host limiter metrics
+UPSTREAM_QUEUE_DEPTH = Gauge(
+    "nba_mcp_upstream_queue_depth",
+    "Requests waiting for an upstream host token",
+    ["host", "priority"],  # priority: interactive, background
+)
+
+UPSTREAM_WAIT_SECONDS = Histogram(
+    "nba_mcp_upstream_wait_seconds",
+    "Time requests waited for an upstream host token",
+    ["host", "priority"],
+    buckets=(0.0, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+UPSTREAM_DEADLINE_EXCEEDED = Counter(
+    "nba_mcp_upstream_deadline_exceeded_total",
+    "Requests that could not get an upstream host token before their deadline",
+    ["host", "priority"],
+)
+
+UPSTREAM_TOKENS = Gauge(
+    "nba_mcp_upstream_tokens", "Available tokens in an upstream host bucket", ["host"]
+)
+
 # NLQ Pipeline metrics
 NLQ_PIPELINE_STAGE_DURATION = Histogram(
     "nba_mcp_nlq_stage_duration_seconds",
@@ -100,6 +158,18 @@ NLQ_PIPELINE_TOOL_CALLS = Counter(
     ["query_intent"],  # intent: leaders, comparison, stats, etc.
 )
 
+NLQ_STAGE_CACHE_LOOKUPS = Counter(
+    "nba_mcp_nlq_stage_cache_total",
+    "NLQ stage cache lookups",
+    ["stage", "result"],  # result: hit, miss
+)
+
+NLQ_STAGE_SAVED_SECONDS = Counter(
+    "nba_mcp_nlq_stage_saved_seconds_total",
+    "NLQ stage time skipped by cache hits (duration of the cached run)",
+    ["stage"],
+)
+
 # System info
 SERVER_INFO = Info("nba_mcp_server", "NBA MCP server information")
 
@@ -109,6 +179,26 @@ SERVER_START_TIME = Gauge(
 )
 
 
+# Last cumulative total published per (counter, labels), see _advance_counter
+_counter_totals: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = {}
+
+
+def _advance_counter(counter: Counter, total: float, **labels: str):
+    """
+    Bring a Counter up to a cumulative total read from a stats dict.
+
+    Stats report running totals, so only the increase since the last update
+    is added. A total below the last one means the source was recreated;
+    its new total is then counted from zero.
+    """
+    key = (counter._name, tuple(sorted(labels.items())))
+    last = _counter_totals.get(key, 0)
+    increase = total - last if total >= last else total
+    _counter_totals[key] = total
+    if increase > 0:
+        (counter.labels(**labels) if labels else counter).inc(increase)
+
+
 # ============================================================================
 # METRICS MANAGER
 # ============================================================================
@@ -182,6 +272,35 @@ class MetricsManager:
             CACHE_HIT_RATE.set(stats["hit_rate"])
         if "stored_items" in stats:
             CACHE_SIZE.set(stats["stored_items"])
+        if "redis_available" in stats:
+            REDIS_AVAILABLE.set(1 if stats["redis_available"] else 0)
+        if "circuit" in stats:
+            _advance_counter(REDIS_CIRCUIT_TRIPS, stats["circuit"].get("trips", 0))
+
+    def update_memory_cache_stats(self, cache_name: str, stats: Dict[str, Any]):
+        """
+        Update in-memory cache metrics from LRUCache.get_stats().
+
+        Args:
+            cache_name: Label for the cache instance (e.g., "redis_fallback")
+            stats: LRUCache statistics dict
+        """
+        _advance_counter(MEMORY_CACHE_HITS, stats.get("hits", 0), cache=cache_name)
+        _advance_counter(MEMORY_CACHE_MISSES, stats.get("misses", 0), cache=cache_name)
+        _advance_counter(
+            MEMORY_CACHE_EVICTIONS,
+            stats.get("evictions", 0),
+            cache=cache_name,
+            reason="size",
+        )
+        _advance_counter(
+            MEMORY_CACHE_EVICTIONS,
+            stats.get("expirations", 0),
+            cache=cache_name,
+            reason="expired",
+        )
+        MEMORY_CACHE_BYTES.labels(cache=cache_name).set(stats.get("bytes", 0))
+        MEMORY_CACHE_MAX_BYTES.labels(cache=cache_name).set(stats.get("max_bytes", 0))
 
     # ────────────────────────────────────────────────────────────────────
     # Rate Limit Metrics
@@ -218,19 +337,66 @@ class MetricsManager:
         """
         TOKEN_BUCKET_TOKENS.labels(tool_name=tool_name).set(tokens)
 
+    def record_upstream_wait(self, host: str, priority: str, seconds: float):
+        """
+        Record how long a request waited for an upstream host token.
+
+        Args:
+            host: Upstream host (e.g., stats.nba.com)
+            priority: Priority lane (interactive, background)
+            seconds: Time spent queued
+        """
+        UPSTREAM_WAIT_SECONDS.labels(host=host, priority=priority).observe(seconds)
+
+    def update_upstream_queue_depth(self, host: str, priority: str, depth: int):
+        """
+        Update the number of requests queued for an upstream host.
+
+        Args:
+            host: Upstream host
+            priority: Priority lane
+            depth: Requests currently waiting
+        """
+        UPSTREAM_QUEUE_DEPTH.labels(host=host, priority=priority).set(depth)
+
+    def record_upstream_deadline_exceeded(self, host: str, priority: str):
+        """Record a request that gave up waiting for an upstream host token."""
+        UPSTREAM_DEADLINE_EXCEEDED.labels(host=host, priority=priority).inc()
+
+    def update_upstream_limiter(self, stats: Dict[str, Any]):
+        """
+        Update upstream gauges from HostRateLimiter.get_stats().
+
+        Args:
+            stats: host -> bucket statistics
+        """
+        for host, bucket in stats.items():
+            UPSTREAM_TOKENS.labels(host=host).set(bucket.get("tokens", 0))
+            for priority, depth in bucket.get("queue_depth", {}).items():
+                UPSTREAM_QUEUE_DEPTH.labels(host=host, priority=priority).set(depth)
+
     # ────────────────────────────────────────────────────────────────────
     # NLQ Pipeline Metrics
     # ────────────────────────────────────────────────────────────────────
 
-    def record_nlq_stage(self, stage: str, duration: float):
+    def record_nlq_stage(
+        self, stage: str, duration: float, cache_status: Optional[str] = None
+    ):
         """
-        Record NLQ pipeline stage duration.
+        Record NLQ pipeline stage duration, or the time a cache hit saved.
 
         Args:
             stage: Pipeline stage (parse, plan, execute, synthesize)
-            duration: Stage duration in seconds
+            duration: Stage duration in seconds; for a cache hit, the duration
+                of the run that produced the cached entry
+            cache_status: "hit" or "miss" for cached stages (None = not cached)
         """
-        NLQ_PIPELINE_STAGE_DURATION.labels(stage=stage).observe(duration)
+        if cache_status is not None:
+            NLQ_STAGE_CACHE_LOOKUPS.labels(stage=stage, result=cache_status).inc()
+        if cache_status == "hit":
+            NLQ_STAGE_SAVED_SECONDS.labels(stage=stage).inc(duration)
+        else:
+            NLQ_PIPELINE_STAGE_DURATION.labels(stage=stage).observe(duration)
 
     def record_nlq_tool_calls(self, query_intent: str, num_calls: int):
         """
@@ -424,6 +590,14 @@ def update_infrastructure_metrics():
         except Exception as e:
             logger.debug(f"Could not update cache metrics: {e}")
 
+        # Update in-memory LRU cache metrics (sweeping expired entries first)
+        try:
+            for cache_name, lru in _memory_caches():
+                lru.sweep_expired()
+                metrics.update_memory_cache_stats(cache_name, lru.get_stats())
+        except Exception as e:
+            logger.debug(f"Could not update memory cache metrics: {e}")
+
         # Update rate limiter metrics
         try:
             from nba_mcp.rate_limit.token_bucket import get_rate_limiter
@@ -447,10 +621,40 @@ def update_infrastructure_metrics():
         except Exception as e:
             logger.debug(f"Could not update rate limiter metrics: {e}")
 
+        # Update upstream host limiter metrics
+        try:
+            from nba_mcp.rate_limit.host_limiter import get_host_limiter
+
+            metrics.update_upstream_limiter(get_host_limiter().get_stats())
+        except Exception as e:
+            logger.debug(f"Could not update upstream limiter metrics: {e}")
+
     except Exception as e:
         logger.warning(f"Failed to update infrastructure metrics: {e}")
 
 
+def _memory_caches():
+    """(label, LRUCache) pairs for the in-memory caches currently in use."""
+    caches = []
+
+    from nba_mcp.cache.redis_cache import get_cache
+
+    cache = get_cache()
+    if cache is not None:
+        caches.append(("redis_fallback", cache.fallback))
+
+    from nba_mcp.data import cache_integration
+
+    manager = cache_integration._cache_manager
+    if manager is not None:
+        if manager.cache_backend == "redis":
+            caches.append(("dataset_fallback", manager.redis_cache.fallback))
+        else:
+            caches.append(("dataset", manager.lru_cache))
+
+    return caches
+
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
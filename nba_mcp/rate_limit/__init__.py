@@ -2,9 +2,18 @@
 """
 Rate limiting for NBA MCP.
 
-Provides token bucket rate limiting to prevent NBA API quota exhaustion.
+Provides token bucket rate limiting to prevent NBA API quota exhaustion,
+and an asyncio limiter that paces requests per upstream host.
 """
 
+from .host_limiter import (
+    AsyncTokenBucket,
+    HostRateLimiter,
+    Priority,
+    get_host_limiter,
+    reset_host_limiter,
+    upstream_priority,
+)
 from .token_bucket import (
     QuotaTracker,
     RateLimiter,
@@ -21,4 +30,10 @@ __all__ = [
     "rate_limited",
     "initialize_rate_limiter",
     "get_rate_limiter",
+    "AsyncTokenBucket",
+    "HostRateLimiter",
+    "Priority",
+    "upstream_priority",
+    "get_host_limiter",
+    "reset_host_limiter",
 ]
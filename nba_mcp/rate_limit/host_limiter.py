@@ -0,0 +1,420 @@
+# nba_mcp/rate_limit/host_limiter.py
+"""
+Asyncio token bucket limiter keyed by upstream host.
+
+The real constraint is the upstream host (stats.nba.com throttles far earlier
+than cdn.nba.com), not the MCP tool that triggered the request. Instead of
+rejecting a request when its bucket is empty, acquire() waits for a token:
+
+- One bucket per host (capacity = burst, refill_rate = sustained req/s)
+- Waiters are served FIFO within a priority lane; interactive requests are
+  served before background work (prefetch, live polling)
+- A max-wait deadline: if the queue ahead cannot drain in time the request
+  fails fast with RateLimitError instead of hanging
+- Queue depth, wait times and deadline misses are exported to Prometheus
+
+Example:
+    limiter = get_host_limiter()
+    await limiter.acquire("stats.nba.com")
+    data = call_stats_api()
+
+    with upstream_priority(Priority.BACKGROUND):
+        await prefetch_next_chunk()
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any, Deque, Dict, Iterator, Optional, Tuple
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(IntEnum):
+    """Priority lanes; lower values are served first."""
+
+    INTERACTIVE = 0  # A user (or NLQ plan) is waiting for the answer
+    BACKGROUND = 1  # Prefetch, read-ahead and polling
+
+
+# Upstream hosts and their (capacity, refill_rate) = (burst, requests/second)
+STATS_HOST = "stats.nba.com"
+CDN_HOST = "cdn.nba.com"
+
+DEFAULT_HOST_LIMITS: Dict[str, Tuple[float, float]] = {
+    STATS_HOST: (5.0, 2.0),
+    CDN_HOST: (20.0, 10.0),
+}
+
+# Longest a request may queue before failing with RateLimitError
+DEFAULT_MAX_WAIT = 30.0
+
+_current_priority: ContextVar[Priority] = ContextVar(
+    "upstream_priority", default=Priority.INTERACTIVE
+)
+
+
+@contextmanager
+def upstream_priority(priority: Priority) -> Iterator[None]:
+    """
+    Run upstream requests in this context (and tasks created in it) at a priority.
+
+    Example:
+        with upstream_priority(Priority.BACKGROUND):
+            await fetch_endpoint("league_player_games", params)
+    """
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def current_priority() -> Priority:
+    """Priority of upstream requests made in the current context."""
+    return _current_priority.get()
+
+
+def host_of(host_or_url: str) -> str:
+    """Host name of a URL ("https://cdn.nba.com/static/..." -> "cdn.nba.com")."""
+    if "://" in host_or_url:
+        return (urlparse(host_or_url).hostname or "").lower()
+    return host_or_url.lower()
+
+
+def _metrics_manager():
+    """The Prometheus metrics manager, or None if metrics are not initialized."""
+    try:
+        from nba_mcp.observability.metrics import get_metrics_manager
+
+        return get_metrics_manager()
+    except Exception:
+        return None
+
+
+@dataclass
+class _Waiter:
+    future: asyncio.Future
+    tokens: float
+    enqueued_at: float
+
+
+class AsyncTokenBucket:
+    """
+    Token bucket whose acquire() waits instead of failing.
+
+    Waiters queue FIFO per priority lane. A single dispatcher task hands out
+    tokens to the head of the highest-priority non-empty lane as they refill,
+    so waiting costs one sleep per grant rather than one poll per waiter.
+    """
+
+    def __init__(self, capacity: float, refill_rate: float, name: str = ""):
+        """
+        Initialize bucket (full).
+
+        Args:
+            capacity: Max tokens (burst size)
+            refill_rate: Tokens added per second (sustained request rate)
+            name: Label for logs and metrics (the upstream host)
+        """
+        if capacity <= 0 or refill_rate <= 0:
+            raise ValueError("capacity and refill_rate must be positive")
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.name = name
+        self.tokens = capacity
+        self._last_refill = time.monotonic()
+
+        self._lanes: Dict[Priority, Deque[_Waiter]] = {p: deque() for p in Priority}
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.stats = {
+            "acquired": 0,
+            "queued": 0,
+            "deadline_exceeded": 0,
+            "total_wait_seconds": 0.0,
+            "max_wait_seconds": 0.0,
+        }
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self._last_refill) * self.refill_rate
+        )
+        self._last_refill = now
+
+    def _bind_loop(self) -> asyncio.AbstractEventLoop:
+        """Waiters belong to the running loop (dropped if the loop changes)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._lanes = {p: deque() for p in Priority}
+            self._dispatcher = None
+            self._loop = loop
+        return loop
+
+    def queue_depth(self, priority: Optional[Priority] = None) -> int:
+        """Number of waiting requests (in one lane, or all lanes)."""
+        lanes = [priority] if priority is not None else list(Priority)
+        return sum(
+            1 for p in lanes for waiter in self._lanes[p] if not waiter.future.done()
+        )
+
+    def estimate_wait(
+        self, tokens: float = 1, priority: Priority = Priority.INTERACTIVE
+    ) -> float:
+        """
+        Seconds until a new request at this priority would be served.
+
+        Counts the tokens queued ahead of it (same or higher priority lanes).
+        """
+        self._refill()
+        ahead = sum(
+            waiter.tokens
+            for p in Priority
+            if p <= priority
+            for waiter in self._lanes[p]
+            if not waiter.future.done()
+        )
+        return max(0.0, (ahead + tokens - self.tokens) / self.refill_rate)
+
+    async def acquire(
+        self,
+        tokens: float = 1,
+        priority: Priority = Priority.INTERACTIVE,
+        max_wait: Optional[float] = None,
+    ) -> float:
+        """
+        Take tokens, waiting in line if the bucket is empty.
+
+        Args:
+            tokens: Tokens to take (1 per request)
+            priority: Lane to wait in
+            max_wait: Deadline in seconds (None = wait as long as needed)
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            RateLimitError: If the request cannot be served within max_wait
+            ValueError: If tokens exceeds the bucket capacity
+        """
+        if tokens > self.capacity:
+            raise ValueError(
+                f"Cannot acquire {tokens} tokens from a bucket of {self.capacity}"
+            )
+
+        loop = self._bind_loop()
+        self._refill()
+        if self.tokens >= tokens and not any(
+            self._lanes[p] for p in Priority if p <= priority
+        ):
+            self.tokens -= tokens
+            self._record_grant(0.0, priority)
+            return 0.0
+
+        estimate = self.estimate_wait(tokens, priority)
+        if max_wait is not None and estimate > max_wait:
+            self._deadline_exceeded(priority, estimate)
+
+        waiter = _Waiter(loop.create_future(), tokens, time.monotonic())
+        self._lanes[priority].append(waiter)
+        self.stats["queued"] += 1
+        self._publish_queue_depth(priority)
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = loop.create_task(self._dispatch())
+
+        try:
+            if max_wait is None:
+                return await waiter.future
+            return await asyncio.wait_for(waiter.future, max_wait)
+        except asyncio.TimeoutError:
+            self._discard(waiter, priority)
+            self._deadline_exceeded(priority, self.estimate_wait(tokens, priority))
+        except BaseException:
+            self._discard(waiter, priority)
+            raise
+
+    def _discard(self, waiter: _Waiter, priority: Priority):
+        try:
+            self._lanes[priority].remove(waiter)
+        except ValueError:
+            pass
+        self._publish_queue_depth(priority)
+
+    def _head(self) -> Optional[Tuple[Priority, _Waiter]]:
+        """First live waiter of the highest-priority non-empty lane."""
+        for priority in Priority:
+            lane = self._lanes[priority]
+            while lane and lane[0].future.done():
+                lane.popleft()
+            if lane:
+                return priority, lane[0]
+        return None
+
+    async def _dispatch(self):
+        """Grant tokens to queued waiters in order until the queues are empty."""
+        while True:
+            head = self._head()
+            if head is None:
+                return
+            priority, waiter = head
+            self._refill()
+            if self.tokens < waiter.tokens:
+                await asyncio.sleep((waiter.tokens - self.tokens) / self.refill_rate)
+                continue
+
+            self.tokens -= waiter.tokens
+            self._lanes[priority].popleft()
+            waited = time.monotonic() - waiter.enqueued_at
+            waiter.future.set_result(waited)
+            self._record_grant(waited, priority)
+            self._publish_queue_depth(priority)
+
+    def _record_grant(self, waited: float, priority: Priority):
+        self.stats["acquired"] += 1
+        self.stats["total_wait_seconds"] += waited
+        self.stats["max_wait_seconds"] = max(self.stats["max_wait_seconds"], waited)
+        metrics = _metrics_manager()
+        if metrics is not None:
+            metrics.record_upstream_wait(self.name, priority.name.lower(), waited)
+
+    def _publish_queue_depth(self, priority: Priority):
+        metrics = _metrics_manager()
+        if metrics is not None:
+            metrics.update_upstream_queue_depth(
+                self.name, priority.name.lower(), self.queue_depth(priority)
+            )
+
+    def _deadline_exceeded(self, priority: Priority, estimate: float):
+        from ..api.errors import RateLimitError
+
+        self.stats["deadline_exceeded"] += 1
+        metrics = _metrics_manager()
+        if metrics is not None:
+            metrics.record_upstream_deadline_exceeded(self.name, priority.name.lower())
+        logger.warning(
+            f"Upstream queue for {self.name or 'bucket'} too long "
+            f"({priority.name.lower()}, ~{estimate:.1f}s wait)"
+        )
+        raise RateLimitError(retry_after=max(1, math.ceil(estimate)))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Bucket statistics (tokens, queue depth per lane, waits)."""
+        self._refill()
+        acquired = self.stats["acquired"]
+        return {
+            **self.stats,
+            "capacity": self.capacity,
+            "refill_rate": self.refill_rate,
+            "tokens": round(self.tokens, 3),
+            "queue_depth": {p.name.lower(): self.queue_depth(p) for p in Priority},
+            "avg_wait_seconds": (
+                self.stats["total_wait_seconds"] / acquired if acquired else 0.0
+            ),
+        }
+
+
+class HostRateLimiter:
+    """
+    Token buckets per upstream host.
+
+    Hosts without a configured limit are not paced.
+
+    Example:
+        limiter = HostRateLimiter()
+        waited = await limiter.acquire("https://stats.nba.com/stats/shotchartdetail")
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, Tuple[float, float]]] = None,
+        max_wait: Optional[float] = DEFAULT_MAX_WAIT,
+    ):
+        """
+        Initialize limiter.
+
+        Args:
+            limits: host -> (capacity, refill_rate); defaults to DEFAULT_HOST_LIMITS
+            max_wait: Default deadline for acquire() in seconds (None = no deadline)
+        """
+        self.max_wait = max_wait
+        self.buckets: Dict[str, AsyncTokenBucket] = {}
+        for host, (capacity, refill_rate) in (limits or DEFAULT_HOST_LIMITS).items():
+            self.set_limit(host, capacity, refill_rate)
+
+    def set_limit(self, host: str, capacity: float, refill_rate: float):
+        """
+        Set (or replace) the limit for a host.
+
+        Args:
+            host: Host name or URL
+            capacity: Burst size
+            refill_rate: Sustained requests per second
+        """
+        host = host_of(host)
+        self.buckets[host] = AsyncTokenBucket(capacity, refill_rate, name=host)
+        logger.info(f"Upstream limit: {host} ({capacity} burst, {refill_rate}/s)")
+
+    async def acquire(
+        self,
+        host_or_url: str,
+        tokens: float = 1,
+        priority: Optional[Priority] = None,
+        max_wait: Optional[float] = None,
+    ) -> float:
+        """
+        Wait for permission to send a request to a host.
+
+        Args:
+            host_or_url: Upstream host or request URL
+            tokens: Tokens to take (1 per request)
+            priority: Lane (defaults to the context's upstream_priority)
+            max_wait: Deadline in seconds (defaults to the limiter's max_wait)
+
+        Returns:
+            Seconds spent waiting (0 for hosts without a limit)
+
+        Raises:
+            RateLimitError: If the request cannot be served within max_wait
+        """
+        bucket = self.buckets.get(host_of(host_or_url))
+        if bucket is None:
+            return 0.0
+        return await bucket.acquire(
+            tokens,
+            priority=current_priority() if priority is None else priority,
+            max_wait=self.max_wait if max_wait is None else max_wait,
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-host bucket statistics."""
+        return {host: bucket.get_stats() for host, bucket in self.buckets.items()}
+
+
+# ============================================================================
+# GLOBAL HOST LIMITER
+# ============================================================================
+
+_host_limiter: Optional[HostRateLimiter] = None
+
+
+def get_host_limiter() -> HostRateLimiter:
+    """Get or create the global host limiter (DEFAULT_HOST_LIMITS)."""
+    global _host_limiter
+    if _host_limiter is None:
+        _host_limiter = HostRateLimiter()
+    return _host_limiter
+
+
+def reset_host_limiter():
+    """Reset the global host limiter (for testing)."""
+    global _host_limiter
+    _host_limiter = None
@@ -373,6 +373,12 @@ def initialize_rate_limiter() -> RateLimiter:
         "get_game_context", capacity=20, refill_rate=20 / 60
     )  # 20/min (4-6 API calls)
 
+    # Chunked dataset fetches (one bucket token per chunk request, see
+    # nba_mcp.data.pagination.RATE_LIMIT_KEY)
+    _rate_limiter.add_limit(
+        "fetch_chunked", capacity=30, refill_rate=30 / 60
+    )  # 30/min after a 30-chunk burst
+
     # Global daily quota (conservative to stay well under NBA API limits)
     _rate_limiter.set_global_quota(daily_limit=10000, warning_threshold=0.8)
 
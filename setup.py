@@ -26,6 +26,9 @@ setup(
         "rich>=10.14.0,<14",
         "duckdb>=0.9.0",
         "pyarrow>=14.0.0",
+        "zstandard>=0.22.0",
+        "orjson>=3.9.0",
+        "msgpack>=1.0.0",
     ],
     extras_require={
         "dev": [
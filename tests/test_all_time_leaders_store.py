@@ -0,0 +1,255 @@
+"""
+Tests for the pre-ranked all-time leaders store.
+
+Validates:
+1. One AllTimeLeadersGrids pull becomes per-stat tables sorted by rank
+2. Top-N, active-only and player-rank lookups are served from memory
+3. Concurrent lookups share one rebuild; failures serve the previous snapshot
+4. The snapshot persists across restarts and is rebuilt on a schedule
+5. get_all_time_leaders output and the all_time_leaders unified_fetch endpoint
+
+Run benchmark: pytest tests/test_all_time_leaders_store.py -m performance -s
+"""
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+import nba_mcp.data.fetch  # noqa: F401  (registers endpoints)
+from nba_mcp import nba_server
+from nba_mcp.api import all_time_leaders
+from nba_mcp.api.all_time_leaders import AllTimeLeadersStore, build_leaders_table
+from nba_mcp.api.errors import InvalidParameterError
+from nba_mcp.data.cache_integration import reset_cache_manager
+from nba_mcp.data.unified_fetch import unified_fetch
+
+PLAYERS = [
+    (2544, "LeBron James", "Y"),
+    (76003, "Kareem Abdul-Jabbar", "N"),
+    (977, "Kobe Bryant", "N"),
+    (893, "Michael Jordan", "N"),
+    (201142, "Kevin Durant", "Y"),
+]
+
+
+def leaderboard(stat, values, active=True):
+    """One AllTimeLeadersGrids frame in the order the API returns it (unsorted here)."""
+    rows = sorted(zip(PLAYERS, values), key=lambda row: -row[1])
+    frame = pd.DataFrame({
+        "PLAYER_ID": [p[0] for p, _ in rows],
+        "PLAYER_NAME": [p[1] for p, _ in rows],
+        stat: [v for _, v in rows],
+        f"{stat}_RANK": range(1, len(rows) + 1),
+    })
+    if active:
+        frame["IS_ACTIVE_FLAG"] = [p[2] for p, _ in rows]
+    return frame.iloc[::-1].reset_index(drop=True)
+
+
+def grids():
+    return [
+        leaderboard("GP", [1492, 1560, 1346, 1072, 1123]),
+        leaderboard("PTS", [41000, 38387, 33643, 32292, 30000]),
+        leaderboard("AST", [11000, 5660, 6306, 5633, 4900]),
+        leaderboard("FG_PCT", [0.505, 0.559, 0.447, 0.497, 0.5]),
+    ]
+
+
+class FakeGrids:
+    """Blocking stand-in for the AllTimeLeadersGrids pull that counts calls."""
+
+    def __init__(self, delay=0.0, frames=grids):
+        self.delay = delay
+        self.frames = frames
+        self.calls = 0
+        self.fail = False
+        self.lock = threading.Lock()
+
+    def __call__(self, season_type, per_mode, topx):
+        with self.lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("stats.nba.com timed out")
+        return self.frames()
+
+
+def make_store(fetch, cache_dir=None, **kwargs):
+    return AllTimeLeadersStore(cache_dir=cache_dir, fetch_func=fetch, **kwargs)
+
+
+def test_build_splits_and_ranks_per_stat():
+    """Stats are grouped and rank-sorted; missing ranks fall back to value order."""
+    no_rank = leaderboard("STL", [2000, 1100, 1944, 2514, 800], active=False).drop(columns="STL_RANK")
+    no_rank.loc[0, "STL"] = None
+    table = build_leaders_table(grids() + [no_rank])
+
+    store = make_store(FakeGrids())
+    store._install(table)
+
+    assert list(store.leaders) == ["PTS", "AST", "STL", "FG_PCT", "GP"]  # ALL_TIME_STATS order
+    assert store.leaders["PTS"].table.column("RANK").to_pylist() == [1, 2, 3, 4, 5]
+    assert store.top("stl", 2) == [
+        {"player_name": "Michael Jordan", "player_id": 893, "value": 2514.0, "rank": 1, "is_active": False},
+        {"player_name": "LeBron James", "player_id": 2544, "value": 2000.0, "rank": 2, "is_active": False},
+    ]
+    assert len(store.leaders["STL"]) == 4  # the row without a value is dropped
+
+
+@pytest.mark.asyncio
+async def test_lookups_served_from_one_pull():
+    """Top-N, active-only and player-rank lookups for every stat cost one pull."""
+    fetch = FakeGrids()
+    store = make_store(fetch)
+    assert await store.ensure_fresh() == "built"
+
+    assert [r["player_name"] for r in store.top("PTS", 3)] == ["LeBron James", "Kareem Abdul-Jabbar", "Kobe Bryant"]
+    assert [r["player_name"] for r in store.top("AST", 10, active_only=True)] == ["LeBron James", "Kevin Durant"]
+    assert store.player_rank("AST", 977)["rank"] == 2
+    assert store.player_rank("GP", "kareem abdul-jabbar") == {
+        "player_name": "Kareem Abdul-Jabbar", "player_id": 76003, "value": 1560.0, "rank": 1, "is_active": False,
+    }
+    assert store.player_rank("PTS", "Stephen Curry") is None
+    assert store.top("REB", 5) == [] and not store.has_stat("REB")
+
+    with pytest.raises(InvalidParameterError):
+        store.top("DUNKS")
+
+    assert await store.ensure_fresh() == "fresh"
+    assert fetch.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_refresh_and_stale_fallback():
+    """Concurrent cold lookups share one pull; a failed rebuild keeps the snapshot."""
+    fetch = FakeGrids(delay=0.05)
+    store = make_store(fetch)
+
+    statuses = await asyncio.gather(*(store.ensure_fresh() for _ in range(10)))
+    assert fetch.calls == 1
+    assert statuses.count("built") == 1
+
+    fetch.fail = True
+    assert store.refresh(force=True) == "stale"
+    assert store.top("PTS", 1)[0]["player_name"] == "LeBron James"
+    assert store.get_stats()["errors"] == 1
+
+    with pytest.raises(ConnectionError):
+        make_store(fetch).refresh()
+
+
+@pytest.mark.asyncio
+async def test_empty_pull_keeps_previous_snapshot(tmp_path):
+    """A response without recognizable leaderboards is a failed refresh, not a new snapshot."""
+    fetch = FakeGrids()
+    store = make_store(fetch, tmp_path)
+    await store.ensure_fresh()
+
+    fetch.frames = lambda: [pd.DataFrame({"PLAYER_ID": [2544], "PLAYER_NAME": ["LeBron James"], "POINTS": [41000]})]
+    assert store.refresh(force=True) == "stale"
+    assert await store.ensure_fresh() == "fresh"
+    assert store.top("PTS", 1)[0]["player_name"] == "LeBron James"
+    assert fetch.calls == 2
+
+    assert make_store(fetch, tmp_path).has_stat("PTS")  # persisted snapshot untouched
+    with pytest.raises(ValueError):
+        make_store(fetch).refresh()
+
+
+@pytest.mark.asyncio
+async def test_snapshot_persists_across_restarts(tmp_path):
+    """A restarted store serves the parquet snapshot; a stale one is rebuilt."""
+    fetch = FakeGrids()
+    await make_store(fetch, tmp_path).ensure_fresh()
+
+    restarted = make_store(fetch, tmp_path)
+    assert restarted.get_stats()["disk_loads"] == 1
+    assert await restarted.ensure_fresh() == "fresh"
+    assert restarted.player_rank("PTS", "Kevin Durant")["rank"] == 5
+    assert fetch.calls == 1
+
+    expired = make_store(fetch, tmp_path, max_age=0.0)
+    assert expired.has_stat("PTS")
+    assert await expired.ensure_fresh() == "built"
+    assert fetch.calls == 2
+
+
+def test_scheduled_refresh_rebuilds_in_background():
+    """The refresh thread builds at start and again every interval until stopped."""
+    fetch = FakeGrids()
+    store = make_store(fetch)
+    store.start_scheduled_refresh(interval=0.05)
+    try:
+        deadline = time.time() + 2
+        while fetch.calls < 3 and time.time() < deadline:
+            time.sleep(0.01)
+        assert store.get_stats()["scheduled"]
+    finally:
+        store.stop_scheduled_refresh(timeout=1.0)
+
+    assert fetch.calls >= 3
+    assert not store.get_stats()["scheduled"]
+    assert store.has_stat("PTS")
+
+
+@pytest.mark.asyncio
+async def test_tool_output_and_unified_fetch_endpoint():
+    """get_all_time_leaders keeps its text/JSON format; unified_fetch caches the endpoint."""
+    fetch = FakeGrids()
+    store = make_store(fetch)
+    reset_cache_manager()
+    try:
+        with patch.object(all_time_leaders, "_all_time_leaders_store", store):
+            text = await nba_server.get_all_time_leaders("PTS", top_n=2)
+            pct = await nba_server.get_all_time_leaders("fg_pct", top_n=1, active_only=True)
+            data = json.loads((await nba_server.get_all_time_leaders("AST", top_n=2, format="json")).split("\n\n", 1)[1])
+            unsupported = await nba_server.get_all_time_leaders("DUNKS")
+
+            first = await unified_fetch("all_time_leaders", {"stat_category": "AST", "top_n": 3, "active_only": True})
+            second = await unified_fetch("all_time_leaders", {"stat_category": "AST", "top_n": 3, "active_only": True})
+    finally:
+        reset_cache_manager()
+
+    assert text.split("\n\n", 1)[1] == (
+        "All-Time PTS Leaders:\n1. LeBron James: 41,000 (Active)\n2. Kareem Abdul-Jabbar: 38,387"
+    )
+    assert pct.endswith("All-Time FG_PCT Leaders (Active Players Only):\n1. LeBron James: 50.5% (Active)")
+    assert data["total_shown"] == 2 and data["leaders"][1] == {
+        "player_name": "Kobe Bryant", "player_id": 977, "value": 6306.0, "rank": 2, "is_active": False,
+    }
+    assert "Unsupported stat category: DUNKS" in unsupported
+
+    assert first.data.column("PLAYER_NAME").to_pylist() == ["LeBron James", "Kevin Durant"]
+    assert second.from_cache
+    assert fetch.calls == 1
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_benchmark_leaderboard_lookups():
+    """40 tool calls across stats with a 50ms upstream pull."""
+    requests = [(stat, n, n % 2 == 0) for n in range(1, 11) for stat in ("PTS", "AST", "GP", "FG_PCT")]
+
+    async def run(store):
+        with patch.object(all_time_leaders, "_all_time_leaders_store", store):
+            start = time.perf_counter()
+            for stat, n, active_only in requests:
+                await nba_server.get_all_time_leaders(stat, top_n=n, active_only=active_only)
+            return time.perf_counter() - start
+
+    per_call_fetch = FakeGrids(delay=0.05)
+    per_call = await run(make_store(per_call_fetch, max_age=0.0))  # old behavior: one pull per call
+
+    snapshot_fetch = FakeGrids(delay=0.05)
+    snapshot = await run(make_store(snapshot_fetch))
+
+    print()
+    print(f"✅ Pull per call: {per_call_fetch.calls} pulls, {per_call * 1000:.0f}ms for {len(requests)} calls")
+    print(f"✅ Snapshot: {snapshot_fetch.calls} pull, {snapshot * 1000:.0f}ms ({per_call / snapshot:.0f}x)")
+
+    assert per_call_fetch.calls == len(requests) and snapshot_fetch.calls == 1
+    assert snapshot < per_call / 10
@@ -0,0 +1,198 @@
+"""
+Tests for the memory-mapped Arrow IPC cache tier.
+
+Validates:
+1. Round trip preserves data and schema metadata
+2. Reads are zero-copy (no Arrow memory pool allocation)
+3. TTL expiry and byte-budgeted LRU eviction
+4. Entries are shared between cache instances (processes) on one host
+5. Writes track the tier size without rescanning the directory
+6. CacheManager uses the tier in front of Redis/LRU and backfills it on Redis hits
+"""
+import os
+import time
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from nba_mcp.data.arrow_ipc_cache import ArrowIPCCache, ArrowIPCCacheConfig
+from nba_mcp.data.cache_integration import CacheManager
+
+
+def make_table(num_rows: int = 1000, seed: int = 0) -> pa.Table:
+    """League-wide-style table."""
+    rng = np.random.default_rng(seed)
+    return pa.table(
+        {
+            "PLAYER_ID": np.arange(num_rows, dtype=np.int64),
+            "PTS": rng.integers(0, 50, num_rows),
+            "FG_PCT": rng.random(num_rows),
+            "PLAYER_NAME": [f"Player {i}" for i in range(num_rows)],
+        }
+    ).replace_schema_metadata({"endpoint": "league_player_games"})
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ArrowIPCCache(ArrowIPCCacheConfig(cache_dir=tmp_path / "ipc", max_size_mb=64))
+
+
+def test_round_trip_preserves_table(cache):
+    """Data and user metadata survive; the expiry marker is stripped."""
+    table = make_table()
+    cache.set("nba_mcp:league_player_games:abc", table, ttl=60)
+
+    loaded = cache.get("nba_mcp:league_player_games:abc")
+    assert loaded.equals(table)
+    assert loaded.schema.metadata == {b"endpoint": b"league_player_games"}
+    assert cache.get("nba_mcp:missing:key") is None
+    assert cache.stats["hits"] == 1 and cache.stats["misses"] == 1
+
+
+def test_reads_are_zero_copy(cache):
+    """Loading a cached table does not allocate from the Arrow memory pool."""
+    cache.set("big", make_table(200_000), ttl=60)
+
+    before = pa.total_allocated_bytes()
+    loaded = cache.get("big")
+    assert pa.total_allocated_bytes() - before < 1024
+    assert loaded.num_rows == 200_000
+
+
+def test_expired_entries_are_removed(cache):
+    """Entries past their TTL are misses and their files are deleted."""
+    cache.set("stale", make_table(), ttl=0)
+    time.sleep(0.01)
+
+    assert cache.get("stale") is None
+    assert cache.stats["expired"] == 1
+    assert cache.get_stats()["files"] == 0
+
+
+def test_byte_budget_evicts_least_recently_used(tmp_path):
+    """Total bytes stay under budget; recently read entries survive."""
+    cache = ArrowIPCCache(
+        ArrowIPCCacheConfig(cache_dir=tmp_path / "ipc", max_size_mb=1, eviction_target=0.9)
+    )
+    table = make_table(10_000)  # ~0.3 MB on disk
+
+    cache.set("a", table, ttl=60)
+    cache.set("b", table, ttl=60)
+    # Make "a" older than "b", then touch it via a read
+    old = time.time() - 100
+    os.utime(cache._path_for("a"), (old, old))
+    os.utime(cache._path_for("b"), (old + 1, old + 1))
+    assert cache.get("a") is not None
+
+    cache.set("c", table, ttl=60)
+    cache.set("d", table, ttl=60)
+
+    assert cache.total_bytes() <= cache.config.max_bytes
+    assert cache.stats["evictions"] >= 1
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+
+
+def test_entries_shared_between_instances(tmp_path):
+    """A second cache (another worker process) sees the first one's writes."""
+    config = ArrowIPCCacheConfig(cache_dir=tmp_path / "ipc")
+    writer, reader = ArrowIPCCache(config), ArrowIPCCache(config)
+
+    writer.set("shared", make_table(), ttl=60)
+    assert reader.get("shared").equals(make_table())
+
+    reader.delete("shared")
+    assert writer.get("shared") is None
+
+
+def test_writes_track_size_without_rescanning(cache):
+    """The running size estimate follows writes, overwrites and removals."""
+    for i in range(20):
+        cache.set(f"k{i}", make_table(500, seed=i), ttl=60)
+    cache.set("k0", make_table(2000), ttl=60)  # overwrite replaces the old size
+    cache.delete("k1")
+
+    assert cache.stats["rescans"] == 1  # only the startup scan
+    assert cache.get_stats()["tracked_bytes"] == cache.total_bytes()
+
+    cache.clear()
+    assert cache.get_stats()["tracked_bytes"] == 0
+
+
+def test_stale_size_estimate_is_rescanned(tmp_path):
+    """Files written by other processes are picked up by the periodic rescan."""
+    config = ArrowIPCCacheConfig(cache_dir=tmp_path / "ipc", max_size_mb=64, rescan_interval=0.0)
+    cache, other = ArrowIPCCache(config), ArrowIPCCache(config)
+
+    other.set("theirs", make_table(), ttl=60)
+    cache.set("mine", make_table(), ttl=60)
+
+    assert cache.get_stats()["tracked_bytes"] == cache.total_bytes()
+
+
+class FakeRedisTier:
+    """Tier 2 stand-in holding one table with a remaining TTL."""
+
+    redis_available = True
+
+    def __init__(self, table, remaining):
+        self.table = table
+        self.remaining = remaining
+        self.gets = 0
+
+    async def aget_with_ttl(self, key):
+        self.gets += 1
+        return self.table, self.remaining
+
+
+@pytest.mark.asyncio
+async def test_redis_hit_backfills_ipc_tier(tmp_path):
+    """A Tier 2 hit is written to the IPC tier with the Redis entry's remaining TTL."""
+    async def fetch():
+        raise AssertionError("should be served from Redis")
+
+    manager = CacheManager(enable_cache=True)
+    manager.enable_arrow_ipc_cache(tmp_path / "ipc", max_size_mb=64)
+    manager.redis_cache = FakeRedisTier(make_table(), remaining=30.0)
+    params = {"season": "2023-24"}
+
+    for _ in range(3):
+        data, from_cache = await manager.get_or_fetch("league_player_games", params, fetch)
+        assert from_cache and data.equals(make_table())
+
+    assert manager.redis_cache.gets == 1
+    assert manager.get_stats()["arrow_backfills"] == 1
+    assert manager.arrow_cache.stats["hits"] == 2
+
+    key = manager.generate_cache_key("league_player_games", params)
+    with pa.memory_map(str(manager.arrow_cache._path_for(key)), "r") as source:
+        metadata = pa.ipc.open_file(source).schema.metadata
+    assert float(metadata[b"nba_mcp.expires_at"]) == pytest.approx(time.time() + 30, abs=5)
+
+
+@pytest.mark.asyncio
+async def test_cache_manager_serves_from_ipc_tier(tmp_path):
+    """get_or_fetch stores into and serves from the IPC tier across managers."""
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        return make_table()
+
+    first = CacheManager(enable_cache=True)
+    first.enable_arrow_ipc_cache(tmp_path / "ipc", max_size_mb=64)
+    data, from_cache = await first.get_or_fetch("league_player_games", {"season": "2023-24"}, fetch)
+    assert not from_cache
+
+    second = CacheManager(enable_cache=True)
+    second.enable_arrow_ipc_cache(tmp_path / "ipc", max_size_mb=64)
+    data, from_cache = await second.get_or_fetch("league_player_games", {"season": "2023-24"}, fetch)
+
+    assert from_cache and len(calls) == 1
+    assert data.equals(make_table())
+    assert second.get_stats()["arrow_ipc"]["hits"] == 1
+
+    await second.invalidate("league_player_games", {"season": "2023-24"})
+    assert second.arrow_cache.get_stats()["files"] == 0
+
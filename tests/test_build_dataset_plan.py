@@ -0,0 +1,229 @@
+"""
+Tests for build_dataset execution through the query optimizer.
+
+Validates:
+1. Results match the old sequential join → filter → select pipeline
+2. Filters are pushed below joins only where that can't change the result
+3. Sources are projected to the columns the query needs
+4. Sources are fetched concurrently; invalid specs fail before any fetch
+5. The build_dataset tool stores only the final table and reports the plan
+"""
+import asyncio
+from unittest.mock import patch
+
+import pyarrow as pa
+import pytest
+
+from nba_mcp import nba_server
+from nba_mcp.data import fetch_scheduler
+from nba_mcp.data.dataset_manager import ProvenanceInfo
+from nba_mcp.data.fetch_scheduler import FetchScheduler
+from nba_mcp.data.joins import filter_table, join_with_stats
+from nba_mcp.data.query_optimizer import DatasetSpecError, OperationType, QueryOptimizer
+
+GAMES = pa.table(
+    {
+        "GAME_ID": [1, 2, 3, 4, 5, 6],
+        "TEAM_ID": [10, 10, 20, 20, 30, 40],
+        "PTS": [110, 95, 120, 101, 99, 130],
+        "WL": ["W", "L", "W", "L", "L", "W"],
+        "GAME_DATE": ["2024-01-0" + str(i) for i in range(1, 7)],
+    }
+)
+STANDINGS = pa.table(
+    {
+        "TEAM_ID": [10, 20, 30],
+        "TEAM_NAME": ["Lakers", "Celtics", "Knicks"],
+        "W": [40, 55, 48],
+        "L": [42, 27, 34],
+    }
+)
+TABLES = {"team_game_log": GAMES, "team_standings": STANDINGS}
+
+
+class FakeFetch:
+    """Serves TABLES by endpoint name and records concurrency."""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, endpoint, params):
+        self.calls.append(endpoint)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            return TABLES[endpoint], ProvenanceInfo(source_endpoints=[endpoint], nba_api_calls=1)
+        finally:
+            self.active -= 1
+
+
+@pytest.fixture(autouse=True)
+def scheduler():
+    with patch.object(fetch_scheduler, "_fetch_scheduler", FetchScheduler()):
+        yield
+
+
+def spec(**overrides):
+    base = {
+        "sources": [
+            {"endpoint": "team_game_log", "params": {"season": "2023-24"}},
+            {"endpoint": "team_standings", "params": {"season": "2023-24"}},
+        ],
+        "joins": [{"on": "TEAM_ID", "how": "left"}],
+    }
+    base.update(overrides)
+    return base
+
+
+def rows(table: pa.Table):
+    return sorted(table.to_pylist(), key=lambda r: tuple(str(v) for v in r.values()))
+
+
+@pytest.mark.asyncio
+async def test_matches_sequential_pipeline():
+    """Same rows as join_with_stats → filter_table → select."""
+    filters = [
+        {"column": "WL", "op": "=", "value": "W"},
+        {"column": "W", "op": ">", "value": 45},
+    ]
+    select = ["GAME_ID", "TEAM_ID", "PTS", "TEAM_NAME", "W"]
+
+    result = await QueryOptimizer().execute_dataset(
+        spec(filters=filters, select=select), FakeFetch(delay=0)
+    )
+
+    joined = join_with_stats([GAMES, STANDINGS], "TEAM_ID", "left")["result"]
+    expected = filter_table(joined, filters).select(select)
+    assert result.table.column_names == select
+    assert rows(result.table) == rows(expected)
+
+
+@pytest.mark.asyncio
+async def test_filters_not_pushed_into_null_extended_side():
+    """Left-side filters are pushed down; right-side filters of a LEFT join stay after it."""
+    result = await QueryOptimizer().execute_dataset(
+        spec(
+            filters=[
+                {"column": "PTS", "op": ">=", "value": 100},
+                {"column": "TEAM_NAME", "op": "IN", "value": ["Lakers", "Celtics"]},
+            ]
+        ),
+        FakeFetch(delay=0),
+    )
+    plan = result.plan
+    ops = {op.op_id: op for op in plan.operations}
+
+    assert ops["filter_s0"].params["pushed_down"] is True
+    assert "filter_s1" not in ops
+    assert ops["filter_final"].params["pushed_down"] is False
+    assert "filter_pushdown_before_joins" in plan.optimization_applied
+    # Team 40 has no standings row: a pre-join filter on s1 would have kept it with nulls
+    assert sorted(result.table.column("GAME_ID").to_pylist()) == [1, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_sources_projected_to_needed_columns():
+    """Only selected, join and residual filter columns are read from each source."""
+    result = await QueryOptimizer().execute_dataset(
+        spec(
+            filters=[{"column": "WL", "op": "=", "value": "W"}],
+            select=["GAME_ID", "TEAM_NAME"],
+        ),
+        FakeFetch(delay=0),
+    )
+    ops = {op.op_id: op for op in result.plan.operations}
+
+    assert ops["project_s0"].params["columns"] == ["GAME_ID", "TEAM_ID"]
+    assert ops["project_s1"].params["columns"] == ["TEAM_ID", "TEAM_NAME"]
+    assert '"GAME_DATE"' not in result.plan.sql
+    assert "projection_pushdown" in result.plan.optimization_applied
+    assert result.plan.operations[-1].actual_rows == result.table.num_rows == 3
+
+
+@pytest.mark.asyncio
+async def test_sources_fetched_concurrently():
+    """Both sources are in flight at once."""
+    fake = FakeFetch(delay=0.05)
+    result = await QueryOptimizer().execute_dataset(spec(), fake)
+
+    assert fake.peak == 2
+    assert "concurrent_fetch" in result.plan.optimization_applied
+    assert result.plan.timings["fetch_ms"] < 95
+
+
+@pytest.mark.asyncio
+async def test_dict_join_and_parameterized_values():
+    """{left: right} joins use ON; filter values are bound, not interpolated."""
+    standings = STANDINGS.rename_columns(["ID", "TEAM_NAME", "W", "L"])
+    tricky = "Knicks' OR 1=1 --"
+
+    async def fetch(endpoint, params):
+        return (standings if endpoint == "team_standings" else GAMES), None
+
+    result = await QueryOptimizer().execute_dataset(
+        spec(
+            joins=[{"on": {"TEAM_ID": "ID"}, "how": "inner"}],
+            filters=[{"column": "TEAM_NAME", "op": "!=", "value": tricky}],
+        ),
+        fetch,
+    )
+
+    assert tricky not in result.plan.sql
+    assert 's0."TEAM_ID" = s1."ID"' in result.plan.sql
+    assert result.table.num_rows == 5
+
+
+@pytest.mark.asyncio
+async def test_invalid_spec_fails_before_fetching():
+    """Spec errors keep their messages and cost no API calls."""
+    fake = FakeFetch(delay=0)
+    optimizer = QueryOptimizer()
+
+    with pytest.raises(DatasetSpecError, match="Join 1 missing 'on'"):
+        await optimizer.execute_dataset(spec(joins=[{"how": "left"}]), fake)
+    with pytest.raises(DatasetSpecError, match="unsupported operator"):
+        await optimizer.execute_dataset(
+            spec(filters=[{"column": "PTS", "op": "; DROP", "value": 1}]), fake
+        )
+    assert fake.calls == []
+
+    with pytest.raises(DatasetSpecError, match="not found in any source"):
+        await optimizer.execute_dataset(spec(select=["NOPE"]), fake)
+
+
+@pytest.mark.asyncio
+async def test_build_dataset_tool_reports_plan():
+    """The tool stores one dataset and returns the plan with costs and SQL."""
+    stored = []
+
+    class FakeManager:
+        async def store(self, table, name=None, provenance=None):
+            stored.append((table, provenance))
+            return type(
+                "Handle",
+                (),
+                {"uuid": "abc", "row_count": table.num_rows,
+                 "column_count": table.num_columns, "size_bytes": table.nbytes},
+            )()
+
+    with patch.object(nba_server, "fetch_endpoint", lambda e, p, as_arrow=True: FakeFetch(0)(e, p)), \
+            patch.object(nba_server, "validate_parameters", lambda e, p: None), \
+            patch.object(nba_server, "get_dataset_manager", lambda: FakeManager()):
+        output = await nba_server.build_dataset(spec(select=["GAME_ID", "W"]))
+        error = await nba_server.build_dataset({"sources": []})
+
+    assert len(stored) == 1
+    table, provenance = stored[0]
+    assert table.column_names == ["GAME_ID", "W"]
+    assert provenance.nba_api_calls == 2
+    assert "## Execution Plan" in output and "Total Estimated Cost" in output
+    assert "LEFT JOIN s1 USING" in output
+    assert "**Dataset Handle**: `abc`" in output
+    assert error == "Error: 'sources' required in spec"
+
+    operation_types = {op["op"] for op in provenance.parameters["plan"]["operations"]}
+    assert {OperationType.FETCH.value, OperationType.JOIN.value} <= operation_types
@@ -0,0 +1,255 @@
+"""
+Tests for the Redis value codec layer.
+
+Validates:
+1. Tables and DataFrames round trip through Arrow IPC (schema, index, dtypes)
+2. Objects use orjson with zstd body compression above the threshold
+3. Legacy gzip/JSON values written before the codec header still decode
+4. Codecs are pluggable (incomplete codecs fail at construction);
+   unknown/corrupt values raise CodecError
+5. RedisCache stores tables through the codec layer
+
+Run benchmark: pytest tests/test_cache_codecs.py -m performance -s
+"""
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from nba_mcp.cache import codecs
+from nba_mcp.cache.codecs import (
+    MAGIC,
+    ArrowTableCodec,
+    Codec,
+    CodecError,
+    decode_value,
+    describe_value,
+    encode_value,
+    register_codec,
+)
+from nba_mcp.cache.redis_cache import RedisCache, compress_value
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+GAME_LOGS = REPO_ROOT / "scripts/mcp_data/2025-10-29/20ppg_players_3seasons_gamelogs.parquet"
+STATIC_DATA = REPO_ROOT / "api_documentation/static_data.json"
+
+
+def make_games(num_rows: int = 200) -> pa.Table:
+    rng = np.random.default_rng(0)
+    return pa.table(
+        {
+            "GAME_ID": [f"00223{i:05d}" for i in range(num_rows)],
+            "PTS": rng.integers(0, 50, num_rows),
+            "FG_PCT": rng.random(num_rows),
+            "WL": rng.choice(["W", "L"], num_rows),
+        }
+    ).replace_schema_metadata({"endpoint": "player_game_log"})
+
+
+@pytest.fixture
+def restore_registry():
+    """Undo register_codec calls made by a test."""
+    by_id, order = dict(codecs._codecs_by_id), list(codecs._encode_order)
+    yield
+    codecs._codecs_by_id.clear()
+    codecs._codecs_by_id.update(by_id)
+    codecs._encode_order[:] = order
+
+
+def test_table_round_trip():
+    """Tables keep data and schema metadata; the body is Arrow zstd."""
+    table = make_games()
+    data = encode_value(table)
+
+    assert data.startswith(MAGIC)
+    assert describe_value(data) == ("arrow-zstd", "none")
+    decoded = decode_value(data)
+    assert decoded.equals(table)
+    assert decoded.schema.metadata == {b"endpoint": b"player_game_log"}
+
+
+def test_dataframe_round_trip():
+    """DataFrames come back with their index and dtypes."""
+    df = pd.DataFrame(
+        {
+            "GAME_DATE": pd.to_datetime(["2024-01-02", "2024-01-04", "2024-01-06"]),
+            "PTS": [31, 25, 40],
+            "MATCHUP": ["LAL vs. BOS", "LAL @ NYK", "LAL vs. GSW"],
+        },
+        index=pd.Index([10, 11, 12], name="row"),
+    )
+    data = encode_value(df)
+
+    assert describe_value(data)[0] == "pandas-arrow-zstd"
+    pd.testing.assert_frame_equal(decode_value(data), df)
+
+
+def test_objects_use_orjson_and_compress_above_threshold():
+    """Small dicts stay plain; large ones get a zstd body. numpy values are accepted."""
+    small = {"player": "LeBron James", "pts": np.float64(25.7), "games": np.int64(71)}
+    large = {"games": [{"GAME_ID": i, "PTS": i % 40} for i in range(500)]}
+
+    small_data = encode_value(small, compression_threshold=1024)
+    large_data = encode_value(large, compression_threshold=1024)
+
+    assert describe_value(small_data) == ("orjson", "none")
+    assert describe_value(large_data) == ("orjson", "zstd")
+    assert decode_value(small_data) == {"player": "LeBron James", "pts": 25.7, "games": 71}
+    assert decode_value(large_data) == large
+    assert describe_value(encode_value(large, compression_threshold=None))[1] == "none"
+
+
+def test_orjson_writes_nan_as_null():
+    """NaN stats read back as None through orjson (json.dumps kept NaN)."""
+    data = encode_value({"fg3_pct": float("nan")})
+
+    assert describe_value(data)[0] == "orjson"
+    assert decode_value(data) == {"fg3_pct": None}
+
+
+def test_bytes_and_unencodable_values():
+    """bytes are stored raw; values no codec accepts raise TypeError."""
+    assert decode_value(encode_value(b"\x00\x01raw")) == b"\x00\x01raw"
+    with pytest.raises(TypeError):
+        encode_value({1, 2, 3})
+
+
+def test_legacy_values_still_decode():
+    """gzip'd JSON and plain JSON written by compress_value are read back."""
+    value = {"rows": [{"PLAYER_ID": 2544, "PTS": 30}] * 100}
+
+    gzipped, was_compressed = compress_value(value, threshold=1024)
+    plain, _ = compress_value({"a": 1}, threshold=1024)
+
+    assert was_compressed
+    assert decode_value(gzipped) == value
+    assert decode_value(plain) == {"a": 1}
+    assert describe_value(gzipped) == ("legacy-json", "gzip")
+
+
+def test_pluggable_codecs(restore_registry):
+    """A preferred codec is used for encoding; both still decode."""
+    table = make_games()
+    zstd_data = encode_value(table)
+
+    register_codec(ArrowTableCodec("lz4"), prefer=True)
+    lz4_data = encode_value(table)
+
+    assert describe_value(lz4_data) == ("arrow-lz4", "none")
+    assert decode_value(lz4_data).equals(table)
+    assert decode_value(zstd_data).equals(table)
+
+    class NoDecode(Codec):
+        codec_id = 99
+
+        def can_encode(self, value):
+            return False
+
+        def encode(self, value):
+            return b""
+
+    with pytest.raises(TypeError):
+        NoDecode()
+
+
+def test_corrupt_values_raise_codec_error():
+    """Unknown codec ids and damaged bodies raise CodecError, never garbage."""
+    data = encode_value(make_games())
+
+    with pytest.raises(CodecError, match="Unknown codec id"):
+        decode_value(MAGIC + bytes((250, 0)) + b"x")
+    with pytest.raises(CodecError):
+        decode_value(data[:40])
+    with pytest.raises(CodecError):
+        decode_value(b"not json")
+
+
+def test_redis_cache_stores_tables_through_codecs():
+    """RedisCache writes the header format and reads legacy entries."""
+
+    class FakeRedis:
+        def __init__(self):
+            self.store = {}
+
+        def setex(self, key, ttl, value):
+            self.store[key] = value
+
+        def get(self, key):
+            return self.store.get(key)
+
+    cache = RedisCache(url="redis://127.0.0.1:1/0", health_check_interval=0)
+    cache.client = FakeRedis()
+    cache.breaker.record_success()
+    table = make_games()
+
+    assert cache.set("games", table, ttl=60)
+    assert cache.client.store["games"].startswith(MAGIC)
+    cache.fallback.clear()
+    assert cache.get("games").equals(table)
+
+    cache.client.store["legacy"] = compress_value({"pts": [1] * 1000})[0]
+    assert cache.get("legacy") == {"pts": [1] * 1000}
+
+    cache.client.store["bad"] = MAGIC + bytes((250, 0))
+    assert cache.get("bad") is None
+    assert cache.stats["errors"] == 1
+
+
+def _measure(encode, decode, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        data = encode()
+    encode_ms = (time.perf_counter() - start) * 1000 / iterations
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        decode(data)
+    decode_ms = (time.perf_counter() - start) * 1000 / iterations
+    return encode_ms, decode_ms, len(data)
+
+
+@pytest.mark.performance
+def test_benchmark_codecs_on_cached_payloads():
+    """Legacy JSON+gzip vs the codec layer on real saved payloads."""
+    games = pq.read_table(GAME_LOGS)  # 4,838 player games x 72 columns
+    games_df = games.to_pandas()
+    records = json.loads(games_df.to_json(orient="records"))  # how tools cached tables
+    static_data = json.loads(STATIC_DATA.read_text())
+    iterations = 5
+
+    results = {
+        "game logs (legacy records json+gzip)": _measure(
+            lambda: compress_value(records)[0],
+            lambda data: pd.DataFrame(decode_value(data)),
+            iterations,
+        ),
+        "game logs (DataFrame arrow+zstd)": _measure(
+            lambda: encode_value(games_df), decode_value, iterations
+        ),
+        "game logs (Table arrow+zstd)": _measure(
+            lambda: encode_value(games), decode_value, iterations
+        ),
+        "static data (legacy json+gzip)": _measure(
+            lambda: compress_value(static_data)[0], decode_value, iterations
+        ),
+        "static data (orjson+zstd)": _measure(
+            lambda: encode_value(static_data), decode_value, iterations
+        ),
+    }
+
+    print()
+    for name, (encode_ms, decode_ms, size) in results.items():
+        print(
+            f"✅ {name}: encode {encode_ms:.2f}ms, decode {decode_ms:.2f}ms, "
+            f"{size / 1024:.0f} KB"
+        )
+
+    legacy = results["game logs (legacy records json+gzip)"]
+    arrow = results["game logs (DataFrame arrow+zstd)"]
+    assert arrow[0] < legacy[0] and arrow[1] < legacy[1] and arrow[2] < legacy[2]
+    assert results["static data (orjson+zstd)"][1] < results["static data (legacy json+gzip)"][1]
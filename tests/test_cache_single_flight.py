@@ -0,0 +1,124 @@
+"""
+Tests for single-flight request coalescing in CacheManager.get_or_fetch.
+
+Validates:
+1. Concurrent misses for the same key run fetch_func once
+2. Every waiter receives the shared result (including failures)
+3. Different keys are fetched independently
+4. Coalesced waiters are reported in get_stats()
+5. Cancelling one caller does not cancel the shared fetch
+"""
+import asyncio
+
+import pyarrow as pa
+import pytest
+
+from nba_mcp.data.cache_integration import CacheManager
+
+
+class CountingFetch:
+    """Slow fetch function that counts invocations."""
+
+    def __init__(self, delay=0.1, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("stats.nba.com timeout")
+        return pa.table({"PTS": [30, 25]})
+
+
+@pytest.fixture
+def manager():
+    return CacheManager(enable_cache=True)
+
+
+PARAMS = {"season": "2025-26"}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_fetch(manager):
+    """Twenty concurrent callers trigger a single upstream fetch."""
+    fetch = CountingFetch()
+    results = await asyncio.gather(
+        *[manager.get_or_fetch("league_player_games", PARAMS, fetch) for _ in range(20)]
+    )
+
+    assert fetch.calls == 1
+    assert all(data is results[0][0] for data, _ in results)
+    assert all(from_cache is False for _, from_cache in results)
+
+    stats = manager.get_stats()
+    assert stats["misses"] == 1
+    assert stats["coalesced_waiters"] == 19
+    assert stats["in_flight"] == 0
+
+    # Later calls hit the cache normally
+    data, from_cache = await manager.get_or_fetch("league_player_games", PARAMS, fetch)
+    assert from_cache and fetch.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_failure_reaches_every_waiter(manager):
+    """A failed shared fetch is reported to all waiters, then retried later."""
+    failing = CountingFetch(fail=True)
+    results = await asyncio.gather(
+        *[manager.get_or_fetch("league_player_games", PARAMS, failing) for _ in range(5)]
+    )
+
+    assert failing.calls == 1
+    assert results == [(None, False)] * 5
+    assert manager.get_stats()["errors"] == 1
+
+    # The failure is not cached: the next call fetches again
+    ok = CountingFetch(delay=0)
+    data, _ = await manager.get_or_fetch("league_player_games", PARAMS, ok)
+    assert data is not None and ok.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_different_keys_fetch_independently(manager):
+    """Coalescing is per cache key."""
+    fetch = CountingFetch()
+    await asyncio.gather(
+        manager.get_or_fetch("league_player_games", {"season": "2023-24"}, fetch),
+        manager.get_or_fetch("league_player_games", {"season": "2024-25"}, fetch),
+        manager.get_or_fetch("league_team_games", {"season": "2023-24"}, fetch),
+    )
+    assert fetch.calls == 3
+    assert manager.get_stats()["coalesced_waiters"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_fetch(manager):
+    """The first caller going away leaves the fetch running for the others."""
+    fetch = CountingFetch(delay=0.2)
+    first = asyncio.create_task(manager.get_or_fetch("league_player_games", PARAMS, fetch))
+    await asyncio.sleep(0.01)
+    second = asyncio.create_task(manager.get_or_fetch("league_player_games", PARAMS, fetch))
+    await asyncio.sleep(0.01)
+
+    first.cancel()
+    data, _ = await second
+
+    assert data is not None
+    assert fetch.calls == 1
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+@pytest.mark.asyncio
+async def test_force_refresh_bypasses_coalescing(manager):
+    """force_refresh always runs its own fetch."""
+    fetch = CountingFetch()
+    await asyncio.gather(
+        *[
+            manager.get_or_fetch("league_player_games", PARAMS, fetch, force_refresh=True)
+            for _ in range(3)
+        ]
+    )
+    assert fetch.calls == 3
@@ -0,0 +1,143 @@
+"""
+Tests for the prebuilt entity resolution index.
+
+Validates:
+1. Index lookups return the same player/team as the original linear scans
+2. Accent-folded queries resolve ("Schroder" → "Dennis Schröder")
+3. Substring candidates and fuzzy top-k suggestions
+4. Cold lookups are sub-millisecond
+
+Run benchmark: pytest tests/test_entity_index.py -m performance -s
+"""
+import random
+import time
+
+import pytest
+from nba_api.stats.static import players, teams
+
+from nba_mcp.api.entity_index import EntityIndex, fold_accents, get_entity_index
+from nba_mcp.api.entity_resolver import (
+    _cached_player_lookup,
+    clear_entity_cache,
+    resolve_player,
+    suggest_players,
+)
+from nba_mcp.api.name_variations import (
+    PLAYER_NICKNAMES,
+    TEAM_VARIATIONS,
+    get_alternate_spelling,
+    get_player_nickname_search,
+)
+
+
+def linear_player_lookup(query_lower):
+    """The pre-index resolver: three full scans over all players."""
+    query_lower = get_alternate_spelling(get_player_nickname_search(query_lower))
+    all_players = players.get_players()
+    for player in all_players:
+        if query_lower == f"{player['first_name']} {player['last_name']}".lower():
+            return player
+    for player in all_players:
+        if query_lower == player["last_name"].lower():
+            return player
+    for player in all_players:
+        if query_lower in f"{player['first_name']} {player['last_name']}".lower():
+            return player
+    return None
+
+
+def sample_queries(seed=0, count=400):
+    """Full names, last names, nicknames and partial names."""
+    rng = random.Random(seed)
+    all_players = players.get_players()
+    queries = list(PLAYER_NICKNAMES)
+    for player in rng.sample(all_players, count):
+        full_name = f"{player['first_name']} {player['last_name']}".lower()
+        start = rng.randrange(len(full_name))
+        queries += [full_name, player["last_name"].lower(), full_name[start : start + 5]]
+    return queries + ["xq", "zzzzzz", "jam", "a"]
+
+
+@pytest.fixture(scope="module")
+def index():
+    return EntityIndex(players.get_players(), teams.get_teams())
+
+
+def test_player_lookup_matches_linear_scan(index):
+    """Index returns the same record as the original scans (outside accent-folded hits)."""
+    for query in sample_queries():
+        expected = linear_player_lookup(query)
+        actual = index.lookup_player(query)
+        if expected is None:
+            continue  # Index may additionally resolve accent-folded names
+        folded = fold_accents(get_alternate_spelling(get_player_nickname_search(query)))
+        if actual != expected and (
+            folded in index._player_folded_full or folded in index._player_folded_last
+        ):
+            continue  # Folded exact match now wins over a raw substring hit
+        assert actual == expected, query
+
+
+def test_team_lookup_matches_variations(index):
+    """Every variation, name, city and abbreviation resolves to the right team."""
+    for variation, abbreviation in TEAM_VARIATIONS.items():
+        team = index.lookup_team(variation)
+        assert team is not None and team["abbreviation"] == abbreviation, variation
+
+    for team in teams.get_teams():
+        for key in ("full_name", "abbreviation", "city", "nickname"):
+            assert index.lookup_team(team[key].lower()) is not None
+
+
+def test_accent_folded_names_resolve():
+    """Players with diacritics resolve from plain ASCII input."""
+    ref = resolve_player("Dennis Schroder")
+    assert ref is not None and ref.name == "Dennis Schröder"
+    assert ref.confidence == 1.0
+
+    ref = resolve_player("Porzingis")
+    assert ref is not None and fold_accents(ref.name) == "Kristaps Porzingis"
+
+
+def test_substring_candidates_are_ordered(index):
+    """Candidates are every name containing the query, in nba_api order."""
+    expected = [
+        p
+        for p in players.get_players()
+        if "curry" in f"{p['first_name']} {p['last_name']}".lower()
+    ]
+    assert index.player_candidates("curry") == expected
+    assert index.player_candidates("qqqq") == []
+
+
+def test_fuzzy_suggestions_for_typos():
+    """Typos with no substring match still get suggestions."""
+    names = [ref.name for ref in suggest_players("lebrn james")]
+    assert "LeBron James" in names
+
+
+@pytest.mark.performance
+def test_benchmark_cold_lookup():
+    """Cold (uncached) resolution through the index vs linear scans."""
+    get_entity_index()  # Built once at startup
+    queries = sample_queries(seed=1, count=200)
+
+    start = time.perf_counter()
+    for query in queries:
+        linear_player_lookup(query)
+    linear_seconds = time.perf_counter() - start
+
+    clear_entity_cache()
+    start = time.perf_counter()
+    for query in queries:
+        _cached_player_lookup(query)
+    index_seconds = time.perf_counter() - start
+
+    per_query_ms = index_seconds * 1000 / len(queries)
+    print(
+        f"\n✅ Cold player lookup over {len(queries)} queries: linear "
+        f"{linear_seconds * 1000:.1f}ms, index {index_seconds * 1000:.1f}ms "
+        f"({per_query_ms:.3f}ms/query)"
+    )
+    # Both timings come from the same run, so a loaded runner slows them alike
+    assert index_seconds < linear_seconds
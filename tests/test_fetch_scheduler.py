@@ -0,0 +1,234 @@
+"""
+Tests for the shared fetch scheduler and bounded multi-season fetching.
+
+Validates:
+1. Concurrency never exceeds the scheduler limit
+2. Throttling (429/timeout) halves the limit, backs off and retries
+3. Non-throttle errors propagate without retries
+4. fetch_grouping_multi_season streams seasons through the scheduler,
+   enriches each season separately, concatenates them in season order and
+   reports progress
+"""
+import asyncio
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from nba_mcp.api import data_groupings
+from nba_mcp.api.data_groupings import fetch_grouping_multi_season
+from nba_mcp.api.errors import NBAApiError
+from nba_mcp.data import fetch_scheduler
+from nba_mcp.data.fetch_scheduler import (
+    FetchScheduler,
+    SchedulerConfig,
+    is_throttle_error,
+)
+
+SEASONS = [f"{year}-{str(year + 1)[-2:]}" for year in range(2004, 2024)]
+
+
+def fast_scheduler(**overrides) -> FetchScheduler:
+    """Scheduler with millisecond backoff for tests."""
+    config = SchedulerConfig(base_delay=0.01, max_delay=0.05, **overrides)
+    return FetchScheduler(config)
+
+
+class FakeGrouping:
+    """Stand-in for fetch_grouping that records concurrency."""
+
+    def __init__(self, fail_seasons=(), delay=0.02):
+        self.active = 0
+        self.peak = 0
+        self.calls = []
+        self.fail_seasons = set(fail_seasons)
+        self.delay = delay
+
+    async def __call__(self, grouping_level, enrich=True, **filters):
+        season = filters["season"]
+        self.calls.append((season, enrich))
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            # Later seasons finish first to exercise reordering
+            await asyncio.sleep(self.delay * (1 + SEASONS[::-1].index(season) % 3))
+            if season in self.fail_seasons:
+                raise ValueError(f"no data for {season}")
+            return pd.DataFrame(
+                {
+                    "PLAYER_ID": [2544, 2544],
+                    "SEASON_YEAR": [season, season],
+                    "PTS": [30, 25],
+                    "MATCHUP": ["LAL vs. BOS", "LAL @ NYK"],
+                }
+            )
+        finally:
+            self.active -= 1
+
+
+def test_is_throttle_error():
+    """429s, timeouts and wrapped messages count as throttling."""
+    assert is_throttle_error(asyncio.TimeoutError())
+    assert is_throttle_error(NBAApiError("slow down", status_code=429))
+    assert is_throttle_error(Exception("HTTPSConnectionPool: Read timed out."))
+    assert not is_throttle_error(ValueError("bad season"))
+    assert not is_throttle_error(NBAApiError("missing", status_code=404))
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_capped():
+    """No more than max_concurrency requests run at once."""
+    scheduler = fast_scheduler(max_concurrency=3)
+    active, peak = 0, 0
+
+    async def fetch(i):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return i
+
+    results = await asyncio.gather(*[scheduler.run(fetch, i) for i in range(20)])
+
+    assert results == list(range(20))
+    assert peak == 3
+    assert scheduler.get_stats()["peak_active"] == 3
+
+
+@pytest.mark.asyncio
+async def test_throttling_backs_off_and_retries():
+    """A 429 halves the limit and the request is retried after a pause."""
+    scheduler = fast_scheduler(max_concurrency=4)
+    attempts = {}
+
+    async def fetch(i):
+        attempts[i] = attempts.get(i, 0) + 1
+        if i == 0 and attempts[i] == 1:
+            raise NBAApiError("Too Many Requests", status_code=429)
+        await asyncio.sleep(0.005)
+        return i
+
+    results = await asyncio.gather(*[scheduler.run(fetch, i) for i in range(6)])
+
+    assert results == list(range(6))
+    assert attempts[0] == 2
+    assert scheduler.stats["throttled"] == 1 and scheduler.stats["retries"] == 1
+    assert scheduler.limit < 4
+
+
+@pytest.mark.asyncio
+async def test_limit_recovers_after_successes():
+    """Consecutive successes grow the limit back to the maximum."""
+    scheduler = fast_scheduler(max_concurrency=4, increase_after=2)
+    scheduler.limit = 1
+
+    async def fetch():
+        return None
+
+    for _ in range(10):
+        await scheduler.run(fetch)
+    assert scheduler.limit == 4
+
+
+@pytest.mark.asyncio
+async def test_non_throttle_errors_are_not_retried():
+    """Ordinary failures raise immediately."""
+    scheduler = fast_scheduler()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        raise ValueError("invalid season")
+
+    with pytest.raises(ValueError):
+        await scheduler.run(fetch)
+    assert len(calls) == 1
+    assert scheduler.limit == scheduler.config.max_concurrency
+
+
+@pytest.mark.asyncio
+async def test_multi_season_fetch_is_bounded_and_ordered():
+    """20 seasons never exceed the cap; results come back in season order."""
+    fake = FakeGrouping(fail_seasons={"2010-11"})
+    scheduler = fast_scheduler(max_concurrency=4)
+
+    with patch.object(data_groupings, "fetch_grouping", fake), patch.object(
+        fetch_scheduler, "_fetch_scheduler", scheduler
+    ):
+        df = await fetch_grouping_multi_season(
+            "player/game", seasons=SEASONS, enrich=False, player_id=2544
+        )
+
+    assert fake.peak <= 4
+    assert all(enrich is False for _, enrich in fake.calls)
+    expected = [s for s in SEASONS if s != "2010-11"]
+    assert df["SEASON_YEAR"].drop_duplicates().tolist() == expected
+    assert len(df) == 2 * len(expected)
+
+
+@pytest.mark.asyncio
+async def test_multi_season_enriches_per_season_and_reports_progress():
+    """Each season is enriched on its own; ctx gets per-season progress."""
+    fake = FakeGrouping(delay=0.001)
+    progress = []
+
+    class FakeContext:
+        async def report_progress(self, progress_value, total=None):
+            progress.append((progress_value, total))
+
+        async def info(self, message):
+            pass
+
+    async def enrich(df, grouping_level, enrichments, exclude_enrichments):
+        enrich.calls += 1
+        return df.assign(ENRICHED=True)
+
+    enrich.calls = 0
+    seasons = SEASONS[:3]
+
+    with patch.object(data_groupings, "fetch_grouping", fake), patch.object(
+        data_groupings, "_enrich_grouping", enrich
+    ), patch.object(fetch_scheduler, "_fetch_scheduler", fast_scheduler()):
+        df = await fetch_grouping_multi_season(
+            "player/game", seasons=seasons, ctx=FakeContext(), player_id=2544
+        )
+
+    assert enrich.calls == 3
+    assert df["ENRICHED"].all() and len(df) == 6
+    assert df["SEASON_YEAR"].drop_duplicates().tolist() == seasons
+    assert progress == [(1, 3), (2, 3), (3, 3)]
+
+
+@pytest.mark.asyncio
+async def test_rest_days_do_not_span_seasons():
+    """A season's first game has no DAYS_REST; rows stay grouped by season."""
+    dates = {
+        "2022-23": ["2023-04-07", "2023-04-09"],
+        "2023-24": ["2023-10-24", "2023-10-25"],
+    }
+
+    async def fetch(grouping_level, enrich=True, **filters):
+        season = filters["season"]
+        return pd.DataFrame(
+            {
+                "PLAYER_ID": [2544, 2544],
+                "SEASON_YEAR": [season, season],
+                "GAME_DATE": dates[season],
+                "MATCHUP": ["LAL vs. BOS", "LAL @ NYK"],
+            }
+        )
+
+    with patch.object(data_groupings, "fetch_grouping", fetch), patch.object(
+        fetch_scheduler, "_fetch_scheduler", fast_scheduler()
+    ):
+        df = await fetch_grouping_multi_season(
+            "player/game",
+            seasons=["2022-23", "2023-24"],
+            enrichments=["game_context"],
+            player_id=2544,
+        )
+
+    assert df["SEASON_YEAR"].tolist() == ["2022-23", "2022-23", "2023-24", "2023-24"]
+    assert df["DAYS_REST"].isna().tolist() == [True, False, True, False]
+    assert df["IS_BACK_TO_BACK"].tolist() == [False, False, False, True]
@@ -0,0 +1,267 @@
+"""
+Tests for the asyncio per-host token bucket limiter.
+
+Validates:
+1. Waiters are served FIFO, interactive lanes before background lanes
+2. Deadlines fail fast (or time out) with RateLimitError
+3. Hosts are paced independently; hosts without a limit are not paced
+4. fetch_endpoint queues on its registration's upstream host
+5. Queue depth, waits and deadline misses reach Prometheus
+
+Run benchmark: pytest tests/test_host_limiter.py -m performance -s
+"""
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from nba_mcp.api.errors import RateLimitError
+from nba_mcp.data import fetch
+from nba_mcp.data.endpoint_registry import register_endpoint, unregister_endpoint
+from nba_mcp.rate_limit import host_limiter
+from nba_mcp.rate_limit.host_limiter import (
+    AsyncTokenBucket,
+    HostRateLimiter,
+    Priority,
+    current_priority,
+    upstream_priority,
+)
+
+
+_real_sleep = asyncio.sleep
+
+
+class FakeClock:
+    """
+    Monotonic clock for the limiter whose sleeps advance it instantly.
+
+    Pacing assertions then measure limiter time, not a loaded runner's wall
+    clock. Sleeps advance at least 1us so float rounding cannot stall a wait.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, delay, result=None):
+        self.now += max(delay, 1e-6)
+        await _real_sleep(0)
+        return result
+
+
+class _AsyncioWithClock:
+    """The asyncio module as seen by host_limiter, with the fake clock's sleep."""
+
+    def __init__(self, clock: FakeClock):
+        self.sleep = clock.sleep
+
+    def __getattr__(self, name):
+        return getattr(asyncio, name)
+
+
+@pytest.fixture
+def clock():
+    fake = FakeClock()
+    with patch.object(host_limiter, "time", SimpleNamespace(monotonic=fake.monotonic)), \
+            patch.object(host_limiter, "asyncio", _AsyncioWithClock(fake)):
+        yield fake
+
+
+async def drain(bucket: AsyncTokenBucket):
+    """Empty the bucket so the next acquire has to queue."""
+    while bucket.tokens >= 1:
+        await bucket.acquire()
+
+
+@pytest.mark.asyncio
+async def test_fast_path_then_queue_in_fifo_order():
+    """A full bucket grants immediately; queued requests are served in arrival order."""
+    bucket = AsyncTokenBucket(capacity=2, refill_rate=200)
+    assert await bucket.acquire() == 0.0
+    await drain(bucket)
+
+    order = []
+
+    async def request(i):
+        await bucket.acquire()
+        order.append(i)
+
+    await asyncio.gather(*(request(i) for i in range(6)))
+
+    assert order == list(range(6))
+    assert bucket.stats["acquired"] == 8 and bucket.stats["queued"] == 6
+    assert bucket.queue_depth() == 0
+
+
+@pytest.mark.asyncio
+async def test_interactive_served_before_background():
+    """Background requests queued first still wait behind interactive ones."""
+    bucket = AsyncTokenBucket(capacity=1, refill_rate=100)
+    await drain(bucket)
+    order = []
+
+    async def request(name, priority):
+        await bucket.acquire(priority=priority)
+        order.append(name)
+
+    background = [asyncio.create_task(request(f"bg{i}", Priority.BACKGROUND)) for i in range(3)]
+    await asyncio.sleep(0)
+    interactive = [asyncio.create_task(request(f"ui{i}", Priority.INTERACTIVE)) for i in range(2)]
+    await asyncio.gather(*background, *interactive)
+
+    assert order == ["ui0", "ui1", "bg0", "bg1", "bg2"]
+
+
+@pytest.mark.asyncio
+async def test_deadline_fails_fast_and_times_out(clock):
+    """Too long a queue is rejected up front; a cancelled slot is released."""
+    bucket = AsyncTokenBucket(capacity=1, refill_rate=1, name="stats.nba.com")
+    await drain(bucket)
+
+    with pytest.raises(RateLimitError) as exc_info:
+        await bucket.acquire(max_wait=0.1)
+    assert clock.now == 0.0  # rejected without waiting
+    assert exc_info.value.details["retry_after_seconds"] >= 1
+
+    queued = asyncio.create_task(bucket.acquire(priority=Priority.BACKGROUND))
+    await asyncio.sleep(0)
+    assert bucket.queue_depth(Priority.BACKGROUND) == 1
+    queued.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+    assert bucket.queue_depth() == 0
+    assert bucket.stats["deadline_exceeded"] == 1
+
+    with pytest.raises(ValueError):
+        await bucket.acquire(tokens=5)
+
+
+@pytest.mark.asyncio
+async def test_wait_for_timeout_raises_rate_limit_error():
+    """A wait that outlasts its deadline (estimate was optimistic) still raises."""
+    bucket = AsyncTokenBucket(capacity=1, refill_rate=10)
+    await drain(bucket)
+    bucket.refill_rate = 1000  # estimate says ~1ms...
+    blocker = asyncio.create_task(bucket.acquire())
+    await asyncio.sleep(0)
+    bucket.refill_rate = 2  # ...but tokens now arrive every 500ms
+
+    with pytest.raises(RateLimitError):
+        await bucket.acquire(max_wait=0.05)
+    await blocker
+    assert bucket.stats["deadline_exceeded"] == 1
+
+
+@pytest.mark.asyncio
+async def test_hosts_paced_independently(clock):
+    """An empty stats.nba.com bucket does not slow cdn.nba.com or unknown hosts."""
+    limiter = HostRateLimiter({"stats.nba.com": (1, 1), "cdn.nba.com": (5, 50)}, max_wait=0.5)
+    await limiter.acquire("https://stats.nba.com/stats/leaguegamelog")
+
+    with pytest.raises(RateLimitError):
+        await limiter.acquire("stats.nba.com")
+    for _ in range(5):
+        assert await limiter.acquire("https://cdn.nba.com/static/json/liveData/x.json") == 0.0
+    assert await limiter.acquire("example.com") == 0.0
+    assert clock.now == 0.0
+
+    stats = limiter.get_stats()
+    assert set(stats) == {"stats.nba.com", "cdn.nba.com"}
+    assert stats["cdn.nba.com"]["acquired"] == 5
+
+
+@pytest.mark.asyncio
+async def test_sustained_rate_and_context_priority(clock):
+    """Queued requests are paced at refill_rate; priority follows the context."""
+    limiter = HostRateLimiter({"stats.nba.com": (1, 40)}, max_wait=None)
+    with upstream_priority(Priority.BACKGROUND):
+        assert current_priority() == Priority.BACKGROUND
+        await asyncio.gather(*(limiter.acquire("stats.nba.com") for _ in range(9)))
+    assert current_priority() == Priority.INTERACTIVE
+
+    # 1 burst token + 8 refills at 40/s = 0.2s
+    assert clock.now == pytest.approx(0.2, abs=0.001)
+    assert limiter.get_stats()["stats.nba.com"]["max_wait_seconds"] == pytest.approx(0.2, abs=0.001)
+
+
+@pytest.mark.asyncio
+async def test_fetch_endpoint_queues_on_upstream_host():
+    """fetch_endpoint paces by registration host; hosts of None are never paced."""
+    calls = []
+
+    @register_endpoint("paced_test_endpoint")
+    async def paced(params, provenance):
+        calls.append(time.perf_counter())
+        return pd.DataFrame({"x": [1]})
+
+    @register_endpoint("unpaced_test_endpoint", upstream_host=None)
+    async def unpaced(params, provenance):
+        return pd.DataFrame({"x": [1]})
+
+    limiter = HostRateLimiter({"stats.nba.com": (2, 20)})
+    try:
+        with patch.object(host_limiter, "_host_limiter", limiter):
+            await asyncio.gather(*(fetch.fetch_endpoint("paced_test_endpoint", {}) for _ in range(6)))
+            for _ in range(5):
+                await fetch.fetch_endpoint("unpaced_test_endpoint", {})
+    finally:
+        unregister_endpoint("paced_test_endpoint")
+        unregister_endpoint("unpaced_test_endpoint")
+
+    stats = limiter.get_stats()["stats.nba.com"]
+    assert stats["acquired"] == 6 and stats["queued"] == 4
+    assert calls[-1] - calls[0] > 0.15  # 4 refills at 20/s
+
+
+@pytest.mark.asyncio
+async def test_metrics_recorded():
+    """Waits, queue depth and deadline misses are exported per host and lane."""
+    from nba_mcp.observability import metrics
+
+    manager = metrics.initialize_metrics()
+    bucket = AsyncTokenBucket(capacity=1, refill_rate=100, name="metrics.test")
+    await drain(bucket)
+    await asyncio.gather(*(bucket.acquire(priority=Priority.BACKGROUND) for _ in range(3)))
+    await drain(bucket)
+    with pytest.raises(RateLimitError):
+        await bucket.acquire(max_wait=0)
+
+    wait = metrics.UPSTREAM_WAIT_SECONDS.labels(host="metrics.test", priority="background")
+    depth = metrics.UPSTREAM_QUEUE_DEPTH.labels(host="metrics.test", priority="background")
+    missed = metrics.UPSTREAM_DEADLINE_EXCEEDED.labels(host="metrics.test", priority="interactive")
+    assert wait._sum.get() > 0
+    assert depth._value.get() == 0
+    assert missed._value.get() >= 1
+
+    manager.update_upstream_limiter({"metrics.test": bucket.get_stats()})
+    tokens = metrics.UPSTREAM_TOKENS.labels(host="metrics.test")._value.get()
+    assert tokens == pytest.approx(bucket.get_stats()["tokens"], abs=0.5)
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_benchmark_fan_out_burst(clock):
+    """A 40-request fan-out: reject-on-empty vs queue-and-pace (limiter time)."""
+    from nba_mcp.rate_limit.token_bucket import TokenBucket
+
+    rejecting = TokenBucket(capacity=5, refill_rate=20)
+    rejected = sum(1 for _ in range(40) if not rejecting.consume())
+
+    limiter = HostRateLimiter({"stats.nba.com": (5, 20)})
+    waits = await asyncio.gather(*(limiter.acquire("stats.nba.com") for _ in range(40)))
+    elapsed = clock.now
+    stats = limiter.get_stats()["stats.nba.com"]
+
+    print()
+    print(f"✅ Reject-on-empty bucket: {rejected}/40 requests failed")
+    print(f"✅ Queued bucket: 0/40 failed, drained in {elapsed:.2f}s "
+          f"(avg wait {stats['avg_wait_seconds'] * 1000:.0f}ms, max {max(waits) * 1000:.0f}ms)")
+
+    assert rejected >= 30
+    assert stats["acquired"] == 40 and stats["deadline_exceeded"] == 0
+    assert elapsed == pytest.approx(1.75, abs=0.01)  # 35 refills at 20/s
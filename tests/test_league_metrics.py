@@ -0,0 +1,298 @@
+"""
+Tests for the league-wide (batch) advanced metrics pipeline.
+
+Validates:
+1. Vectorized metrics match calculate_all_metrics for every player
+2. Game logs are aggregated per player (GP, latest team, nulls, zero minutes)
+3. The store builds a season once, shares concurrent builds and persists it
+4. Leaderboards, and calculate_all_metrics / MCP tools answering from the store
+
+Run benchmark: pytest tests/test_league_metrics.py -m performance -s
+"""
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from nba_mcp import nba_server
+from nba_mcp.api import advanced_metrics_calculator as amc
+from nba_mcp.api.advanced_metrics_calculator import (
+    LEAGUE_METRIC_COLUMNS,
+    AdvancedMetricsCalculator,
+    LeagueMetricsStore,
+    aggregate_player_totals,
+    calculate_effective_fg_pct,
+    calculate_game_score,
+    calculate_true_shooting_pct,
+    compute_league_metrics,
+    effective_fg_pct_array,
+    game_score_array,
+    true_shooting_pct_array,
+)
+
+SEASON = "2023-24"
+STATS = ["MIN", "PTS", "FGM", "FGA", "FG3M", "FG3A", "FTM", "FTA",
+         "OREB", "DREB", "REB", "AST", "STL", "BLK", "TOV", "PF"]
+
+
+def make_league_games(num_players: int = 450, games: int = 70, seed: int = 0) -> pa.Table:
+    """league_player_games-shaped table (one row per player per game)."""
+    rng = np.random.default_rng(seed)
+    player_ids = np.repeat(np.arange(1, num_players + 1) * 1000, games)
+    n = len(player_ids)
+    fga = rng.integers(0, 25, n)
+    fgm = rng.binomial(fga, 0.47)
+    fg3a = rng.binomial(fga, 0.4)
+    fg3m = np.minimum(rng.binomial(fg3a, 0.36), fgm)
+    fta = rng.integers(0, 10, n)
+    ftm = rng.binomial(fta, 0.78)
+    oreb = rng.integers(0, 5, n)
+    dreb = rng.integers(0, 10, n)
+    dates = pd.date_range("2023-10-24", periods=games, freq="2D").strftime("%Y-%m-%dT00:00:00")
+    return pa.table(
+        {
+            "SEASON_YEAR": [SEASON] * n,
+            "PLAYER_ID": player_ids,
+            "PLAYER_NAME": [f"Player {pid}" for pid in player_ids],
+            "TEAM_ID": 1610612737 + (player_ids // 1000) % 30,
+            "TEAM_ABBREVIATION": [f"T{(pid // 1000) % 30:02d}" for pid in player_ids],
+            # newest first, as PlayerGameLogs returns them
+            "GAME_DATE": np.tile(dates[::-1], num_players),
+            "MIN": rng.uniform(0, 40, n).round(2),
+            "PTS": 2 * (fgm - fg3m) + 3 * fg3m + ftm,
+            "FGM": fgm, "FGA": fga, "FG3M": fg3m, "FG3A": fg3a, "FTM": ftm, "FTA": fta,
+            "OREB": oreb, "DREB": dreb, "REB": oreb + dreb,
+            "AST": rng.integers(0, 12, n), "STL": rng.integers(0, 4, n),
+            "BLK": rng.integers(0, 4, n), "TOV": rng.integers(0, 6, n), "PF": rng.integers(0, 6, n),
+        }
+    )
+
+
+GAMES = make_league_games()
+
+
+class CountingFetch:
+    """league_player_games stand-in that counts requests."""
+
+    def __init__(self, games=GAMES, delay=0.0):
+        self.games = games
+        self.delay = delay
+        self.calls = []
+
+    async def __call__(self, season, season_type):
+        self.calls.append((season, season_type))
+        await asyncio.sleep(self.delay)
+        return self.games
+
+
+def scalar_totals(games: pa.Table) -> dict:
+    """Season totals per player, as get_player_season_stats returns them."""
+    df = games.to_pandas()
+    totals = df.groupby("PLAYER_ID")[STATS].sum()
+    totals["GP"] = df.groupby("PLAYER_ID").size()
+    return {pid: row.to_dict() for pid, row in totals.iterrows()}
+
+
+@pytest.mark.asyncio
+async def test_batch_matches_scalar_calculator():
+    """Every metric equals calculate_all_metrics on the same season totals."""
+    table = compute_league_metrics(GAMES, SEASON)
+    totals = scalar_totals(GAMES)
+    calculator = AdvancedMetricsCalculator()
+
+    assert table.num_rows == 450
+    for row in table.to_pylist()[::15]:
+        expected = await calculator.calculate_all_metrics(
+            row["PLAYER_NAME"], SEASON, player_stats=totals[row["PLAYER_ID"]], team_stats={}
+        )
+        actual = amc.AdvancedMetrics.from_league_row(row)
+        for field in ("game_score_total", "game_score_per_game", "game_score_per_36",
+                      "true_shooting_pct", "effective_fg_pct", "offensive_win_shares",
+                      "defensive_win_shares", "win_shares", "win_shares_per_48", "ewa"):
+            assert getattr(actual, field) == pytest.approx(getattr(expected, field), abs=1e-9)
+
+    win_shares = table["WIN_SHARES"].to_numpy()
+    assert (np.diff(win_shares) <= 0).all()
+
+
+def test_row_wise_kernels_match_scalar_functions():
+    """game_score/TS%/eFG% arrays equal the scalar functions row by row."""
+    df = GAMES.slice(0, 500).to_pandas()
+    records = df.to_dict("records")
+
+    np.testing.assert_allclose(game_score_array(df), [calculate_game_score(r) for r in records])
+    np.testing.assert_allclose(
+        true_shooting_pct_array(df["PTS"], df["FGA"], df["FTA"]),
+        [calculate_true_shooting_pct(r["PTS"], r["FGA"], r["FTA"]) for r in records],
+    )
+    np.testing.assert_allclose(
+        effective_fg_pct_array(df["FGM"], df["FG3M"], df["FGA"]),
+        [calculate_effective_fg_pct(r["FGM"], r["FG3M"], r["FGA"]) for r in records],
+    )
+
+
+def test_aggregation_edge_cases():
+    """Latest team wins, nulls count as zero, zero-minute players get zeros."""
+    games = pa.table(
+        {
+            "PLAYER_ID": [1, 1, 1, 2],
+            "PLAYER_NAME": ["Traded", "Traded", "Traded", "Bench"],
+            "TEAM_ABBREVIATION": ["NEW", "OLD", "OLD", "BEN"],
+            "GAME_DATE": ["2024-02-10", "2023-11-01", "2023-12-01", "2024-01-01"],
+            "MIN": [30.0, 20.0, None, 0.0],
+            "PTS": [20, 10, None, 0],
+            "FGA": [15, 8, 2, 0],
+            "FGM": [8, 4, 1, 0],
+        }
+    )
+    totals = aggregate_player_totals(games)
+    metrics = {r["PLAYER_ID"]: r for r in compute_league_metrics(games, "1999-00").to_pylist()}
+
+    assert totals.column_names[:4] == ["PLAYER_ID", "PLAYER_NAME", "TEAM_ABBREVIATION", "GP"]
+    assert metrics[1]["TEAM_ABBREVIATION"] == "NEW"
+    assert metrics[1]["GP"] == 3 and metrics[1]["MIN"] == 50.0 and metrics[1]["PTS"] == 30.0
+    assert metrics[2]["GAME_SCORE_PER_36"] == 0.0
+    assert metrics[2]["WIN_SHARES"] == 0.0 and metrics[2]["EWA"] == 0.0
+    assert set(LEAGUE_METRIC_COLUMNS) <= set(metrics[2])
+
+
+@pytest.mark.asyncio
+async def test_store_builds_once_and_indexes_players():
+    """Concurrent requests share one build; lookups are index hits."""
+    fetch = CountingFetch(delay=0.02)
+    store = LeagueMetricsStore(cache_dir=None, fetch_func=fetch)
+
+    tables = await asyncio.gather(*(store.get_table(SEASON) for _ in range(5)))
+    row = await store.lookup(7000, SEASON)
+
+    assert len(fetch.calls) == 1
+    assert all(t is tables[0] for t in tables)
+    assert row["PLAYER_ID"] == 7000 and row["SEASON"] == SEASON
+    assert await store.lookup(999, SEASON) is None
+    stats = store.get_stats()
+    assert stats["builds"] == 1 and stats["lookups"] == 2 and stats["lookup_misses"] == 1
+
+    await store.get_table(SEASON, "Playoffs")
+    assert fetch.calls[-1] == (SEASON, "Playoffs") and len(fetch.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_store_persists_and_expires(tmp_path):
+    """A new store loads the parquet; stale or invalidated tables are rebuilt."""
+    fetch = CountingFetch()
+    await LeagueMetricsStore(cache_dir=tmp_path, fetch_func=fetch).get_table(SEASON)
+    assert (tmp_path / f"{SEASON}_regular_season.parquet").exists()
+
+    reloaded = LeagueMetricsStore(cache_dir=tmp_path, fetch_func=fetch)
+    row = await reloaded.lookup(1000, SEASON)
+    assert reloaded.stats["disk_loads"] == 1 and len(fetch.calls) == 1
+    assert row["PLAYER_NAME"] == "Player 1000"
+
+    expired = LeagueMetricsStore(cache_dir=tmp_path, max_age=0, fetch_func=fetch)
+    await expired.get_table(SEASON)
+    assert expired.stats["disk_loads"] == 0 and len(fetch.calls) == 2
+
+    reloaded.invalidate(SEASON)
+    assert not list(tmp_path.glob("*.parquet"))
+    await reloaded.get_table(SEASON)
+    assert len(fetch.calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_leaders():
+    """Ranked by metric, filtered by games played; unknown metrics rejected."""
+    games = pa.concat_tables([GAMES, make_league_games(num_players=5, games=10, seed=1)
+                              .set_column(1, "PLAYER_ID", pa.array(np.repeat(np.arange(1, 6), 10)))])
+    store = LeagueMetricsStore(cache_dir=None, fetch_func=CountingFetch(games))
+
+    top = await store.leaders(SEASON, metric="TRUE_SHOOTING_PCT", top_n=10, min_games=20)
+    values = top["TRUE_SHOOTING_PCT"].to_numpy()
+
+    assert top["RANK"].to_pylist() == list(range(1, 11))
+    assert (np.diff(values) <= 0).all()
+    assert min(top["GP"].to_pylist()) >= 20
+    assert (await store.leaders(SEASON, "EWA", top_n=3, ascending=True))["EWA"].to_pylist() == sorted(
+        (await store.get_table(SEASON))["EWA"].to_pylist()
+    )[:3]
+    with pytest.raises(ValueError, match="Unknown metric"):
+        await store.leaders(SEASON, metric="PER")
+
+
+@pytest.mark.asyncio
+async def test_calculate_all_metrics_uses_store():
+    """Without team_stats the stored row answers; unknown players fall back."""
+    store = LeagueMetricsStore(cache_dir=None, fetch_func=CountingFetch())
+    calculator = AdvancedMetricsCalculator()
+    fallback = AsyncMock(return_value=scalar_totals(GAMES)[2000])
+
+    with patch.object(amc, "_league_metrics_store", store), \
+            patch("nba_mcp.api.entity_resolver.resolve_entity",
+                  side_effect=lambda name, entity_type: SimpleNamespace(entity_id=int(name.split()[1]))), \
+            patch.object(calculator, "_fetch_player_season_stats", fallback):
+        stored = await calculator.calculate_all_metrics("Player 3000", SEASON)
+        missing = await calculator.calculate_all_metrics("Player 5", SEASON)
+
+    expected = (await store.lookup(3000, SEASON))["WIN_SHARES"]
+    assert stored.player_name == "Player 3000" and stored.win_shares == expected
+    assert fallback.await_count == 1 and missing.win_shares > 0
+
+
+@pytest.mark.asyncio
+async def test_league_advanced_metrics_tool():
+    """The MCP tool ranks the league and reports cache hits after the first build."""
+    fetch = CountingFetch()
+    store = LeagueMetricsStore(cache_dir=None, fetch_func=fetch)
+    with patch.object(amc, "_league_metrics_store", store):
+        first = json.loads(await nba_server.get_league_advanced_metrics(SEASON, top_n=5))
+        second = json.loads(await nba_server.get_league_advanced_metrics(SEASON, metric="EWA", top_n=5))
+        invalid = json.loads(await nba_server.get_league_advanced_metrics(SEASON, metric="PER"))
+
+    assert first["status"] == "success" and len(first["data"]["players"]) == 5
+    assert first["metadata"]["cache_status"] == "miss"
+    assert second["metadata"]["cache_status"] == "hit"
+    assert second["data"]["players"][0]["RANK"] == 1
+    assert invalid["status"] == "error"
+    assert len(fetch.calls) == 1
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_benchmark_batch_vs_per_player():
+    """Scalar calculate_all_metrics per player vs one vectorized pass and index lookups."""
+    totals = scalar_totals(GAMES)
+    calculator = AdvancedMetricsCalculator()
+    logging_level = amc.logger.level
+    amc.logger.setLevel("WARNING")
+
+    start = time.perf_counter()
+    for pid, stats in totals.items():
+        await calculator.calculate_all_metrics(f"Player {pid}", SEASON, player_stats=stats, team_stats={})
+    scalar_ms = (time.perf_counter() - start) * 1000
+    amc.logger.setLevel(logging_level)
+
+    start = time.perf_counter()
+    compute_league_metrics(GAMES, SEASON)
+    batch_ms = (time.perf_counter() - start) * 1000
+
+    fetch = CountingFetch()
+    store = LeagueMetricsStore(cache_dir=None, fetch_func=fetch)
+    await store.get_table(SEASON)
+    start = time.perf_counter()
+    for pid in totals:
+        await store.lookup(pid, SEASON)
+    lookup_us = (time.perf_counter() - start) * 1e6 / len(totals)
+
+    print()
+    print(f"✅ Scalar metrics for {len(totals)} players (stats already fetched): {scalar_ms:.1f}ms "
+          f"(plus {len(totals)} season-stat fetches)")
+    print(f"✅ Vectorized league pass over {GAMES.num_rows} game rows: {batch_ms:.1f}ms (1 fetch)")
+    print(f"✅ Stored player lookup: {lookup_us:.1f}µs")
+
+    assert len(fetch.calls) == 1
+    assert lookup_us < 1000
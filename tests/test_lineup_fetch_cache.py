@@ -0,0 +1,189 @@
+"""
+Tests for lineup data fetching through the team_lineups endpoint.
+
+Validates:
+1. Lineup fetches go through unified_fetch (cache hit on repeat)
+2. Multi-season fetches run concurrently (API call off the event loop)
+3. Parquet persistence across restarts, with TTL expiry
+4. Current-season (or season-less) Parquet entries expire with at most DAILY,
+   whatever the endpoint tier; past seasons persist
+"""
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+import nba_mcp.data.fetch  # noqa: F401  (registers endpoints)
+from nba_mcp.data.cache_integration import get_cache_manager, reset_cache_manager
+from nba_mcp.nba_server import _fetch_lineup_data
+
+LAKERS = 1610612747
+SEASONS = ["2019-20", "2020-21", "2021-22"]
+
+
+class FakeLineups:
+    """Stand-in for LeagueDashLineups that blocks like the real HTTP call."""
+
+    calls = []
+    delay = 0.2
+    lock = threading.Lock()
+
+    def __init__(self, team_id_nullable, season, **kwargs):
+        with self.lock:
+            FakeLineups.calls.append((team_id_nullable, season))
+        time.sleep(self.delay)
+        self.frame = pd.DataFrame(
+            {
+                "GROUP_ID": ["-1-2-3-4-5-"],
+                "GROUP_NAME": ["A - B - C - D - E"],
+                "TEAM_ID": [team_id_nullable],
+                "MIN": [120.0],
+                "SEASON": [season],
+            }
+        )
+
+    def get_data_frames(self):
+        return [self.frame]
+
+
+def start_cache_manager(cache_dir):
+    """Fresh CacheManager (empty Tier 1/2) over a persistent Parquet directory."""
+    reset_cache_manager()
+    manager = get_cache_manager()
+    manager.enable_parquet_cache(cache_dir=cache_dir, background_writes=False)
+    return manager
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    FakeLineups.calls = []
+    with patch("nba_api.stats.endpoints.leaguedashlineups.LeagueDashLineups", FakeLineups):
+        yield tmp_path / "parquet"
+    reset_cache_manager()
+
+
+@pytest.fixture
+def cache_manager(cache_dir):
+    return start_cache_manager(cache_dir)
+
+
+@pytest.mark.asyncio
+async def test_repeat_fetch_is_cached(cache_manager):
+    """Second fetch for the same team/season is served from cache."""
+    first = await _fetch_lineup_data(LAKERS, "2023-24")
+    second = await _fetch_lineup_data(LAKERS, "2023-24")
+
+    assert len(FakeLineups.calls) == 1
+    pd.testing.assert_frame_equal(first, second)
+    assert first["TEAM_ID"].iloc[0] == LAKERS
+
+
+@pytest.mark.asyncio
+async def test_seasons_fetch_concurrently(cache_manager):
+    """Uncached seasons overlap instead of blocking the event loop in turn."""
+    start = time.perf_counter()
+    frames = await asyncio.gather(*[_fetch_lineup_data(LAKERS, s) for s in SEASONS])
+    elapsed = time.perf_counter() - start
+
+    assert [df["SEASON"].iloc[0] for df in frames] == SEASONS
+    assert len(FakeLineups.calls) == 3
+    assert elapsed < FakeLineups.delay * len(SEASONS) * 0.75
+
+
+@pytest.mark.asyncio
+async def test_parquet_entry_survives_restart(cache_dir):
+    """Within the TTL a restarted server is served from Parquet, not the API."""
+    start_cache_manager(cache_dir)
+    await _fetch_lineup_data(LAKERS, "2021-22")
+    await asyncio.sleep(0.05)  # Let the Parquet write land
+
+    start_cache_manager(cache_dir)
+    await _fetch_lineup_data(LAKERS, "2021-22")
+
+    assert len(FakeLineups.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_parquet_entry_is_refetched(cache_dir):
+    """Parquet entries older than the endpoint TTL are treated as misses."""
+    start_cache_manager(cache_dir)
+    await _fetch_lineup_data(LAKERS, "2022-23")
+    await asyncio.sleep(0.05)
+
+    manager = start_cache_manager(cache_dir)
+    with patch.object(manager, "get_ttl_for_endpoint", return_value=0):
+        await _fetch_lineup_data(LAKERS, "2022-23")
+
+    assert len(FakeLineups.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_stale_current_season_parquet_entry_is_refetched(cache_dir):
+    """Current-season entries expire with their 1h tier; past seasons persist."""
+    manager = start_cache_manager(cache_dir)
+    current = manager._get_current_season()
+    fetches = []
+
+    def fetcher(season):
+        async def fetch():
+            fetches.append(season)
+            return pa.table({"SEASON": [season]})
+
+        return fetch
+
+    async def fetch_both(manager):
+        for season in (current, "2015-16"):
+            await manager.get_or_fetch("league_player_games", {"season": season}, fetcher(season))
+
+    await fetch_both(manager)
+    await asyncio.sleep(0.05)
+
+    two_hours_later = datetime.now(timezone.utc) + timedelta(hours=2)
+
+    class TwoHoursLater(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return two_hours_later
+
+    manager = start_cache_manager(cache_dir)
+    with patch("nba_mcp.data.parquet_cache.datetime", TwoHoursLater):
+        await fetch_both(manager)
+
+    assert fetches == [current, "2015-16", current]
+    assert manager.get_parquet_max_age("league_player_games", {"season": "2015-16"}) is None
+
+
+@pytest.mark.asyncio
+async def test_current_season_historical_tier_entry_goes_stale(cache_dir):
+    """A HISTORICAL-tier endpoint still expires with DAILY for the current season."""
+    manager = start_cache_manager(cache_dir)
+    current = {"season": manager._get_current_season(), "team": "LAL"}
+    fetches = []
+
+    async def fetch():
+        fetches.append(1)
+        return pa.table({"GAME_ID": ["0022400001"]})
+
+    await manager.get_or_fetch("team_game_log", current, fetch)
+    await asyncio.sleep(0.05)
+
+    two_hours_later = datetime.now(timezone.utc) + timedelta(hours=2)
+
+    class TwoHoursLater(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return two_hours_later
+
+    manager = start_cache_manager(cache_dir)
+    with patch("nba_mcp.data.parquet_cache.datetime", TwoHoursLater):
+        await manager.get_or_fetch("team_game_log", current, fetch)
+
+    assert len(fetches) == 2
+    assert manager.get_parquet_max_age("team_game_log", current) == 3600
+    assert manager.get_parquet_max_age("team_game_log", {"team": "LAL"}) == 3600
+    assert manager.get_parquet_max_age("team_game_log", {"season": "2015-16"}) is None
@@ -0,0 +1,196 @@
+"""
+Tests for LineupTracker: columnar engine vs row-wise reference.
+
+Validates:
+1. Columnar engine produces identical lineup columns to the row-wise path
+2. Substitutions are applied in order and logged
+3. Stint boundaries (lineup, start/end event, clock) are emitted
+4. Benchmark over a batch of recorded-format games (PlayByPlayV3 layout)
+
+Run benchmark: pytest tests/test_lineup_tracker.py -m performance -s
+"""
+import random
+import time
+
+import pandas as pd
+import pytest
+
+from nba_mcp.api.lineup_tracker import (
+    LINEUP_COLUMNS,
+    LineupTracker,
+    add_lineups_to_play_by_play,
+)
+
+HOME_TEAM = 1610612747
+AWAY_TEAM = 1610612738
+
+
+def make_roster(team_id: int, offset: int):
+    """12-man roster with unique last names."""
+    return [
+        (team_id * 0 + 1_600_000 + offset + i, f"First{offset + i} Last{offset + i}")
+        for i in range(12)
+    ]
+
+
+def make_game(seed: int, events_per_period: int = 120, with_period_start: bool = True) -> pd.DataFrame:
+    """
+    Build a play-by-play frame in PlayByPlayV3 layout.
+
+    Mirrors the recorded format: mixed-case columns, period-start rows with
+    teamId 0, substitutions described as "SUB: <in> FOR <out>" with personId
+    set to the entering player.
+    """
+    rng = random.Random(seed)
+    rosters = {HOME_TEAM: make_roster(HOME_TEAM, 0), AWAY_TEAM: make_roster(AWAY_TEAM, 100)}
+    on_court = {team: roster[:5] for team, roster in rosters.items()}
+    rows = []
+    action_number = 1
+
+    def add(period, clock, team_id, person, action_type, description):
+        nonlocal action_number
+        pid, name = person if person else (0, "")
+        rows.append(
+            {
+                "gameId": f"00223{seed:05d}",
+                "actionNumber": action_number,
+                "clock": clock,
+                "period": period,
+                "teamId": team_id,
+                "personId": pid,
+                "playerName": name.split()[-1] if name else "",
+                "playerNameI": name,
+                "actionType": action_type,
+                "description": description,
+            }
+        )
+        action_number += 1
+
+    # Opening events by starters so both teams' first five are seen first
+    if with_period_start:
+        add(1, "PT12M00.00S", 0, None, "period", "Start of 1st Period")
+    for team in (HOME_TEAM, AWAY_TEAM):
+        for player in on_court[team]:
+            add(1, "PT11M59.00S", team, player, "Made Shot", f"{player[1]} 2' Layup")
+
+    for period in range(1, 5):
+        if period > 1 and with_period_start:
+            add(period, "PT12M00.00S", 0, None, "period", f"Start of period {period}")
+        for i in range(events_per_period):
+            seconds = 720 - int(720 * i / events_per_period)
+            clock = f"PT{seconds // 60:02d}M{seconds % 60:02d}.00S"
+            team = rng.choice([HOME_TEAM, AWAY_TEAM])
+            if rng.random() < 0.12:
+                bench = [p for p in rosters[team] if p not in on_court[team]]
+                out_player = rng.choice(on_court[team])
+                in_player = rng.choice(bench)
+                on_court[team] = [p for p in on_court[team] if p != out_player] + [in_player]
+                add(
+                    period,
+                    clock,
+                    team,
+                    in_player,
+                    "Substitution",
+                    f"SUB: {in_player[1].split()[-1]} FOR {out_player[1].split()[-1]}",
+                )
+            else:
+                player = rng.choice(on_court[team])
+                action = rng.choice(["Made Shot", "Missed Shot", "Rebound", "Turnover", "Foul"])
+                add(period, clock, team, player, action, f"{player[1]} {action}")
+
+    return pd.DataFrame(rows)
+
+
+RECORDED_GAMES = [make_game(seed, with_period_start=seed % 2 == 0) for seed in range(8)]
+
+
+@pytest.mark.parametrize("game_index", range(len(RECORDED_GAMES)))
+def test_columnar_matches_rowwise(game_index):
+    """Both engines produce identical lineup columns and substitution logs."""
+    pbp = RECORDED_GAMES[game_index]
+
+    rowwise = LineupTracker("g")
+    expected = rowwise.process_play_by_play_rowwise(pbp)
+    columnar = LineupTracker("g")
+    actual = columnar.process_play_by_play(pbp)
+
+    pd.testing.assert_frame_equal(actual, expected)
+    assert columnar.substitution_log == rowwise.substitution_log
+    assert columnar.state.home_lineup.player_ids == rowwise.state.home_lineup.player_ids
+    assert columnar.state.away_lineup.player_ids == rowwise.state.away_lineup.player_ids
+
+
+def test_substitution_updates_lineup():
+    """A substitution swaps exactly one player from that point on."""
+    pbp = make_game(3, with_period_start=False)
+    result = add_lineups_to_play_by_play(pbp, "g")
+
+    sub_rows = result.index[result["actiontype"] == "Substitution"]
+    first_sub = sub_rows[0]
+    before = set(result.loc[first_sub - 1, "CURRENT_LINEUP_HOME_IDS"]) | set(
+        result.loc[first_sub - 1, "CURRENT_LINEUP_AWAY_IDS"]
+    )
+    after = set(result.loc[first_sub, "CURRENT_LINEUP_HOME_IDS"]) | set(
+        result.loc[first_sub, "CURRENT_LINEUP_AWAY_IDS"]
+    )
+    assert len(before) == len(after) == 10
+    assert len(before - after) == 1
+    assert result.loc[first_sub, "personid"] in after
+
+
+def test_stint_boundaries():
+    """Stints tile the game, split at lineup changes and period boundaries."""
+    pbp = make_game(5, with_period_start=False)
+    tracker = LineupTracker("g")
+    result = tracker.process_play_by_play(pbp)
+    stints = tracker.get_stints()
+
+    assert not stints.empty
+    assert stints["EVENT_COUNT"].sum() == len(result)
+    assert stints["START_ROW"].iloc[0] == 0
+    assert stints["END_ROW"].iloc[-1] == len(result) - 1
+    assert (stints["START_ROW"].iloc[1:].to_numpy() == stints["END_ROW"].iloc[:-1].to_numpy() + 1).all()
+
+    for stint in stints.itertuples():
+        window = result.iloc[stint.START_ROW : stint.END_ROW + 1]
+        assert (window["LINEUP_ID_HOME"] == stint.LINEUP_ID_HOME).all()
+        assert (window["LINEUP_ID_AWAY"] == stint.LINEUP_ID_AWAY).all()
+        assert (window["period"] == stint.PERIOD).all()
+        assert stint.START_CLOCK == window["clock"].iloc[0]
+        assert stint.END_EVENT_NUM == window["actionnumber"].iloc[-1]
+
+    assert set(stints["PERIOD"]) == {1, 2, 3, 4}
+
+
+def test_missing_columns_returns_empty_lineups():
+    """Frames without required columns get empty lineup columns."""
+    result = LineupTracker("g").process_play_by_play(pd.DataFrame({"period": [1, 1]}))
+    assert all(col in result.columns for col in LINEUP_COLUMNS)
+    assert (result["LINEUP_ID_HOME"] == "").all()
+
+
+def test_empty_frame_passthrough():
+    """Empty input is returned unchanged."""
+    assert LineupTracker("g").process_play_by_play(pd.DataFrame()).empty
+
+
+@pytest.mark.performance
+def test_benchmark_columnar_vs_rowwise():
+    """Benchmark both engines over the recorded game batch."""
+    start = time.perf_counter()
+    for pbp in RECORDED_GAMES:
+        LineupTracker("g").process_play_by_play_rowwise(pbp)
+    rowwise_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for pbp in RECORDED_GAMES:
+        LineupTracker("g").process_play_by_play(pbp)
+    columnar_seconds = time.perf_counter() - start
+
+    events = sum(len(pbp) for pbp in RECORDED_GAMES)
+    print(
+        f"\n✅ Lineup tracking over {len(RECORDED_GAMES)} games ({events} events): "
+        f"row-wise {rowwise_seconds * 1000:.1f}ms, columnar {columnar_seconds * 1000:.1f}ms "
+        f"({rowwise_seconds / columnar_seconds:.1f}x)"
+    )
+    assert columnar_seconds < rowwise_seconds
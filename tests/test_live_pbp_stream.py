@@ -0,0 +1,268 @@
+"""
+Tests for the incremental live play-by-play poller.
+
+Validates:
+1. Only actions past the last actionNumber are emitted; ETags are revalidated
+2. Many subscribers share one upstream poll per game; a rate-limited poll
+   backs off instead of ending the stream
+3. Late subscribers and cursor readers catch up from the buffer
+4. The interval adapts to new actions, stoppages, period breaks and Final
+5. The sync generators key on actionNumber
+6. Pollers leave the hub at Final or once nobody subscribes or reads
+"""
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from nba_mcp import nba_server
+from nba_mcp.api.errors import RateLimitError
+from nba_mcp.api.tools import live_pbp_stream
+from nba_mcp.api.tools import playbyplayv3_or_realtime as pbp
+from nba_mcp.api.tools.live_pbp_stream import (
+    LiveActionTracker,
+    LiveFetchResult,
+    LiveGamePoller,
+    LivePBPHub,
+)
+
+GAME_ID = "0022500123"
+
+
+def action(number, action_type="2pt", sub_type="", description=None):
+    return {
+        "actionNumber": number,
+        "actionType": action_type,
+        "subType": sub_type,
+        "description": description or f"Action {number}",
+        "period": 1,
+    }
+
+
+class FakeFeed:
+    """Async CDN stand-in: a growing action list with an ETag per version."""
+
+    def __init__(self, actions=None):
+        self.actions = list(actions or [])
+        self.version = 0
+        self.requests = []
+
+    def append(self, *new_actions):
+        self.actions.extend(new_actions)
+        self.version += 1
+
+    async def __call__(self, game_id, etag):
+        self.requests.append(etag)
+        current = f'"v{self.version}"'
+        if etag == current:
+            return LiveFetchResult(304, None, current)
+        return LiveFetchResult(200, list(self.actions), current)
+
+
+FAST = dict(
+    min_interval=0.01, max_interval=0.04, break_interval=0.05,
+    final_interval=0.02, final_polls=1, idle_timeout=0.2,
+)
+
+
+def test_tracker_emits_only_new_actions():
+    """The tail past the last actionNumber is new; numbering gaps are fine."""
+    tracker = LiveActionTracker(GAME_ID)
+    first = [action(1), action(2), action(4)]
+
+    assert tracker.update(LiveFetchResult(200, first, '"a"')) == first
+    assert tracker.update(LiveFetchResult(304, None, '"a"')) == []
+    new = tracker.update(LiveFetchResult(200, first + [action(7), action(9)], '"b"'))
+
+    assert [a["actionNumber"] for a in new] == [7, 9]
+    assert tracker.last_action_number == 9 and tracker.etag == '"b"'
+    assert not tracker.final
+    tracker.update(LiveFetchResult(200, first + [action(7), action(9), action(10, "game", "end")], '"c"'))
+    assert tracker.final
+
+
+@pytest.mark.asyncio
+async def test_fan_out_shares_one_upstream_poll():
+    """Three subscribers, one request per tick, identical streams; ends at Final."""
+    feed = FakeFeed([action(1), action(2)])
+    hub = LivePBPHub(fetch=feed, **FAST)
+    subscriptions = [hub.subscribe(GAME_ID) for _ in range(3)]
+
+    async def consume(subscription):
+        return [a["actionNumber"] async for a in subscription]
+
+    consumers = [asyncio.create_task(consume(s)) for s in subscriptions]
+    await asyncio.sleep(0.03)
+    feed.append(action(3), action(4))
+    await asyncio.sleep(0.03)
+    feed.append(action(5, "game", "end"))
+
+    results = await asyncio.wait_for(asyncio.gather(*consumers), timeout=2)
+
+    assert results == [[1, 2, 3, 4, 5]] * 3
+    stats = subscriptions[0].poller.get_stats()
+    assert stats["polls"] == len(feed.requests)
+    assert stats["deliveries"] == 15 and stats["final"]
+    assert stats["not_modified"] >= 1
+    assert '"v0"' in feed.requests  # validators were sent
+    await hub.close()
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_poll_backs_off_and_keeps_streaming():
+    """A rejected limiter acquire delays the poll; the stream survives."""
+    feed = FakeFeed([action(1), action(2, "game", "end")])
+
+    class RejectingLimiter:
+        def __init__(self):
+            self.rejections = 2
+
+        async def acquire(self, host, priority=None):
+            if self.rejections:
+                self.rejections -= 1
+                raise RateLimitError(retry_after=0)
+
+    async def fetch_live(client, game_id, etag, timeout):
+        return await feed(game_id, etag)
+
+    limiter = RejectingLimiter()
+    hub = LivePBPHub(**FAST)
+    with patch.object(live_pbp_stream, "get_host_limiter", lambda: limiter), patch.object(
+        live_pbp_stream, "fetch_live_actions_async", fetch_live
+    ):
+        subscription = hub.subscribe(GAME_ID)
+        received = await asyncio.wait_for(_consume(subscription), timeout=2)
+
+    assert received == [1, 2]
+    stats = subscription.poller.get_stats()
+    assert stats["rate_limited"] == 2 and stats["errors"] == 0
+    await hub.close()
+
+
+async def _consume(subscription):
+    return [a["actionNumber"] async for a in subscription]
+
+
+@pytest.mark.asyncio
+async def test_late_subscriber_and_cursor_reads_catch_up():
+    """The buffer serves actions past a cursor without another request."""
+    feed = FakeFeed([action(n) for n in range(1, 11)])
+    hub = LivePBPHub(fetch=feed, **FAST)
+
+    first = await hub.events_since(GAME_ID, 0, limit=4)
+    rest = await hub.events_since(GAME_ID, first[-1]["actionNumber"])
+    assert [a["actionNumber"] for a in first] == [1, 2, 3, 4]
+    assert [a["actionNumber"] for a in rest] == list(range(5, 11))
+
+    late = hub.subscribe(GAME_ID, after_action_number=8)
+    assert [late.queue.get_nowait()["actionNumber"] for _ in range(2)] == [9, 10]
+    late.close()
+    await hub.close()
+
+
+@pytest.mark.asyncio
+async def test_finished_pollers_leave_the_hub():
+    """Pollers are dropped at Final, when the last subscriber leaves, and when reads stop."""
+    feed = FakeFeed([action(1), action(2, "game", "end")])
+    hub = LivePBPHub(fetch=feed, **FAST)
+    assert await _consume(hub.subscribe(GAME_ID)) == [1, 2]
+    assert hub.pollers == {}
+
+    final_read = await hub.events_since(GAME_ID)
+    assert [a["actionNumber"] for a in final_read] == [1, 2]
+    assert hub.pollers == {}
+
+    live = FakeFeed([action(1)])
+    hub = LivePBPHub(fetch=live, **FAST)
+    subscription = hub.subscribe("0022500124")
+    await asyncio.sleep(0.03)
+    subscription.close()
+    await asyncio.sleep(0.01)
+    assert hub.pollers == {}
+
+    await hub.events_since("0022500124")
+    assert "0022500124" in hub.pollers
+    await asyncio.sleep(0.4)  # idle_timeout without reads
+    assert hub.pollers == {}
+    await hub.close()
+
+
+@pytest.mark.asyncio
+async def test_adaptive_interval():
+    """Fast with new actions, backs off when quiet, long at breaks and after Final."""
+    feed = FakeFeed([action(1)])
+    poller = LiveGamePoller(GAME_ID, feed, min_interval=1, max_interval=10, break_interval=30, final_interval=60)
+
+    await poller.poll_once()
+    assert poller.interval == 1
+    await poller.poll_once()
+    await poller.poll_once()
+    assert poller.interval == 2.25  # 1 → 1.5 → 2.25
+
+    feed.append(action(2, "timeout", "full"))
+    await poller.poll_once()
+    assert poller.interval == 10
+
+    feed.append(action(3, "period", "end"))
+    await poller.poll_once()
+    assert poller.interval == 30
+
+    feed.append(action(4, "game", "end"))
+    await poller.poll_once()
+    assert poller.interval == 60
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_drops_oldest():
+    """A full queue drops the oldest actions instead of blocking the poller."""
+    feed = FakeFeed([action(n) for n in range(1, 6)])
+    poller = LiveGamePoller(GAME_ID, feed, **FAST)
+    subscription = poller.subscribe(maxsize=3)
+
+    await poller.poll_once()
+    await poller.stop()
+
+    assert subscription.dropped == 2
+    assert [a["actionNumber"] async for a in subscription] == [3, 4, 5]
+
+
+@pytest.mark.asyncio
+async def test_live_play_by_play_tool_cursor():
+    """The MCP tool returns events past the cursor and the next cursor."""
+    feed = FakeFeed([action(n) for n in range(1, 6)])
+    hub = LivePBPHub(fetch=feed, **FAST)
+    with patch.object(live_pbp_stream, "_live_pbp_hub", hub):
+        first = json.loads(await nba_server.get_live_play_by_play(GAME_ID, max_events=3))
+        second = json.loads(
+            await nba_server.get_live_play_by_play(
+                GAME_ID, after_action_number=first["data"]["next_action_number"]
+            )
+        )
+
+    assert [e["actionNumber"] for e in first["data"]["events"]] == [1, 2, 3]
+    assert first["data"]["next_action_number"] == 3
+    assert [e["actionNumber"] for e in second["data"]["events"]] == [4, 5]
+    assert len(feed.requests) == 1
+    await hub.close()
+
+
+def test_sync_stream_keys_on_action_number():
+    """stream_live_pbp yields each action once and sends the ETag back."""
+    responses = [
+        LiveFetchResult(200, [action(1), action(2)], '"a"'),
+        LiveFetchResult(304, None, '"a"'),
+        LiveFetchResult(200, [action(1), action(2), action(3)], '"b"'),
+    ]
+    etags = []
+
+    def fake_fetch(game_id, etag=None, timeout=5.0):
+        etags.append(etag)
+        return responses[len(etags) - 1]
+
+    with patch.object(pbp, "fetch_live_actions", fake_fetch), patch.object(pbp.time, "sleep"):
+        stream = pbp.stream_live_pbp(GAME_ID, interval=0)
+        numbers = [next(stream)["actionNumber"] for _ in range(3)]
+
+    assert numbers == [1, 2, 3]
+    assert etags == [None, '"a"', '"a"']
@@ -0,0 +1,117 @@
+"""
+Tests for the byte-budgeted in-memory LRUCache.
+
+Validates:
+1. Entry sizes come from Arrow/pandas nbytes or a pickled-size estimate
+2. Eviction keeps total bytes within the budget (large tables count more)
+3. Expired entries are swept proactively, not only on read
+4. Hit/miss/eviction/byte gauges are exported through observability metrics
+"""
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from nba_mcp.cache.redis_cache import LRUCache, estimate_size
+from nba_mcp.observability.metrics import (
+    MEMORY_CACHE_BYTES,
+    MEMORY_CACHE_EVICTIONS,
+    MEMORY_CACHE_HITS,
+    MetricsManager,
+)
+
+
+def make_table(num_rows: int) -> pa.Table:
+    """league_player_games-style table."""
+    return pa.table(
+        {
+            "PLAYER_ID": np.arange(num_rows, dtype=np.int64),
+            "PTS": np.zeros(num_rows, dtype=np.int64),
+            "FG_PCT": np.zeros(num_rows),
+        }
+    )
+
+
+def test_estimate_size_by_type():
+    """Arrow and pandas values report buffer sizes; others are pickled."""
+    table = make_table(25_000)
+    assert estimate_size(table) == table.nbytes
+    assert estimate_size(table.to_pandas()) >= 25_000 * 24
+    assert estimate_size(b"x" * 100) == 100
+    assert 0 < estimate_size({"team": "LAL", "wins": 50}) < 200
+
+
+def test_eviction_respects_byte_budget():
+    """A large table pushes out older entries; many small ones fit."""
+    big = make_table(25_000)  # ~600 KB
+    cache = LRUCache(max_bytes=int(big.nbytes * 1.5))
+
+    for i in range(50):
+        cache.set(f"standings:{i}", {"team": i, "wins": 40}, ttl=60)
+    assert cache.size() == 50
+
+    cache.get("standings:0")  # Most recently used survives
+    cache.set("league_player_games", big, ttl=60)
+
+    assert cache.total_bytes <= cache.max_bytes
+    assert cache.get("league_player_games") is big
+    assert cache.get("standings:0") is not None
+    assert cache.stats["evictions"] == 0  # Small entries fit alongside
+
+    cache.set("league_player_games:2", make_table(25_000), ttl=60)
+    assert cache.total_bytes <= cache.max_bytes
+    assert cache.get("league_player_games") is None
+    assert cache.stats["evictions"] >= 1
+
+
+def test_oversized_value_not_cached():
+    """A value larger than the whole budget is rejected, not thrashed in."""
+    cache = LRUCache(max_bytes=1024)
+    cache.set("small", {"a": 1}, ttl=60)
+    cache.set("huge", make_table(10_000), ttl=60)
+
+    assert cache.get("huge") is None
+    assert cache.get("small") == {"a": 1}
+    assert cache.stats["rejected"] == 1
+
+
+def test_overwrite_and_delete_release_bytes():
+    """Replacing or deleting a key adjusts total bytes."""
+    cache = LRUCache()
+    cache.set("k", make_table(1000), ttl=60)
+    cache.set("k", b"x" * 10, ttl=60)
+    assert cache.total_bytes == 10
+
+    cache.delete("k")
+    assert cache.total_bytes == 0 and cache.size() == 0
+
+
+def test_expired_entries_swept_proactively():
+    """Expired entries are removed by a sweep without being read."""
+    cache = LRUCache(sweep_interval=0.05)
+    cache.set("live", make_table(1000), ttl=0)
+    cache.set("daily", {"a": 1}, ttl=3600)
+    time.sleep(0.06)
+
+    cache.set("other", {"b": 2}, ttl=3600)  # Any access triggers the sweep
+
+    assert "live" not in cache.cache
+    assert cache.stats["expirations"] == 1
+    assert cache.total_bytes == estimate_size({"a": 1}) + estimate_size({"b": 2})
+    assert cache.sweep_expired() == 0
+
+
+def test_metrics_export_cache_stats():
+    """update_memory_cache_stats publishes per-cache counters and gauges."""
+    cache = LRUCache(max_bytes=2048)
+    cache.set("a", b"x" * 1500, ttl=60)
+    cache.get("a")
+    cache.set("b", b"y" * 1500, ttl=60)  # Evicts "a"
+
+    MetricsManager().update_memory_cache_stats("test_lru", cache.get_stats())
+
+    assert MEMORY_CACHE_HITS.labels(cache="test_lru")._value.get() == 1
+    assert MEMORY_CACHE_EVICTIONS.labels(cache="test_lru", reason="size")._value.get() == 1
+    assert MEMORY_CACHE_BYTES.labels(cache="test_lru")._value.get() == 1500
@@ -0,0 +1,235 @@
+"""
+Tests for the NLQ plan and answer cache.
+
+Validates:
+1. Rewordings of a question share a canonical key; seasons/entities/stats split it
+2. Answer TTLs follow tool freshness (live 30s, current season 1h, past 24h)
+3. An answer hit skips planning, execution and synthesis
+4. Failed executions are not cached; an expired answer still reuses the plan
+5. Hits, misses and time saved reach record_nlq_stage metrics
+
+Run benchmark: pytest tests/test_nlq_answer_cache.py -m performance -s
+"""
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from nba_mcp.cache.redis_cache import CacheTier
+from nba_mcp.nlq import answer_cache, pipeline
+from nba_mcp.nlq.answer_cache import (
+    NLQCache,
+    answer_ttl,
+    canonical_query_key,
+    tier_for_call,
+)
+from nba_mcp.nlq.executor import ExecutionResult
+from nba_mcp.nlq.parser import ParsedQuery, TimeRange
+from nba_mcp.nlq.planner import ExecutionPlan, ToolCall
+from nba_mcp.nlq.synthesizer import SynthesizedResponse
+
+CURRENT_SEASON = "2025-26"
+
+LEBRON = {"entity_type": "player", "entity_id": 2544, "name": "LeBron James"}
+DURANT = {"entity_type": "player", "entity_id": 201142, "name": "Kevin Durant"}
+
+
+def parsed(query="Who leads the NBA in assists?", intent="leaders", entities=None,
+           stats=("AST",), season=CURRENT_SEASON, confidence=0.9):
+    return ParsedQuery(
+        raw_query=query,
+        intent=intent,
+        entities=list(entities or []),
+        stat_types=list(stats),
+        time_range=TimeRange(season=season),
+        confidence=confidence,
+    )
+
+
+def plan_for(query: ParsedQuery, *calls: ToolCall) -> ExecutionPlan:
+    calls = calls or (ToolCall("get_league_leaders_info", {"stat_category": "AST", "season": query.time_range.season}),)
+    return ExecutionPlan(parsed_query=query, tool_calls=list(calls), template_used=query.intent)
+
+
+class FakeStages:
+    """Stand-ins for plan/execute/synthesize that count calls."""
+
+    def __init__(self, success=True, execute_delay=0.0):
+        self.success = success
+        self.execute_delay = execute_delay
+        self.calls = {"plan": 0, "execute": 0, "synthesize": 0}
+
+    async def plan(self, query):
+        self.calls["plan"] += 1
+        return plan_for(query)
+
+    async def execute(self, plan):
+        self.calls["execute"] += 1
+        await asyncio.sleep(self.execute_delay)
+        return ExecutionResult(plan=plan, tool_results={}, total_time_ms=self.execute_delay * 1000,
+                               all_success=self.success)
+
+    async def synthesize(self, query, result):
+        self.calls["synthesize"] += 1
+        return SynthesizedResponse(raw_query=query.raw_query, intent=query.intent,
+                                   answer=f"answer #{self.calls['synthesize']}", confidence=0.9,
+                                   sources=["get_league_leaders_info"], metadata={})
+
+
+def run_pipeline(stages: FakeStages, cache: NLQCache, parse_results: dict):
+    """Patch the pipeline stages; parse_results maps raw query -> ParsedQuery."""
+
+    async def parse(query):
+        return parse_results[query]
+
+    return (
+        patch.object(answer_cache, "_nlq_cache", cache),
+        patch.object(answer_cache, "get_current_season", lambda: CURRENT_SEASON),
+        patch.object(pipeline, "parse_query", parse),
+        patch.object(pipeline, "plan_query_execution", stages.plan),
+        patch.object(pipeline, "execute_plan", stages.execute),
+        patch.object(pipeline, "synthesize_response", stages.synthesize),
+    )
+
+
+async def ask(stages, cache, parse_results, query, **kwargs):
+    patches = run_pipeline(stages, cache, parse_results)
+    for p in patches:
+        p.start()
+    try:
+        return await pipeline.answer_nba_question(query, **kwargs)
+    finally:
+        for p in reversed(patches):
+            p.stop()
+
+
+def test_canonical_key_ignores_wording_not_content():
+    """Rewordings share a key; season, entities, entity order and stats split it."""
+    base = canonical_query_key(parsed())
+    assert canonical_query_key(parsed(query="assists leader?", confidence=0.6)) == base
+    assert base.startswith("nlq:") and len(base) == 28
+
+    assert canonical_query_key(parsed(season="2019-20")) != base
+    assert canonical_query_key(parsed(stats=("PTS",))) != base
+
+    lebron_kd = canonical_query_key(parsed(intent="comparison", entities=[LEBRON, DURANT]))
+    kd_lebron = canonical_query_key(parsed(intent="comparison", entities=[DURANT, LEBRON]))
+    renamed = canonical_query_key(parsed(intent="comparison", entities=[{**LEBRON, "name": "King James"}, DURANT]))
+    assert lebron_kd != kd_lebron
+    assert lebron_kd == renamed
+
+
+def test_tiers_follow_tool_and_season_freshness():
+    """Live tools 30s; current season DAILY; finished seasons HISTORICAL."""
+    live = ToolCall("get_live_scores", {"target_date": "2025-11-01"})
+    current = ToolCall("get_league_leaders_info", {"season": CURRENT_SEASON})
+    past = ToolCall("compare_players", {"player1_name": "A", "player2_name": "B", "season": "2015-16"})
+    span = ToolCall("get_season_stats", {"seasons": ["2018-19", CURRENT_SEASON], "season_type": "Regular Season"})
+
+    assert tier_for_call(live, CURRENT_SEASON) is CacheTier.LIVE
+    assert tier_for_call(current, CURRENT_SEASON) is CacheTier.DAILY
+    assert tier_for_call(past, CURRENT_SEASON) is CacheTier.HISTORICAL
+    assert tier_for_call(span, CURRENT_SEASON) is CacheTier.DAILY
+
+    with patch.object(answer_cache, "get_current_season", lambda: CURRENT_SEASON):
+        query = parsed()
+        assert answer_ttl(plan_for(query, past)) == 86400
+        assert answer_ttl(plan_for(query, past, current)) == 3600
+        assert answer_ttl(plan_for(query, past, live)) == 30
+
+
+@pytest.mark.asyncio
+async def test_answer_hit_skips_execution():
+    """A reworded repeat is answered from cache without planning or executing."""
+    stages, cache = FakeStages(), NLQCache()
+    queries = {"Who leads the NBA in assists?": parsed(), "assists leader?": parsed(query="assists leader?")}
+
+    first = await ask(stages, cache, queries, "Who leads the NBA in assists?", return_metadata=True)
+    second = await ask(stages, cache, queries, "assists leader?", return_metadata=True)
+
+    assert stages.calls == {"plan": 1, "execute": 1, "synthesize": 1}
+    assert second["answer"] == first["answer"] == "answer #1"
+    assert second["raw_query"] == "assists leader?"
+    assert first["metadata"]["cache"] == {"status": "miss", "ttl_seconds": 3600}
+    assert second["metadata"]["cache"]["status"] == "hit"
+    assert "cache" not in cache.get_answer(canonical_query_key(parsed())).value.metadata
+
+    await ask(stages, cache, queries, "assists leader?", use_cache=False)
+    assert stages.calls["execute"] == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_execution_not_cached():
+    """Partial failures are re-executed next time."""
+    stages, cache = FakeStages(success=False), NLQCache()
+    queries = {"q": parsed(query="q")}
+
+    await ask(stages, cache, queries, "q")
+    await ask(stages, cache, queries, "q")
+
+    assert stages.calls == {"plan": 1, "execute": 2, "synthesize": 2}  # the plan is still reused
+    assert cache.get_stats()["answers"]["items"] == 0
+
+
+@pytest.mark.asyncio
+async def test_expired_answer_reuses_plan():
+    """Once a short-lived answer expires the plan is still served from cache."""
+    stages, cache = FakeStages(), NLQCache()
+    queries = {"q": parsed(query="q")}
+
+    await ask(stages, cache, queries, "q")
+    cache.answers.clear()
+    answer = await ask(stages, cache, queries, "q")
+
+    assert answer == "answer #2"
+    assert stages.calls == {"plan": 1, "execute": 2, "synthesize": 2}
+
+
+@pytest.mark.asyncio
+async def test_metrics_record_hits_and_time_saved():
+    """Misses observe stage durations; hits count and add the time saved."""
+    from nba_mcp.observability import metrics
+
+    metrics.initialize_metrics()
+    lookups = metrics.NLQ_STAGE_CACHE_LOOKUPS
+    saved = metrics.NLQ_STAGE_SAVED_SECONDS.labels(stage="execute")
+    hits_before = lookups.labels(stage="execute", result="hit")._value.get()
+    misses_before = lookups.labels(stage="execute", result="miss")._value.get()
+    saved_before = saved._value.get()
+
+    stages, cache = FakeStages(execute_delay=0.02), NLQCache()
+    queries = {"q": parsed(query="q")}
+    for _ in range(3):
+        await ask(stages, cache, queries, "q")
+
+    assert lookups.labels(stage="execute", result="miss")._value.get() - misses_before == 1
+    assert lookups.labels(stage="execute", result="hit")._value.get() - hits_before == 2
+    assert saved._value.get() - saved_before >= 0.04
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_benchmark_repeated_questions():
+    """20 asks of 4 questions (5 wordings each) with a 50ms execute stage."""
+    wordings = {}
+    for i, stat in enumerate(("AST", "PTS", "REB", "STL")):
+        for w in range(5):
+            wordings[f"{stat} wording {w}"] = parsed(query=f"{stat} wording {w}", stats=(stat,))
+    queries = list(wordings)
+
+    timings = {}
+    for use_cache in (False, True):
+        stages, cache = FakeStages(execute_delay=0.05), NLQCache()
+        start = time.perf_counter()
+        for query in queries:
+            await ask(stages, cache, wordings, query, use_cache=use_cache)
+        timings[use_cache] = (time.perf_counter() - start, stages.calls["execute"])
+
+    uncached, cached = timings[False], timings[True]
+    print()
+    print(f"✅ Uncached: {len(queries)} questions, {uncached[1]} executions in {uncached[0] * 1000:.0f}ms")
+    print(f"✅ Cached: {cached[1]} executions in {cached[0] * 1000:.0f}ms ({uncached[0] / cached[0]:.1f}x)")
+
+    assert cached[1] == 4 and uncached[1] == len(queries)
+    assert cached[0] < uncached[0] / 3
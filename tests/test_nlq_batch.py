@@ -0,0 +1,305 @@
+"""
+Tests for batch NLQ answering with shared tool calls.
+
+Validates:
+1. Plans of all questions are merged; each distinct call runs once
+2. Every question's synthesizer gets its own result keys, in question order
+3. Invalid questions and planning errors stay in their own slot
+4. Cached answers skip planning; answers are cached for the next batch
+5. Concurrency stays bounded
+6. depends_on edges stay within each question's plan
+7. Batch execution time is recorded once, not per question
+
+Run benchmark: pytest tests/test_nlq_batch.py -m performance -s
+"""
+import asyncio
+import time
+from contextlib import ExitStack
+from unittest.mock import patch
+
+import pytest
+
+from nba_mcp.nlq import pipeline, tool_registry
+from nba_mcp.nlq.answer_cache import NLQCache
+from nba_mcp.nlq.executor import execute_plans
+from nba_mcp.nlq.parser import ParsedQuery, TimeRange
+from nba_mcp.nlq.planner import ExecutionPlan, ToolCall
+from nba_mcp.nlq.synthesizer import SynthesizedResponse
+
+SEASON = "2023-24"
+
+
+def standings(conference=None):
+    return ToolCall("get_team_standings", {"season": SEASON, "conference": conference})
+
+
+def leaders(stat):
+    return ToolCall("get_league_leaders_info", {"stat_category": stat, "season": SEASON})
+
+
+def team(name, group=0):
+    return ToolCall("get_team_advanced_stats", {"team_name": name, "season": SEASON}, parallel_group=group)
+
+
+# Question -> plan (team comparisons use the planner's comparison_teams shape)
+PLANS = {
+    "Lakers vs Celtics": [standings(), team("Lakers", 1), team("Celtics", 1)],
+    "Celtics vs Knicks": [standings(), team("Celtics", 1), team("Knicks", 1)],
+    "Who leads the NBA in assists?": [leaders("AST")],
+    "Assists leaders": [leaders("AST")],
+    "League standings": [standings()],
+    "Lakers offense": [team("Lakers")],
+}
+
+
+class FakeBackend:
+    """Counting tools plus parse/plan/synthesize stand-ins."""
+
+    def __init__(self, delay=0.0, upstream_slots=None):
+        self.delay = delay
+        self.upstream = asyncio.Semaphore(upstream_slots) if upstream_slots else None
+        self.tool_calls = []
+        self.plans_made = []
+        self.running = 0
+        self.max_running = 0
+
+    def _tool(self, name):
+        async def tool(**params):
+            self.tool_calls.append((name, params))
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            try:
+                if self.upstream:
+                    async with self.upstream:
+                        await asyncio.sleep(self.delay)
+                else:
+                    await asyncio.sleep(self.delay)
+                return {"tool": name, **params}
+            finally:
+                self.running -= 1
+
+        return tool
+
+    async def parse(self, query):
+        if query == "boom":
+            raise ValueError("parser exploded")
+        intent = "unknown" if query == "???" else "team_stats"
+        return ParsedQuery(raw_query=query, intent=intent, time_range=TimeRange(season=SEASON),
+                           modifiers={"q": query})
+
+    async def plan(self, parsed):
+        self.plans_made.append(parsed.raw_query)
+        if parsed.raw_query not in PLANS:
+            raise ValueError("no template")
+        return ExecutionPlan(parsed_query=parsed, tool_calls=list(PLANS[parsed.raw_query]), template_used="test")
+
+    async def synthesize(self, parsed, result):
+        lines = [f"{key}={r.data.get('team_name') or r.data.get('stat_category') or 'standings'}"
+                 for key, r in result.tool_results.items()]
+        return SynthesizedResponse(raw_query=parsed.raw_query, intent=parsed.intent, answer="; ".join(lines),
+                                   confidence=1.0, sources=[], metadata={})
+
+    def patches(self, cache):
+        registry = {name: self._tool(name) for name in
+                    ("get_team_standings", "get_league_leaders_info", "get_team_advanced_stats")}
+        return [
+            patch.dict(tool_registry._TOOL_REGISTRY, registry, clear=True),
+            patch.object(pipeline, "get_nlq_cache", lambda: cache),
+            patch.object(pipeline, "parse_query", self.parse),
+            patch.object(pipeline, "plan_query_execution", self.plan),
+            patch.object(pipeline, "synthesize_response", self.synthesize),
+            patch.object(pipeline, "validate_parsed_query", validate),
+        ]
+
+
+def validate(parsed):
+    class Validation:
+        valid = parsed.intent != "unknown"
+        errors = ["Could not determine query intent"]
+        hints = []
+
+    return Validation()
+
+
+def patched(backend, cache=None):
+    stack = ExitStack()
+    for p in backend.patches(cache or NLQCache()):
+        stack.enter_context(p)
+    return stack
+
+
+async def run_batch(backend, queries, cache=None, **kwargs):
+    with patched(backend, cache):
+        return await pipeline.answer_nba_questions_batch(queries, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_shared_calls_run_once_and_fan_out():
+    """Standings and Celtics stats are fetched once for both comparisons."""
+    backend = FakeBackend()
+    queries = ["Lakers vs Celtics", "Celtics vs Knicks", "League standings", "Lakers offense"]
+
+    batch = await run_batch(backend, queries)
+
+    assert batch.calls_planned == 8
+    assert batch.calls_executed == len(backend.tool_calls) == 4  # standings, Lakers, Celtics, Knicks
+    assert batch.calls_saved == 4
+    assert batch.answers == [
+        "get_team_standings=standings; get_team_advanced_stats=Lakers; get_team_advanced_stats_2=Celtics",
+        "get_team_standings=standings; get_team_advanced_stats=Celtics; get_team_advanced_stats_2=Knicks",
+        "get_team_standings=standings",
+        "get_team_advanced_stats=Lakers",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_errors_stay_in_their_slot():
+    """Parse, validation and planning failures don't affect other questions."""
+    backend = FakeBackend()
+    batch = await run_batch(backend, ["boom", "???", "Unplannable", "League standings"], return_metadata=True)
+
+    assert batch.answers[0]["answer"] == "Error processing query: parser exploded"
+    assert batch.answers[1]["answer"].startswith("Unable to understand query: '???'")
+    assert batch.answers[2]["answer"] == "Error processing query: no template"
+    assert batch.answers[2]["raw_query"] == "Unplannable"
+    assert batch.answers[3]["answer"] == "get_team_standings=standings"
+    assert batch.calls_executed == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_hits_skip_planning():
+    """A second batch is served from the answer cache."""
+    backend, cache = FakeBackend(), NLQCache()
+    queries = ["Who leads the NBA in assists?", "League standings"]
+
+    first = await run_batch(backend, queries, cache)
+    second = await run_batch(backend, queries + ["Lakers offense"], cache)
+
+    assert first.cache_hits == 0 and second.cache_hits == 2
+    assert second.answers[:2] == first.answers
+    assert backend.plans_made == queries + ["Lakers offense"]
+    assert second.calls_planned == second.calls_executed == 1
+
+
+@pytest.mark.asyncio
+async def test_bounded_concurrency_and_list_api():
+    """max_concurrency caps running tools; answer_nba_questions returns the answers."""
+    backend = FakeBackend(delay=0.02)
+    extra_plans = {f"Team {i}": [team(f"Team {i}")] for i in range(10)}
+
+    with patch.dict(PLANS, extra_plans):
+        batch = await run_batch(backend, list(extra_plans), max_concurrency=3, use_cache=False)
+        assert backend.max_running == 3
+        assert batch.calls_executed == 10
+
+        with patched(backend):
+            answers = await pipeline.answer_nba_questions(["Team 1", "Team 2"])
+    assert answers == ["get_team_advanced_stats=Team 1", "get_team_advanced_stats=Team 2"]
+
+
+@pytest.mark.asyncio
+async def test_batch_execute_time_recorded_once():
+    """Execution is observed once per batch; cached answers keep only their own share."""
+    backend, cache = FakeBackend(delay=0.05), NLQCache()
+    extra_plans = {f"Team {i}": [team(f"Team {i}")] for i in range(10)}
+    recorded, stored = [], []
+    set_answer = cache.set_answer
+
+    def store(key, response, plan, stage_seconds):
+        stored.append(stage_seconds)
+        return set_answer(key, response, plan, stage_seconds)
+
+    with patch.dict(PLANS, extra_plans), \
+            patch.object(pipeline, "_record_stages", lambda stages, status=None: recorded.append(stages)), \
+            patch.object(cache, "set_answer", store):
+        start = time.perf_counter()
+        await run_batch(backend, list(extra_plans), cache)
+        wall = time.perf_counter() - start
+
+    executes = [stages["execute"] for stages in recorded if "execute" in stages]
+    assert len(executes) == 1 and executes[0] <= wall
+    assert len(stored) == 10
+    assert all(0.04 < s["execute"] <= executes[0] for s in stored)
+
+
+@pytest.mark.asyncio
+async def test_execute_plans_keeps_plan_keys():
+    """Per-plan results use the plan's own keys; a plan's internal duplicates count too."""
+    backend = FakeBackend()
+    query = ParsedQuery(raw_query="q", intent="team_stats")
+    plans = [
+        ExecutionPlan(query, [team("Lakers"), team("Lakers", 1)], "test"),
+        ExecutionPlan(query, [standings(), team("Lakers")], "test"),
+    ]
+    with backend.patches(NLQCache())[0]:
+        batch = await execute_plans(plans)
+
+    assert batch.calls_planned == 4 and batch.calls_executed == 2
+    assert list(batch.results[0].tool_results) == ["get_team_advanced_stats", "get_team_advanced_stats_2"]
+    assert batch.results[0].deduplicated_calls == 1
+    assert batch.results[1].tool_results["get_team_advanced_stats"] is batch.results[0].tool_results[
+        "get_team_advanced_stats"]
+
+
+@pytest.mark.asyncio
+async def test_dependencies_stay_within_their_plan():
+    """Another plan's failing call of the same tool never skips this plan's dependents."""
+    ran = []
+
+    async def player_stats(player):
+        ran.append(("player_stats", player))
+        if player == "Unknown":
+            raise ValueError("player not found")
+        return {"player": player}
+
+    async def summary(player):
+        ran.append(("summary", player))
+        return {"summary": player}
+
+    query = ParsedQuery(raw_query="q", intent="player_stats")
+    good = ExecutionPlan(query, [ToolCall("player_stats", {"player": "LeBron James"}),
+                                 ToolCall("summary", {"player": "LeBron James"}, depends_on=["player_stats"])], "test")
+    bad = ExecutionPlan(query, [ToolCall("player_stats", {"player": "Unknown"}),
+                                ToolCall("summary", {"player": "Unknown"}, depends_on=["player_stats"])], "test")
+    registry = {"player_stats": player_stats, "summary": summary}
+
+    with patch.dict(tool_registry._TOOL_REGISTRY, registry, clear=True):
+        batch = await execute_plans([good, bad, good])
+
+    assert batch.results[0].all_success and batch.results[2].all_success
+    assert batch.results[1].tool_results["summary"].error == "Skipped: dependency player_stats failed"
+    assert sorted(ran) == [("player_stats", "LeBron James"), ("player_stats", "Unknown"), ("summary", "LeBron James")]
+    assert batch.calls_planned == 6 and batch.calls_executed == 3  # the skipped summary never ran
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_benchmark_dashboard_batch():
+    """20 dashboard questions about one season (50ms per call, 8 concurrent upstream calls)."""
+    teams = ["Lakers", "Celtics", "Knicks", "Bucks", "Nuggets"]
+    dashboard = {}
+    for i in range(20):
+        home, away = teams[i % 5], teams[(i + 1 + i // 5) % 5]
+        dashboard[f"Q{i}"] = [standings(), leaders(("PTS", "AST", "REB")[i % 3]), team(home, 1), team(away, 1)]
+
+    with patch.dict(PLANS, dashboard):
+        backend = FakeBackend(delay=0.05, upstream_slots=8)
+        with patched(backend):
+            start = time.perf_counter()
+            await asyncio.gather(*(pipeline.answer_nba_question(q, use_cache=False) for q in dashboard))
+            independent = time.perf_counter() - start
+        independent_calls = len(backend.tool_calls)
+
+        backend = FakeBackend(delay=0.05, upstream_slots=8)
+        start = time.perf_counter()
+        batch = await run_batch(backend, list(dashboard), use_cache=False)
+        batched = time.perf_counter() - start
+
+    print()
+    print(f"✅ Independent questions: {independent_calls} tool calls in {independent * 1000:.0f}ms")
+    print(f"✅ Batch: {batch.calls_executed} tool calls ({batch.calls_saved} saved) in {batched * 1000:.0f}ms")
+
+    assert independent_calls == 80
+    assert batch.calls_executed == 9  # standings + 3 leaderboards + 5 teams
+    assert batch.calls_saved == 71
+    assert batched < independent / 2
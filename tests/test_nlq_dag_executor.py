@@ -0,0 +1,280 @@
+"""
+Tests for the dependency-aware NLQ plan executor.
+
+Validates:
+1. Calls start when their depends_on edges are satisfied, not when their
+   whole parallel_group has finished
+2. Failed dependencies and cycles fail dependents without running them
+3. Identical calls in a plan run once; result keys keep plan order
+4. Per-tool deadlines, the concurrency cap (shared by concurrent plans) and
+   cancellation on early close
+5. stream_nba_answer re-synthesizes as results arrive
+
+Run benchmark: pytest tests/test_nlq_dag_executor.py -m performance -s
+"""
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from nba_mcp.api.errors import ErrorCode
+from nba_mcp.nlq import executor, pipeline, tool_registry
+from nba_mcp.nlq.executor import (
+    ExecutionResult,
+    execute_parallel_group,
+    execute_plan,
+    iter_plan_results,
+    tool_call_signature,
+)
+from nba_mcp.nlq.parser import ParsedQuery
+from nba_mcp.nlq.planner import ExecutionPlan, ToolCall
+from nba_mcp.nlq.synthesizer import SynthesizedResponse
+
+
+class FakeTools:
+    """Async tools that sleep `delay` seconds and log when they start/finish."""
+
+    def __init__(self, **delays):
+        self.delays = delays
+        self.events = []
+        self.calls = []
+        self.running = 0
+        self.max_running = 0
+
+    def registry(self):
+        return {name: self._tool(name) for name in self.delays}
+
+    def _tool(self, name):
+        async def tool(**params):
+            self.calls.append((name, params))
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            self.events.append(("start", name))
+            try:
+                delay = self.delays[name]
+                if isinstance(delay, Exception):
+                    raise delay
+                await asyncio.sleep(delay)
+                self.events.append(("end", name))
+                return {"tool": name, **params}
+            finally:
+                self.running -= 1
+
+        return tool
+
+
+def make_plan(*calls: ToolCall) -> ExecutionPlan:
+    return ExecutionPlan(
+        parsed_query=ParsedQuery(raw_query="q", intent="leaders", stat_types=["AST"]),
+        tool_calls=list(calls),
+        template_used="test",
+    )
+
+
+def registered(tools: FakeTools):
+    return patch.dict(tool_registry._TOOL_REGISTRY, tools.registry(), clear=True)
+
+
+@pytest.mark.asyncio
+async def test_independent_calls_do_not_wait_for_earlier_groups():
+    """A fast group-1 call finishes while a slow group-0 call is still running."""
+    tools = FakeTools(slow=0.2, fast=0.01)
+    plan = make_plan(ToolCall("slow", {}, parallel_group=0), ToolCall("fast", {}, parallel_group=1))
+
+    with registered(tools):
+        start = time.perf_counter()
+        streamed = [key async for key, _ in iter_plan_results(plan)]
+        elapsed = time.perf_counter() - start
+
+    assert streamed == ["fast", "slow"]
+    assert elapsed < 0.3
+
+
+@pytest.mark.asyncio
+async def test_depends_on_orders_calls():
+    """A dependent call starts only after every call it names has finished."""
+    tools = FakeTools(standings=0.05, team=0.01, summary=0.01)
+    plan = make_plan(
+        ToolCall("summary", {}, depends_on=["standings", "team"]),
+        ToolCall("standings", {}),
+        ToolCall("team", {}),
+    )
+
+    with registered(tools):
+        result = await execute_plan(plan)
+
+    assert result.all_success
+    assert list(result.tool_results) == ["summary", "standings", "team"]  # plan order
+    assert tools.events.index(("start", "summary")) > tools.events.index(("end", "standings"))
+
+
+@pytest.mark.asyncio
+async def test_failed_dependency_and_cycle_skip_dependents():
+    """Dependents of a failure, and calls on a cycle, fail without running."""
+    tools = FakeTools(broken=RuntimeError("boom"), after=0.0, a=0.0, b=0.0, free=0.0)
+    plan = make_plan(
+        ToolCall("broken", {}),
+        ToolCall("after", {}, depends_on=["broken"]),
+        ToolCall("a", {}, depends_on=["b"]),
+        ToolCall("b", {}, depends_on=["a"]),
+        ToolCall("free", {}, depends_on=["not_in_plan"]),
+    )
+
+    with registered(tools):
+        result = await execute_plan(plan)
+
+    called = {name for name, _ in tools.calls}
+    assert called == {"broken", "free"}
+    assert result.tool_results["after"].error == "Skipped: dependency broken failed"
+    assert "circular dependency" in result.tool_results["a"].error
+    assert "circular dependency" in result.tool_results["b"].error
+    assert result.tool_results["free"].success
+    assert not result.all_success
+
+
+@pytest.mark.asyncio
+async def test_identical_calls_run_once():
+    """Same tool and params (any key order) share one execution and result."""
+    tools = FakeTools(get_team_standings=0.01, get_team_advanced_stats=0.01)
+    plan = make_plan(
+        ToolCall("get_team_standings", {"season": "2023-24", "conference": None}),
+        ToolCall("get_team_advanced_stats", {"team_name": "Lakers", "season": "2023-24"}),
+        ToolCall("get_team_advanced_stats", {"season": "2023-24", "team_name": "Lakers"}, parallel_group=1),
+        ToolCall("get_team_advanced_stats", {"team_name": "Celtics", "season": "2023-24"}, parallel_group=1),
+    )
+
+    with registered(tools):
+        result = await execute_plan(plan)
+
+    assert len(tools.calls) == 3
+    assert result.deduplicated_calls == 1
+    assert list(result.tool_results) == [
+        "get_team_standings",
+        "get_team_advanced_stats",
+        "get_team_advanced_stats_2",
+        "get_team_advanced_stats_3",
+    ]
+    assert result.tool_results["get_team_advanced_stats_2"] is result.tool_results["get_team_advanced_stats"]
+    assert result.tool_results["get_team_advanced_stats_3"].data["team_name"] == "Celtics"
+    assert tool_call_signature(plan.tool_calls[1]) == tool_call_signature(plan.tool_calls[2])
+
+
+@pytest.mark.asyncio
+async def test_deadline_and_concurrency_cap():
+    """Calls past their deadline fail with UPSTREAM_TIMEOUT; at most N run at once."""
+    tools = FakeTools(stuck=1.0, quick=0.02)
+    plan = make_plan(ToolCall("stuck", {}), *(ToolCall("quick", {"i": i}) for i in range(9)))
+
+    with registered(tools), patch.dict(executor.TOOL_TIMEOUTS, {"stuck": 0.05}):
+        start = time.perf_counter()
+        result = await execute_plan(plan, max_concurrency=3)
+        elapsed = time.perf_counter() - start
+
+    stuck = result.tool_results["stuck"]
+    assert stuck.error_code == ErrorCode.UPSTREAM_TIMEOUT
+    assert stuck.error_details == {"timeout_seconds": 0.05}
+    assert tools.max_running == 3
+    assert sum(r.success for r in result.tool_results.values()) == 9
+    assert elapsed < 0.5
+
+
+@pytest.mark.asyncio
+async def test_concurrency_cap_is_shared_across_plans():
+    """Ten concurrent questions never run more than MAX_CONCURRENT_TOOLS tools."""
+    tools = FakeTools(quick=0.01)
+    plans = [
+        make_plan(*(ToolCall("quick", {"plan": p, "i": i}) for i in range(4)))
+        for p in range(10)
+    ]
+
+    with registered(tools), patch.object(executor, "MAX_CONCURRENT_TOOLS", 3):
+        results = await asyncio.gather(*(execute_plan(plan) for plan in plans))
+
+    assert tools.max_running == 3
+    assert all(r.success for result in results for r in result.tool_results.values())
+
+
+@pytest.mark.asyncio
+async def test_closing_stream_cancels_running_calls():
+    """Abandoning the stream cancels the calls still in flight."""
+    tools = FakeTools(fast=0.01, slow=5.0)
+    plan = make_plan(ToolCall("fast", {}), ToolCall("slow", {}))
+
+    with registered(tools):
+        stream = iter_plan_results(plan)
+        key, _ = await stream.__anext__()
+        await stream.aclose()
+        running_after_close = tools.running
+
+    assert key == "fast"
+    assert running_after_close == 0
+    assert ("end", "slow") not in tools.events
+
+
+@pytest.mark.asyncio
+async def test_on_result_callback_and_stream_nba_answer():
+    """Results reach callbacks in completion order; the stream yields partials then the answer."""
+    tools = FakeTools(slow=0.1, fast=0.01)
+    plan = make_plan(ToolCall("slow", {}), ToolCall("fast", {}))
+    seen = []
+
+    async def on_result(key, result):
+        seen.append(key)
+
+    with registered(tools):
+        await execute_plan(plan, on_result=on_result)
+    assert seen == ["fast", "slow"]
+
+    async def parse(query):
+        return plan.parsed_query
+
+    async def plan_query(parsed):
+        return plan
+
+    async def synthesize(parsed, result: ExecutionResult):
+        return SynthesizedResponse(raw_query="q", intent=parsed.intent, answer=",".join(result.tool_results),
+                                   confidence=1.0, sources=[], metadata={})
+
+    with registered(tools), patch.object(pipeline, "parse_query", parse), \
+            patch.object(pipeline, "plan_query_execution", plan_query), \
+            patch.object(pipeline, "synthesize_response", synthesize):
+        responses = [r async for r in pipeline.stream_nba_answer("q", use_cache=False)]
+
+    assert [r.answer for r in responses] == ["fast", "slow,fast"]
+    assert [r.metadata["partial"] for r in responses] == [True, False]
+    assert responses[0].metadata["completed"] == 1 and responses[0].metadata["total"] == 2
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_benchmark_multi_season_plan():
+    """5-season plan (one parallel_group per season, 80ms per call) plus a slow lookup."""
+    tools = FakeTools(get_player_advanced_stats=0.08, get_team_standings=0.2)
+    calls = [ToolCall("get_team_standings", {"season": "2023-24"}, parallel_group=0)]
+    calls += [
+        ToolCall("get_player_advanced_stats", {"player_name": "LeBron James", "season": f"{y}-{str(y + 1)[2:]}"},
+                 parallel_group=i)
+        for i, y in enumerate(range(2019, 2024))
+    ]
+    plan = make_plan(*calls)
+
+    with registered(tools):
+        start = time.perf_counter()
+        groups = {}
+        for tc in plan.tool_calls:
+            groups.setdefault(tc.parallel_group, []).append(tc)
+        for group_id in sorted(groups):
+            await execute_parallel_group(groups[group_id])
+        grouped = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = await execute_plan(plan)
+        dag = time.perf_counter() - start
+
+    print()
+    print(f"✅ Group-by-group execution: {grouped * 1000:.0f}ms")
+    print(f"✅ DAG execution: {dag * 1000:.0f}ms ({grouped / dag:.1f}x)")
+
+    assert result.all_success and len(result.tool_results) == 6
+    assert dag < grouped / 2
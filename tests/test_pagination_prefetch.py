@@ -0,0 +1,196 @@
+"""
+Tests for the prefetching chunk pipeline in DatasetPaginator.
+
+Validates:
+1. Chunks are yielded in order even when later fetches finish first
+2. Upcoming chunks are fetched while the consumer processes the current one
+3. prefetch_depth bounds the number of in-flight fetches
+4. Failed chunks are skipped, early exit cancels outstanding fetches
+5. Per-chunk timing is reported in ChunkInfo
+"""
+import asyncio
+import time
+from unittest.mock import patch
+
+import pyarrow as pa
+import pytest
+
+from nba_mcp.data.fetch import FetchError
+from nba_mcp.data.introspection import EndpointCapabilities
+from nba_mcp.data.pagination import DatasetPaginator
+
+SEASONS = ["2019-20", "2020-21", "2021-22", "2022-23", "2023-24"]
+
+
+def make_caps() -> EndpointCapabilities:
+    """Capabilities for a season-chunkable endpoint."""
+    return EndpointCapabilities(
+        endpoint="team_game_log",
+        columns=["SEASON"],
+        column_types={"SEASON": "string"},
+        supports_date_range=True,
+        supports_season_filter=True,
+        supports_pagination=False,
+        estimated_row_count=82,
+        min_date=None,
+        max_date=None,
+        available_seasons=SEASONS,
+        sample_data_shape=(82, 1),
+        chunk_strategy="season",
+        notes="",
+    )
+
+
+class FakeFetcher:
+    """Async stand-in for fetch_endpoint that records concurrency."""
+
+    def __init__(self, delays=None, fail=()):
+        self.delays = delays or {}
+        self.fail = set(fail)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.started = []
+        self.cancelled = 0
+
+    async def __call__(self, endpoint, params):
+        season = params["season"]
+        self.started.append(season)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(season, 0.05))
+            if season in self.fail:
+                raise FetchError(f"boom {season}")
+            return pa.table({"SEASON": [season]}), None
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def paginator():
+    # Keep chunk pacing off unless a test installs its own limiter
+    with patch("nba_mcp.data.pagination.get_introspector"), \
+            patch("nba_mcp.rate_limit.token_bucket._rate_limiter", None):
+        yield DatasetPaginator()
+
+
+async def collect(paginator, fetcher, depth):
+    with patch("nba_mcp.data.pagination.fetch_endpoint", fetcher):
+        return [
+            chunk
+            async for chunk in paginator._fetch_by_season(
+                "team_game_log", {"seasons": SEASONS}, make_caps(), depth
+            )
+        ]
+
+
+@pytest.mark.asyncio
+async def test_chunks_yielded_in_order(paginator):
+    """Later chunks finishing first must not reorder output."""
+    fetcher = FakeFetcher(delays={"2019-20": 0.2, "2020-21": 0.01})
+    chunks = await collect(paginator, fetcher, depth=4)
+
+    assert [info.season for _, info in chunks] == SEASONS
+    assert [info.chunk_number for _, info in chunks] == [1, 2, 3, 4, 5]
+    assert all(info.total_chunks == 5 for _, info in chunks)
+    assert [t.column("SEASON")[0].as_py() for t, _ in chunks] == SEASONS
+
+
+@pytest.mark.asyncio
+async def test_prefetch_depth_bounds_concurrency(paginator):
+    """At most prefetch_depth + 1 fetches are in flight."""
+    fetcher = FakeFetcher()
+    await collect(paginator, fetcher, depth=2)
+    assert fetcher.max_in_flight == 3
+
+    sequential = FakeFetcher()
+    await collect(paginator, sequential, depth=0)
+    assert sequential.max_in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_prefetch_overlaps_consumer_work(paginator):
+    """Fetches run while the consumer is busy, so total time ~ max(fetch, work)."""
+
+    async def run(depth):
+        fetcher = FakeFetcher(delays={s: 0.1 for s in SEASONS})
+        start = time.perf_counter()
+        with patch("nba_mcp.data.pagination.fetch_endpoint", fetcher):
+            async for _ in paginator._fetch_by_season(
+                "team_game_log", {"seasons": SEASONS}, make_caps(), depth
+            ):
+                await asyncio.sleep(0.1)  # Consumer processing
+        return time.perf_counter() - start
+
+    sequential = await run(0)
+    prefetched = await run(2)
+    assert sequential >= 0.95
+    assert prefetched < sequential * 0.75
+
+
+@pytest.mark.asyncio
+async def test_failed_chunk_is_skipped(paginator):
+    """A FetchError on one chunk skips it and keeps order for the rest."""
+    fetcher = FakeFetcher(fail={"2021-22"})
+    chunks = await collect(paginator, fetcher, depth=2)
+    assert [info.season for _, info in chunks] == ["2019-20", "2020-21", "2022-23", "2023-24"]
+
+
+@pytest.mark.asyncio
+async def test_early_exit_cancels_prefetched_chunks(paginator):
+    """Breaking out of the loop cancels fetches still in flight."""
+    fetcher = FakeFetcher(delays={**{s: 0.5 for s in SEASONS}, "2019-20": 0.05})
+    with patch("nba_mcp.data.pagination.fetch_endpoint", fetcher):
+        gen = paginator._fetch_by_season(
+            "team_game_log", {"seasons": SEASONS}, make_caps(), 3
+        )
+        async for _ in gen:
+            break
+        await gen.aclose()
+
+    assert fetcher.cancelled >= 1
+    assert fetcher.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_chunk_info_reports_timing(paginator):
+    """ChunkInfo carries fetch/wait timing and the prefetch depth used."""
+    fetcher = FakeFetcher(delays={s: 0.05 for s in SEASONS})
+    chunks = await collect(paginator, fetcher, depth=2)
+
+    for _, info in chunks:
+        assert info.prefetch_depth == 2
+        assert info.fetch_seconds >= 0.04
+        assert info.wait_seconds is not None
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_paces_chunks(paginator):
+    """An exhausted bucket delays chunk fetches instead of failing them."""
+    from nba_mcp.rate_limit.token_bucket import RateLimiter
+
+    limiter = RateLimiter()
+    limiter.add_limit("fetch_chunked", capacity=2, refill_rate=20.0)
+    fetcher = FakeFetcher(delays={s: 0.0 for s in SEASONS})
+
+    with patch("nba_mcp.rate_limit.token_bucket._rate_limiter", limiter):
+        start = time.perf_counter()
+        chunks = await collect(paginator, fetcher, depth=4)
+        elapsed = time.perf_counter() - start
+
+    assert len(chunks) == 5
+    # 3 requests beyond the burst at 20 tokens/s
+    assert elapsed >= 0.1
+
+
+def test_default_limits_include_chunk_bucket():
+    """The bucket the paginator consults is configured by default."""
+    from nba_mcp.data.pagination import RATE_LIMIT_KEY
+    from nba_mcp.rate_limit.token_bucket import initialize_rate_limiter
+
+    with patch("nba_mcp.rate_limit.token_bucket._rate_limiter", None):
+        limiter = initialize_rate_limiter()
+    assert RATE_LIMIT_KEY in limiter.buckets
@@ -0,0 +1,258 @@
+"""
+Tests for the Parquet cache metadata store (SQLite index).
+
+Validates:
+1. Cache hits batch access counters in memory (no per-hit writes)
+2. Flushing writes the batch in one transaction
+3. Legacy manifest.json files are migrated automatically
+4. Eviction and stats are served from the index
+5. Concurrent hits on the same entry are all counted
+6. The background flusher persists counters without further hits;
+   CacheManager.close() flushes on shutdown
+"""
+import asyncio
+import json
+import time
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from nba_mcp.data.cache_integration import CacheManager
+from nba_mcp.data.cache_metadata import CacheMetadataStore
+from nba_mcp.data.parquet_cache import ParquetCacheBackend, ParquetCacheConfig
+
+
+def make_table(num_rows: int = 50) -> pa.Table:
+    """Create a small NBA-like table."""
+    return pa.Table.from_pandas(
+        pd.DataFrame(
+            {
+                "PLAYER_ID": range(num_rows),
+                "PTS": [20 + i % 30 for i in range(num_rows)],
+            }
+        )
+    )
+
+
+@pytest.fixture
+def backend(tmp_path):
+    """Parquet backend with a long flush interval (manual flushes only)."""
+    config = ParquetCacheConfig(
+        cache_dir=tmp_path / "cache", max_size_mb=100, metadata_flush_interval=3600
+    )
+    backend = ParquetCacheBackend(config)
+    yield backend
+    backend.close()
+
+
+@pytest.mark.asyncio
+async def test_hits_are_batched_until_flush(backend):
+    """Access counters accumulate in memory and land in SQLite on flush."""
+    params = {"season": "2023-24"}
+    await backend.set("league_player_games", params, make_table())
+
+    for _ in range(10):
+        assert await backend.get("league_player_games", params) is not None
+
+    file_hash = backend._generate_cache_key("league_player_games", params)
+    assert backend._metadata.pending_count() == 1
+
+    # Raw row is untouched until flush
+    row = backend._metadata._conn.execute(
+        "SELECT access_count FROM cache_entries WHERE file_hash = ?", (file_hash,)
+    ).fetchone()
+    assert row[0] == 1
+
+    # Reads through the store include unflushed hits
+    assert backend.get_entry_metadata("league_player_games", params)["access_count"] == 11
+
+    assert await backend.flush_access_metadata() == 1
+    assert backend._metadata.pending_count() == 0
+    row = backend._metadata._conn.execute(
+        "SELECT access_count FROM cache_entries WHERE file_hash = ?", (file_hash,)
+    ).fetchone()
+    assert row[0] == 11
+
+
+@pytest.mark.asyncio
+async def test_concurrent_hits_are_all_counted(backend):
+    """Concurrent hits on one entry no longer race on a manifest file."""
+    params = {"season": "2022-23"}
+    await backend.set("team_game_log", params, make_table())
+
+    await asyncio.gather(*[backend.get("team_game_log", params) for _ in range(50)])
+    await backend.flush_access_metadata()
+
+    assert backend.get_entry_metadata("team_game_log", params)["access_count"] == 51
+
+
+@pytest.mark.asyncio
+async def test_metadata_survives_restart(tmp_path):
+    """Entries and flushed counters persist across backend instances."""
+    config = ParquetCacheConfig(cache_dir=tmp_path / "cache", metadata_flush_interval=3600)
+    params = {"season": "2021-22"}
+
+    first = ParquetCacheBackend(config)
+    await first.set("shot_chart", params, make_table(10), metadata={"ttl": 86400})
+    await first.get("shot_chart", params)
+    first.close()  # flushes pending counters
+
+    second = ParquetCacheBackend(config)
+    entry = second.get_entry_metadata("shot_chart", params)
+    assert entry["access_count"] == 2
+    assert entry["row_count"] == 10
+    assert entry["ttl"] == 86400
+    assert entry["params"] == params
+    second.close()
+
+
+def flushed_access_count(backend, endpoint, params) -> int:
+    """access_count as stored in SQLite (excludes unflushed hits)."""
+    file_hash = backend._generate_cache_key(endpoint, params)
+    return backend._metadata._conn.execute(
+        "SELECT access_count FROM cache_entries WHERE file_hash = ?", (file_hash,)
+    ).fetchone()[0]
+
+
+@pytest.mark.asyncio
+async def test_background_flusher_persists_idle_counters(backend):
+    """Pending hits are flushed on a timer, not only on the next hit."""
+    params = {"season": "2020-21"}
+    await backend.set("team_game_log", params, make_table())
+    await backend.get("team_game_log", params)
+
+    backend.start_metadata_flusher(interval=0.01)
+    deadline = time.monotonic() + 2
+    while backend._metadata.pending_count() and time.monotonic() < deadline:
+        await asyncio.sleep(0.01)
+
+    assert flushed_access_count(backend, "team_game_log", params) == 2
+    backend.close()
+    assert not backend._flush_thread
+
+
+@pytest.mark.asyncio
+async def test_cache_manager_close_flushes_pending_counters(tmp_path):
+    """Shutdown persists hits still batched in memory."""
+    manager = CacheManager(enable_cache=True)
+    manager.enable_parquet_cache(cache_dir=tmp_path / "cache", background_writes=False)
+    backend = manager.parquet_backend
+    backend._metadata.flush_interval = 3600
+    params = {"season": "2019-20"}
+    await backend.set("shot_chart", params, make_table(10))
+    await backend.get("shot_chart", params)
+
+    manager.close()
+
+    reopened = ParquetCacheBackend(backend.config)
+    assert reopened.get_entry_metadata("shot_chart", params)["access_count"] == 2
+    reopened.close()
+
+
+def test_legacy_manifests_are_migrated(tmp_path):
+    """Existing manifest.json files are imported once and renamed."""
+    cache_dir = tmp_path / "cache"
+    endpoint_dir = cache_dir / "endpoints" / "league_player_games"
+    endpoint_dir.mkdir(parents=True)
+    pq.write_table(make_table(), endpoint_dir / "a3f7e2d1b9c48f3a.parquet")
+
+    manifest = {
+        "endpoint": "league_player_games",
+        "files": {
+            "a3f7e2d1b9c48f3a": {
+                "params": {"season": "2023-24"},
+                "created_at": "2025-11-05T10:00:00+00:00",
+                "last_accessed": "2025-11-05T12:00:00+00:00",
+                "size_bytes": 473178,
+                "row_count": 8355,
+                "access_count": 42,
+                "compression": "SNAPPY",
+            },
+            # File no longer on disk: not imported
+            "deadbeefdeadbeef": {"params": {}, "size_bytes": 10},
+        },
+        "total_files": 2,
+        "total_size_bytes": 473188,
+    }
+    (endpoint_dir / "manifest.json").write_text(json.dumps(manifest))
+
+    backend = ParquetCacheBackend(ParquetCacheConfig(cache_dir=cache_dir))
+
+    assert not (endpoint_dir / "manifest.json").exists()
+    assert (endpoint_dir / "manifest.json.migrated").exists()
+
+    entry = backend._metadata.get("league_player_games", "a3f7e2d1b9c48f3a")
+    assert entry["access_count"] == 42
+    assert entry["size_bytes"] == 473178
+    assert backend._metadata.get("league_player_games", "deadbeefdeadbeef") is None
+
+    stats = backend.get_stats()
+    assert stats["total_files"] == 1
+    assert stats["endpoints"] == ["league_player_games"]
+    backend.close()
+
+
+def test_corrupted_manifest_is_skipped(tmp_path):
+    """A corrupted legacy manifest does not prevent startup."""
+    endpoint_dir = tmp_path / "cache" / "endpoints" / "broken"
+    endpoint_dir.mkdir(parents=True)
+    (endpoint_dir / "manifest.json").write_text("CORRUPTED JSON {{{")
+
+    backend = ParquetCacheBackend(ParquetCacheConfig(cache_dir=tmp_path / "cache"))
+    assert backend.get_stats()["total_files"] == 0
+    backend.close()
+
+
+@pytest.mark.asyncio
+async def test_eviction_uses_access_order(tmp_path):
+    """Least recently accessed entries are evicted first, including batched hits."""
+    config = ParquetCacheConfig(
+        cache_dir=tmp_path / "cache", max_size_mb=1, metadata_flush_interval=3600
+    )
+    backend = ParquetCacheBackend(config)
+
+    # Keep eviction from running during setup
+    backend.config.max_size_mb = 10_000
+    for i in range(4):
+        await backend.set("ep", {"i": i}, make_table(), metadata={"size_bytes": 300_000})
+        await asyncio.sleep(0.01)
+
+    # Touch the oldest entry so it becomes most recently used (unflushed)
+    await backend.get("ep", {"i": 0})
+
+    backend.config.max_size_mb = 1
+    await backend._evict_if_needed()
+
+    remaining = {e["file_hash"] for e in backend._metadata.entries_by_access()}
+    assert backend._generate_cache_key("ep", {"i": 0}) in remaining
+    assert backend._generate_cache_key("ep", {"i": 1}) not in remaining
+    assert not backend._get_cache_path("ep", backend._generate_cache_key("ep", {"i": 1})).exists()
+    assert await backend._calculate_total_size() <= 1024 * 1024 * 0.9
+    backend.close()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_endpoint_clears_index(backend):
+    """Endpoint-wide and full invalidation clear the index rows."""
+    await backend.set("a", {"x": 1}, make_table())
+    await backend.set("b", {"x": 1}, make_table())
+
+    await backend.invalidate("a")
+    assert [row["endpoint"] for row in backend._metadata.endpoint_summary()] == ["b"]
+
+    await backend.invalidate()
+    assert backend._metadata.endpoint_summary() == []
+
+
+def test_store_flush_due_respects_interval(tmp_path):
+    """flush_due only fires after the interval with pending accesses."""
+    store = CacheMetadataStore(tmp_path / "index.db", flush_interval=0)
+    assert not store.flush_due()
+    store.upsert("ep", "h", {"size_bytes": 1})
+    store.record_access("ep", "h")
+    assert store.flush_due()
+    store.flush()
+    assert not store.flush_due()
+    store.close()
@@ -444,16 +444,12 @@ async def test_access_pattern_updates(stress_cache_manager):
         await stress_cache_manager.parquet_backend.get(endpoint, params)
         await asyncio.sleep(0.1)
 
-    # Check manifest for access count
-    manifest_path = stress_cache_manager.parquet_backend.endpoints_dir / endpoint / "manifest.json"
-    if manifest_path.exists():
-        manifest = json.loads(manifest_path.read_text())
-        cache_key = stress_cache_manager.parquet_backend._generate_cache_key(endpoint, params)
-
-        if cache_key in manifest["files"]:
-            access_count = manifest["files"][cache_key].get("access_count", 0)
-            assert access_count >= 5, f"Access count should be >= 5, got {access_count}"
-            print(f"   [OK] Access tracking working (count: {access_count})")
+    # Check metadata store for access count (includes batched, unflushed hits)
+    entry = stress_cache_manager.parquet_backend.get_entry_metadata(endpoint, params)
+    assert entry is not None, "Entry should be tracked in the metadata store"
+    access_count = entry.get("access_count", 0)
+    assert access_count >= 5, f"Access count should be >= 5, got {access_count}"
+    print(f"   [OK] Access tracking working (count: {access_count})")
 
 
 # ============================================================================
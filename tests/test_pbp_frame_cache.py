@@ -0,0 +1,205 @@
+"""
+Tests for the shared per-game play-by-play frame cache.
+
+Validates:
+1. get_playbyplay_v3, get_pbp, find_event_index and stream_pbp share one request
+2. The clock index returns the same event as the old row scan
+3. Final games are never refetched; unfinished games expire after the TTL
+4. Period slicing and LRU eviction
+
+Run benchmark: pytest tests/test_pbp_frame_cache.py -m performance -s
+"""
+import re
+import time
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from nba_mcp.api.tools import playbyplayv3_or_realtime as pbp
+from nba_mcp.api.tools.playbyplayv3_or_realtime import (
+    PastGamesPlaybyPlay,
+    PBPFrameCache,
+    PlayByPlayFetcher,
+    get_playbyplay_v3,
+)
+
+GAME_ID = "0022400123"
+
+
+def make_pbp(periods: int = 4, events_per_period: int = 120, final: bool = True, seed: int = 0):
+    """PlayByPlayV3-shaped PlayByPlay frame (camelCase), clocks mostly decreasing."""
+    rng = np.random.default_rng(seed)
+    rows = []
+    number = 1
+    for period in range(1, periods + 1):
+        seconds = np.sort(rng.uniform(0, 720, events_per_period))[::-1]
+        # a few out-of-order clocks, as in real feeds (reviews, corrections)
+        for i in rng.choice(events_per_period, 5, replace=False):
+            seconds[i] = min(720.0, seconds[i] + 20)
+        for sec in seconds:
+            rows.append(
+                {
+                    "gameId": GAME_ID,
+                    "actionNumber": number,
+                    "clock": f"PT{int(sec // 60):02d}M{sec % 60:05.2f}S",
+                    "period": period,
+                    "scoreHome": str(number),
+                    "scoreAway": "0",
+                    "description": f"Event {number}",
+                    "actionType": "2pt",
+                    "subType": "",
+                    "personId": 0,
+                }
+            )
+            number += 1
+    if final:
+        rows.append(
+            {
+                "gameId": GAME_ID, "actionNumber": number, "clock": "PT00M00.00S",
+                "period": periods, "scoreHome": "0", "scoreAway": "0",
+                "description": "Game End", "actionType": "game", "subType": "end", "personId": 0,
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+class FakePlayByPlayV3:
+    """Stand-in for the nba_api endpoint that counts requests."""
+
+    calls = []
+    frame = make_pbp()
+
+    def __init__(self, game_id, start_period=1, end_period=10, timeout=30):
+        FakePlayByPlayV3.calls.append((game_id, start_period, end_period))
+
+    def get_data_frames(self):
+        return [pd.DataFrame({"videoAvailable": [1]}), FakePlayByPlayV3.frame]
+
+
+@pytest.fixture(autouse=True)
+def fake_endpoint():
+    FakePlayByPlayV3.calls = []
+    FakePlayByPlayV3.frame = make_pbp()
+    with patch.object(pbp, "PlayByPlayV3", FakePlayByPlayV3), \
+            patch.object(pbp, "_pbp_cache", PBPFrameCache()):
+        yield
+
+
+def scan_event_index(df: pd.DataFrame, period: int, clock: str) -> int:
+    """The previous find_event_index algorithm (row scan)."""
+    mins, secs = map(int, clock.split(":"))
+    target = mins * 60 + secs
+    for idx, row in df.iterrows():
+        m = re.match(r"PT(\d+)M([\d\.]+)S", row["clock"])
+        seconds = int(m.group(1)) * 60 + float(m.group(2)) if m else 0.0
+        if row["period"] == period and seconds <= target:
+            return idx
+    return 0
+
+
+def test_all_paths_share_one_request():
+    """The tool wrapper, the class methods and streaming fetch the game once."""
+    game = PastGamesPlaybyPlay(game_id=GAME_ID)
+
+    v3 = get_playbyplay_v3(GAME_ID, 1, 4)
+    records = game.get_pbp(start_period=2, end_period=2)
+    idx = game.find_event_index(period=2, clock="06:00", start_period=2)
+    streamed = list(game.stream_pbp(start_period=2, end_period=2, start_clock="06:00"))
+
+    assert len(FakePlayByPlayV3.calls) == 1
+    assert v3["AvailableVideo"] == [{"videoAvailable": 1}]
+    assert len(v3["PlayByPlay"]) == 481
+    assert {r["period"] for r in records["PlayByPlay"]} == {2}
+    assert streamed == records["PlayByPlay"][idx:]
+    assert pbp.get_pbp_cache().get_stats()["final_games"] == 1
+
+
+@pytest.mark.parametrize("period", [1, 2, 4])
+@pytest.mark.parametrize("clock", ["12:00", "11:59", "06:30", "00:45", "00:00"])
+def test_clock_index_matches_row_scan(period, clock):
+    """Binary search over the running-minimum clock finds the scanned event."""
+    df = PlayByPlayFetcher(GAME_ID, 1, 4).fetch()
+    game = PastGamesPlaybyPlay(game_id=GAME_ID)
+
+    assert game.find_event_index(period=period, clock=clock) == scan_event_index(df, period, clock)
+
+
+def test_period_slices_and_missing_period():
+    """Slices are positional per period range; an absent period gives index 0."""
+    frames = pbp.get_pbp_cache().get(GAME_ID)
+    overtime_free = frames.frame(3, 4)
+
+    assert list(overtime_free.index) == list(range(len(overtime_free)))
+    assert set(overtime_free["period"]) == {3, 4}
+    assert "score_home" in overtime_free.columns
+    assert frames.event_index(5, "03:00") == 0
+
+    # callers get copies; the shared frame is not modified
+    fetched = PlayByPlayFetcher(GAME_ID, 3, 4).fetch()
+    fetched["period"] = 0
+    assert set(frames.frame(3, 4)["period"]) == {3, 4}
+
+
+def test_live_games_expire_final_games_do_not():
+    """Unfinished games are refetched after the TTL; Final games never."""
+    FakePlayByPlayV3.frame = make_pbp(final=False)
+    cache = PBPFrameCache(live_ttl=0.05)
+
+    cache.get(GAME_ID)
+    cache.get(GAME_ID)
+    assert len(FakePlayByPlayV3.calls) == 1
+
+    time.sleep(0.06)
+    FakePlayByPlayV3.frame = make_pbp(final=True)
+    assert cache.get(GAME_ID).is_final
+    assert len(FakePlayByPlayV3.calls) == 2
+
+    time.sleep(0.06)
+    cache.get(GAME_ID)
+    assert len(FakePlayByPlayV3.calls) == 2
+    assert cache.get_stats()["refreshes"] == 1
+
+
+def test_lru_eviction():
+    """The least recently used game is dropped beyond max_games."""
+    cache = PBPFrameCache(max_games=2)
+    cache.get("0022400001")
+    cache.get("0022400002")
+    cache.get("0022400001")
+    cache.get("0022400003")
+
+    assert cache.get_stats()["evictions"] == 1
+    cache.get("0022400001")
+    assert len(FakePlayByPlayV3.calls) == 3
+    cache.get("0022400002")
+    assert len(FakePlayByPlayV3.calls) == 4
+
+
+@pytest.mark.performance
+def test_benchmark_event_lookup():
+    """Row scan per lookup vs the cached clock index."""
+    df = PlayByPlayFetcher(GAME_ID, 1, 4).fetch()
+    game = PastGamesPlaybyPlay(game_id=GAME_ID)
+    lookups = [(period, f"{m:02d}:00") for period in (1, 4) for m in (11, 6, 1)]
+    game.find_event_index(period=1, clock="11:00")  # build the index
+
+    start = time.perf_counter()
+    for period, clock in lookups:
+        scan_event_index(df, period, clock)
+    scan_ms = (time.perf_counter() - start) * 1000 / len(lookups)
+
+    iterations = 1000
+    start = time.perf_counter()
+    for _ in range(iterations // len(lookups)):
+        for period, clock in lookups:
+            game.find_event_index(period=period, clock=clock)
+    index_us = (time.perf_counter() - start) * 1e6 / iterations
+
+    print()
+    print(f"✅ Row scan lookup ({len(df)} events): {scan_ms:.2f}ms (plus a refetch before)")
+    print(f"✅ Clock index lookup: {index_us:.1f}µs, PlayByPlayV3 requests: {len(FakePlayByPlayV3.calls)}")
+
+    assert index_us / 1000 < scan_ms
+    assert len(FakePlayByPlayV3.calls) == 1
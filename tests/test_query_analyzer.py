@@ -0,0 +1,162 @@
+"""
+Tests for the compiled NLQ query analyzer.
+
+Validates:
+1. classify_intent and extract_stat_types match the per-pattern loops
+   (intent priority order, overlapping substring stat keys)
+2. The trie phrase scan finds every phrase, including overlapping ones
+3. Tokens carry offsets; has() / has_word() keep substring / \\b semantics
+4. parse_query analyzes the query once and shares it with every extractor
+
+Run benchmark: pytest tests/test_query_analyzer.py -m performance -s
+"""
+import re
+import time
+from unittest.mock import patch
+
+import pytest
+
+from nba_mcp.nlq import parser
+from nba_mcp.nlq.parser import (
+    INTENT_PATTERNS,
+    STAT_PATTERNS,
+    analyze_query,
+    classify_intent,
+    extract_modifiers,
+    extract_stat_types,
+    parse_time_range,
+)
+from tests.golden.queries import GOLDEN_QUERIES
+
+EXTRA_QUERIES = [
+    "Lakers or Celtics all-time record",
+    "LeBron three point percentage vs Curry threes made",
+    "Team performance per 36 in the paint",
+    "Who has the best +/- and net rating?",
+    "Games where Jokic had a triple-double since Christmas",
+    "Top 5 offensive rebound percentage leaders in the Western conference",
+    "Warriors 2015-16 to 2017-18 win% at home",
+    "Giannis career highs in defensive win shares",
+    "",
+]
+QUERIES = [g.query for g in GOLDEN_QUERIES] + EXTRA_QUERIES
+
+
+def loop_classify_intent(query):
+    """The previous classify_intent (one re.search per pattern)."""
+    query_lower = query.lower()
+    for intent, patterns in INTENT_PATTERNS.items():
+        for pattern in patterns:
+            if re.search(pattern, query_lower):
+                return intent
+    return "unknown"
+
+
+def loop_extract_stat_types(query):
+    """The previous extract_stat_types (one substring scan per key)."""
+    query_lower = query.lower()
+    stats = set()
+    for pattern, codes in STAT_PATTERNS.items():
+        if pattern in query_lower:
+            stats.update(codes)
+    return sorted(stats)
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_matches_per_pattern_loops(query):
+    """Same intent and stat codes as scanning every pattern in turn."""
+    assert classify_intent(query) == loop_classify_intent(query)
+    assert extract_stat_types(query) == loop_extract_stat_types(query)
+
+
+def test_phrase_scan_finds_overlapping_phrases():
+    """Every registered phrase occurring as a substring is found."""
+    query = "Threes made and 3 point percentage per 100 possessions"
+    analysis = analyze_query(query)
+
+    expected = {phrase for phrase in parser._PHRASES if phrase in query.lower()}
+    assert analysis.phrases == expected
+    assert {"three", "threes", "threes made", "3 point percentage", "per 100", "per"} <= analysis.phrases
+
+
+def test_tokens_words_and_has():
+    """Tokens keep raw offsets; has() falls back to a substring search."""
+    analysis = analyze_query("Karl-Anthony Towns vs De'Aaron Fox, East only")
+
+    assert [t.text for t in analysis.tokens] == ["Karl-Anthony", "Towns", "vs", "De'Aaron", "Fox", "East", "only"]
+    assert all(analysis.raw[t.start:t.end] == t.text for t in analysis.tokens)
+    assert analysis.has_word("east") and not analysis.has_word("eas")
+    assert analysis.has("ea") and not analysis.has("lakers")  # unregistered phrases
+    assert analysis.has("tonight", "fox") and not analysis.has("tonight", "playoffs")
+
+
+def test_extractors_accept_analysis_or_string():
+    """Extractors return the same result for a string or its analysis."""
+    query = "Curry 30+ points in December games on the road, top 10, last season"
+    analysis = analyze_query(query)
+
+    assert extract_modifiers(analysis) == extract_modifiers(query)
+    assert extract_modifiers(query)["month"] == 12
+    assert parse_time_range(analysis) == parse_time_range(query)
+    assert extract_modifiers("December games in January")["month"] == 1  # earliest month wins
+
+
+@pytest.mark.asyncio
+async def test_parse_query_analyzes_once():
+    """One analysis per parse_query, shared by every extractor."""
+    calls = []
+    original = parser.analyze_query
+
+    def counting(query):
+        calls.append(query)
+        return original(query)
+
+    async def no_entities(query):
+        return []
+
+    with patch.object(parser, "analyze_query", counting), \
+            patch.object(parser, "extract_entities", no_entities):
+        parsed = await parser.parse_query("Who leads the NBA in assists at home?")
+
+    assert calls == ["Who leads the NBA in assists at home?"]
+    assert parsed.intent == "leaders" and parsed.stat_types == ["AST"]
+    assert parsed.modifiers["location"] == "home"
+
+
+@pytest.mark.performance
+def test_benchmark_pattern_stages():
+    """Per-pattern loops vs compiled matchers over the golden queries."""
+    queries = [g.query for g in GOLDEN_QUERIES]
+    rounds = 200
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for query in queries:
+            loop_classify_intent(query)
+            loop_extract_stat_types(query)
+    loop_us = (time.perf_counter() - start) / (rounds * len(queries)) * 1e6
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for query in queries:
+            analysis = analyze_query(query)
+            classify_intent(analysis)
+            extract_stat_types(analysis)
+    compiled_us = (time.perf_counter() - start) / (rounds * len(queries)) * 1e6
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for query in queries:
+            analysis = analyze_query(query)
+            classify_intent(analysis)
+            extract_stat_types(analysis)
+            parse_time_range(analysis)
+            extract_modifiers(analysis)
+    stages_us = (time.perf_counter() - start) / (rounds * len(queries)) * 1e6
+
+    print()
+    print(f"✅ Intent + stats, per-pattern loops ({len(queries)} golden queries): {loop_us:.1f}us/query")
+    print(f"✅ Intent + stats, compiled: {compiled_us:.1f}us/query ({loop_us / compiled_us:.1f}x)")
+    print(f"✅ All pattern stages (intent, stats, time range, modifiers): {stages_us:.1f}us/query")
+
+    assert compiled_us < loop_us
@@ -0,0 +1,316 @@
+"""
+Tests for the async, pooled RedisCache backend.
+
+Validates:
+1. Circuit breaker opens after repeated failures, probes and recovers
+2. Unreachable Redis at startup falls back to memory without per-call retries
+3. aget_many/aset_many use one MGET / one pipeline round trip; aget_with_ttl
+   reads the value and its TTL in one pipeline
+4. Background health checks restore Redis after an outage
+5. The cached decorator no longer pings Redis on every call
+6. The sync API keeps working for legacy callers
+7. Values Redis accepted are not duplicated in the in-process fallback
+8. aclose() cancels and waits for the health check task; breaker trips are
+   exported as a Prometheus counter
+"""
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+
+from nba_mcp.cache import redis_cache
+from nba_mcp.cache.redis_cache import CacheTier, RedisCache, RedisCircuitBreaker, cached
+
+UNREACHABLE = "redis://127.0.0.1:1/0"
+
+
+class FakeAsyncRedis:
+    """In-memory stand-in for redis.asyncio.Redis that records calls."""
+
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+        self.calls = []
+        self.down = False
+
+    def _call(self, op):
+        self.calls.append(op)
+        if self.down:
+            raise ConnectionError("Connection refused")
+
+    async def get(self, key):
+        self._call("get")
+        return self.store.get(key)
+
+    async def mget(self, keys):
+        self._call("mget")
+        return [self.store.get(key) for key in keys]
+
+    async def setex(self, key, ttl, value):
+        self._call("setex")
+        self.store[key] = value
+        self.ttls[key] = ttl
+
+    async def delete(self, key):
+        self._call("delete")
+        self.store.pop(key, None)
+
+    async def ping(self):
+        self._call("ping")
+        return True
+
+    async def aclose(self):
+        pass
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def setex(self, key, ttl, value):
+        self.commands.append(("setex", key, ttl, value))
+
+    def get(self, key):
+        self.commands.append(("get", key))
+
+    def pttl(self, key):
+        self.commands.append(("pttl", key))
+
+    async def execute(self):
+        self.client._call("execute")
+        results = []
+        for op, key, *args in self.commands:
+            if op == "setex":
+                ttl, value = args
+                self.client.store[key] = value
+                self.client.ttls[key] = ttl
+                results.append(True)
+            elif op == "get":
+                results.append(self.client.store.get(key))
+            else:
+                results.append(self.client.ttls[key] * 1000 if key in self.client.store else -2)
+        return results
+
+
+@pytest_asyncio.fixture
+async def make_cache():
+    """
+    Factory for RedisCache instances whose async client is `fake` (the
+    startup ping fails harmlessly). Every cache is closed on teardown,
+    which waits for its health check task.
+    """
+    caches = []
+
+    def make(fake=None, **kwargs) -> RedisCache:
+        kwargs.setdefault("health_check_interval", 0)
+        cache = RedisCache(url=UNREACHABLE, **kwargs)
+        if fake is not None:
+            cache._async_client = fake
+            cache._async_loop = asyncio.get_running_loop()
+            cache.breaker.record_success()
+        caches.append(cache)
+        return cache
+
+    yield make
+    for cache in caches:
+        await cache.aclose()
+
+
+def test_breaker_opens_probes_and_recovers():
+    """CLOSED → OPEN after threshold; one half-open probe; success closes."""
+    breaker = RedisCircuitBreaker(failure_threshold=2, recovery_timeout=0.05)
+
+    breaker.record_failure()
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == "OPEN" and not breaker.allow_request()
+
+    time.sleep(0.06)
+    assert breaker.allow_request()  # the probe
+    assert breaker.state == "HALF_OPEN" and not breaker.allow_request()
+
+    breaker.record_failure()  # failed probe reopens immediately
+    assert breaker.state == "OPEN"
+
+    time.sleep(0.06)
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == "CLOSED"
+    assert breaker.get_stats()["trips"] == 2 and breaker.get_stats()["recoveries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_unreachable_redis_uses_fallback(make_cache):
+    """A dead server at startup opens the circuit; reads/writes hit memory only."""
+    cache = make_cache(recovery_timeout=60)
+
+    assert not cache.redis_available
+    assert await cache.aset("k", {"pts": 30}, ttl=60)
+    assert await cache.aget("k") == {"pts": 30}
+    assert cache.get("k") == {"pts": 30}
+
+    stats = cache.get_stats()
+    assert stats["fallback_hits"] == 2 and stats["errors"] == 0
+    assert stats["circuit"]["state"] == "OPEN"
+
+
+@pytest.mark.asyncio
+async def test_batch_operations_use_single_round_trips(make_cache):
+    """aset_many pipelines every SETEX; aget_many is one MGET."""
+    fake = FakeAsyncRedis()
+    cache = make_cache(fake, compression_threshold=64)
+    items = {f"player:{i}": {"id": i, "games": list(range(i * 10))} for i in range(20)}
+
+    assert await cache.aset_many(items, ttl=3600, tier=CacheTier.HISTORICAL)
+    assert fake.calls == ["execute"]
+    assert len(fake.store) == 20
+    assert cache.stats["compression_saves"] > 0
+
+    cache.fallback.clear()
+    found = await cache.aget_many(list(items) + ["player:missing"])
+
+    assert fake.calls == ["execute", "mget"]
+    assert found == items
+    assert cache.stats["redis_hits"] == 20 and cache.stats["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_get_with_ttl_is_one_round_trip(make_cache):
+    """aget_with_ttl pipelines GET and PTTL; fallback hits carry no TTL."""
+    fake = FakeAsyncRedis()
+    cache = make_cache(fake)
+    await cache.aset("k", {"pts": 30}, ttl=120)
+
+    assert await cache.aget_with_ttl("k") == ({"pts": 30}, 120.0)
+    assert fake.calls == ["setex", "execute"]
+
+    fake.down = True
+    await cache.aset("outage", {"pts": 12}, ttl=120)  # kept in the fallback
+    fake.down = False
+    assert await cache.aget_with_ttl("outage") == ({"pts": 12}, None)
+    assert await cache.aget_with_ttl("missing") == (None, None)
+
+
+@pytest.mark.asyncio
+async def test_redis_writes_skip_the_fallback(make_cache):
+    """Accepted writes live only in Redis; an outage copy is dropped on rewrite."""
+    fake = FakeAsyncRedis()
+    cache = make_cache(fake)
+
+    assert await cache.aset("k", {"pts": 30}, ttl=60)
+    assert await cache.aset_many({"a": 1, "b": 2}, ttl=60)
+    assert cache.fallback.get_stats()["items"] == 0
+
+    fake.down = True
+    await cache.aset("k", {"pts": 31}, ttl=60)
+    fake.down = False
+    cache.breaker.record_success()
+    assert cache.fallback.get("k") == {"pts": 31}
+
+    assert await cache.aset("k", {"pts": 32}, ttl=60)
+    assert cache.fallback.get("k") is None
+    assert await cache.aget("k") == {"pts": 32}
+
+
+@pytest.mark.asyncio
+async def test_outage_opens_circuit_and_health_check_recovers(make_cache):
+    """Failures fall back to memory; a successful health check restores Redis."""
+    fake = FakeAsyncRedis()
+    cache = make_cache(fake, failure_threshold=2, recovery_timeout=60)
+    await cache.aset("k", 1, ttl=60)
+
+    fake.down = True
+    assert await cache.aget("k") is None  # only Redis held it
+    assert not await cache.aset("k", 1, ttl=60)  # failed write lands in the fallback
+    assert await cache.aget("k") == 1  # served by fallback
+    assert cache.breaker.state == "OPEN"
+
+    calls_while_open = len(fake.calls)
+    assert await cache.aget("k") == 1
+    assert len(fake.calls) == calls_while_open  # Redis skipped entirely
+
+    fake.down = False
+    assert await cache.check_health()
+    assert cache.redis_available
+    cache.fallback.clear()
+    assert await cache.aget("k") == 1
+    assert fake.calls[-1] == "get"
+
+
+@pytest.mark.asyncio
+async def test_background_health_checks_run(make_cache):
+    """The health check task starts with the async client and pings periodically."""
+    fake = FakeAsyncRedis()
+    cache = make_cache(fake, health_check_interval=0.01)
+    fake.down = True
+    cache.breaker.trip()
+
+    await cache.aget("warmup")  # starts the task
+    fake.down = False
+    await asyncio.sleep(0.05)
+
+    assert fake.calls.count("ping") >= 1
+    assert cache.redis_available
+
+    task = cache._health_task
+    await cache.aclose()
+    assert task.done() and cache._health_task is None
+
+
+@pytest.mark.asyncio
+async def test_cached_decorator_does_not_ping(monkeypatch, make_cache):
+    """Decorated calls do one GET (and one SETEX on a miss), no PING."""
+    fake = FakeAsyncRedis()
+    cache = make_cache(fake)
+    monkeypatch.setattr(redis_cache, "_cache_instance", cache)
+    calls = []
+
+    @cached(tier=CacheTier.DAILY)
+    async def get_stats(player_name: str):
+        calls.append(player_name)
+        return {"player": player_name, "pts": 25.7}
+
+    cache.fallback.clear()
+    assert await get_stats(player_name="LeBron James") == {"player": "LeBron James", "pts": 25.7}
+    cache.fallback.clear()
+    assert await get_stats(player_name="LeBron James") == {"player": "LeBron James", "pts": 25.7}
+
+    assert calls == ["LeBron James"]
+    assert "ping" not in fake.calls
+    assert fake.calls == ["get", "setex", "get"]
+
+
+def test_circuit_trips_exported_as_counter():
+    """Trip totals only ever add to the counter, also when a new cache starts at 0."""
+    from nba_mcp.observability import metrics
+
+    manager = metrics.MetricsManager()
+    before = metrics.REDIS_CIRCUIT_TRIPS._value.get()
+    with patch.dict(metrics._counter_totals, clear=True):
+        for trips in (2, 3, 3, 1):  # the last cache was recreated
+            manager.update_cache_stats({"circuit": {"trips": trips}})
+
+    assert metrics.REDIS_CIRCUIT_TRIPS._value.get() - before == 4
+
+
+def test_sync_api_still_available():
+    """Legacy sync get/set/get_many/set_many work (here via the fallback)."""
+    cache = RedisCache(url=UNREACHABLE, health_check_interval=0, recovery_timeout=60)
+
+    assert cache.set_many({"a": 1, "b": [2, 3]}, ttl=60)
+    assert cache.get_many(["a", "b", "c"]) == {"a": 1, "b": [2, 3]}
+    assert cache.delete("a")
+    assert cache.get("a") is None
+    cache.close()
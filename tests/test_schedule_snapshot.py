@@ -0,0 +1,331 @@
+"""
+Tests for the conditional-GET schedule snapshot store.
+
+Validates:
+1. Lookups match parse_schedule_to_dataframe on the same payload
+2. Revalidation sends ETag / If-Modified-Since; a 304 keeps the snapshot
+3. The snapshot is persisted and reloaded without a download
+4. CDN failures serve the previous snapshot
+5. get_nba_schedule and get_game_context answer from the snapshot
+6. Undated games survive date filters; lookups are safe during a refresh
+7. Games sharing a tip-off time keep one order (game_id) in parser and store
+
+Run benchmark: pytest tests/test_schedule_snapshot.py -m performance -s
+"""
+import copy
+import threading
+import time
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+import requests
+
+from nba_mcp.api import schedule_store
+from nba_mcp.api.game_context import fetch_schedule_context
+from nba_mcp.api.schedule import get_nba_schedule, parse_schedule_to_dataframe
+from nba_mcp.api.schedule_store import ScheduleSnapshot, build_schedule_table
+
+TEAMS = [(1610612737 + i, f"T{i:02d}") for i in range(30)]
+
+
+def make_schedule(num_days: int = 170, games_per_day: int = 8, start: date = date(2025, 10, 21)):
+    """scheduleLeagueV2-shaped payload (~1,360 games)."""
+    game_dates = []
+    number = 1
+    for day in range(num_days):
+        game_day = start + timedelta(days=day)
+        games = []
+        for slot in range(games_per_day):
+            home = TEAMS[(day + 2 * slot) % 30]
+            away = TEAMS[(day + 2 * slot + 7) % 30]
+            games.append(
+                {
+                    "gameId": f"00225{number:05d}",
+                    "gameStatusText": "Final" if day < 10 else "7:30 pm ET",
+                    "gameDateTimeUTC": f"{game_day.isoformat()}T{23 - slot % 3:02d}:30:00Z",
+                    "seasonYear": 2026,
+                    "seasonStageId": 1 if day < 5 else 2,
+                    "arenaName": f"Arena {home[1]}",
+                    "arenaCity": "City",
+                    "arenaState": "ST",
+                    "homeTeam": {"teamId": home[0], "teamName": home[1], "teamTricode": home[1], "score": 100},
+                    "awayTeam": {"teamId": away[0], "teamName": away[1], "teamTricode": away[1], "score": 98},
+                    "broadcasters": {"nationalBroadcasters": [{"broadcastDisplay": "TNT"}] if slot == 0 else []},
+                    "seriesText": "",
+                }
+            )
+            number += 1
+        game_dates.append({"gameDate": game_day.strftime("%m/%d/%Y 00:00:00"), "games": games})
+    return {"leagueSchedule": {"seasonYear": "2025-26", "gameDates": game_dates}}
+
+
+class FakeResponse:
+    def __init__(self, status_code, payload=None, headers=None):
+        self.status_code = status_code
+        self._payload = payload
+        self.headers = headers or {}
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Server Error")
+
+
+class FakeCDN:
+    """requests.Session stand-in honouring If-None-Match."""
+
+    def __init__(self, payload, etag='"v1"'):
+        self.payload = payload
+        self.etag = etag
+        self.requests = []
+        self.down = False
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append(dict(headers or {}))
+        if self.down:
+            raise requests.ConnectionError("CDN unreachable")
+        if headers and headers.get("If-None-Match") == self.etag:
+            return FakeResponse(304)
+        return FakeResponse(
+            200,
+            self.payload,
+            {"ETag": self.etag, "Last-Modified": "Tue, 21 Oct 2025 10:00:00 GMT"},
+        )
+
+
+PAYLOAD = make_schedule()
+
+
+def make_store(tmp_path=None, cdn=None, **kwargs) -> ScheduleSnapshot:
+    return ScheduleSnapshot(
+        cache_dir=tmp_path, session=cdn or FakeCDN(PAYLOAD), **kwargs
+    )
+
+
+def frames_equal(left: pd.DataFrame, right: pd.DataFrame):
+    pd.testing.assert_frame_equal(
+        left.reset_index(drop=True), right.reset_index(drop=True), check_dtype=False
+    )
+
+
+@pytest.mark.parametrize(
+    "filters,store_filters",
+    [
+        ({}, {}),
+        ({"team_abbr": "t03"}, {"team": "t03"}),
+        ({"date_from": "2025-12-01", "date_to": "2025-12-31"}, {"date_from": "2025-12-01", "date_to": "2025-12-31"}),
+        (
+            {"season_year": 2026, "season_stage_id": 2, "team_abbr": "T11", "date_from": "2025-11-15"},
+            {"season_year": 2026, "season_stage_id": 2, "team": "T11", "date_from": "2025-11-15"},
+        ),
+        ({"season_stage_id": 1}, {"season_stage_id": 1}),
+    ],
+)
+def test_lookups_match_parser(filters, store_filters):
+    """Index lookups return the same games, in the same order, as the parser."""
+    store = make_store()
+    store.refresh()
+
+    expected = parse_schedule_to_dataframe(PAYLOAD, **filters)
+    frames_equal(store.query(**store_filters).to_pandas(), expected)
+
+
+def test_point_lookups():
+    """game_id, date, team ID and next-meeting lookups."""
+    store = make_store()
+    store.refresh()
+
+    game = store.game("0022500009")
+    assert game["game_date_local"] == "2025-10-22"
+    assert store.game("nope") is None
+    assert store.games_on("2025-10-22").num_rows == 8
+    assert store.games_on("2027-01-01").num_rows == 0
+    assert store.games_for_team(TEAMS[3][0]).equals(store.games_for_team("T03"))
+
+    meeting = store.next_game("T03", opponent="T10", on_or_after="2025-11-01")
+    assert {meeting["home_abbr"], meeting["away_abbr"]} == {"T03", "T10"}
+    assert meeting["game_date_local"] >= "2025-11-01"
+    with pytest.raises(ValueError, match="Invalid date format"):
+        store.query(date_from="12/25/2025")
+
+
+def test_conditional_get_and_refresh_interval():
+    """Fresh snapshots skip the CDN; stale ones send validators and keep the table on 304."""
+    cdn = FakeCDN(PAYLOAD)
+    store = make_store(cdn=cdn, min_refresh_interval=60)
+
+    assert store.refresh() == "downloaded"
+    table = store.table
+    assert store.refresh() == "fresh"
+    assert len(cdn.requests) == 1
+
+    store.checked_at -= 61
+    assert store.refresh() == "not_modified"
+    assert cdn.requests[-1] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Tue, 21 Oct 2025 10:00:00 GMT",
+    }
+    assert store.table is table
+
+    cdn.etag = '"v2"'
+    assert store.refresh(force=True) == "downloaded"
+    assert store.get_stats()["downloads"] == 2 and store.get_stats()["not_modified"] == 1
+
+
+def test_snapshot_persisted_and_reloaded(tmp_path):
+    """A new process reuses the parquet snapshot and its validators."""
+    cdn = FakeCDN(PAYLOAD)
+    make_store(tmp_path, cdn).refresh()
+
+    reloaded = make_store(tmp_path, cdn)
+    assert reloaded.stats["disk_loads"] == 1
+    assert reloaded.table.num_rows == len(parse_schedule_to_dataframe(PAYLOAD))
+    assert reloaded.refresh() == "fresh"
+    assert len(cdn.requests) == 1
+
+    reloaded.checked_at = 0
+    assert reloaded.refresh() == "not_modified"
+    assert cdn.requests[-1]["If-None-Match"] == '"v1"'
+
+
+def test_cdn_failure_serves_previous_snapshot():
+    """Errors keep the last snapshot; with no snapshot they propagate."""
+    cdn = FakeCDN(PAYLOAD)
+    store = make_store(cdn=cdn)
+    store.refresh()
+
+    cdn.down = True
+    assert store.refresh(force=True) == "stale"
+    assert store.table.num_rows > 0
+    assert store.stats["errors"] == 1
+
+    with pytest.raises(requests.ConnectionError):
+        make_store(cdn=cdn).refresh()
+
+
+def test_undated_games_kept_under_date_filters():
+    """Games without gameDateTimeUTC stay in date-filtered results, as in the parser."""
+    payload = make_schedule(num_days=20)
+    tbd = copy.deepcopy(payload["leagueSchedule"]["gameDates"][-1]["games"][0])
+    tbd.update(gameId="0022599999", gameDateTimeUTC=None)
+    payload["leagueSchedule"]["gameDates"][-1]["games"].append(tbd)
+
+    store = make_store(cdn=FakeCDN(payload))
+    store.refresh()
+
+    filters = {"date_from": "2025-10-25", "date_to": "2025-10-26"}
+    frames_equal(store.query(**filters).to_pandas(), parse_schedule_to_dataframe(payload, **filters))
+    assert "0022599999" in store.query(**filters).column("game_id").to_pylist()
+
+
+def test_tied_tipoffs_ordered_by_game_id():
+    """Games sharing a tip-off time sort by game_id, whatever the payload order."""
+    payload = make_schedule(num_days=5)
+    for game_date in payload["leagueSchedule"]["gameDates"]:
+        game_date["games"].reverse()
+
+    store = make_store(cdn=FakeCDN(payload))
+    store.refresh()
+
+    games = store.query().select(["game_date_utc", "game_id"]).to_pylist()
+    keys = [(g["game_date_utc"], g["game_id"]) for g in games]
+    assert keys == sorted(keys)
+    frames_equal(store.query(team="T03").to_pandas(), parse_schedule_to_dataframe(payload, team_abbr="T03"))
+
+
+def test_lookups_consistent_during_refresh():
+    """A lookup never mixes one snapshot's indexes with another's table."""
+    big, small = build_schedule_table(PAYLOAD), build_schedule_table(make_schedule(num_days=3))
+    store = make_store()
+    store._install(big)
+    stop = threading.Event()
+
+    def swap():
+        while not stop.is_set():
+            for table in (small, big):
+                store._install(table)
+
+    swapper = threading.Thread(target=swap)
+    swapper.start()
+    try:
+        for _ in range(300):
+            games = store.games_for_team("T03").to_pandas()
+            assert ((games["home_abbr"] == "T03") | (games["away_abbr"] == "T03")).all()
+            store.next_game("T03", on_or_after="2025-10-21")
+    finally:
+        stop.set()
+        swapper.join()
+
+
+@pytest.mark.asyncio
+async def test_get_nba_schedule_uses_snapshot():
+    """Repeated calls make one request; invalid dates raise ValueError."""
+    cdn = FakeCDN(PAYLOAD)
+    with patch.object(schedule_store, "_schedule_store", make_store(cdn=cdn)):
+        december = await get_nba_schedule(
+            season="2025-26", team="T05", date_from="2025-12-01", date_to="2025-12-31"
+        )
+        everything = await get_nba_schedule()
+        with pytest.raises(ValueError, match="Invalid date format"):
+            await get_nba_schedule(date_from="12/25/2025")
+
+    frames_equal(
+        december,
+        parse_schedule_to_dataframe(
+            PAYLOAD, season_year=2026, team_abbr="T05", date_from="2025-12-01", date_to="2025-12-31"
+        ),
+    )
+    assert len(everything) in (0, len(parse_schedule_to_dataframe(PAYLOAD, season_year=2026)))
+    assert len(cdn.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_game_context_schedule_component():
+    """The next meeting of two teams comes from the snapshot."""
+    with patch.object(schedule_store, "_schedule_store", make_store()):
+        meeting = await fetch_schedule_context(TEAMS[3][0], TEAMS[10][0], "2025-11-01")
+        none = await fetch_schedule_context(TEAMS[3][0], TEAMS[10][0], "2027-01-01")
+
+    assert {meeting["home"], meeting["away"]} == {"T03", "T10"}
+    assert meeting["game_date"] >= "2025-11-01"
+    assert none == {}
+
+
+@pytest.mark.performance
+def test_benchmark_snapshot_vs_reparse():
+    """Per-call parse of the full payload vs snapshot index lookups."""
+    store = make_store()
+    store.refresh()
+    iterations = 200
+
+    start = time.perf_counter()
+    for _ in range(20):
+        parse_schedule_to_dataframe(PAYLOAD, team_abbr="T07", date_from="2025-12-01", date_to="2025-12-31")
+    parse_ms = (time.perf_counter() - start) * 1000 / 20
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        store.select_rows(team="T07", date_from="2025-12-01", date_to="2025-12-31")
+    rows_us = (time.perf_counter() - start) * 1e6 / iterations
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        store.query(team="T07", date_from="2025-12-01", date_to="2025-12-31").to_pandas()
+    frame_ms = (time.perf_counter() - start) * 1000 / iterations
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        store.game("0022500777")
+    game_us = (time.perf_counter() - start) * 1e6 / iterations
+
+    print()
+    print(f"✅ Re-parse per call ({store.table.num_rows} games): {parse_ms:.2f}ms")
+    print(f"✅ Snapshot team+month row lookup: {rows_us:.1f}µs")
+    print(f"✅ Snapshot team+month DataFrame: {frame_ms:.3f}ms")
+    print(f"✅ Snapshot game_id lookup: {game_us:.1f}µs")
+
+    assert frame_ms < parse_ms
@@ -0,0 +1,323 @@
+"""
+Tests for the grouped, single-pass season aggregation.
+
+Validates:
+1. aggregate_season_table matches _aggregate_games group by group
+2. The store materializes every level from one league fetch and persists it
+3. get_player_season_stats / get_team_season_stats answer from the store
+   (filtered requests still aggregate fetched game logs)
+4. compare_players and the NLQ rankings fallback reuse the same table
+
+Run benchmark: pytest tests/test_season_table.py -m performance -s
+"""
+import json
+import re
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from nba_mcp import nba_server
+from nba_mcp.api import advanced_stats
+from nba_mcp.api import season_aggregator as sa
+from nba_mcp.api.season_aggregator import (
+    SeasonAggregator,
+    SeasonStatsStore,
+    aggregate_season_table,
+    get_player_season_stats,
+    get_team_season_stats,
+    rank_season_table,
+)
+from nba_mcp.nlq.executor import ExecutionResult, ToolResult
+from nba_mcp.nlq.parser import ParsedQuery, TimeRange
+from nba_mcp.nlq.planner import ExecutionPlan
+from nba_mcp.nlq.synthesizer import synthesize_response
+
+SEASON = "2023-24"
+TEAM_IDS = [1610612737 + i for i in range(30)]
+
+
+def make_player_logs(num_players: int = 450, games: int = 70, seed: int = 0) -> pd.DataFrame:
+    """league_player_games-shaped logs, newest first; every 10th player is traded."""
+    rng = np.random.default_rng(seed)
+    player_ids = np.repeat(np.arange(1, num_players + 1) * 10, games)
+    game_index = np.tile(np.arange(games), num_players)
+    n = len(player_ids)
+    team_slot = (player_ids // 10) % 30
+    traded = ((player_ids // 10) % 10 == 0) & (game_index < games // 2)
+    team_slot = np.where(traded, (team_slot + 1) % 30, team_slot)
+    fga = rng.integers(0, 25, n)
+    fgm = rng.binomial(fga, 0.47)
+    fg3a = rng.binomial(fga, 0.4)
+    fg3m = np.minimum(rng.binomial(fg3a, 0.36), fgm)
+    fta = rng.integers(0, 10, n)
+    ftm = rng.binomial(fta, 0.78)
+    pts = (2 * (fgm - fg3m) + 3 * fg3m + ftm).astype(float)
+    pts[rng.choice(n, 50, replace=False)] = np.nan  # missing box score values
+    reb = rng.integers(0, 15, n)
+    ast = rng.integers(0, 12, n)
+    return pd.DataFrame(
+        {
+            "SEASON_YEAR": SEASON,
+            "PLAYER_ID": player_ids,
+            "PLAYER_NAME": [f"Player {pid}" for pid in player_ids],
+            "TEAM_ID": np.array(TEAM_IDS)[team_slot],
+            "TEAM_ABBREVIATION": [f"T{slot:02d}" for slot in team_slot],
+            "GAME_ID": [f"00223{i:05d}" for i in game_index],
+            "WL": np.where(rng.random(n) < 0.5, "W", "L"),
+            "MIN": rng.uniform(0, 40, n).round(2),
+            "PTS": pts, "FGM": fgm, "FGA": fga, "FG3M": fg3m, "FG3A": fg3a, "FTM": ftm, "FTA": fta,
+            "REB": reb, "AST": ast,
+            "STL": rng.integers(0, 4, n), "BLK": rng.integers(0, 4, n), "TOV": rng.integers(0, 6, n),
+            "PLUS_MINUS": rng.integers(-20, 20, n),
+            "DD2": ((pts >= 10).astype(int) + (reb >= 10) + (ast >= 10) >= 2).astype(int),
+            "TD3": ((pts >= 10).astype(int) + (reb >= 10) + (ast >= 10) >= 3).astype(int),
+        }
+    )
+
+
+def make_team_logs(games: int = 82, seed: int = 1) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    team_ids = np.repeat(TEAM_IDS, games)
+    n = len(team_ids)
+    fga = rng.integers(75, 100, n)
+    fgm = rng.binomial(fga, 0.47)
+    return pd.DataFrame(
+        {
+            "SEASON_ID": "22023",
+            "TEAM_ID": team_ids,
+            "TEAM_ABBREVIATION": [f"T{t - TEAM_IDS[0]:02d}" for t in team_ids],
+            "WL": np.where(rng.random(n) < 0.5, "W", "L"),
+            "MIN": 240, "PTS": 2 * fgm + rng.integers(5, 25, n), "FGM": fgm, "FGA": fga,
+            "FG3M": rng.integers(5, 20, n), "FG3A": rng.integers(25, 45, n),
+            "FTM": rng.integers(5, 25, n), "FTA": rng.integers(15, 30, n),
+            "REB": rng.integers(35, 55, n), "AST": rng.integers(15, 35, n),
+            "STL": rng.integers(3, 12, n), "BLK": rng.integers(1, 9, n), "TOV": rng.integers(8, 20, n),
+            "PLUS_MINUS": rng.integers(-25, 25, n),
+        }
+    )
+
+
+PLAYER_LOGS = make_player_logs()
+TEAM_LOGS = make_team_logs()
+
+
+class CountingFetch:
+    """League game log stand-in that counts requests per source."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, source, season, season_type):
+        self.calls.append((source, season, season_type))
+        logs = PLAYER_LOGS if source == "player" else TEAM_LOGS
+        return pa.Table.from_pandas(logs, preserve_index=False)
+
+
+@pytest.fixture
+def store():
+    store = SeasonStatsStore(cache_dir=None, fetch_func=CountingFetch())
+    with patch.object(sa, "_season_stats_store", store):
+        yield store
+
+
+def assert_row_matches(row, expected):
+    for key, value in expected.items():
+        if key.startswith("_"):
+            continue
+        if isinstance(value, float):
+            assert row[key] == pytest.approx(value, abs=1e-9), key
+        else:
+            assert row[key] == value, key
+
+
+@pytest.mark.parametrize(
+    "logs,level,keys",
+    [
+        (PLAYER_LOGS, "player/season", ["PLAYER_ID"]),
+        (PLAYER_LOGS, "player/team/season", ["PLAYER_ID", "TEAM_ID"]),
+        (TEAM_LOGS, "team/season", ["TEAM_ID"]),
+    ],
+)
+def test_grouped_matches_per_group_aggregation(logs, level, keys):
+    """Every row equals _aggregate_games on that group's games, in key order."""
+    table = aggregate_season_table(logs, SEASON, level)
+    aggregator = SeasonAggregator()
+    is_team = level == "team/season"
+    groups = list(logs.groupby(keys))
+
+    assert table.num_rows == len(groups)
+    rows = table.to_pylist()
+    for row, (_, games) in list(zip(rows, groups))[::7]:
+        expected = aggregator._aggregate_games(games, SEASON, is_team=is_team)
+        assert_row_matches(row, expected.to_dict())
+
+
+def test_derived_double_doubles_and_labels():
+    """Without DD2/TD3 columns both paths derive them; first-row labels are kept."""
+    logs = PLAYER_LOGS.drop(columns=["DD2", "TD3", "PLAYER_NAME"])
+    table = aggregate_season_table(logs, None, "player/season")
+    expected = SeasonAggregator()._aggregate_games(logs[logs["PLAYER_ID"] == 100], SEASON)
+    row = table.to_pylist()[9]
+
+    assert row["PLAYER_ID"] == 100 and row["SEASON_YEAR"] == SEASON
+    assert row["PLAYER_NAME"] == ""
+    assert row["DD2"] == expected.double_doubles > 0
+    assert row["TD3"] == expected.triple_doubles
+    assert row["TEAM_ABBREVIATION"] == "T11"  # traded: first (newest) row's team
+    with pytest.raises(ValueError, match="group key"):
+        aggregate_season_table(TEAM_LOGS, SEASON, "player/season")
+
+
+@pytest.mark.asyncio
+async def test_store_builds_player_levels_from_one_fetch(tmp_path):
+    """player/season and player/team/season share a fetch; tables persist."""
+    fetch = CountingFetch()
+    store = SeasonStatsStore(cache_dir=tmp_path, fetch_func=fetch)
+
+    row = await store.lookup(SEASON, 100)
+    split = await store.lookup(SEASON, (100, TEAM_IDS[11]), "player/team/season")
+    team = await store.lookup(SEASON, TEAM_IDS[3], "team/season")
+
+    assert [c[0] for c in fetch.calls] == ["player", "team"]
+    assert row["GP"] == 70 and split["GP"] == 35
+    assert team["TEAM_ABBREVIATION"] == "T03" and team["W"] + team["L"] == 82
+    assert await store.lookup(SEASON, 999) is None
+    assert len(list(tmp_path.glob("*.parquet"))) == 3
+
+    reloaded = SeasonStatsStore(cache_dir=tmp_path, fetch_func=fetch)
+    assert await reloaded.lookup(SEASON, 100) == row
+    assert reloaded.stats["disk_loads"] == 1 and len(fetch.calls) == 2
+
+    reloaded.invalidate(SEASON)
+    assert not list(tmp_path.glob("*.parquet"))
+
+
+@pytest.mark.asyncio
+async def test_season_stats_functions_use_store(store):
+    """Many single-entity lookups cost one fetch per source and match the per-group path."""
+    player = await get_player_season_stats(SEASON, player_id=200)
+    split = await get_player_season_stats(SEASON, player_id=100, team_id=TEAM_IDS[10])
+    roster = await get_player_season_stats(SEASON, team_id=TEAM_IDS[10])
+    everyone = await get_player_season_stats(SEASON)
+    team = await get_team_season_stats(SEASON, team_id=TEAM_IDS[5])
+    teams = await get_team_season_stats(SEASON)
+
+    expected = SeasonAggregator()._aggregate_games(PLAYER_LOGS[PLAYER_LOGS["PLAYER_ID"] == 200], SEASON)
+    assert_row_matches(player, expected.to_dict())
+    assert player["_grouping_level"] == "player/season"
+    assert split["_grouping_level"] == "player/team/season" and split["GP"] == 35
+    assert set(roster["PLAYER_ID"]) == set(PLAYER_LOGS.loc[PLAYER_LOGS["TEAM_ID"] == TEAM_IDS[10], "PLAYER_ID"])
+    assert len(everyone) == 450 and len(teams) == 30
+    assert team["TEAM_ID"] == TEAM_IDS[5] and team["_grouping_level"] == "team/season"
+    assert [c[0] for c in store._fetch_func.calls] == ["player", "team"]
+
+
+@pytest.mark.asyncio
+async def test_filtered_requests_aggregate_fetched_logs(store):
+    """Filters that change which games count bypass the season table."""
+    home = PLAYER_LOGS[PLAYER_LOGS["PLAYER_ID"] == 200].iloc[::2]
+    grouping = SimpleNamespace(fetch=AsyncMock(return_value=home))
+
+    with patch.object(sa.GroupingFactory, "create", return_value=grouping):
+        stats = await get_player_season_stats(SEASON, player_id=200, location="Home")
+
+    assert stats["GP"] == len(home)
+    assert grouping.fetch.await_args.kwargs["location"] == "Home"
+    assert store._fetch_func.calls == []
+
+
+def test_rank_season_table():
+    """Per-game and rate rankings, min games, worst-first."""
+    table = aggregate_season_table(PLAYER_LOGS, SEASON)
+    df = table.to_pandas()
+
+    top = rank_season_table(table, "PTS", top_n=5)
+    expected = (df["PTS"] / df["GP"]).nlargest(5)
+    assert [e["value"] for e in top] == pytest.approx(list(expected))
+    assert [e["rank"] for e in top] == [1, 2, 3, 4, 5]
+
+    totals = rank_season_table(table, "reb", top_n=1, per_game=False)
+    assert totals[0]["value"] == df["REB"].max()
+    worst = rank_season_table(table, "FG_PCT", top_n=3, ascending=True, min_games=71)
+    assert worst == []
+    with pytest.raises(ValueError, match="Cannot rank"):
+        rank_season_table(table, "USG_PCT")
+
+
+@pytest.mark.asyncio
+async def test_compare_players_uses_season_table(store):
+    """Both sides come from one league build instead of LeagueDash calls."""
+    ids = {"Player A": 100, "Player B": 200}
+    resolver = lambda name, entity_type: SimpleNamespace(entity_id=ids[name], name=name)  # noqa: E731
+    dashboard = AsyncMock(side_effect=AssertionError("LeagueDash should not be called"))
+
+    with patch.object(advanced_stats, "resolve_entity", resolver), \
+            patch.object(advanced_stats, "get_player_advanced_stats", dashboard):
+        comparison = await advanced_stats.compare_players("Player A", "Player B", SEASON, "per_game")
+
+    row = await store.lookup(SEASON, 200)
+    assert comparison.player2.points_per_game == pytest.approx(row["PPG"])
+    assert comparison.player1.games_played == 70
+    assert [c[0] for c in store._fetch_func.calls] == ["player"]
+
+
+@pytest.mark.asyncio
+async def test_rankings_synthesis_falls_back_to_season_table(store):
+    """A failed leaders call is answered from the season table."""
+    parsed = ParsedQuery(
+        raw_query="who leads the league in assists 2023-24",
+        intent="rankings",
+        stat_types=["AST"],
+        time_range=TimeRange(season=SEASON),
+        modifiers={"top_n": 3},
+    )
+    result = ExecutionResult(
+        plan=ExecutionPlan(parsed_query=parsed, tool_calls=[], template_used="rankings"),
+        tool_results={"get_league_leaders_info": ToolResult("get_league_leaders_info", False, error="down")},
+        all_success=False,
+    )
+
+    response = await synthesize_response(parsed, result)
+    leader = rank_season_table(await store.get_table(SEASON), "AST", top_n=1)[0]
+
+    assert leader["player"] in response.answer
+    assert len(re.findall(r"Player \d+", response.answer)) == 3
+
+
+@pytest.mark.asyncio
+async def test_get_season_stats_tool(store):
+    """The MCP tool resolves the entity and reads the materialized row."""
+    with patch.object(nba_server, "resolve_entity",
+                      lambda name, entity_type: SimpleNamespace(entity_id=TEAM_IDS[7])):
+        payload = json.loads(await nba_server.get_season_stats("team", "T07", SEASON))
+
+    assert payload["status"] == "success"
+    assert payload["data"]["TEAM_ABBREVIATION"] == "T07"
+    assert payload["data"]["_grouping_level"] == "team/season"
+
+
+@pytest.mark.performance
+def test_benchmark_grouped_vs_per_group():
+    """_aggregate_games per player vs one grouped pass over the league table."""
+    aggregator = SeasonAggregator()
+    league = pa.Table.from_pandas(PLAYER_LOGS, preserve_index=False)
+
+    start = time.perf_counter()
+    loop = [aggregator._aggregate_games(g, SEASON) for _, g in PLAYER_LOGS.groupby("PLAYER_ID")]
+    loop_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    table = aggregate_season_table(league, SEASON)
+    grouped_ms = (time.perf_counter() - start) * 1000
+
+    print()
+    print(f"✅ Per-player _aggregate_games ({len(loop)} players, {league.num_rows} rows): {loop_ms:.1f}ms")
+    print(f"✅ Grouped single pass: {grouped_ms:.1f}ms ({loop_ms / grouped_ms:.0f}x)")
+
+    assert table.num_rows == len(loop)
+    assert grouped_ms < loop_ms
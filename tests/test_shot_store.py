@@ -0,0 +1,333 @@
+"""
+Tests for the league-wide shot store and the bincount shot chart kernels.
+
+Validates:
+1. hexbin / zone kernels match the previous groupby and mask implementations
+2. One league request serves every player and team; slices keep game order
+3. Date filters, persistence and expiry; memory holds at most max_seasons
+   seasons and a failed league pull is not retried during its cooldown
+4. get_shot_chart, compare_shot_charts and the MCP tool slice from the store
+   (and fall back to a per-entity request if the league fetch fails)
+
+Run benchmark: pytest tests/test_shot_store.py -m performance -s
+"""
+import json
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from nba_mcp import nba_server
+from nba_mcp.api import shot_charts
+from nba_mcp.api.errors import InvalidParameterError
+from nba_mcp.api.shot_charts import (
+    ShotStore,
+    aggregate_to_hexbin,
+    calculate_zone_summary,
+    compare_shot_charts,
+    get_shot_chart,
+    load_entity_shots,
+)
+
+SEASON = "2023-24"
+TEAM_IDS = [1610612737 + i for i in range(30)]
+
+
+def make_league_shots(num_players: int = 450, shots_per_player: int = 480, seed: int = 0) -> pd.DataFrame:
+    """ShotChartDetail-shaped league shots in game order (team_id=0, player_id=0)."""
+    rng = np.random.default_rng(seed)
+    n = num_players * shots_per_player
+    player_ids = rng.integers(1, num_players + 1, n) * 10
+    game_index = np.sort(rng.integers(0, 1230, n))
+    loc_x = rng.integers(-250, 251, n)
+    loc_y = rng.integers(-52, 418, n)
+    loc_x[rng.choice(n, 20, replace=False)] = 400  # invalid coordinates from the feed
+    distance = np.round(np.hypot(loc_x, loc_y) / 10).astype(float)
+    is_three = (distance >= 23.75) | ((np.abs(loc_x) >= 220) & (loc_y < 92))
+    dates = pd.Timestamp("2023-10-24") + pd.to_timedelta(game_index // 8, unit="D")
+    return pd.DataFrame(
+        {
+            "GRID_TYPE": "Shot Chart Detail",
+            "GAME_ID": [f"00223{i:05d}" for i in game_index],
+            "GAME_EVENT_ID": np.arange(n),
+            "PLAYER_ID": player_ids,
+            "PLAYER_NAME": [f"Player {pid}" for pid in player_ids],
+            "TEAM_ID": np.array(TEAM_IDS)[(player_ids // 10) % 30],
+            "SHOT_TYPE": np.where(is_three, "3PT Field Goal", "2PT Field Goal"),
+            "SHOT_DISTANCE": distance,
+            "LOC_X": loc_x,
+            "LOC_Y": loc_y,
+            "SHOT_ATTEMPTED_FLAG": 1,
+            "SHOT_MADE_FLAG": (rng.random(n) < np.where(is_three, 0.36, 0.5)).astype(int),
+            "GAME_DATE": dates.strftime("%Y%m%d"),
+        }
+    )
+
+
+LEAGUE_SHOTS = make_league_shots()
+
+
+class CountingFetch:
+    """League ShotChartDetail stand-in that counts requests."""
+
+    def __init__(self, frame=LEAGUE_SHOTS):
+        self.frame = frame
+        self.calls = []
+
+    async def __call__(self, season, season_type):
+        self.calls.append((season, season_type))
+        return self.frame.copy()
+
+
+@pytest.fixture
+def store():
+    store = ShotStore(cache_dir=None, fetch_func=CountingFetch())
+    with patch.object(shot_charts, "_shot_store", store):
+        yield store
+
+
+def resolver(query, entity_type):
+    """resolve_entity stand-in: 'Player 120' -> 120, 'Team 3' -> TEAM_IDS[3]."""
+    number = int(query.split()[-1])
+    entity_id = number if entity_type == "player" else TEAM_IDS[number]
+    return SimpleNamespace(entity_id=entity_id, name=query, entity_type=entity_type)
+
+
+def groupby_hexbin(shots, grid_size=10, min_shots=5):
+    """The previous aggregate_to_hexbin algorithm (groupby + iterrows)."""
+    binned = shots.assign(
+        bin_x=((shots["LOC_X"] + 250) // grid_size).astype(int),
+        bin_y=((shots["LOC_Y"] + 52.5) // grid_size).astype(int),
+    )
+    grouped = binned.groupby(["bin_x", "bin_y"]).agg(
+        shot_count=("SHOT_MADE_FLAG", "count"),
+        made_count=("SHOT_MADE_FLAG", "sum"),
+        distance=("SHOT_DISTANCE", "mean"),
+    ).reset_index()
+    grouped = grouped[grouped["shot_count"] >= min_shots]
+    return [
+        {
+            "bin_x": int(row["bin_x"] * grid_size - 250 + grid_size // 2),
+            "bin_y": int(row["bin_y"] * grid_size - 52.5 + grid_size // 2),
+            "shot_count": int(row["shot_count"]),
+            "made_count": int(row["made_count"]),
+            "fg_pct": round(float(row["made_count"] / row["shot_count"]), 3),
+            "distance_avg": round(float(row["distance"]), 1),
+        }
+        for _, row in grouped.iterrows()
+    ]
+
+
+def mask_zone_summary(shots):
+    """The previous calculate_zone_summary algorithm (one boolean mask per zone)."""
+    d, three = shots["SHOT_DISTANCE"], shots["SHOT_TYPE"] == "3PT Field Goal"
+    zones = {
+        "paint": shots[d < 8],
+        "short_mid": shots[(d >= 8) & (d < 16)],
+        "long_mid": shots[(d >= 16) & (d < 23.75) & ~three],
+        "three": shots[three],
+        "overall": shots,
+    }
+    return {
+        zone: {
+            "attempts": len(z),
+            "made": int(z["SHOT_MADE_FLAG"].sum()),
+            "pct": round(z["SHOT_MADE_FLAG"].sum() / len(z), 3) if len(z) else 0.0,
+        }
+        for zone, z in zones.items()
+    }
+
+
+@pytest.mark.parametrize("grid_size,min_shots", [(10, 5), (25, 1), (7, 0)])
+def test_hexbin_kernel_matches_groupby(grid_size, min_shots):
+    """Same bins, same order, same values as groupby + iterrows."""
+    shots = LEAGUE_SHOTS[LEAGUE_SHOTS["LOC_X"] <= 250].head(20000).copy()
+    shots.loc[shots.index[::97], "SHOT_DISTANCE"] = np.nan
+
+    bins = pd.DataFrame(aggregate_to_hexbin(shots, grid_size, min_shots))
+    expected = pd.DataFrame(groupby_hexbin(shots, grid_size, min_shots))
+
+    assert bins.equals(expected)  # NaN distance_avg where a bin has no distances
+
+
+def test_zone_kernel_matches_masks():
+    """Zones overlap exactly as before (e.g. a 3PT heave logged at 7 ft)."""
+    shots = LEAGUE_SHOTS.head(20000).copy()
+    shots.loc[shots.index[:5], ["SHOT_DISTANCE", "SHOT_TYPE"]] = [7.0, "3PT Field Goal"]
+    shots.loc[shots.index[5:10], "SHOT_DISTANCE"] = np.nan
+
+    assert calculate_zone_summary(shots) == mask_zone_summary(shots)
+
+
+@pytest.mark.asyncio
+async def test_store_serves_players_and_teams_from_one_request(store):
+    """Every slice equals a filter of the league frame, in game order."""
+    valid = LEAGUE_SHOTS[LEAGUE_SHOTS["LOC_X"].between(-250, 250)].reset_index(drop=True)
+
+    for player_id in (10, 1230, 4500):
+        shots = await store.get_shots(player_id, "player", SEASON)
+        pd.testing.assert_frame_equal(shots, valid[valid["PLAYER_ID"] == player_id].reset_index(drop=True))
+    team = await store.get_shots(TEAM_IDS[4], "team", SEASON)
+
+    assert team["GAME_EVENT_ID"].is_monotonic_increasing
+    assert len(team) == (valid["TEAM_ID"] == TEAM_IDS[4]).sum()
+    assert (await store.get_shots(99, "player", SEASON)).empty
+    assert store._fetch_func.calls == [(SEASON, "Regular Season")]
+    assert store.get_stats()["shots"] == len(valid)
+
+
+@pytest.mark.asyncio
+async def test_date_filters(store):
+    """Inclusive bounds in either accepted format; bad dates are rejected."""
+    shots = await store.get_shots(120, "player", SEASON, date_from="2023-12-01", date_to="12/31/2023")
+    all_shots = await store.get_shots(120, "player", SEASON)
+    in_december = all_shots["GAME_DATE"].between("20231201", "20231231")
+
+    assert len(shots) == in_december.sum() > 0
+    assert set(shots["GAME_DATE"]) == set(all_shots.loc[in_december, "GAME_DATE"])
+    with pytest.raises(InvalidParameterError):
+        await store.get_shots(120, "player", SEASON, date_from="not a date")
+
+
+@pytest.mark.asyncio
+async def test_persistence_and_expiry(tmp_path):
+    """A new store reads the season partition from disk until it expires."""
+    fetch = CountingFetch()
+    first = ShotStore(cache_dir=tmp_path, fetch_func=fetch)
+    expected = await first.get_shots(120, "player", SEASON)
+
+    second = ShotStore(cache_dir=tmp_path, fetch_func=fetch)
+    pd.testing.assert_frame_equal(await second.get_shots(120, "player", SEASON), expected)
+    assert len(fetch.calls) == 1 and second.stats["disk_loads"] == 1
+    assert (tmp_path / f"season={SEASON}" / "season_type=regular_season" / "shots.parquet").exists()
+
+    expired = ShotStore(cache_dir=tmp_path, max_age=0, fetch_func=fetch)
+    await expired.get_season(SEASON)
+    assert len(fetch.calls) == 2
+
+    first.invalidate(SEASON)
+    assert not list(tmp_path.rglob("*.parquet"))
+
+
+@pytest.mark.asyncio
+async def test_memory_bounded_to_recent_seasons(tmp_path):
+    """Least recently used seasons leave memory and reload from disk."""
+    fetch = CountingFetch()
+    store = ShotStore(cache_dir=tmp_path, fetch_func=fetch, max_seasons=2)
+
+    for season in ("2021-22", "2022-23", "2021-22", "2023-24"):
+        await store.get_season(season)
+
+    assert [key[0] for key in store._seasons] == ["2021-22", "2023-24"]
+    assert store.stats["evictions"] == 1
+
+    await store.get_season("2022-23")
+    assert store.stats["disk_loads"] == 1 and len(fetch.calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_league_pull_is_not_retried_during_cooldown():
+    """After a failure, callers go straight to the per-entity fetch."""
+    league = AsyncMock(side_effect=RuntimeError("timeout"))
+    failing = ShotStore(cache_dir=None, fetch_func=league, failure_cooldown=60)
+    direct = AsyncMock(return_value=LEAGUE_SHOTS[LEAGUE_SHOTS["PLAYER_ID"] == 120])
+
+    with patch.object(shot_charts, "_shot_store", failing), \
+            patch.object(shot_charts, "fetch_shot_chart_data", direct):
+        for _ in range(3):
+            await load_entity_shots(120, "player", SEASON, "Regular Season", None, None)
+
+    assert league.await_count == 1 and direct.await_count == 3
+    assert failing.stats["cooldown_skips"] == 2
+
+    failing._failed_at[(SEASON, "Regular Season")] -= 61
+    league.side_effect = None
+    league.return_value = LEAGUE_SHOTS
+    assert len(await failing.get_season(SEASON)) > 0
+    assert league.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_shot_chart_slices_store(store):
+    """Charts are computed from the slice; no per-entity request is made."""
+    direct = AsyncMock(side_effect=AssertionError("per-entity fetch should not be called"))
+    with patch.object(shot_charts, "resolve_entity", resolver), \
+            patch.object(shot_charts, "fetch_shot_chart_data", direct):
+        chart = await get_shot_chart("Player 120", "player", SEASON, granularity="both")
+        team_chart = await get_shot_chart("Team 2", "team", SEASON, game_date="2023-11-15", granularity="summary")
+
+    shots = await store.get_shots(120, "player", SEASON)
+    assert chart["metadata"]["total_shots"] == len(shots) == len(chart["raw_shots"])
+    assert chart["hexbin"] == groupby_hexbin(shots)
+    assert chart["zone_summary"] == mask_zone_summary(shots)
+    assert team_chart["metadata"]["date_range"] == {"min": "2023-11-15", "max": "2023-11-15"}
+    assert len(store._fetch_func.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_shot_chart_falls_back_to_entity_fetch():
+    """If the league request fails, the entity is fetched on its own."""
+    failing = ShotStore(cache_dir=None, fetch_func=AsyncMock(side_effect=RuntimeError("timeout")))
+    player_shots = LEAGUE_SHOTS[LEAGUE_SHOTS["PLAYER_ID"] == 120]
+    direct = AsyncMock(return_value=player_shots)
+
+    with patch.object(shot_charts, "_shot_store", failing), \
+            patch.object(shot_charts, "resolve_entity", resolver), \
+            patch.object(shot_charts, "fetch_shot_chart_data", direct):
+        chart = await get_shot_chart("Player 120", "player", SEASON, granularity="summary")
+
+    assert direct.await_count == 1
+    assert chart["zone_summary"]["overall"]["attempts"] == player_shots["LOC_X"].between(-250, 250).sum()
+
+
+@pytest.mark.asyncio
+async def test_compare_shot_charts_tool(store):
+    """Many players, one league request; fewer than two names is rejected."""
+    names = [f"Player {i * 10}" for i in range(1, 11)]
+    with patch.object(shot_charts, "resolve_entity", resolver):
+        response = json.loads(await nba_server.compare_shot_charts(names, season=SEASON))
+        again = json.loads(await nba_server.compare_shot_charts(names[:2], season=SEASON, granularity="hexbin"))
+        with pytest.raises(InvalidParameterError):
+            await compare_shot_charts(names[:1], season=SEASON)
+
+    charts = response["data"]["charts"]
+    assert [c["entity"]["id"] for c in charts] == list(range(10, 101, 10))
+    assert all("zone_summary" in c and "raw_shots" not in c for c in charts)
+    assert response["metadata"]["cache_status"] == "miss"
+    assert again["metadata"]["cache_status"] == "hit" and "hexbin" in again["data"]["charts"][0]
+    assert len(store._fetch_func.calls) == 1
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_benchmark_shot_store(store):
+    """groupby/iterrows charts vs bincount kernels; 10-player comparison from the store."""
+    await store.get_season(SEASON)
+    shots = LEAGUE_SHOTS[LEAGUE_SHOTS["LOC_X"] <= 250]
+
+    start = time.perf_counter()
+    groupby_hexbin(shots)
+    mask_zone_summary(shots)
+    old_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    aggregate_to_hexbin(shots)
+    calculate_zone_summary(shots)
+    new_ms = (time.perf_counter() - start) * 1000
+
+    names = [f"Player {i * 10}" for i in range(1, 11)]
+    with patch.object(shot_charts, "resolve_entity", resolver):
+        start = time.perf_counter()
+        await compare_shot_charts(names, season=SEASON, granularity="both")
+        compare_ms = (time.perf_counter() - start) * 1000
+
+    print()
+    print(f"✅ groupby + iterrows hexbin/zones ({len(shots)} shots): {old_ms:.1f}ms")
+    print(f"✅ bincount kernels: {new_ms:.1f}ms ({old_ms / new_ms:.0f}x)")
+    print(f"✅ 10-player comparison from the store: {compare_ms:.1f}ms, league requests: {len(store._fetch_func.calls)}")
+
+    assert new_ms < old_ms
+    assert len(store._fetch_func.calls) == 1